@@ -0,0 +1,179 @@
+import { createElement, useEffect, useRef, useState } from "react";
+
+/**
+ * Render only the rows of a list visible in a scroll container.
+ *
+ * With `total` and `offset`, `iterable` holds a window of a longer list, and
+ * `onRangeChange(start, end)` is called when the visible rows are not all in
+ * the window, to fetch the rows from `start` to `end` (overscan included).
+ *
+ * Without `itemHeight`, the rows are measured as they render and the rows not
+ * measured yet are estimated with the mean measured height.
+ */
+export function VirtualList({
+  iterable,
+  renderItem,
+  itemHeight,
+  estimatedItemHeight = 32,
+  overscan = 10,
+  total,
+  offset = 0,
+  onRangeChange,
+  height = "100%",
+  style,
+  ...props
+}) {
+  const items = iterable ?? [];
+  const count = total ?? offset + items.length;
+  const scrollRef = useRef(null);
+  const [scrollTop, setScrollTop] = useState(0);
+  const [viewportHeight, setViewportHeight] = useState(0);
+  // Measured row heights, by index.
+  const heights = useRef(new Map());
+  const [, setMeasured] = useState(0);
+  const observer = useRef(null);
+  const requested = useRef(null);
+
+  useEffect(() => {
+    const element = scrollRef.current;
+    if (!element) return;
+    const resize = new ResizeObserver(() =>
+      setViewportHeight(element.clientHeight),
+    );
+    resize.observe(element);
+    setViewportHeight(element.clientHeight);
+    return () => resize.disconnect();
+  }, []);
+
+  useEffect(() => {
+    if (itemHeight !== undefined) return;
+    observer.current = new ResizeObserver((entries) => {
+      let changed = false;
+      for (const entry of entries) {
+        const index = Number(entry.target.dataset.index);
+        const size =
+          entry.borderBoxSize?.[0]?.blockSize ?? entry.contentRect.height;
+        if (heights.current.get(index) !== size) {
+          heights.current.set(index, size);
+          changed = true;
+        }
+      }
+      if (changed) setMeasured((version) => version + 1);
+    });
+    return () => observer.current?.disconnect();
+  }, [itemHeight]);
+
+  let measuredTotal = 0;
+  for (const size of heights.current.values()) measuredTotal += size;
+  const estimate =
+    itemHeight ??
+    (heights.current.size > 0
+      ? measuredTotal / heights.current.size
+      : estimatedItemHeight);
+  const sizeOf = (index) =>
+    itemHeight ?? heights.current.get(index) ?? estimate;
+
+  // The visible rows, from the scroll position.
+  let start = 0;
+  let top = 0;
+  if (itemHeight !== undefined) {
+    start = Math.min(count, Math.floor(scrollTop / itemHeight));
+    top = start * itemHeight;
+  } else {
+    while (start < count && top + sizeOf(start) <= scrollTop) {
+      top += sizeOf(start);
+      start++;
+    }
+  }
+  let end = start;
+  let bottom = top;
+  while (end < count && bottom < scrollTop + viewportHeight) {
+    bottom += sizeOf(end);
+    end++;
+  }
+
+  // The rendered rows, with the overscan.
+  const first = Math.max(0, start - overscan);
+  const last = Math.min(count, end + overscan);
+  let before = top;
+  for (let index = first; index < start; index++) before -= sizeOf(index);
+  let after = bottom;
+  for (let index = end; index < last; index++) after += sizeOf(index);
+  let totalHeight = 0;
+  if (itemHeight !== undefined) {
+    totalHeight = count * itemHeight;
+  } else {
+    totalHeight = after;
+    for (let index = last; index < count; index++) totalHeight += sizeOf(index);
+  }
+
+  useEffect(() => {
+    if (!onRangeChange) return;
+    if (items.length > 0 && start >= offset && end <= offset + items.length) {
+      return;
+    }
+    // Until the total is known, ask for the rows filling the viewport.
+    const wanted = Math.ceil(viewportHeight / estimate) + 2 * overscan;
+    const range = [first, Math.max(last, first + wanted)];
+    if (
+      requested.current?.[0] === range[0] &&
+      requested.current?.[1] === range[1]
+    ) {
+      return;
+    }
+    requested.current = range;
+    onRangeChange(...range);
+  }, [
+    onRangeChange,
+    start,
+    end,
+    first,
+    last,
+    offset,
+    items.length,
+    viewportHeight,
+  ]);
+
+  const rows = [];
+  for (let index = first; index < last; index++) {
+    const item = items[index - offset];
+    rows.push(
+      createElement(
+        "div",
+        {
+          key: index,
+          "data-index": index,
+          // Measure the loaded rows, not the placeholders of rows to fetch.
+          ref:
+            itemHeight === undefined && item !== undefined
+              ? (element) => element && observer.current?.observe(element)
+              : undefined,
+          style: {
+            height: item === undefined ? sizeOf(index) : itemHeight,
+            overflow: itemHeight === undefined ? undefined : "hidden",
+          },
+        },
+        item === undefined ? null : renderItem(item, index),
+      ),
+    );
+  }
+
+  return createElement(
+    "div",
+    {
+      ref: scrollRef,
+      onScroll: (event) => setScrollTop(event.currentTarget.scrollTop),
+      style: { height, overflowY: "auto", ...style },
+      ...props,
+    },
+    createElement(
+      "div",
+      { style: { height: totalHeight, position: "relative" } },
+      createElement(
+        "div",
+        { style: { transform: `translateY(${before}px)` } },
+        rows,
+      ),
+    ),
+  );
+}
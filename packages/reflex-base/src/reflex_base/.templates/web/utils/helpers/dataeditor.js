@@ -73,7 +73,7 @@ export function formatCell(value, column) {
 }
 
 export function formatDataEditorCells(col, row, columns, data) {
-  if (row < data.length && col < columns.length) {
+  if (row >= 0 && row < data.length && col < columns.length) {
     const column = getDEColumn(columns, col);
     const rowData = getDERow(data, row);
     const cellData = locateCell(rowData, column);
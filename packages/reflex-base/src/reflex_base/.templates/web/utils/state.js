@@ -165,6 +165,78 @@ export const applyDelta = (state, delta) => {
   return { ...state, ...delta };
 };
 
+// The typed arrays reading the column buffers of a columnar update, by dtype.
+const COLUMNAR_ARRAYS = {
+  int8: Int8Array,
+  uint8: Uint8Array,
+  int16: Int16Array,
+  uint16: Uint16Array,
+  int32: Int32Array,
+  uint32: Uint32Array,
+  float32: Float32Array,
+  float64: Float64Array,
+  bool: Uint8Array,
+};
+
+/**
+ * Read a column buffer of a columnar update.
+ * @param column The encoded column, with either a dtype and buffer or JSON values.
+ * @returns The values of the column, as an array or typed array.
+ */
+const readColumn = (column) => {
+  if (column.buffer === undefined) {
+    return column.values;
+  }
+  let buffer = column.buffer;
+  if (ArrayBuffer.isView(buffer)) {
+    buffer = buffer.buffer.slice(
+      buffer.byteOffset,
+      buffer.byteOffset + buffer.byteLength,
+    );
+  }
+  const values = new COLUMNAR_ARRAYS[column.dtype](buffer);
+  return column.dtype === "bool" ? Array.from(values, Boolean) : values;
+};
+
+/**
+ * Nest the flat values of an array in lists, like numpy's tolist().
+ * @param values The flat values.
+ * @param shape The shape of the array.
+ * @returns The nested lists.
+ */
+const nestValues = (values, shape) => {
+  if (shape.length <= 1) {
+    return Array.from(values);
+  }
+  const inner = shape.slice(1);
+  const size = inner.reduce((a, b) => a * b, 1);
+  return Array.from({ length: shape[0] }, (_, i) =>
+    nestValues(values.slice(i * size, (i + 1) * size), inner),
+  );
+};
+
+/**
+ * Decode a DataFrame or array sent as column buffers into its JSON form.
+ * @param value A value of a delta.
+ * @returns The decoded value, or the value itself.
+ */
+export const decodeColumnar = (value) => {
+  switch (value?.__columnar__) {
+    case "ndarray":
+      return nestValues(readColumn(value), value.shape);
+    case "dataframe": {
+      const columns = value.data.map(readColumn);
+      const data = new Array(value.length);
+      for (let row = 0; row < value.length; row++) {
+        data[row] = columns.map((column) => column[row]);
+      }
+      return { columns: value.columns, data };
+    }
+    default:
+      return value;
+  }
+};
+
 /**
  * Evaluate a dynamic component.
  * @param component The component to evaluate.
@@ -754,7 +826,11 @@ export const connect = async (
     try {
       if (update.delta) {
         for (const substate in update.delta) {
-          dispatch[substate](update.delta[substate]);
+          const substate_delta = update.delta[substate];
+          for (const key in substate_delta) {
+            substate_delta[key] = decodeColumnar(substate_delta[key]);
+          }
+          dispatch[substate](substate_delta);
           // handle events waiting for `is_hydrated`
           if (
             substate === state_name &&
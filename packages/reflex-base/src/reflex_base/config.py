@@ -166,6 +166,8 @@ class BaseConfig:
         backend_host: The url the backend will be hosted on.
         db_url: The database url used by rx.Model.
         async_db_url: The async database url used by rx.Model.
+        db_read_replica_urls: Database urls of read replicas that read-only sessions are spread across.
+        async_db_read_replica_urls: Async database urls of read replicas that read-only async sessions are spread across.
         redis_url: The redis url.
         telemetry_enabled: Telemetry opt-in.
         bun_path: The bun path.
@@ -216,6 +218,16 @@ class BaseConfig:
 
     async_db_url: str | None = None
 
+    db_read_replica_urls: Annotated[
+        list[str],
+        SequenceOptions(delimiter=",", strip=True),
+    ] = dataclasses.field(default_factory=list)
+
+    async_db_read_replica_urls: Annotated[
+        list[str],
+        SequenceOptions(delimiter=",", strip=True),
+    ] = dataclasses.field(default_factory=list)
+
     redis_url: str | None = None
 
     telemetry_enabled: bool = True
@@ -66,8 +66,16 @@ class Dirs(SimpleNamespace):
     BACKEND = "backend"
     # JSON-encoded list of page routes that need to be evaluated on the backend.
     STATEFUL_PAGES = "stateful_pages.json"
+    # JSON-encoded usage and dependency report of the computed vars of the app.
+    COMPUTED_VARS = "computed_vars.json"
     # Marker file indicating that upload component was used in the frontend.
     UPLOAD_IS_USED = "upload_is_used"
+    # Spool files and deduplicated content of resumable uploads.
+    UPLOAD_SESSIONS = "upload_sessions"
+    # Content-addressed images and binary state values served by the backend.
+    MEDIA = "media"
+    # Content-addressed cache of precompressed static assets reused across builds.
+    PRECOMPRESS_CACHE = "precompress_cache"
 
 
 def _reflex_version() -> str:
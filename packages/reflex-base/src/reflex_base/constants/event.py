@@ -13,6 +13,10 @@ class Endpoint(Enum):
     AUTH_CODESPACE = "auth-codespace"
     HEALTH = "_health"
     ALL_ROUTES = "_all_routes"
+    EVENT_TRACES = "_event_traces"
+    EVENT_PROFILES = "_event_profiles"
+    STATE_ACCOUNTING = "_state_accounting"
+    MEDIA = "_media"
 
     def __str__(self) -> str:
         """Get the string representation of the endpoint.
@@ -600,6 +600,12 @@ class EnvironmentVariables:
         Path(constants.Dirs.UPLOADED_FILES)
     )
 
+    # The directory to spool resumable uploads in (defaults to .web/backend/upload_sessions).
+    REFLEX_UPLOAD_SESSIONS_DIR: EnvVar[Path | None] = env_var(None)
+
+    # Seconds an unused resumable upload session or its deduplicated content is kept.
+    REFLEX_UPLOAD_SESSION_TTL: EnvVar[int] = env_var(24 * 60 * 60)
+
     # The directory to store reflex dependencies.
     REFLEX_DIR: EnvVar[Path] = env_var(constants.Reflex.DIR)
 
@@ -621,6 +627,12 @@ class EnvironmentVariables:
     # The timeout for acquiring a connection from the pool.
     SQLALCHEMY_POOL_TIMEOUT: EnvVar[int] = env_var(30)
 
+    # Whether rx.session()/rx.asession() calls within one event handler share a session.
+    REFLEX_DB_EVENT_SCOPED_SESSIONS: EnvVar[bool] = env_var(False)
+
+    # The maximum number of result pages kept in the process-wide rx.QueryState page cache.
+    REFLEX_QUERY_PAGE_CACHE_SIZE: EnvVar[int] = env_var(256)
+
     # Whether to ignore the redis config error. Some redis servers only allow out-of-band configuration.
     REFLEX_IGNORE_REDIS_CONFIG_ERROR: EnvVar[bool] = env_var(False)
 
@@ -649,6 +661,9 @@ class EnvironmentVariables:
     # dev reload-capable worker boots from other backend starts. Never set in prod.
     REFLEX_DEV_BACKEND_RELOAD_ACTIVE: EnvVar[bool] = env_var(False, internal=True)
 
+    # Whether to evaluate the app once in the prod backend parent process and fork the workers from it.
+    REFLEX_PRELOAD_BACKEND: EnvVar[bool] = env_var(False)
+
     # Whether to run app harness tests in headless mode.
     APP_HARNESS_HEADLESS: EnvVar[bool] = env_var(False)
 
@@ -685,6 +700,73 @@ class EnvironmentVariables:
     # Used by flexgen to enumerate the pages.
     REFLEX_ADD_ALL_ROUTES_ENDPOINT: EnvVar[bool] = env_var(False)
 
+    # Where to export per-event tracing spans (logging, memory, otel). Separated by a colon. Tracing is off when empty.
+    REFLEX_EVENT_TRACE_EXPORTERS: EnvVar[list[Literal["logging", "memory", "otel"]]] = (
+        env_var([])
+    )
+
+    # The number of event traces kept by the in-memory trace exporter.
+    REFLEX_EVENT_TRACE_BUFFER_SIZE: EnvVar[int] = env_var(1000)
+
+    # Only log traces of events taking at least this long (ms) with the logging trace exporter.
+    REFLEX_EVENT_TRACE_LOG_THRESHOLD: EnvVar[float] = env_var(0.0)
+
+    # Whether to serve the in-memory event traces and their per-phase latency summary on /_event_traces.
+    REFLEX_ADD_EVENT_TRACES_ENDPOINT: EnvVar[bool] = env_var(False)
+
+    # Profile the stacks of events taking at least this long (ms). Disabled when 0.
+    REFLEX_EVENT_PROFILE_THRESHOLD: EnvVar[float] = env_var(0.0)
+
+    # Profile the stacks of one in this many events. Disabled when 0.
+    REFLEX_EVENT_PROFILE_SAMPLE_RATE: EnvVar[int] = env_var(0)
+
+    # The time between two stack samples of a profiled event (ms).
+    REFLEX_EVENT_PROFILE_INTERVAL: EnvVar[float] = env_var(5.0)
+
+    # Whether to serve the event handler profiles on /_event_profiles.
+    REFLEX_ADD_EVENT_PROFILES_ENDPOINT: EnvVar[bool] = env_var(False)
+
+    # Account for the size and writes of each substate, measuring its size once in this many of its updates. Disabled when 0.
+    REFLEX_STATE_ACCOUNTING_SAMPLE_RATE: EnvVar[int] = env_var(0)
+
+    # Whether to serve the state size and write accounting on /_state_accounting.
+    REFLEX_ADD_STATE_ACCOUNTING_ENDPOINT: EnvVar[bool] = env_var(False)
+
+    # Where synchronous event handlers run by default: on the event loop, or on the thread pool of the event processor.
+    REFLEX_EVENT_HANDLER_EXECUTOR: EnvVar[Literal["loop", "thread"]] = env_var("loop")
+
+    # The number of threads running synchronous event handlers. Sized from the number of backend workers when 0.
+    REFLEX_EVENT_HANDLER_THREADS: EnvVar[int] = env_var(0)
+
+    # Whether to send the DataFrames and numeric NumPy arrays of state updates as binary column buffers instead of JSON.
+    REFLEX_COLUMNAR_TRANSPORT: EnvVar[bool] = env_var(False)
+
+    # Merge the state updates sent to a connection within this interval (ms) into one message, 0 for each loop iteration. Each update is sent on its own when unset.
+    REFLEX_EMIT_BATCH_INTERVAL: EnvVar[int | None] = env_var(None)
+
+    # Where to store the images and bytes of state updates, served on /_media instead of inlined. Inlined when unset.
+    REFLEX_MEDIA_STORE: EnvVar[Literal["memory", "disk", "redis"] | None] = env_var(
+        None
+    )
+
+    # The directory of the disk media store. Defaults to a directory in the backend build directory.
+    REFLEX_MEDIA_STORE_DIR: EnvVar[Path | None] = env_var(None)
+
+    # The most bytes kept by the memory and disk media stores, least recently used first out.
+    REFLEX_MEDIA_STORE_MAX_BYTES: EnvVar[int] = env_var(256 * 1024 * 1024)
+
+    # How long (s) a media blob not sent or fetched is kept.
+    REFLEX_MEDIA_STORE_TTL: EnvVar[int] = env_var(24 * 60 * 60)
+
+    # The smallest encoded image or bytes value to store as media, smaller values are inlined.
+    REFLEX_MEDIA_MIN_BYTES: EnvVar[int] = env_var(16 * 1024)
+
+    # Whether to leave frontend computed vars read by no compiled page out of the deltas.
+    REFLEX_SKIP_UNUSED_COMPUTED_VARS: EnvVar[bool] = env_var(False)
+
+    # Whether to fold constant var operations and hoist the state expressions repeated in a page when compiling.
+    REFLEX_OPTIMIZE_VARS: EnvVar[bool] = env_var(False)
+
     # The address to bind the HTTP client to. You can set this to "::" to enable IPv6.
     REFLEX_HTTP_CLIENT_BIND_ADDRESS: EnvVar[str | None] = env_var(None)
 
@@ -735,9 +817,21 @@ class EnvironmentVariables:
     # Whether to mount the compiled frontend app in the backend server in production.
     REFLEX_MOUNT_FRONTEND_COMPILED_APP: EnvVar[bool] = env_var(False, internal=True)
 
+    # Whether the production frontend server indexes the (immutable) static build at startup instead of stat-ing files per request.
+    REFLEX_FRONTEND_STATIC_INDEX: EnvVar[bool] = env_var(True)
+
+    # The total bytes of small static files the production frontend server keeps in memory (0 disables the cache).
+    REFLEX_FRONTEND_STATIC_MEMORY_CACHE_SIZE: EnvVar[int] = env_var(0)
+
     # How long to delay writing updated states to disk. (Higher values mean less writes, but more chance of lost data.)
     REFLEX_STATE_MANAGER_DISK_DEBOUNCE_SECONDS: EnvVar[float] = env_var(2.0)
 
+    # The maximum number of threads the disk state manager uses to read and write state files concurrently.
+    REFLEX_STATE_MANAGER_DISK_IO_WORKERS: EnvVar[int] = env_var(8)
+
+    # Whether to fsync state files (and their directory, once per batch) after writing them to disk.
+    REFLEX_STATE_MANAGER_DISK_FSYNC: EnvVar[bool] = env_var(False)
+
     # How long to wait between automatic reload on frontend error to avoid reload loops.
     REFLEX_AUTO_RELOAD_COOLDOWN_TIME_MS: EnvVar[int] = env_var(10_000)
 
@@ -750,6 +844,12 @@ class EnvironmentVariables:
     # How long to opportunistically hold the redis lock in milliseconds (must be less than the token expiration).
     REFLEX_OPLOCK_HOLD_TIME_MS: EnvVar[int] = env_var(0)
 
+    # Whether the redis state manager grants each lock to waiters in arrival order (FIFO tickets) across all instances.
+    REFLEX_STATE_MANAGER_REDIS_FAIR_LOCKS: EnvVar[bool] = env_var(False)
+
+    # Whether to run events and shared state updates for a client on the instance that owns its socket, instead of sending deltas through the redis lost and found.
+    REFLEX_TOKEN_MANAGER_OWNER_AFFINITY: EnvVar[bool] = env_var(False)
+
     # Extra plugins to append to the config's plugins list.
     REFLEX_EXTRA_PLUGINS: EnvVar[list[type[Plugin]]] = env_var([])
 
@@ -294,6 +294,12 @@ def _scan_detach(value: Any, memo: dict[int, Any], active: set[int]) -> Any:
 
 BACKGROUND_TASK_MARKER = "_reflex_background_task"
 EVENT_ACTIONS_MARKER = "_rx_event_actions"
+EVENT_EXECUTOR_MARKER = "_rx_event_executor"
+EVENT_EMIT_INTERVAL_MARKER = "_rx_event_emit_interval"
+EVENT_FLUSH_INTERVAL_MARKER = "_rx_event_flush_interval"
+
+# Where a synchronous event handler runs: on the event loop, or on a thread pool.
+EventExecutor = Literal["loop", "thread"]
 UPLOAD_FILES_CLIENT_HANDLER = "uploadFiles"
 
 # Payload key listing the names of the extra bound handler args in an upload
@@ -550,6 +556,38 @@ class EventHandler(EventActionsMixin):
         """
         return getattr(self.fn, BACKGROUND_TASK_MARKER, False)
 
+    @property
+    def executor(self) -> EventExecutor | None:
+        """Where the event handler runs, if set with ``@rx.event(executor=...)``.
+
+        Returns:
+            "thread" to run a synchronous handler off the event loop, "loop" to
+            run it on the event loop, None for the default of the app.
+        """
+        return getattr(self.fn, EVENT_EXECUTOR_MARKER, None)
+
+    @property
+    def emit_interval(self) -> int | None:
+        """The fewest milliseconds between the deltas a generator handler emits.
+
+        Set with ``@rx.event(emit_interval=...)``.
+
+        Returns:
+            The interval, or None to emit a delta on every yield.
+        """
+        return getattr(self.fn, EVENT_EMIT_INTERVAL_MARKER, None)
+
+    @property
+    def flush_interval(self) -> int | None:
+        """The milliseconds a background task batches its state changes for.
+
+        Set with ``@rx.event(background=True, flush_interval=...)``.
+
+        Returns:
+            The interval, or None to write the state on every ``async with self``.
+        """
+        return getattr(self.fn, EVENT_FLUSH_INTERVAL_MARKER, None)
+
     def __call__(self, *args: Any, **kwargs: Any) -> "EventSpec":
         """Pass arguments to the handler to get an event spec.
 
@@ -2888,10 +2926,14 @@ class EventNamespace:
     LAMBDA_OR_STATE = LAMBDA_OR_STATE
     BASIC_EVENT_TYPES = BASIC_EVENT_TYPES
     IndividualEventType = IndividualEventType
+    EventExecutor = EventExecutor
 
     # Constants
     BACKGROUND_TASK_MARKER = BACKGROUND_TASK_MARKER
     EVENT_ACTIONS_MARKER = EVENT_ACTIONS_MARKER
+    EVENT_EXECUTOR_MARKER = EVENT_EXECUTOR_MARKER
+    EVENT_EMIT_INTERVAL_MARKER = EVENT_EMIT_INTERVAL_MARKER
+    EVENT_FLUSH_INTERVAL_MARKER = EVENT_FLUSH_INTERVAL_MARKER
     _EVENT_FIELDS = _EVENT_FIELDS
     FORM_DATA = FORM_DATA
     FORM_SUBMIT_MAPPING = FORM_SUBMIT_MAPPING
@@ -2921,6 +2963,9 @@ class EventNamespace:
         throttle: int | None = None,
         debounce: int | None = None,
         temporal: bool | None = None,
+        executor: EventExecutor | None = None,
+        emit_interval: int | None = None,
+        flush_interval: int | None = None,
     ) -> (
         "Callable[[Callable[[BASE_STATE, Unpack[P]], Any]], EventCallback[Unpack[P]]]"
     ): ...
@@ -2936,6 +2981,9 @@ class EventNamespace:
         throttle: int | None = None,
         debounce: int | None = None,
         temporal: bool | None = None,
+        executor: EventExecutor | None = None,
+        emit_interval: int | None = None,
+        flush_interval: int | None = None,
     ) -> EventCallback[Unpack[P]]: ...
 
     def __new__(
@@ -2948,6 +2996,9 @@ class EventNamespace:
         throttle: int | None = None,
         debounce: int | None = None,
         temporal: bool | None = None,
+        executor: EventExecutor | None = None,
+        emit_interval: int | None = None,
+        flush_interval: int | None = None,
     ) -> "EventCallback[Unpack[P]] | Callable[[Callable[[BASE_STATE, Unpack[P]], Any]], EventCallback[Unpack[P]]]":
         """Wrap a function to be used as an event.
 
@@ -2959,12 +3010,29 @@ class EventNamespace:
             throttle: Throttle the event handler to limit calls (in milliseconds).
             debounce: Debounce the event handler to delay calls (in milliseconds).
             temporal: Whether the event should be dropped when the backend is down.
+            executor: Where a synchronous handler runs: "thread" on the thread pool
+                of the event processor, "loop" on the event loop. Defaults to
+                REFLEX_EVENT_HANDLER_EXECUTOR.
+            emit_interval: The fewest milliseconds between the deltas a generator
+                handler emits. The changes of the yields in between are merged
+                into the next delta, emitted at the end of the interval (or at
+                the next yield for a handler on the thread pool) and always when
+                the handler returns.
+            flush_interval: The milliseconds a background task batches its state
+                changes for. The ``async with self`` blocks in between change a
+                local copy of the state, and the changes are written under the
+                lock at the end of the interval and of the task. A change is
+                dropped if the state changed it meanwhile, and the client gets
+                the kept value. Only applies with the redis state manager without
+                REFLEX_OPLOCK_ENABLED, other state managers write every block and
+                log a warning.
 
         Returns:
             The wrapped function.
 
         Raises:
-            TypeError: If background is True and the function is not a coroutine or async generator. # noqa: DAR402
+            TypeError: If background is True and the function is not a coroutine or async generator, an executor is set for an async function, or an emit interval for a function not a generator, or a flush interval for a task not in the background. # noqa: DAR402
+            ValueError: If the executor is not "thread" or "loop", or an interval is not positive. # noqa: DAR402
         """
 
         def _build_event_actions():
@@ -3005,6 +3073,34 @@ class EventNamespace:
                     msg = "Background task must be async function or generator."
                     raise TypeError(msg)
                 setattr(func, BACKGROUND_TASK_MARKER, True)
+            if executor is not None:
+                if executor not in get_args(EventExecutor):
+                    msg = f"Invalid event executor {executor!r}, expected 'thread' or 'loop'."
+                    raise ValueError(msg)
+                if inspect.iscoroutinefunction(func) or inspect.isasyncgenfunction(
+                    func
+                ):
+                    msg = "Only synchronous event handlers can set an executor."
+                    raise TypeError(msg)
+                setattr(func, EVENT_EXECUTOR_MARKER, executor)
+            if emit_interval is not None:
+                if emit_interval <= 0:
+                    msg = f"Invalid emit interval {emit_interval!r}, expected a positive number of milliseconds."
+                    raise ValueError(msg)
+                if not inspect.isgeneratorfunction(
+                    func
+                ) and not inspect.isasyncgenfunction(func):
+                    msg = "Only generator event handlers can set an emit interval."
+                    raise TypeError(msg)
+                setattr(func, EVENT_EMIT_INTERVAL_MARKER, emit_interval)
+            if flush_interval is not None:
+                if flush_interval <= 0:
+                    msg = f"Invalid flush interval {flush_interval!r}, expected a positive number of milliseconds."
+                    raise ValueError(msg)
+                if background is not True:
+                    msg = "Only background event handlers can set a flush interval."
+                    raise TypeError(msg)
+                setattr(func, EVENT_FLUSH_INTERVAL_MARKER, flush_interval)
             if getattr(func, "__name__", "").startswith("_"):
                 msg = "Event handlers cannot be private."
                 raise ValueError(msg)
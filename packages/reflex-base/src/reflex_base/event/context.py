@@ -14,6 +14,7 @@ from reflex_base.utils.format import to_snake_case
 if TYPE_CHECKING:
     from reflex.istate.manager import StateManager
     from reflex_base.event import Event
+    from reflex_base.event.tracing import EventTrace
 
 
 @functools.lru_cache
@@ -103,6 +104,10 @@ class EventContext(BaseContext):
     # event a handler yields resolves against the view that produced it.
     router_data: dict[str, Any] = dataclasses.field(default_factory=dict, repr=False)
 
+    # Records the phases of this context's event when tracing is enabled. Not
+    # inherited by fork(), each chained event gets its own trace.
+    trace: EventTrace | None = dataclasses.field(default=None, repr=False)
+
     def fork(self, token: str | None = None) -> EventContext:
         """Return a new EventContext with the specified fields replaced.
 
@@ -0,0 +1,215 @@
+"""Run synchronous event handlers off the event loop.
+
+A synchronous event handler runs on the event loop, so a handler blocking on
+I/O or crunching data stalls the events of every client of the worker. The
+handlers set to ``@rx.event(executor="thread")``, or every synchronous handler
+when REFLEX_EVENT_HANDLER_EXECUTOR is ``thread``, run on the bounded thread pool
+of ``handler_executor`` instead.
+
+The event keeps the state lock of its client while its handler runs on the
+pool, so the handler has the state to itself like on the event loop. The time
+spent waiting for a free thread is recorded as the ``executor_queue`` span of
+the event trace, and in the ``stats`` of the executor.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import dataclasses
+import functools
+import inspect
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Literal, TypeVar
+
+from reflex_base.event.tracing import span
+
+if TYPE_CHECKING:
+    from reflex_base.event import EventHandler
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+# The fewest threads of a pool sized from the number of backend workers.
+MIN_HANDLER_THREADS = 2
+
+
+def _default_max_workers() -> int:
+    """Share the thread budget of the host between the backend workers.
+
+    Returns:
+        The number of threads of the pool of each worker.
+    """
+    from reflex.utils.processes import get_num_workers
+
+    budget = (os.cpu_count() or 1) * 2 + 1
+    return max(MIN_HANDLER_THREADS, budget // get_num_workers())
+
+
+@dataclasses.dataclass
+class ExecutorStats:
+    """Counters describing the handler thread pool."""
+
+    # The number of handler calls submitted to the pool.
+    submitted: int = 0
+
+    # The number of submitted calls waiting for a free thread.
+    queue_depth: int = 0
+
+    # The highest queue depth observed.
+    max_queue_depth: int = 0
+
+    # The time calls waited for a free thread (s), in total and at most.
+    queue_time: float = 0.0
+    max_queue_time: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summarize the counters.
+
+        Returns:
+            The counters, with the mean and max queue times in milliseconds.
+        """
+        return {
+            "submitted": self.submitted,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "mean_queue_ms": (
+                self.queue_time / self.submitted * 1000 if self.submitted else 0.0
+            ),
+            "max_queue_ms": self.max_queue_time * 1000,
+        }
+
+
+@dataclasses.dataclass
+class HandlerExecutor:
+    """Decide where synchronous event handlers run, and run them there."""
+
+    # Where synchronous handlers without an executor of their own run.
+    default: Literal["loop", "thread"] = "loop"
+
+    # The number of threads of the pool, sized from the number of backend workers when 0.
+    max_workers: int = 0
+
+    stats: ExecutorStats = dataclasses.field(default_factory=ExecutorStats)
+
+    _pool: ThreadPoolExecutor | None = dataclasses.field(default=None, init=False)
+
+    # Guards the stats updated from the pool threads.
+    _lock: threading.Lock = dataclasses.field(
+        default_factory=threading.Lock, init=False
+    )
+
+    def configure_from_environment(self):
+        """Apply the REFLEX_EVENT_HANDLER_* environment variables that are set."""
+        from reflex_base.environment import environment
+
+        if environment.REFLEX_EVENT_HANDLER_EXECUTOR.is_set():
+            self.default = environment.REFLEX_EVENT_HANDLER_EXECUTOR.get()
+        if environment.REFLEX_EVENT_HANDLER_THREADS.is_set():
+            self.max_workers = environment.REFLEX_EVENT_HANDLER_THREADS.get()
+
+    def offloads(self, handler: EventHandler) -> bool:
+        """Check whether a handler runs on the thread pool.
+
+        Args:
+            handler: The event handler.
+
+        Returns:
+            Whether the handler is synchronous and set to run on a thread.
+        """
+        return (
+            (handler.executor or self.default) == "thread"
+            and not inspect.iscoroutinefunction(handler.fn)
+            and not inspect.isasyncgenfunction(handler.fn)
+        )
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            if not self.max_workers:
+                self.max_workers = _default_max_workers()
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="EventHandler"
+            )
+        return self._pool
+
+    def _started(self, submitted_at: float):
+        """Record that a submitted call got a thread.
+
+        Args:
+            submitted_at: The perf counter value the call was submitted at.
+        """
+        waited = time.perf_counter() - submitted_at
+        with self._lock:
+            stats = self.stats
+            stats.queue_depth -= 1
+            stats.queue_time += waited
+            stats.max_queue_time = max(stats.max_queue_time, waited)
+
+    def _run_in_thread(
+        self, submitted_at: float, fn: Callable[..., _T], *args: Any, **kwargs: Any
+    ) -> _T:
+        self._started(submitted_at)
+        # The handler span is opened by the caller, around the whole handler.
+        return fn(*args, **kwargs)
+
+    async def run(self, fn: Callable[..., _T], /, *args: Any, **kwargs: Any) -> _T:
+        """Call a function on the thread pool, in the context of the caller.
+
+        If the calling task is cancelled, the call still runs to completion
+        before the cancellation propagates, so it never outlives the state lock
+        of the event.
+
+        Args:
+            fn: The function to call.
+            *args: The positional arguments of the call.
+            **kwargs: The keyword arguments of the call.
+
+        Returns:
+            The return value of the function.
+        """
+        pool = self._get_pool()
+        with span("executor_queue"):
+            with self._lock:
+                stats = self.stats
+                stats.submitted += 1
+                stats.queue_depth += 1
+                if stats.queue_depth > stats.max_queue_depth:
+                    stats.max_queue_depth = stats.queue_depth
+                    logger.debug(
+                        f"Event handler queue depth reached {stats.max_queue_depth} "
+                        f"with {self.max_workers} threads"
+                    )
+            call = functools.partial(
+                self._run_in_thread, time.perf_counter(), fn, *args, **kwargs
+            )
+            future = asyncio.get_running_loop().run_in_executor(
+                pool, contextvars.copy_context().run, call
+            )
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                await asyncio.wait([future])
+                raise
+
+    def close(self):
+        """Shut the thread pool down, waiting for running handlers."""
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+
+# The executor of the synchronous event handlers of this process.
+handler_executor = HandlerExecutor()
+
+
+__all__ = [
+    "ExecutorStats",
+    "HandlerExecutor",
+    "handler_executor",
+]
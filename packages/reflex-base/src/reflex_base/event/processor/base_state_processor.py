@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import dataclasses
 import functools
 import inspect
 import logging
+import time
 import warnings
-from collections.abc import Mapping, Sequence
+from collections.abc import Generator, Mapping, Sequence
 from enum import Enum
 from importlib.util import find_spec
 from typing import TYPE_CHECKING, Any
@@ -17,7 +19,9 @@ from reflex.istate.manager.token import BaseStateToken
 from reflex.istate.proxy import StateProxy
 from reflex.utils import types
 from reflex_base.event.context import EventContext
+from reflex_base.event.executor import handler_executor
 from reflex_base.event.processor.event_processor import EventProcessor, EventQueueEntry
+from reflex_base.event.tracing import add_to_attribute, span
 from reflex_base.registry import RegisteredEventHandler
 from reflex_base.utils.format import format_event_handler
 
@@ -215,7 +219,8 @@ async def chain_updates(
     if root_state is not None:
         # Emit deltas first, so any frontend events are processed with the latest state.
         try:
-            delta = await root_state._get_resolved_delta()
+            with span("delta"):
+                delta = await root_state._get_resolved_delta()
             if delta:
                 await ctx.emit_delta(delta)
         finally:
@@ -228,6 +233,144 @@ async def chain_updates(
         await _route_events(ctx, fixed_events)
 
 
+async def _emit_dirty_delta(root_state: BaseState) -> None:
+    """Emit the changes made since the last delta, while the handler is suspended.
+
+    The delta is taken and the state cleaned without awaiting in between, so the
+    changes the handler makes while the delta is sent are kept for the next one.
+
+    Args:
+        root_state: The root state of the app.
+    """
+    from reflex.state import _resolve_delta
+
+    delta = root_state.get_delta()
+    root_state._clean()
+    if delta:
+        await EventContext.get().emit_delta(await _resolve_delta(delta))
+
+
+@dataclasses.dataclass(slots=True)
+class _EmitThrottle:
+    """Merge the deltas of the yields of a generator handler within an interval.
+
+    A merged yield schedules a flush at the end of the interval, so its changes
+    reach the client even when the handler does not yield again for a while.
+    """
+
+    # The fewest seconds between two emitted deltas.
+    interval: float
+
+    # The root state flushed at the end of the interval, None when the handler
+    # runs on a thread and the state must not be read while it does.
+    root_state: BaseState | None = None
+
+    # The monotonic time the last delta was emitted at.
+    last_emit: float = -float("inf")
+
+    # The number of yields merged into the next delta.
+    coalesced: int = 0
+
+    # The flush scheduled by a merged yield.
+    _timer: asyncio.Task | None = None
+
+    # Whether the scheduled flush is emitting its delta.
+    _flushing: bool = False
+
+    async def should_emit(self, events: Any) -> bool:
+        """Check whether a yield emits its delta, or merges it into the next one.
+
+        A yield with events always emits, for the events to see the latest state.
+
+        Args:
+            events: The events yielded.
+
+        Returns:
+            Whether to emit the delta now.
+        """
+        now = time.monotonic()
+        if events is None and now - self.last_emit < self.interval:
+            # The changes stay dirty, and are part of the next delta.
+            add_to_attribute("coalesced_emits", 1)
+            self.coalesced += 1
+            if self.root_state is not None and (
+                self._timer is None or self._timer.done()
+            ):
+                await self._settle()
+                self._timer = asyncio.create_task(
+                    self._flush_later(
+                        self.root_state, self.last_emit + self.interval - now
+                    )
+                )
+            return False
+        await self.cancel()
+        self.last_emit = now
+        return True
+
+    def _merged(self):
+        """Log the yields merged into the delta being emitted."""
+        if self.coalesced:
+            logger.debug(f"Yields merged into one delta: {self.coalesced}")
+            self.coalesced = 0
+
+    async def _flush_later(self, root_state: BaseState, delay: float):
+        """Emit the merged changes at the end of the interval.
+
+        Args:
+            root_state: The root state of the app.
+            delay: The seconds left in the interval.
+        """
+        await asyncio.sleep(delay)
+        self._flushing = True
+        self.last_emit = time.monotonic()
+        self._merged()
+        try:
+            await _emit_dirty_delta(root_state)
+        finally:
+            self._flushing = False
+
+    async def _settle(self):
+        """Drop the scheduled flush, or wait for it if it is already emitting.
+
+        Raises:
+            Exception: The error of the scheduled flush, if it failed.
+        """
+        timer, self._timer = self._timer, None
+        if timer is None:
+            return
+        if not self._flushing:
+            timer.cancel()
+        await asyncio.wait([timer])
+        if not timer.cancelled() and (exc := timer.exception()) is not None:
+            raise exc
+
+    async def cancel(self):
+        """Settle the scheduled flush before the handler emits a delta.
+
+        The flush is dropped, or awaited if it is already emitting, so the
+        deltas reach the client in order.
+        """
+        await self._settle()
+        self._merged()
+
+
+def _advance(events: Generator) -> tuple[bool, Any]:
+    """Run a generator handler up to its next yield.
+
+    Args:
+        events: The generator returned by the handler.
+
+    Returns:
+        Whether the generator returned, and the value it yielded or returned.
+    """
+    try:
+        return False, next(events)
+    except StopIteration as si:
+        # the "return" value of the generator is not available
+        # in the loop, we must catch StopIteration to access it
+        return True, si.value
+
+
 async def process_event(
     handler: EventHandler,
     payload: dict,
@@ -259,38 +402,70 @@ async def process_event(
             f"Error transforming event payload for handler {handler_name}: {ex}"
         )
 
-    # Handle async functions.
-    if inspect.iscoroutinefunction(fn.func):
-        events = await fn(**payload)
-
-    # Handle regular functions.
-    else:
-        events = fn(**payload)
-    # Handle async generators.
-    if inspect.isasyncgen(events):
-        async for event in events:
-            await chain_updates(event, root_state=root_state, handler_name=handler_name)
-        await chain_updates(None, root_state=root_state, handler_name=handler_name)
-
-    # Handle regular generators.
-    elif inspect.isgenerator(events):
-        try:
-            while True:
+    offload = handler_executor.offloads(handler)
+    throttle = (
+        _EmitThrottle(
+            interval=emit_interval / 1000,
+            root_state=None if offload else root_state,
+        )
+        if (emit_interval := handler.emit_interval) is not None
+        else None
+    )
+
+    try:
+        with span("handler"):
+            # Handle async functions.
+            if inspect.iscoroutinefunction(fn.func):
+                events = await fn(**payload)
+
+            # Handle regular functions on the thread pool.
+            elif offload:
+                events = await handler_executor.run(fn, **payload)
+
+            # Handle regular functions.
+            else:
+                events = fn(**payload)
+            # Handle async generators.
+            if inspect.isasyncgen(events):
+                async for event in events:
+                    if throttle is None or await throttle.should_emit(event):
+                        await chain_updates(
+                            event, root_state=root_state, handler_name=handler_name
+                        )
+                if throttle is not None:
+                    await throttle.cancel()
                 await chain_updates(
-                    next(events), root_state=root_state, handler_name=handler_name
+                    None, root_state=root_state, handler_name=handler_name
                 )
-        except StopIteration as si:
-            # the "return" value of the generator is not available
-            # in the loop, we must catch StopIteration to access it
-            if si.value is not None:
+
+            # Handle regular generators.
+            elif inspect.isgenerator(events):
+                returned = False
+                while not returned:
+                    if offload:
+                        returned, value = await handler_executor.run(_advance, events)
+                    else:
+                        returned, value = _advance(events)
+                    if (not returned or value is not None) and (
+                        throttle is None or await throttle.should_emit(value)
+                    ):
+                        await chain_updates(
+                            value, root_state=root_state, handler_name=handler_name
+                        )
+                if throttle is not None:
+                    await throttle.cancel()
                 await chain_updates(
-                    si.value, root_state=root_state, handler_name=handler_name
+                    None, root_state=root_state, handler_name=handler_name
                 )
-        await chain_updates(None, root_state=root_state, handler_name=handler_name)
 
-    # Handle regular event chains.
-    else:
-        await chain_updates(events, root_state=root_state, handler_name=handler_name)
+            # Handle regular event chains.
+            else:
+                await chain_updates(
+                    events, root_state=root_state, handler_name=handler_name
+                )
+    finally:
+        if throttle is not None:
+            await throttle.cancel()
 
 
 class BaseStateEventProcessor(EventProcessor):
@@ -396,12 +571,18 @@ class BaseStateEventProcessor(EventProcessor):
                 )
                 return
         # Otherwise drop the state lock and start processing the background task with a proxy state.
-        await process_event(
-            handler=registered_handler.handler,
-            state=StateProxy(substate),
-            payload=event.payload,
-            root_state=root_state,
+        state_proxy = StateProxy(
+            substate, flush_interval=registered_handler.handler.flush_interval
         )
+        try:
+            await process_event(
+                handler=registered_handler.handler,
+                state=state_proxy,
+                payload=event.payload,
+                root_state=root_state,
+            )
+        finally:
+            await state_proxy._flush()
 
     async def _handle_backend_exception(
         self, ex: Exception, ev_ctx: EventContext | None = None
@@ -22,6 +22,8 @@ from reflex.istate.manager import StateManager
 from reflex_base.event.context import EventContext
 from reflex_base.event.processor.future import EventFuture
 from reflex_base.event.processor.timeout import DrainTimeoutManager
+from reflex_base.event.profiling import profiler
+from reflex_base.event.tracing import tracer
 from reflex_base.registry import RegisteredEventHandler, RegistrationContext
 
 logger = logging.getLogger(__name__)
@@ -134,6 +136,7 @@ class EventProcessor:
         *,
         state_manager: StateManager | None = None,
         event_namespace: EventNamespace | None = None,
+        event_router: Callable[..., Coroutine[Any, Any, bool]] | None = None,
     ) -> Self:
         """Set up the event processor.
 
@@ -144,6 +147,9 @@ class EventProcessor:
         Args:
             state_manager: The state manager to use for processing events.
             event_namespace: The event namespace to use for processing events.
+            event_router: Called with a token and the events enqueued for it from
+                an event context; returning True means the events were handed to
+                another instance and are not processed here.
 
         Returns:
             The event processor instance.
@@ -196,11 +202,32 @@ class EventProcessor:
             # For testing use cases, default to a new in-memory state manager if one is not provided.
             state_manager = StateManagerMemory()
 
+        enqueue_impl = self.enqueue_many
+        if event_router is not None:
+
+            async def enqueue_routed(
+                token: str, *events: Event
+            ) -> Sequence[EventFuture]:
+                """Enqueue events locally unless the router processes them elsewhere.
+
+                Args:
+                    token: The client token associated with the events.
+                    events: The events to enqueue.
+
+                Returns:
+                    The futures of locally enqueued events.
+                """
+                if await event_router(token, *events):
+                    return []
+                return await self.enqueue_many(token, *events)
+
+            enqueue_impl = enqueue_routed
+
         self._root_context = EventContext(
             token="",
             parent_txid=None,
             state_manager=state_manager,
-            enqueue_impl=self.enqueue_many,
+            enqueue_impl=enqueue_impl,
             emit_delta_impl=emit_delta_impl,
             emit_event_impl=emit_event_impl,
         )
@@ -397,6 +424,13 @@ class EventProcessor:
             # Bound before the entry exists, so entry.ctx is what the handler,
             # the task metadata, and every event it yields all read.
             ev_ctx = dataclasses.replace(ev_ctx, router_data=event.router_data)
+        if tracer.enabled:
+            ev_ctx = dataclasses.replace(
+                ev_ctx,
+                trace=tracer.start_trace(
+                    event.name, token, ev_ctx.txid, ev_ctx.parent_txid
+                ),
+            )
         queue = self._ensure_queue_task()
         txid = ev_ctx.txid
         parent_future = (
@@ -470,12 +504,13 @@ class EventProcessor:
                 return
             await deltas.put(delta)
 
+        # Fork so each stream gets its own txid, concurrent streams must not
+        # share (and overwrite) the tracked future of the root context.
         task_future = await self.enqueue(
             token,
             event,
             ev_ctx=dataclasses.replace(
-                self._root_context,
-                token=token,
+                self._root_context.fork(token=token),
                 emit_delta_impl=_emit_delta_impl,
             ),
         )
@@ -577,7 +612,13 @@ class EventProcessor:
         """
         # Set up the event context for this task.
         EventContext.set(entry.ctx)
-        await self._execute_event(entry=entry, registered_handler=registered_handler)
+        with (
+            tracer.activate(entry.ctx.trace),
+            profiler.profile(entry.event.name),
+        ):
+            await self._execute_event(
+                entry=entry, registered_handler=registered_handler
+            )
 
     def _create_event_task(
         self,
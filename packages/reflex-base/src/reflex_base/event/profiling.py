@@ -0,0 +1,433 @@
+"""Sampling profiler for slow event handlers.
+
+When enabled on ``profiler``, a background thread samples the stack of every
+profiled event at a fixed interval. An event is profiled when it runs for
+longer than a threshold, or once every N events. The samples are aggregated by
+handler name and can be dumped as folded stacks, the input format of
+flamegraph.pl, speedscope and inferno.
+
+Samples taken while an event awaits are rebuilt from its chain of awaited
+coroutines and end with an ``<await>`` frame, so the profiles account for
+wall-clock time rather than only the time spent on the CPU.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import dataclasses
+import logging
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, nullcontext
+from types import CodeType, FrameType, TracebackType
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# The last frame of samples taken while the event was awaiting.
+AWAIT_FRAME = "<await>"
+
+# The frame samples are counted under once a handler has too many distinct stacks.
+TRUNCATED_FRAME = "<truncated>"
+
+# Sampled stacks are cut to this many frames from the event's own frame.
+MAX_STACK_DEPTH = 128
+
+# The number of distinct stacks kept per handler.
+MAX_STACKS_PER_HANDLER = 5000
+
+_frame_labels: dict[CodeType, str] = {}
+
+
+def _frame_label(frame: FrameType) -> str:
+    """Get the label of a frame in a folded stack.
+
+    Args:
+        frame: The frame.
+
+    Returns:
+        The qualified name of the function with its module and first line.
+    """
+    code = frame.f_code
+    if (label := _frame_labels.get(code)) is None:
+        name = getattr(code, "co_qualname", code.co_name)
+        module = frame.f_globals.get("__name__", code.co_filename)
+        # Semicolons separate the frames of folded stacks.
+        label = _frame_labels[code] = (
+            f"{name} ({module}:{code.co_firstlineno})".replace(";", ",")
+        )
+    return label
+
+
+def _await_chain(task: asyncio.Task) -> list[FrameType]:
+    """Get the frames of the coroutines awaited by a suspended task.
+
+    Args:
+        task: The task.
+
+    Returns:
+        The frames, outermost first.
+    """
+    frames = []
+    awaitable: Any = task.get_coro()
+    while awaitable is not None and len(frames) < MAX_STACK_DEPTH:
+        frame = getattr(awaitable, "cr_frame", None) or getattr(
+            awaitable, "gi_frame", None
+        )
+        if frame is None:
+            break
+        frames.append(frame)
+        awaitable = getattr(awaitable, "cr_await", None) or getattr(
+            awaitable, "gi_yieldfrom", None
+        )
+    return frames
+
+
+@dataclasses.dataclass(eq=False, slots=True)
+class _ActiveProfile:
+    """The samples of an event being profiled."""
+
+    handler: str
+
+    # The frame running the event, where sampled stacks start.
+    frame: FrameType
+
+    # The thread running the event.
+    thread_id: int
+
+    # The task running the event, to sample it while it awaits.
+    task: asyncio.Task | None
+
+    # Whether the event is kept regardless of its duration.
+    sampled: bool
+
+    start: float = dataclasses.field(default_factory=time.perf_counter)
+
+    samples: collections.Counter[tuple[str, ...]] = dataclasses.field(
+        default_factory=collections.Counter
+    )
+
+
+@dataclasses.dataclass
+class HandlerProfile:
+    """The aggregated profile of an event handler."""
+
+    handler: str
+
+    # The number of profiled events.
+    events: int = 0
+
+    # The total and maximum duration of the profiled events (s).
+    total_duration: float = 0.0
+    max_duration: float = 0.0
+
+    # The number of samples per stack, outermost frame first.
+    stacks: collections.Counter[tuple[str, ...]] = dataclasses.field(
+        default_factory=collections.Counter
+    )
+
+    def add(self, duration: float, samples: collections.Counter[tuple[str, ...]]):
+        """Add a profiled event.
+
+        Args:
+            duration: How long the event took (s).
+            samples: The number of samples per stack.
+        """
+        self.events += 1
+        self.total_duration += duration
+        self.max_duration = max(self.max_duration, duration)
+        for stack, count in samples.items():
+            if stack not in self.stacks and len(self.stacks) >= MAX_STACKS_PER_HANDLER:
+                stack = (TRUNCATED_FRAME,)
+            self.stacks[stack] += count
+
+    def folded(self) -> Iterator[str]:
+        """Get the profile as folded stacks, rooted at the handler name.
+
+        Yields:
+            A ``frame;frame;frame count`` line per stack.
+        """
+        for stack, count in self.stacks.most_common():
+            yield f"{';'.join((self.handler, *stack))} {count}"
+
+    def to_dict(self, top: int = 10) -> dict[str, Any]:
+        """Summarize the profile.
+
+        Args:
+            top: The number of hottest frames to include.
+
+        Returns:
+            The event count, mean and max duration, sample count and the frames
+            with the most samples at the top of the stack, or awaiting.
+        """
+        leaves: collections.Counter[str] = collections.Counter()
+        for stack, count in self.stacks.items():
+            leaf = " ".join(stack[-2:]) if stack[-1:] == (AWAIT_FRAME,) else stack[-1]
+            leaves[leaf] += count
+        return {
+            "events": self.events,
+            "mean_ms": self.total_duration / self.events * 1000 if self.events else 0,
+            "max_ms": self.max_duration * 1000,
+            "samples": sum(self.stacks.values()),
+            "hottest": [
+                {"frame": frame, "samples": count}
+                for frame, count in leaves.most_common(top)
+            ],
+        }
+
+
+class _ProfileContext(AbstractContextManager):
+    """Profile the frame entering the context."""
+
+    __slots__ = ("_active", "_handler", "_profiler")
+
+    def __init__(self, profiler: EventProfiler, handler: str):
+        self._profiler = profiler
+        self._handler = handler
+        self._active = None
+
+    def __enter__(self):
+        self._active = self._profiler._start(self._handler, sys._getframe(1))
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if self._active is not None:
+            self._profiler._finish(self._active)
+
+
+@dataclasses.dataclass
+class EventProfiler:
+    """Profile event handlers that are slow, or a sample of all of them."""
+
+    # Profile events taking at least this long (s). Disabled when 0.
+    threshold: float = 0.0
+
+    # Profile one in this many events. Disabled when 0.
+    sample_rate: int = 0
+
+    # The time between two stack samples (s).
+    interval: float = 0.005
+
+    # The aggregated profiles by handler name.
+    profiles: dict[str, HandlerProfile] = dataclasses.field(default_factory=dict)
+
+    _active: set[_ActiveProfile] = dataclasses.field(default_factory=set)
+    _lock: threading.Lock = dataclasses.field(default_factory=threading.Lock)
+    _wakeup: threading.Event = dataclasses.field(default_factory=threading.Event)
+    _sampler: threading.Thread | None = None
+    _closed: bool = False
+    _event_count: int = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any event is profiled.
+
+        Returns:
+            True when a threshold or a sample rate is set.
+        """
+        return self.threshold > 0 or self.sample_rate > 0
+
+    def configure_from_environment(self):
+        """Apply the REFLEX_EVENT_PROFILE_* environment variables that are set."""
+        from reflex_base.environment import environment
+
+        if environment.REFLEX_EVENT_PROFILE_THRESHOLD.is_set():
+            self.threshold = environment.REFLEX_EVENT_PROFILE_THRESHOLD.get() / 1000
+        if environment.REFLEX_EVENT_PROFILE_SAMPLE_RATE.is_set():
+            self.sample_rate = environment.REFLEX_EVENT_PROFILE_SAMPLE_RATE.get()
+        if environment.REFLEX_EVENT_PROFILE_INTERVAL.is_set():
+            self.interval = environment.REFLEX_EVENT_PROFILE_INTERVAL.get() / 1000
+
+    def profile(self, handler: str) -> AbstractContextManager[None]:
+        """Profile the frame entering the returned context.
+
+        With a threshold, every event is sampled while it runs and the samples
+        are dropped if it ends early enough.
+
+        Args:
+            handler: The name of the event handler the profile is aggregated under.
+
+        Returns:
+            The context manager.
+        """
+        if not self.enabled:
+            return nullcontext()
+        return _ProfileContext(self, handler)
+
+    def _start(self, handler: str, frame: FrameType) -> _ActiveProfile | None:
+        """Start sampling an event.
+
+        Args:
+            handler: The name of the event handler.
+            frame: The frame running the event.
+
+        Returns:
+            The active profile, or None if the event is not profiled.
+        """
+        self._event_count += 1
+        sampled = self.sample_rate > 0 and self._event_count % self.sample_rate == 0
+        if not sampled and self.threshold <= 0:
+            return None
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        active = _ActiveProfile(
+            handler=handler,
+            frame=frame,
+            thread_id=threading.get_ident(),
+            task=task,
+            sampled=sampled,
+        )
+        with self._lock:
+            self._active.add(active)
+            self._wakeup.set()
+            if self._sampler is None:
+                self._closed = False
+                self._sampler = threading.Thread(
+                    target=self._run_sampler, name="reflex-event-profiler", daemon=True
+                )
+                self._sampler.start()
+        return active
+
+    def _finish(self, active: _ActiveProfile):
+        """Stop sampling an event, and keep its samples if it is profiled.
+
+        Args:
+            active: The active profile of the event.
+        """
+        duration = time.perf_counter() - active.start
+        with self._lock:
+            self._active.discard(active)
+            if not self._active:
+                self._wakeup.clear()
+        if not active.sampled and duration < self.threshold:
+            return
+        profile = self.profiles.get(active.handler)
+        if profile is None:
+            profile = self.profiles[active.handler] = HandlerProfile(active.handler)
+        profile.add(duration, active.samples)
+
+    def _run_sampler(self):
+        """Sample the active events until the profiler is closed."""
+        while True:
+            self._wakeup.wait()
+            if self._closed:
+                return
+            time.sleep(self.interval)
+            try:
+                self._sample()
+            except Exception:
+                logger.exception("Error sampling event handler stacks")
+
+    def _sample(self):
+        """Record the current stack of every active event."""
+        thread_frames = sys._current_frames()
+        # The frames on the stack of each thread, innermost first.
+        stacks: dict[int, list[FrameType]] = {}
+        with self._lock:
+            for active in self._active:
+                stack = stacks.get(active.thread_id)
+                if stack is None:
+                    stack = stacks[active.thread_id] = []
+                    frame = thread_frames.get(active.thread_id)
+                    while frame is not None:
+                        stack.append(frame)
+                        frame = frame.f_back
+                active.samples[self._stack_of(active, stack)] += 1
+
+    def _stack_of(
+        self, active: _ActiveProfile, thread_stack: list[FrameType]
+    ) -> tuple[str, ...]:
+        """Get the stack of an event from its thread, or its awaited coroutines.
+
+        Args:
+            active: The active profile of the event.
+            thread_stack: The frames on the stack of its thread, innermost first.
+
+        Returns:
+            The frame labels from the frame of the event outwards in.
+        """
+        for depth, frame in enumerate(thread_stack):
+            if frame is active.frame:
+                frames = thread_stack[depth::-1]
+                return tuple(_frame_label(f) for f in frames[:MAX_STACK_DEPTH])
+        frames = _await_chain(active.task) if active.task is not None else []
+        for depth, frame in enumerate(frames):
+            if frame is active.frame:
+                frames = frames[depth:]
+                break
+        else:
+            frames = [active.frame]
+        return (*(_frame_label(f) for f in frames), AWAIT_FRAME)
+
+    def folded(self, handler: str | None = None) -> str:
+        """Dump the profiles as folded stacks, for flamegraph tools.
+
+        Args:
+            handler: Only dump the profile of this handler.
+
+        Returns:
+            A ``handler;frame;frame count`` line per stack.
+        """
+        return "".join(
+            f"{line}\n"
+            for profile in self.profiles.values()
+            if handler is None or profile.handler == handler
+            for line in profile.folded()
+        )
+
+    def summary(self, top: int = 10) -> dict[str, Any]:
+        """Summarize the profiles, the handlers with the most samples first.
+
+        Args:
+            top: The number of hottest frames to include per handler.
+
+        Returns:
+            The profiler settings and a summary per handler.
+        """
+        profiles = sorted(
+            self.profiles.values(),
+            key=lambda profile: sum(profile.stacks.values()),
+            reverse=True,
+        )
+        return {
+            "threshold_ms": self.threshold * 1000,
+            "sample_rate": self.sample_rate,
+            "interval_ms": self.interval * 1000,
+            "handlers": {
+                profile.handler: profile.to_dict(top=top) for profile in profiles
+            },
+        }
+
+    def reset(self):
+        """Drop the aggregated profiles."""
+        self.profiles.clear()
+
+    def close(self):
+        """Stop the sampler thread."""
+        with self._lock:
+            self._closed = True
+            self._wakeup.set()
+            sampler, self._sampler = self._sampler, None
+        if sampler is not None:
+            sampler.join()
+
+
+# The profiler of the event processor.
+profiler = EventProfiler()
+
+
+__all__ = [
+    "AWAIT_FRAME",
+    "EventProfiler",
+    "HandlerProfile",
+    "profiler",
+]
@@ -0,0 +1,689 @@
+"""Per-event tracing spans across the event pipeline.
+
+When at least one exporter is registered on ``tracer``, every event queued on
+the event processor records an ``EventTrace`` with a span for each phase it
+goes through:
+
+- ``receive``: parsing the websocket message in ``EventNamespace.on_event``.
+- ``queue``: waiting in the event queue, including behind earlier events of
+  the same client.
+- ``lock_wait``: waiting for the state lock of the client.
+- ``state_load`` / ``state_save``: reading and writing the state store.
+- ``handler``: running the event handler.
+- ``delta``: computing the delta of dirty vars.
+- ``emit`` / ``serialize``: sending the update, and encoding it as JSON.
+
+Spans nest (``delta`` runs within ``handler``), the phase durations of a trace
+exclude the time spent in nested spans so they add up to the event's latency.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import dataclasses
+import hashlib
+import logging
+import math
+import time
+from collections.abc import AsyncIterator, Iterator, Sequence
+from contextlib import (
+    AbstractAsyncContextManager,
+    AbstractContextManager,
+    asynccontextmanager,
+    contextmanager,
+    nullcontext,
+)
+from contextvars import ContextVar
+from typing import Any, Protocol
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass(slots=True)
+class Span:
+    """A timed phase of an event."""
+
+    # The phase name.
+    name: str
+
+    # When the span started (s), relative to the start of the trace.
+    start: float
+
+    # How long the span took (s), including nested spans.
+    duration: float = 0.0
+
+    # How long nested spans took (s).
+    child_duration: float = 0.0
+
+    # The index of the enclosing span in the trace, if any.
+    parent: int | None = None
+
+    @property
+    def exclusive_duration(self) -> float:
+        """How long the span took, excluding nested spans.
+
+        Returns:
+            The duration in seconds.
+        """
+        return max(self.duration - self.child_duration, 0.0)
+
+
+@dataclasses.dataclass(slots=True)
+class EventTrace:
+    """The spans recorded while processing one event."""
+
+    # The name of the event handler.
+    event_name: str
+
+    # A hash of the client token, so traces do not leak session tokens.
+    token_hash: str
+
+    # The transaction id of the event.
+    txid: str
+
+    # The transaction id of the event that queued this one, if any.
+    parent_txid: str | None = None
+
+    # The wall clock time (ns since the epoch) the trace started.
+    start_time_ns: int = dataclasses.field(default_factory=time.time_ns)
+
+    # How long the event took (s), from receiving it to the end of the handler.
+    duration: float = 0.0
+
+    # The recorded spans, in start order.
+    spans: list[Span] = dataclasses.field(default_factory=list)
+
+    # Counters such as the size of the state and deltas, in bytes.
+    attributes: dict[str, float] = dataclasses.field(default_factory=dict)
+
+    # The type of the exception raised by the handler, if any.
+    error: str | None = None
+
+    # The perf counter value the trace started at.
+    _perf_start: float = dataclasses.field(default_factory=time.perf_counter)
+
+    # The perf counter value the event was queued at.
+    _queued_at: float = dataclasses.field(default_factory=time.perf_counter)
+
+    # Whether the trace was exported, tasks outliving the event stop recording.
+    _finished: bool = False
+
+    def _elapsed(self) -> float:
+        return time.perf_counter() - self._perf_start
+
+    def add_span(self, name: str, start: float, end: float | None = None) -> Span:
+        """Record a top-level span that was timed outside of a ``span`` block.
+
+        Args:
+            name: The phase name.
+            start: The perf counter value the phase started at.
+            end: The perf counter value the phase ended at, defaults to now.
+
+        Returns:
+            The recorded span.
+        """
+        end = time.perf_counter() if end is None else end
+        recorded = Span(name=name, start=start - self._perf_start, duration=end - start)
+        self.spans.append(recorded)
+        return recorded
+
+    def phase_durations(self) -> dict[str, float]:
+        """Sum the exclusive duration of the spans by phase.
+
+        Time not covered by any span is reported as ``other``.
+
+        Returns:
+            The seconds spent in each phase.
+        """
+        phases: dict[str, float] = {}
+        covered = 0.0
+        for recorded in self.spans:
+            phases[recorded.name] = (
+                phases.get(recorded.name, 0.0) + recorded.exclusive_duration
+            )
+            if recorded.parent is None:
+                covered += recorded.duration
+        phases["other"] = max(self.duration - covered, 0.0)
+        return phases
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the trace to a JSON-serializable dict.
+
+        Returns:
+            The trace, with durations in milliseconds.
+        """
+        return {
+            "event": self.event_name,
+            "token_hash": self.token_hash,
+            "txid": self.txid,
+            "parent_txid": self.parent_txid,
+            "start_time": self.start_time_ns / 1e9,
+            "duration_ms": self.duration * 1000,
+            "error": self.error,
+            "attributes": dict(self.attributes),
+            "phases_ms": {
+                name: duration * 1000
+                for name, duration in self.phase_durations().items()
+            },
+            "spans": [
+                {
+                    "name": recorded.name,
+                    "start_ms": recorded.start * 1000,
+                    "duration_ms": recorded.duration * 1000,
+                    "parent": recorded.parent,
+                }
+                for recorded in self.spans
+            ],
+        }
+
+    def format(self) -> str:
+        """Format the trace as a single log line.
+
+        Returns:
+            The event, its duration and the time spent in each phase.
+        """
+        phases = " ".join(
+            f"{name}={duration * 1000:.1f}ms"
+            for name, duration in self.phase_durations().items()
+            if duration
+        )
+        attributes = " ".join(
+            f"{key}={value}" for key, value in self.attributes.items()
+        )
+        error = f" error={self.error}" if self.error else ""
+        return (
+            f"[trace] {self.event_name} [{self.token_hash}] "
+            f"{self.duration * 1000:.1f}ms: {phases} {attributes}{error}".rstrip()
+        )
+
+
+@dataclasses.dataclass(slots=True)
+class _Scope:
+    """The trace and span that new spans are nested in."""
+
+    trace: EventTrace
+
+    # The index of the enclosing span, or None at the top level of the trace.
+    span: int | None = None
+
+
+# The scope of the event being processed by the current task.
+_current_scope: ContextVar[_Scope | None] = ContextVar(
+    "reflex_event_trace_scope", default=None
+)
+
+# When the websocket message of the event about to be queued was received.
+_received_at: ContextVar[float | None] = ContextVar(
+    "reflex_event_received_at", default=None
+)
+
+_NO_SPAN: AbstractContextManager[Span | None] = nullcontext()
+
+
+class _SpanContext(AbstractContextManager):
+    """Time a block of code as a span of the current trace."""
+
+    __slots__ = ("_index", "_parent", "_reset_token", "name")
+
+    def __init__(self, parent: _Scope, name: str):
+        self._parent = parent
+        self.name = name
+
+    def __enter__(self) -> Span:
+        trace = self._parent.trace
+        recorded = Span(
+            name=self.name, start=trace._elapsed(), parent=self._parent.span
+        )
+        self._index = len(trace.spans)
+        trace.spans.append(recorded)
+        self._reset_token = _current_scope.set(_Scope(trace, self._index))
+        return recorded
+
+    def __exit__(self, *exc_info: object):
+        trace = self._parent.trace
+        recorded = trace.spans[self._index]
+        recorded.duration = trace._elapsed() - recorded.start
+        _current_scope.reset(self._reset_token)
+        if self._parent.span is not None:
+            trace.spans[self._parent.span].child_duration += recorded.duration
+
+
+def span(name: str) -> AbstractContextManager[Span | None]:
+    """Time a block of code as a span of the event being processed.
+
+    This is a no-op outside of a traced event, so it is cheap to leave in hot
+    paths. The block must not span a ``yield`` of a generator.
+
+    Args:
+        name: The phase name.
+
+    Returns:
+        A context manager yielding the span, or None when not tracing.
+    """
+    if (scope := _current_scope.get()) is None or scope.trace._finished:
+        return _NO_SPAN
+    return _SpanContext(scope, name)
+
+
+@asynccontextmanager
+async def _acquire_traced(lock: asyncio.Lock) -> AsyncIterator[None]:
+    with span("lock_wait"):
+        await lock.acquire()
+    try:
+        yield
+    finally:
+        lock.release()
+
+
+def traced_lock(lock: asyncio.Lock) -> AbstractAsyncContextManager[Any]:
+    """Hold a lock, recording the time spent waiting for it as a lock_wait span.
+
+    Args:
+        lock: The lock.
+
+    Returns:
+        An async context manager holding the lock, the lock itself when not tracing.
+    """
+    if (scope := _current_scope.get()) is None or scope.trace._finished:
+        return lock
+    return _acquire_traced(lock)
+
+
+def add_to_attribute(name: str, value: float):
+    """Add to a counter of the event being processed, such as a size in bytes.
+
+    Args:
+        name: The counter name.
+        value: The amount to add.
+    """
+    if (scope := _current_scope.get()) is None or scope.trace._finished:
+        return
+    attributes = scope.trace.attributes
+    attributes[name] = attributes.get(name, 0) + value
+
+
+def current_trace() -> EventTrace | None:
+    """Get the trace of the event being processed.
+
+    Returns:
+        The trace, or None when not tracing.
+    """
+    scope = _current_scope.get()
+    return scope.trace if scope is not None else None
+
+
+def hash_token(token: str) -> str:
+    """Hash a client token for inclusion in traces.
+
+    Args:
+        token: The client token.
+
+    Returns:
+        A short, stable hash of the token.
+    """
+    return hashlib.sha256(token.encode()).hexdigest()[:12]
+
+
+class TraceExporter(Protocol):
+    """Receives the trace of every processed event."""
+
+    def export(self, trace: EventTrace) -> None:
+        """Export a finished trace.
+
+        Args:
+            trace: The trace.
+        """
+        ...
+
+
+@dataclasses.dataclass
+class LoggingTraceExporter:
+    """Log traces of events taking at least a minimum duration."""
+
+    # Only events taking at least this long (s) are logged.
+    min_duration: float = 0.0
+
+    # The level of the log records.
+    level: int = logging.INFO
+
+    def export(self, trace: EventTrace) -> None:
+        """Log a finished trace.
+
+        Args:
+            trace: The trace.
+        """
+        if trace.duration >= self.min_duration:
+            logger.log(self.level, trace.format())
+
+
+def _percentile(sorted_values: Sequence[float], percentile: float) -> float:
+    """Get a percentile of sorted values, using the nearest-rank method.
+
+    Args:
+        sorted_values: The values, in ascending order.
+        percentile: The percentile, between 0 and 100.
+
+    Returns:
+        The percentile.
+    """
+    rank = max(math.ceil(percentile / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+@dataclasses.dataclass
+class InMemoryTraceExporter:
+    """Keep the most recent traces in a ring buffer."""
+
+    # The number of traces kept.
+    max_traces: int = 1000
+
+    _traces: collections.deque[EventTrace] = dataclasses.field(init=False, repr=False)
+
+    def __post_init__(self):
+        """Create the ring buffer."""
+        self._traces = collections.deque(maxlen=self.max_traces)
+
+    def export(self, trace: EventTrace) -> None:
+        """Keep a finished trace.
+
+        Args:
+            trace: The trace.
+        """
+        self._traces.append(trace)
+
+    def traces(self) -> list[EventTrace]:
+        """Get the kept traces.
+
+        Returns:
+            The traces, oldest first.
+        """
+        return list(self._traces)
+
+    def clear(self):
+        """Drop the kept traces."""
+        self._traces.clear()
+
+    def summary(self, traces: Sequence[EventTrace] | None = None) -> dict[str, Any]:
+        """Summarize the latency of each phase over the kept traces.
+
+        Args:
+            traces: The traces to summarize, defaults to all kept traces.
+
+        Returns:
+            The p50, p99 and maximum (ms) of the total duration and of each phase.
+        """
+        traces = self.traces() if traces is None else traces
+        durations: dict[str, list[float]] = {"total": []}
+        for trace in traces:
+            durations["total"].append(trace.duration)
+            for name, duration in trace.phase_durations().items():
+                durations.setdefault(name, []).append(duration)
+        summary: dict[str, Any] = {"count": len(traces), "phases_ms": {}}
+        for name, values in durations.items():
+            if not values:
+                continue
+            # Phases an event skipped took no time in it.
+            values = sorted(values + [0.0] * (len(traces) - len(values)))
+            summary["phases_ms"][name] = {
+                "p50": _percentile(values, 50) * 1000,
+                "p99": _percentile(values, 99) * 1000,
+                "max": values[-1] * 1000,
+            }
+        return summary
+
+    def to_json(self, limit: int | None = None) -> dict[str, Any]:
+        """Get the kept traces and their summary as JSON-serializable data.
+
+        Args:
+            limit: Only include this many of the most recent traces.
+
+        Returns:
+            The summary of all kept traces, and the most recent traces.
+        """
+        traces = self.traces()
+        recent = traces[-limit:] if limit else traces
+        return {
+            "summary": self.summary(traces),
+            "traces": [trace.to_dict() for trace in reversed(recent)],
+        }
+
+
+class OpenTelemetryTraceExporter:
+    """Export traces as OpenTelemetry spans, one span per event with a child per phase."""
+
+    def __init__(self, otel_tracer: Any = None):
+        """Create the exporter.
+
+        Args:
+            otel_tracer: The OpenTelemetry tracer to use, defaults to the tracer
+                of the global tracer provider.
+
+        Raises:
+            ImportError: If opentelemetry-api is not installed.
+        """
+        try:
+            from opentelemetry import (  # pyright: ignore[reportMissingImports]
+                trace as otel_trace,
+            )
+        except ImportError as ie:
+            msg = "Exporting event traces to OpenTelemetry requires `pip install opentelemetry-api`."
+            raise ImportError(msg) from ie
+        self._otel_trace = otel_trace
+        self._tracer = otel_tracer or otel_trace.get_tracer("reflex")
+
+    def export(self, trace: EventTrace) -> None:
+        """Export a finished trace.
+
+        Args:
+            trace: The trace.
+        """
+        start_ns = trace.start_time_ns
+        attributes = {
+            "reflex.event": trace.event_name,
+            "reflex.token_hash": trace.token_hash,
+            "reflex.txid": trace.txid,
+            **{f"reflex.{key}": value for key, value in trace.attributes.items()},
+        }
+        if trace.parent_txid:
+            attributes["reflex.parent_txid"] = trace.parent_txid
+        if trace.error:
+            attributes["reflex.error"] = trace.error
+        root = self._tracer.start_span(
+            f"reflex.event {trace.event_name}",
+            start_time=start_ns,
+            attributes=attributes,
+        )
+        otel_spans = []
+        for recorded in trace.spans:
+            parent = root if recorded.parent is None else otel_spans[recorded.parent]
+            otel_span = self._tracer.start_span(
+                recorded.name,
+                context=self._otel_trace.set_span_in_context(parent),
+                start_time=start_ns + int(recorded.start * 1e9),
+            )
+            otel_span.end(
+                end_time=start_ns + int((recorded.start + recorded.duration) * 1e9)
+            )
+            otel_spans.append(otel_span)
+        root.end(end_time=start_ns + int(trace.duration * 1e9))
+
+
+@dataclasses.dataclass
+class EventTracer:
+    """Records event traces and passes them to the registered exporters."""
+
+    # The exporters receiving finished traces. Tracing is off while empty.
+    exporters: list[TraceExporter] = dataclasses.field(default_factory=list)
+
+    _configured_from_environment: bool = dataclasses.field(default=False, init=False)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether events are traced.
+
+        Returns:
+            True if any exporter is registered.
+        """
+        return bool(self.exporters)
+
+    def add_exporter(self, exporter: TraceExporter) -> TraceExporter:
+        """Register an exporter.
+
+        Args:
+            exporter: The exporter.
+
+        Returns:
+            The exporter.
+        """
+        self.exporters.append(exporter)
+        return exporter
+
+    def remove_exporter(self, exporter: TraceExporter):
+        """Unregister an exporter.
+
+        Args:
+            exporter: The exporter.
+        """
+        if exporter in self.exporters:
+            self.exporters.remove(exporter)
+
+    def memory_exporter(self) -> InMemoryTraceExporter:
+        """Get the registered in-memory exporter, registering one if needed.
+
+        Returns:
+            The in-memory exporter.
+        """
+        from reflex_base.environment import environment
+
+        for exporter in self.exporters:
+            if isinstance(exporter, InMemoryTraceExporter):
+                return exporter
+        exporter = InMemoryTraceExporter(
+            max_traces=environment.REFLEX_EVENT_TRACE_BUFFER_SIZE.get()
+        )
+        self.add_exporter(exporter)
+        return exporter
+
+    def configure_from_environment(self):
+        """Register the exporters named in REFLEX_EVENT_TRACE_EXPORTERS, once."""
+        from reflex_base.environment import environment
+
+        if self._configured_from_environment:
+            return
+        self._configured_from_environment = True
+        for name in environment.REFLEX_EVENT_TRACE_EXPORTERS.get():
+            if name == "memory":
+                self.memory_exporter()
+            elif name == "logging":
+                self.add_exporter(
+                    LoggingTraceExporter(
+                        min_duration=environment.REFLEX_EVENT_TRACE_LOG_THRESHOLD.get()
+                        / 1000
+                    )
+                )
+            elif name == "otel":
+                try:
+                    self.add_exporter(OpenTelemetryTraceExporter())
+                except ImportError as ie:
+                    logger.warning(f"Not exporting event traces: {ie}")
+
+    def start_trace(
+        self, event_name: str, token: str, txid: str, parent_txid: str | None = None
+    ) -> EventTrace | None:
+        """Start the trace of a queued event.
+
+        A receive span is recorded if ``mark_received`` was called in this
+        context since the last trace started.
+
+        Args:
+            event_name: The name of the event handler.
+            token: The client token.
+            txid: The transaction id of the event.
+            parent_txid: The transaction id of the event that queued it.
+
+        Returns:
+            The trace, or None when not tracing.
+        """
+        if not self.exporters:
+            return None
+        trace = EventTrace(
+            event_name=event_name,
+            token_hash=hash_token(token),
+            txid=txid,
+            parent_txid=parent_txid,
+        )
+        if (received_at := _received_at.get()) is not None:
+            _received_at.set(None)
+            # Start the trace when the message arrived.
+            trace.start_time_ns -= int((trace._queued_at - received_at) * 1e9)
+            trace._perf_start = received_at
+            trace.add_span("receive", received_at, trace._queued_at)
+        return trace
+
+    @contextmanager
+    def activate(self, trace: EventTrace | None) -> Iterator[EventTrace | None]:
+        """Record spans in the current context into a trace, then export it.
+
+        The time since the trace started is recorded as the queue span.
+
+        Args:
+            trace: The trace of the event about to run, or None to not trace it.
+
+        Yields:
+            The trace.
+        """
+        if trace is None:
+            yield None
+            return
+        trace.add_span("queue", trace._queued_at)
+        reset_token = _current_scope.set(_Scope(trace))
+        try:
+            yield trace
+        except BaseException as ex:
+            trace.error = type(ex).__name__
+            raise
+        finally:
+            _current_scope.reset(reset_token)
+            trace.duration = trace._elapsed()
+            trace._finished = True
+            self.export(trace)
+
+    def export(self, trace: EventTrace):
+        """Pass a finished trace to every exporter.
+
+        Args:
+            trace: The trace.
+        """
+        for exporter in self.exporters:
+            try:
+                exporter.export(trace)
+            except Exception:  # noqa: PERF203
+                logger.exception(f"Error exporting event trace with {exporter!r}")
+
+
+def mark_received():
+    """Mark that the event about to be queued in this context was just received."""
+    if tracer.enabled:
+        _received_at.set(time.perf_counter())
+
+
+# The tracer of the event processor.
+tracer = EventTracer()
+
+
+__all__ = [
+    "EventTrace",
+    "EventTracer",
+    "InMemoryTraceExporter",
+    "LoggingTraceExporter",
+    "OpenTelemetryTraceExporter",
+    "Span",
+    "TraceExporter",
+    "add_to_attribute",
+    "current_trace",
+    "mark_received",
+    "span",
+    "traced_lock",
+    "tracer",
+]
@@ -0,0 +1,180 @@
+"""Encode DataFrames and NumPy arrays of state updates as binary column buffers.
+
+As JSON, a DataFrame is boxed cell by cell into Python objects and written as
+nested lists of numbers, for every delta sending it. With
+REFLEX_COLUMNAR_TRANSPORT set, the DataFrames and numeric arrays set as state
+vars are sent as the raw bytes of their columns instead, carried as binary
+Socket.IO attachments next to the JSON of the update. The frontend reads the
+buffers as typed arrays and rebuilds the same values the JSON encoding gives,
+so components reading the vars are unaffected.
+
+Columns of other dtypes (strings, objects, datetimes, nullable extension
+types) are sent as JSON lists within the encoded DataFrame.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Mapping
+from typing import Any
+
+# The key marking an encoded value in the JSON of an update.
+COLUMNAR_MARKER = "__columnar__"
+
+# The numpy dtypes read as a typed array by the frontend, by dtype name.
+TYPED_ARRAY_DTYPES = frozenset({
+    "int8",
+    "uint8",
+    "int16",
+    "uint16",
+    "int32",
+    "uint32",
+    "float32",
+    "float64",
+    "bool",
+})
+
+# The largest integer represented exactly by a float64, and so by a JS number.
+_MAX_SAFE_INTEGER = 2**53 - 1
+
+
+def _encode_buffer(array: Any) -> dict[str, Any] | None:
+    """Encode the values of a numpy array as a little-endian buffer.
+
+    64-bit integers are sent as float64 when the values are safe JS numbers.
+
+    Args:
+        array: The numpy array.
+
+    Returns:
+        The dtype and buffer of the values, None if the dtype has no typed array.
+    """
+    import numpy as np
+
+    dtype = array.dtype
+    if dtype.kind in "iu" and dtype.itemsize == 8:
+        if array.size and (
+            array.max() > _MAX_SAFE_INTEGER or array.min() < -_MAX_SAFE_INTEGER
+        ):
+            return None
+        dtype = np.dtype("float64")
+    if dtype.name not in TYPED_ARRAY_DTYPES:
+        return None
+    array = np.ascontiguousarray(array, dtype=dtype.newbyteorder("<"))
+    return {"dtype": dtype.name, "buffer": array.tobytes()}
+
+
+def encode_dataframe(df: Any) -> dict[str, Any]:
+    """Encode a pandas DataFrame column by column.
+
+    Args:
+        df: The dataframe to encode.
+
+    Returns:
+        The column names, row count and the encoded columns.
+    """
+    columns = []
+    for i in range(df.shape[1]):
+        series = df.iloc[:, i]
+        column = None
+        if series.dtype.kind in "biuf":
+            column = _encode_buffer(series.to_numpy())
+        if column is None:
+            column = {
+                "values": [
+                    str(d) if isinstance(d, (list, tuple)) else d
+                    for d in series.tolist()
+                ]
+            }
+        columns.append(column)
+    return {
+        COLUMNAR_MARKER: "dataframe",
+        "columns": df.columns.tolist(),
+        "length": len(df),
+        "data": columns,
+    }
+
+
+def encode_ndarray(array: Any) -> dict[str, Any] | None:
+    """Encode a numeric numpy array.
+
+    Args:
+        array: The array to encode.
+
+    Returns:
+        The shape and buffer of the array, None if its dtype has no typed array.
+    """
+    encoded = _encode_buffer(array)
+    if encoded is None:
+        return None
+    return {COLUMNAR_MARKER: "ndarray", "shape": list(array.shape), **encoded}
+
+
+def encode_value(value: Any) -> Any:
+    """Encode a state var value, if it is a DataFrame or a numeric array.
+
+    pandas and numpy are only looked up if the app already imported them.
+
+    Args:
+        value: The value of the var.
+
+    Returns:
+        The encoded value, or the value itself.
+    """
+    if (pandas := sys.modules.get("pandas")) is not None and isinstance(
+        value, pandas.DataFrame
+    ):
+        return encode_dataframe(value)
+    if (numpy := sys.modules.get("numpy")) is not None and isinstance(
+        value, numpy.ndarray
+    ):
+        encoded = encode_ndarray(value)
+        if encoded is not None:
+            return encoded
+    return value
+
+
+def encode_delta(
+    delta: Mapping[str, Mapping[str, Any]],
+) -> dict[str, dict[str, Any]] | None:
+    """Encode the DataFrames and numeric arrays of a delta.
+
+    Only the values of the vars themselves are encoded, not values nested in
+    other values.
+
+    Args:
+        delta: The delta, by substate and var name.
+
+    Returns:
+        The delta with the values encoded, None if it has no value to encode.
+    """
+    encoded_delta = None
+    for substate, values in delta.items():
+        for name, value in values.items():
+            encoded = encode_value(value)
+            if encoded is value:
+                continue
+            if encoded_delta is None:
+                encoded_delta = {key: dict(vars) for key, vars in delta.items()}
+            encoded_delta[substate][name] = encoded
+    return encoded_delta
+
+
+def attachment_bytes(delta: Mapping[str, Mapping[str, Any]]) -> int:
+    """Count the bytes of the buffers of an encoded delta.
+
+    Args:
+        delta: The delta from encode_delta.
+
+    Returns:
+        The total size of the buffers sent as attachments.
+    """
+    total = 0
+    for values in delta.values():
+        for value in values.values():
+            if not isinstance(value, dict) or COLUMNAR_MARKER not in value:
+                continue
+            for column in value.get("data", (value,)):
+                if "buffer" in column:
+                    total += len(column["buffer"])
+    return total
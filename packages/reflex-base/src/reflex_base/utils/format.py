@@ -6,6 +6,7 @@ import inspect
 import json
 import os
 import re
+import uuid
 from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
@@ -699,6 +700,8 @@ def format_library_name(library_fullname: str | dict[str, Any]) -> str:
 def json_dumps(obj: Any, **kwargs) -> str:
     """Takes an object and returns a jsonified string.
 
+    Values serialized to RawJSON are written as their JSON text, verbatim.
+
     Args:
         obj: The object to be serialized.
         kwargs: Additional keyword arguments to pass to json.dumps.
@@ -709,9 +712,28 @@ def json_dumps(obj: Any, **kwargs) -> str:
     from reflex_base.utils import serializers
 
     kwargs.setdefault("ensure_ascii", False)
-    kwargs.setdefault("default", serializers.serialize)
-
-    return json.dumps(obj, **kwargs)
+    if "default" in kwargs:
+        return json.dumps(obj, **kwargs)
+
+    # The JSON text of RawJSON values, replacing their placeholder strings.
+    fragments: list[str] = []
+    nonce = ""
+
+    def default(value: Any) -> Any:
+        nonlocal nonce
+        serialized = serializers.serialize_raw(value)
+        if not isinstance(serialized, serializers.RawJSON):
+            return serialized
+        nonce = nonce or uuid.uuid4().hex
+        fragments.append(serialized.text)
+        return f"\0{nonce}:{len(fragments) - 1}"
+
+    text = json.dumps(obj, default=default, **kwargs)
+    if not fragments:
+        return text
+    return re.sub(
+        rf'"\\u0000{nonce}:(\d+)"', lambda match: fragments[int(match[1])], text
+    )
 
 
 def collect_form_dict_names(form_dict: dict[str, Any]) -> dict[str, Any]:
@@ -11,7 +11,8 @@ import json
 import logging
 import uuid
 import warnings
-from collections.abc import Callable, Mapping, Sequence
+import weakref
+from collections.abc import Callable, Iterable, Mapping, Sequence
 from datetime import date, datetime, time, timedelta
 from enum import Enum
 from importlib.util import find_spec
@@ -29,7 +30,27 @@ logger = logging.getLogger(__name__)
 SerializedType = str | bool | int | float | list | dict | None
 
 
-Serializer = Callable[[Any], SerializedType]
+@dataclasses.dataclass(frozen=True, slots=True)
+class RawJSON:
+    """JSON text spliced verbatim into the output of format.json_dumps.
+
+    Serializers of types that encode themselves to JSON text return it as
+    RawJSON, so the text is not decoded and encoded again. `serialize` still
+    returns the decoded value.
+    """
+
+    text: str
+
+    def loads(self) -> Any:
+        """Decode the JSON text.
+
+        Returns:
+            The decoded value.
+        """
+        return json.loads(self.text)
+
+
+Serializer = Callable[[Any], SerializedType | RawJSON]
 
 
 SERIALIZERS: dict[type, Serializer] = {}
@@ -165,6 +186,8 @@ def serialize(
 
     # If there is no serializer, return None.
     if serializer is None:
+        if isinstance(value, RawJSON):
+            return (value.loads(), None) if get_type else value.loads()
         if dataclasses.is_dataclass(value) and not isinstance(value, type):
             return {k.name: getattr(value, k.name) for k in dataclasses.fields(value)}
 
@@ -174,6 +197,8 @@ def serialize(
 
     # Serialize the value.
     serialized = serializer(value)
+    if isinstance(serialized, RawJSON):
+        serialized = serialized.loads()
 
     # Return the serialized value and the type.
     if get_type:
@@ -181,6 +206,69 @@ def serialize(
     return serialized
 
 
+def serialize_raw(value: Any) -> SerializedType | RawJSON | None:
+    """Serialize the value, keeping the JSON text of serializers returning RawJSON.
+
+    Args:
+        value: The value to serialize.
+
+    Returns:
+        The serialized value, or None if a serializer is not found.
+    """
+    if isinstance(value, RawJSON):
+        return value
+    serializer = get_serializer(type(value))
+    if serializer is None:
+        return serialize(value)
+    return serializer(value)
+
+
+# The JSON text of objects serialized with json_fragment, by object id.
+_JSON_FRAGMENTS: dict[int, tuple[weakref.ref, RawJSON]] = {}
+
+# The most objects to keep the JSON text of.
+MAX_JSON_FRAGMENTS = 256
+
+
+def json_fragment(value: Any, encode: Callable[[Any], str]) -> RawJSON:
+    """Encode an object to JSON text, reusing the text while the object is unchanged.
+
+    The text is kept until the object is garbage collected or sent as a
+    changed state var, see forget_json_fragments.
+
+    Args:
+        value: The object to encode.
+        encode: The function encoding the object to JSON text.
+
+    Returns:
+        The JSON text of the object.
+    """
+    key = id(value)
+    entry = _JSON_FRAGMENTS.get(key)
+    if entry is not None and entry[0]() is value:
+        return entry[1]
+    fragment = RawJSON(encode(value))
+    try:
+        ref = weakref.ref(value, lambda _: _JSON_FRAGMENTS.pop(key, None))
+    except TypeError:
+        return fragment
+    if len(_JSON_FRAGMENTS) >= MAX_JSON_FRAGMENTS:
+        _JSON_FRAGMENTS.pop(next(iter(_JSON_FRAGMENTS)))
+    _JSON_FRAGMENTS[key] = (ref, fragment)
+    return fragment
+
+
+def forget_json_fragments(values: Iterable[Any]):
+    """Drop the JSON text kept for objects, because they may have changed.
+
+    Args:
+        values: The objects.
+    """
+    if _JSON_FRAGMENTS:
+        for value in values:
+            _JSON_FRAGMENTS.pop(id(value), None)
+
+
 @functools.lru_cache
 def get_serializer(type_: type) -> Serializer | None:
     """Get the serializer for the type.
@@ -420,6 +508,9 @@ with contextlib.suppress(ImportError):
         Returns:
             The dataframe as a list of lists.
         """
+        if all(dtype.kind in "biuf" for dtype in df.dtypes):
+            # Numeric cells are never lists or tuples.
+            return df.to_numpy().tolist()
         return [
             [str(d) if isinstance(d, (list, tuple)) else d for d in data]
             for data in list(df.to_numpy().tolist())
@@ -441,36 +532,55 @@ with contextlib.suppress(ImportError):
         }
 
 
+with contextlib.suppress(ImportError):
+    from numpy import ndarray
+
+    @serializer(to=list)
+    def serialize_ndarray(array: ndarray) -> list:
+        """Serialize a numpy array.
+
+        Args:
+            array: The array to serialize.
+
+        Returns:
+            The array as nested lists.
+        """
+        return array.tolist()
+
+
 with contextlib.suppress(ImportError):
     from plotly.graph_objects import Figure, layout
     from plotly.io import to_json
 
-    @serializer
-    def serialize_figure(figure: Figure) -> dict:
+    @serializer(to=dict)
+    def serialize_figure(figure: Figure) -> RawJSON:
         """Serialize a plotly figure.
 
         Args:
             figure: The figure to serialize.
 
         Returns:
-            The serialized figure.
+            The JSON text of the figure.
         """
-        return json.loads(str(to_json(figure)))
+        return json_fragment(figure, lambda figure: str(to_json(figure)))
 
-    @serializer
-    def serialize_template(template: layout.Template) -> dict:
+    @serializer(to=dict)
+    def serialize_template(template: layout.Template) -> RawJSON:
         """Serialize a plotly template.
 
         Args:
             template: The template to serialize.
 
         Returns:
-            The serialized template.
+            The JSON text of the template data and layout.
         """
-        return {
-            "data": json.loads(str(to_json(template.data))),
-            "layout": json.loads(str(to_json(template.layout))),
-        }
+        return json_fragment(
+            template,
+            lambda template: (
+                f'{{"data":{to_json(template.data)},'
+                f'"layout":{to_json(template.layout)}}}'
+            ),
+        )
 
 
 with contextlib.suppress(ImportError):
@@ -480,21 +590,19 @@ with contextlib.suppress(ImportError):
     from PIL.Image import MIME
     from PIL.Image import Image as Img
 
-    @serializer
-    def serialize_image(image: Img) -> str:
-        """Serialize a plotly figure.
+    def encode_image(image: Img) -> tuple[bytes, str]:
+        """Encode an image in its format, PNG if it has none.
 
         Args:
-            image: The image to serialize.
+            image: The image to encode.
 
         Returns:
-            The serialized image.
+            The encoded image and its mime type.
         """
         buff = io.BytesIO()
         image_format = getattr(image, "format", None) or "PNG"
         image.save(buff, format=image_format)
         image_bytes = buff.getvalue()
-        base64_image = base64.b64encode(image_bytes).decode("utf-8")
         try:
             # Newer method to get the mime type, but does not always work.
             mime_type = image.get_format_mimetype()  # pyright: ignore [reportAttributeAccessIssue]
@@ -508,5 +616,18 @@ with contextlib.suppress(ImportError):
                     f"Unknown mime type for {image} {image_format}. Defaulting to image/png"
                 )
                 mime_type = "image/png"
+        return image_bytes, mime_type
+
+    @serializer
+    def serialize_image(image: Img) -> str:
+        """Serialize an image as a data URI.
+
+        Args:
+            image: The image to serialize.
 
+        Returns:
+            The serialized image.
+        """
+        image_bytes, mime_type = encode_image(image)
+        base64_image = base64.b64encode(image_bytes).decode("utf-8")
         return f"data:{mime_type};base64,{base64_image}"
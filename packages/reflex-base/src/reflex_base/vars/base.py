@@ -13,8 +13,8 @@ import json
 import logging
 import re
 import string
-import uuid
 import warnings
+import weakref
 from abc import ABCMeta
 from collections.abc import Callable, Coroutine, Iterable, Mapping, Sequence
 from dataclasses import _MISSING_TYPE, MISSING
@@ -91,6 +91,7 @@ OTHER_VAR_TYPE = TypeVar("OTHER_VAR_TYPE")
 STRING_T = TypeVar("STRING_T", bound=str)
 LITERAL_STRING_T = TypeVar("LITERAL_STRING_T", bound=LiteralString)
 SEQUENCE_TYPE = TypeVar("SEQUENCE_TYPE", bound=Sequence)
+VAR_CLASS = TypeVar("VAR_CLASS")
 
 warnings.filterwarnings("ignore", message="fields may not start with an underscore")
 
@@ -575,9 +576,92 @@ def can_use_in_object_var(cls: GenericType) -> bool:
     )
 
 
+# Marks a value that cannot be part of the interning key of a var.
+_UNINTERNABLE = object()
+
+# The interned vars, by the key of the arguments they were created with.
+_INTERNED_VARS: weakref.WeakValueDictionary[Any, Any] = weakref.WeakValueDictionary()
+
+
+def _intern_key(value: Any, refs: list[Var]) -> Any:
+    """Get the key of a value for interning the var created with it.
+
+    Vars are keyed by identity, interned vars being unique by structure, and
+    collected in refs for the interned var to keep them, and so their ids,
+    alive. Other values are keyed by value, if they are immutable.
+
+    Args:
+        value: An argument of a var class.
+        refs: The vars of the arguments.
+
+    Returns:
+        The key of the value, or _UNINTERNABLE.
+    """
+    value_type = type(value)
+    if value_type is str:
+        return value
+    if isinstance(value, Var):
+        refs.append(value)
+        return (Var, id(value))
+    if value_type is tuple:
+        keys = [tuple]
+        for item in value:
+            key = _intern_key(item, refs)
+            if key is _UNINTERNABLE:
+                return _UNINTERNABLE
+            keys.append(key)
+        return tuple(keys)
+    if value is None or value_type is int or value_type is bool:
+        return (value_type, value)
+    if value_type is float:
+        # repr tells 0.0 and -0.0 apart.
+        return (float, repr(value))
+    if value_type is VarData:
+        return value
+    if isinstance(value, type) or value_type.__module__ in (
+        "types",
+        "typing",
+        "typing_extensions",
+    ):
+        # Types, generic aliases and unions.
+        return (type, value)
+    return _UNINTERNABLE
+
+
 class MetaclassVar(type):
     """Metaclass for the Var class."""
 
+    def __call__(cls: type[VAR_CLASS], *args: Any, **kwargs: Any) -> VAR_CLASS:
+        """Create a var, or get the interned var created with the same arguments.
+
+        Vars are immutable, so the var classes setting ``_intern_instances``
+        share one instance by structure, along with the JS expression and
+        merged VarData it caches. Interned vars are only weakly referenced.
+
+        Args:
+            *args: The positional arguments of the var.
+            **kwargs: The keyword arguments of the var.
+
+        Returns:
+            The var.
+        """
+        if not getattr(cls, "_intern_instances", False):
+            return super().__call__(*args, **kwargs)  # pyright: ignore[reportAttributeAccessIssue]
+        refs = []
+        key = _intern_key((cls, args, tuple(kwargs.items())), refs)
+        if key is _UNINTERNABLE:
+            return super().__call__(*args, **kwargs)  # pyright: ignore[reportAttributeAccessIssue]
+        try:
+            var = _INTERNED_VARS.get(key)
+        except TypeError:
+            # A type with unhashable arguments.
+            return super().__call__(*args, **kwargs)  # pyright: ignore[reportAttributeAccessIssue]
+        if var is None:
+            var = super().__call__(*args, **kwargs)  # pyright: ignore[reportAttributeAccessIssue]
+            object.__getattribute__(var, "__dict__")["_reflex_intern_refs"] = refs
+            _INTERNED_VARS[key] = var
+        return var
+
     def __setattr__(cls, name: str, value: Any):
         """Set an attribute on the class.
 
@@ -803,6 +887,8 @@ class Var(Generic[VAR_TYPE], metaclass=MetaclassVar):
         )
 
         if (js_expr := kwargs.get("_js_expr")) is not None:
+            # Set on a copy, the replaced var may be interned.
+            value_with_replaced = copy.copy(value_with_replaced)
             object.__setattr__(value_with_replaced, "_js_expr", js_expr)
 
         return value_with_replaced
@@ -1531,6 +1617,8 @@ VAR_INSIDE = TypeVar("VAR_INSIDE")
 class ToOperation:
     """A var operation that converts a var to another type."""
 
+    _intern_instances: ClassVar[bool] = True
+
     def __getattr__(self, name: str) -> Any:
         """Get an attribute of the var.
 
@@ -1597,6 +1685,8 @@ class ToOperation:
 class LiteralVar(Var[VAR_TYPE]):
     """Base class for immutable literal vars."""
 
+    _intern_instances: ClassVar[bool] = True
+
     def __init_subclass__(cls, **kwargs):
         """Initialize the subclass.
 
@@ -1989,11 +2079,24 @@ def figure_out_type(value: Any) -> types.GenericType:
     return type(value)
 
 
-GLOBAL_CACHE = {}
+# Bumped to invalidate the values cached by cached_property.
+_cached_property_generation = 0
+
+
+def invalidate_cached_properties():
+    """Invalidate the values cached by cached_property, of all vars.
+
+    For when the components nested in vars change, changing their VarData.
+    """
+    global _cached_property_generation
+    _cached_property_generation += 1
 
 
 class cached_property:  # noqa: N801
-    """A cached property that caches the result of the function."""
+    """A cached property that caches the result of the function.
+
+    The result is kept in the instance, and so freed with it.
+    """
 
     def __init__(self, func: Callable):
         """Initialize the cached_property.
@@ -2003,6 +2106,7 @@ class cached_property:  # noqa: N801
         """
         self._func = func
         self._attrname = None
+        self._cache_name = ""
 
     def __set_name__(self, owner: Any, name: str):
         """Set the name of the cached property.
@@ -2016,29 +2120,7 @@ class cached_property:  # noqa: N801
         """
         if self._attrname is None:
             self._attrname = name
-
-            original_del = getattr(owner, "__del__", None)
-
-            def delete_property(this: Any):
-                """Delete the cached property.
-
-                Args:
-                    this: The object to delete the cached property from.
-                """
-                cached_field_name = "_reflex_cache_" + name
-                try:
-                    unique_id = object.__getattribute__(this, cached_field_name)
-                except AttributeError:
-                    if original_del is not None:
-                        original_del(this)
-                    return
-                GLOBAL_CACHE.pop(unique_id, None)
-
-                if original_del is not None:
-                    original_del(this)
-
-            owner.__del__ = delete_property
-
+            self._cache_name = "_reflex_cache_" + name
         elif name != self._attrname:
             msg = (
                 "Cannot assign the same cached_property to two different names "
@@ -2062,15 +2144,15 @@ class cached_property:  # noqa: N801
         if self._attrname is None:
             msg = "Cannot use cached_property on a class without __set_name__."
             raise TypeError(msg)
-        cached_field_name = "_reflex_cache_" + self._attrname
-        try:
-            unique_id = object.__getattribute__(instance, cached_field_name)
-        except AttributeError:
-            unique_id = uuid.uuid4().int
-            object.__setattr__(instance, cached_field_name, unique_id)
-        if unique_id not in GLOBAL_CACHE:
-            GLOBAL_CACHE[unique_id] = self._func(instance)
-        return GLOBAL_CACHE[unique_id]
+        # Written to the instance dict directly, vars being frozen.
+        cache = object.__getattribute__(instance, "__dict__")
+        entry = cache.get(self._cache_name)
+        if entry is None or entry[0] != _cached_property_generation:
+            entry = cache[self._cache_name] = (
+                _cached_property_generation,
+                self._func(instance),
+            )
+        return entry[1]
 
 
 cached_property_no_lock = cached_property
@@ -2094,6 +2176,8 @@ class VarProtocol(Protocol):
 class CachedVarOperation:
     """Base class for cached var operations to lower boilerplate code."""
 
+    _intern_instances: ClassVar[bool] = True
+
     def __post_init__(self):
         """Post-initialize the CachedVarOperation."""
         object.__delattr__(self, "_js_expr")
@@ -3024,6 +3108,8 @@ RETURN = TypeVar("RETURN")
 class CustomVarOperationReturn(Var[RETURN]):
     """Base class for custom var operations."""
 
+    _intern_instances: ClassVar[bool] = True
+
     @classmethod
     def create(
         cls,
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import dataclasses
 import decimal
+import functools
 import json
 import math
 from collections.abc import Callable
@@ -506,7 +507,9 @@ def binary_number_operation(
         The binary number operation.
     """
 
+    # Named after func, for the operation to tell which it is.
     @var_operation
+    @functools.wraps(func)
     def operation(lhs: NumberVar, rhs: NumberVar):
         return var_operation_return(
             js_expression=func(lhs, rhs),
@@ -820,7 +823,9 @@ def comparison_operator(
         The comparison operation.
     """
 
+    # Named after func, for the operation to tell which it is.
     @var_operation
+    @functools.wraps(func)
     def operation(lhs: Var, rhs: Var):
         return var_operation_return(
             js_expression=func(lhs, rhs),
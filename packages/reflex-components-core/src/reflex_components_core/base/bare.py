@@ -13,7 +13,7 @@ from reflex_base.environment import PerformanceMode, environment
 from reflex_base.utils.decorator import once
 from reflex_base.utils.imports import ParsedImportDict
 from reflex_base.vars import BooleanVar, ObjectVar, Var
-from reflex_base.vars.base import GLOBAL_CACHE, VarData
+from reflex_base.vars.base import VarData, invalidate_cached_properties
 from reflex_base.vars.sequence import LiteralStringVar
 
 logger = logging.getLogger(__name__)
@@ -230,7 +230,7 @@ class Bare(Component):
                     are_components_touched = True
 
         if are_components_touched:
-            GLOBAL_CACHE.clear()
+            invalidate_cached_properties()
 
         return new_self
 
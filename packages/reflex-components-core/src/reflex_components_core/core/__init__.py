@@ -26,6 +26,8 @@ _SUBMOD_ATTRS: dict[str, list[str]] = {
     "foreach": [
         "foreach",
         "Foreach",
+        "virtual_foreach",
+        "VirtualForeach",
     ],
     "html": ["html", "Html"],
     "helmet": ["Helmet"],
@@ -5,7 +5,12 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import dataclasses
+import hashlib
 import json
+import math
+import os
+import shutil
+import time
 from collections import deque
 from collections.abc import (
     AsyncGenerator,
@@ -22,6 +27,7 @@ from reflex_base.registry import RegistrationContext
 from reflex_base.utils import exceptions
 from reflex_base.utils.format import json_dumps
 from reflex_base.utils.streaming_response import DisconnectAwareStreamingResponse
+from starlette.concurrency import run_in_threadpool
 from starlette.datastructures import FormData, Headers
 from starlette.datastructures import UploadFile as StarletteUploadFile
 from starlette.exceptions import HTTPException
@@ -31,6 +37,7 @@ from starlette.responses import JSONResponse, Response, StreamingResponse
 from typing_extensions import Self
 
 if TYPE_CHECKING:
+    from reflex_base.event import Event
     from reflex_base.utils.types import ASGIApp, Receive, Scope, Send
 
     from reflex.app import App
@@ -45,6 +52,7 @@ class UploadFile(StarletteUploadFile):
         filename: The original file name.
         size: The size of the file in bytes.
         headers: The headers of the request.
+        digest: The sha256 hex digest of the content, for resumable uploads.
     """
 
     file: BinaryIO
@@ -55,6 +63,8 @@ class UploadFile(StarletteUploadFile):
 
     headers: Headers = dataclasses.field(default_factory=Headers)
 
+    digest: str | None = dataclasses.field(default=None)
+
     @property
     def filename(self) -> str | None:
         """Get the name of the uploaded file.
@@ -113,6 +123,46 @@ def _upload_file_from_starlette(file: StarletteUploadFile) -> UploadFile:
     )
 
 
+@dataclasses.dataclass
+class UploadStats:
+    """Throughput and backpressure counters for uploads."""
+
+    # Bytes written to resumable upload spool files.
+    bytes_received: int = 0
+
+    # Time spent receiving resumable upload chunk requests (s).
+    receive_seconds: float = 0.0
+
+    # Chunk requests that continued a partially uploaded file.
+    requests_resumed: int = 0
+
+    # Chunk requests rejected because their offset did not match the spool file.
+    offset_conflicts: int = 0
+
+    # Files whose content was already stored and did not need to be kept twice.
+    files_deduplicated: int = 0
+
+    # Bytes that did not need to be stored because the content was already present.
+    bytes_deduplicated: int = 0
+
+    # Times a producer waited because the upload handler had not consumed its chunks.
+    backpressure_stalls: int = 0
+
+    # Time producers spent waiting for the upload handler (s).
+    backpressure_stall_seconds: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Get the average rate resumable upload chunks were received at.
+
+        Returns:
+            Bytes per second, or 0 if nothing was received yet.
+        """
+        if not self.receive_seconds:
+            return 0.0
+        return self.bytes_received / self.receive_seconds
+
+
 @dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class UploadChunk:
     """A chunk of uploaded file data."""
@@ -133,15 +183,18 @@ class UploadChunkIterator(AsyncIterator[UploadChunk]):
         "_consumer_task",
         "_error",
         "_maxsize",
+        "_stats",
     )
 
-    def __init__(self, *, maxsize: int = 8):
+    def __init__(self, *, maxsize: int = 8, stats: UploadStats | None = None):
         """Initialize the iterator.
 
         Args:
             maxsize: Maximum number of chunks to buffer before blocking producers.
+            stats: Counters to record backpressure stalls in.
         """
         self._maxsize = maxsize
+        self._stats = stats
         self._chunks: deque[UploadChunk] = deque()
         self._condition = asyncio.Condition()
         self._closed = False
@@ -198,9 +251,15 @@ class UploadChunkIterator(AsyncIterator[UploadChunk]):
             RuntimeError: If the iterator is already closed or the consumer exited early.
         """
         async with self._condition:
+            stalled_at = None
             while len(self._chunks) >= self._maxsize and not self._closed:
                 self._raise_if_consumer_finished()
+                if stalled_at is None:
+                    stalled_at = time.monotonic()
                 await self._condition.wait()
+            if stalled_at is not None and self._stats is not None:
+                self._stats.backpressure_stalls += 1
+                self._stats.backpressure_stall_seconds += time.monotonic() - stalled_at
 
             if self._closed:
                 msg = "Upload chunk iterator is closed."
@@ -595,8 +654,6 @@ async def _upload_buffered_file(
     from reflex_base.event import Event
     from reflex_base.utils.exceptions import UploadValueError
 
-    from reflex.state import StateUpdate
-
     try:
         form_data = await request.form()
     except ClientDisconnect:
@@ -644,6 +701,31 @@ async def _upload_buffered_file(
         msg = "Upload event was not created."
         raise RuntimeError(msg)
 
+    return _stream_upload_event(
+        app, token=token, event=event, on_finish=_close_form_data
+    )
+
+
+def _stream_upload_event(
+    app: App,
+    *,
+    token: str,
+    event: Event,
+    on_finish: Callable[[], Awaitable[None]],
+) -> Response:
+    """Process an upload event, streaming its deltas back as the response.
+
+    Args:
+        app: The app to process the event with.
+        token: The client token.
+        event: The upload event.
+        on_finish: Called once the response is finished or abandoned.
+
+    Returns:
+        A streaming ndjson response of state updates.
+    """
+    from reflex.state import StateUpdate
+
     disconnect_seen = False
 
     def _mark_disconnected() -> None:
@@ -667,7 +749,7 @@ async def _upload_buffered_file(
     return DisconnectAwareStreamingResponse(
         _ndjson_updates(),
         media_type="application/x-ndjson",
-        on_finish=_close_form_data,
+        on_finish=on_finish,
         on_disconnect=_mark_disconnected,
     )
 
@@ -693,6 +775,7 @@ async def _upload_chunk_file(
     handler_name: str,
     handler_upload_param: tuple[str, Any],
     acknowledge_on_upload_endpoint: bool,
+    stats: UploadStats | None = None,
 ) -> Response:
     """Handle a streaming upload request.
 
@@ -701,7 +784,7 @@ async def _upload_chunk_file(
     """
     from reflex_base.event import Event
 
-    chunk_iter = UploadChunkIterator(maxsize=8)
+    chunk_iter = UploadChunkIterator(maxsize=8, stats=stats)
     task_future: asyncio.Future[Any] | None = None
 
     async def _start_handler(extra_args_raw: str | None) -> None:
@@ -750,6 +833,763 @@ async def _upload_chunk_file(
     return Response(status_code=202)
 
 
+# Request headers of the resumable upload protocol. A client uploads each file
+# of a session with PATCH requests carrying raw bytes at an offset, asks for the
+# stored offset with HEAD after a disconnect, and dispatches the handler with a
+# POST listing the session's files (and bound args) as JSON.
+UPLOAD_SESSION_HEADER = "reflex-upload-session"
+UPLOAD_FILENAME_HEADER = "reflex-upload-filename"
+UPLOAD_OFFSET_HEADER = "reflex-upload-offset"
+UPLOAD_LENGTH_HEADER = "reflex-upload-length"
+UPLOAD_DIGEST_HEADER = "reflex-upload-digest"
+
+# Received bytes are buffered up to this size before each write to the spool file.
+UPLOAD_SPOOL_WRITE_SIZE = 1024 * 1024
+
+# The size of the chunks replayed from a spool file into a streaming upload handler.
+UPLOAD_REPLAY_CHUNK_SIZE = 1024 * 1024
+
+# The most session files whose state is kept in memory, the rest is recovered from disk.
+UPLOAD_MAX_TRACKED_FILES = 10_000
+
+
+@dataclasses.dataclass(kw_only=True, slots=True)
+class _SpooledFile:
+    """A file of a resumable upload session that is being written to disk."""
+
+    filename: str
+    path: Path
+    content_type: str = ""
+    offset: int = 0
+    length: int | None = None
+    expected_digest: str | None = None
+    hasher: Any = dataclasses.field(default_factory=hashlib.sha256)
+    # The content-addressed blob holding the file, once its content is known.
+    blob: Path | None = None
+    # The markers of the blobs the client uploaded itself, the only ones its announced digests are trusted for.
+    claims: Path | None = None
+    lock: asyncio.Lock = dataclasses.field(default_factory=asyncio.Lock)
+
+    @property
+    def complete(self) -> bool:
+        """Whether every byte of the file has been received.
+
+        Returns:
+            Whether the file is complete. Files of unknown length are complete
+            once the handler is dispatched.
+        """
+        return self.blob is not None or (
+            self.length is not None and self.offset >= self.length
+        )
+
+
+def _hash_file(path: Path) -> tuple[Any, int]:
+    """Hash the content already written to a spool file.
+
+    Args:
+        path: The spool file.
+
+    Returns:
+        The sha256 hasher fed with the file content, and the number of bytes read.
+    """
+    hasher = hashlib.sha256()
+    size = 0
+    with path.open("rb") as fp:
+        while data := fp.read(UPLOAD_SPOOL_WRITE_SIZE):
+            hasher.update(data)
+            size += len(data)
+    return hasher, size
+
+
+def _append_spool(fp: BinaryIO, hasher: Any, data: bytes) -> None:
+    """Write received bytes to a spool file and feed them to its hasher.
+
+    Args:
+        fp: The spool file, opened for appending.
+        hasher: The running sha256 hasher of the file.
+        data: The received bytes.
+    """
+    fp.write(data)
+    hasher.update(data)
+
+
+class UploadSessionStore:
+    """Spool files and content-addressed blobs of resumable uploads.
+
+    Each session lives in a directory derived from the client token and the
+    client-chosen session id, so sessions cannot be addressed by other clients.
+    File state is recovered from the spool file size, so an upload can resume
+    after a backend restart or on another instance sharing the directory.
+    Completed files are moved into ``blobs/<sha256>``; identical content is
+    stored once, and a client that announces the digest of content it uploaded
+    before does not need to send it again. Digests announced for content
+    uploaded by other clients are verified against the received bytes instead.
+    Sessions, blobs and claims unused for ``ttl`` seconds are removed.
+    """
+
+    def __init__(self, root: Path, *, ttl: float = 24 * 60 * 60):
+        """Initialize the store.
+
+        Args:
+            root: The directory to spool uploads in. Must not be publicly served.
+            ttl: How long (s) an unused session or blob is kept.
+        """
+        self.root = root
+        self.ttl = ttl
+        self.stats = UploadStats()
+        self._files: dict[Path, _SpooledFile] = {}
+        self._last_prune = 0.0
+
+    @property
+    def sessions_dir(self) -> Path:
+        """The directory holding one subdirectory of spool files per session."""
+        return self.root / "sessions"
+
+    @property
+    def blobs_dir(self) -> Path:
+        """The directory holding completed files named by their sha256 digest."""
+        return self.root / "blobs"
+
+    @property
+    def claims_dir(self) -> Path:
+        """The directory holding one subdirectory of blob markers per client."""
+        return self.root / "claims"
+
+    def _claims_dir(self, token: str) -> Path:
+        key = hashlib.sha256(f"claims:{token}".encode()).hexdigest()
+        return self.claims_dir / key[:32]
+
+    def _session_dir(self, token: str, session_id: str) -> Path:
+        key = hashlib.sha256(f"{token}:{session_id}".encode()).hexdigest()
+        return self.sessions_dir / key[:32]
+
+    def _blob_path(self, digest: str) -> Path | None:
+        digest = digest.lower()
+        if len(digest) != 64 or any(c not in "0123456789abcdef" for c in digest):
+            return None
+        return self.blobs_dir / digest
+
+    async def get_file(
+        self,
+        token: str,
+        session_id: str,
+        filename: str,
+        *,
+        length: int | None = None,
+        digest: str | None = None,
+        content_type: str = "",
+    ) -> _SpooledFile:
+        """Get the state of a session file, recovering it from disk if needed.
+
+        Args:
+            token: The client token.
+            session_id: The client-chosen upload session id.
+            filename: The client filename (sanitized here).
+            length: The total file length, if the client announced it.
+            digest: The sha256 hex digest of the file, if the client announced it.
+            content_type: The content type of the file.
+
+        Returns:
+            The spooled file.
+
+        Raises:
+            HTTPException: If the announced length or digest is inconsistent.
+        """
+        await self._maybe_prune()
+        filename = _sanitize_upload_filename(filename)
+        session_dir = self._session_dir(token, session_id)
+        path = session_dir / hashlib.sha256(filename.encode()).hexdigest()[:32]
+        spooled = self._files.get(path)
+        if spooled is None:
+            self._evict_files(UPLOAD_MAX_TRACKED_FILES - 1)
+            spooled = self._files[path] = _SpooledFile(
+                filename=filename, path=path, claims=self._claims_dir(token)
+            )
+        if length is not None:
+            if length < 0 or (spooled.length is not None and length != spooled.length):
+                raise HTTPException(status_code=400, detail="Upload length changed.")
+            spooled.length = length
+        if digest is not None:
+            if self._blob_path(digest) is None:
+                raise HTTPException(status_code=400, detail="Malformed upload digest.")
+            spooled.expected_digest = digest.lower()
+        if content_type and not spooled.content_type:
+            spooled.content_type = content_type
+        async with spooled.lock:
+            await self._sync(spooled)
+        return spooled
+
+    async def _sync(self, spooled: _SpooledFile) -> None:
+        """Bring a file's offset and hasher up to date with its spool file.
+
+        The spool file may have been written by an earlier process or another
+        instance, in which case the existing content is rehashed.
+
+        Args:
+            spooled: The file, with its lock held.
+        """
+        if spooled.blob is not None:
+            return
+        if (
+            spooled.expected_digest is not None
+            and spooled.offset == 0
+            and spooled.claims is not None
+        ):
+            blob = self._blob_path(spooled.expected_digest)
+            size = (
+                await run_in_threadpool(
+                    _touch_claimed_blob, blob, spooled.claims / blob.name
+                )
+                if blob
+                else None
+            )
+            if blob is not None and size is not None and spooled.length in (None, size):
+                spooled.blob = blob
+                spooled.offset = spooled.length = size
+                spooled.path.unlink(missing_ok=True)
+                self.stats.files_deduplicated += 1
+                self.stats.bytes_deduplicated += size
+                return
+        try:
+            size = spooled.path.stat().st_size
+        except FileNotFoundError:
+            size = 0
+        if size == spooled.offset:
+            return
+        if size:
+            spooled.hasher, spooled.offset = await run_in_threadpool(
+                _hash_file, spooled.path
+            )
+        else:
+            spooled.hasher, spooled.offset = hashlib.sha256(), 0
+
+    async def receive(
+        self, spooled: _SpooledFile, offset: int, stream: AsyncIterator[bytes]
+    ) -> None:
+        """Append the body of a chunk request to a spool file.
+
+        Bytes received before a client disconnect are kept, so the client can
+        resume from the offset reported afterwards.
+
+        Args:
+            spooled: The file being uploaded.
+            offset: The offset the client is sending from.
+            stream: The request body.
+
+        Raises:
+            HTTPException: With status 409 if the offset does not match the stored
+                content, or 400 if the file would exceed its announced length.
+        """
+        async with spooled.lock:
+            await self._sync(spooled)
+            if spooled.blob is not None or offset != spooled.offset:
+                self.stats.offset_conflicts += 1
+                raise HTTPException(
+                    status_code=409,
+                    detail="Upload offset does not match the stored content.",
+                    headers={UPLOAD_OFFSET_HEADER: str(spooled.offset)},
+                )
+            if offset:
+                self.stats.requests_resumed += 1
+            spooled.path.parent.mkdir(parents=True, exist_ok=True)
+            started = time.monotonic()
+            fp = await run_in_threadpool(spooled.path.open, "ab")
+            try:
+                buffer = bytearray()
+                async for data in _iter_until_disconnect(stream):
+                    buffer += data
+                    if (
+                        spooled.length is not None
+                        and spooled.offset + len(buffer) > spooled.length
+                    ):
+                        raise HTTPException(
+                            status_code=400,
+                            detail="Upload exceeds its announced length.",
+                        )
+                    if len(buffer) >= UPLOAD_SPOOL_WRITE_SIZE:
+                        await self._write(spooled, fp, bytes(buffer))
+                        buffer.clear()
+                if buffer:
+                    await self._write(spooled, fp, bytes(buffer))
+            finally:
+                await run_in_threadpool(fp.close)
+                self.stats.receive_seconds += time.monotonic() - started
+
+    async def _write(self, spooled: _SpooledFile, fp: BinaryIO, data: bytes) -> None:
+        await run_in_threadpool(_append_spool, fp, spooled.hasher, data)
+        spooled.offset += len(data)
+        self.stats.bytes_received += len(data)
+
+    async def open_files(
+        self, token: str, session_id: str, filenames: list[str]
+    ) -> list[UploadFile]:
+        """Finalize the files of a session and open them for the upload handler.
+
+        Each file is moved to its content-addressed blob (or dropped in favor of
+        an identical blob that already exists) and opened as a regular file, so
+        the handler can read or ``mmap`` it without another copy.
+
+        Args:
+            token: The client token.
+            session_id: The client-chosen upload session id.
+            filenames: The files to hand to the handler, in order.
+
+        Returns:
+            The opened upload files.
+
+        Raises:
+            HTTPException: If a file is incomplete or does not match its digest.
+        """
+        finalized: list[tuple[_SpooledFile, Path]] = []
+        for filename in filenames:
+            spooled = await self.get_file(token, session_id, filename)
+            async with spooled.lock:
+                blob = spooled.blob
+                if blob is None:
+                    if spooled.length is not None and spooled.offset != spooled.length:
+                        raise HTTPException(
+                            status_code=400,
+                            detail=f"Upload {filename} is incomplete.",
+                            headers={UPLOAD_OFFSET_HEADER: str(spooled.offset)},
+                        )
+                    digest = spooled.hasher.hexdigest()
+                    if spooled.expected_digest not in (None, digest):
+                        spooled.path.unlink(missing_ok=True)
+                        spooled.hasher, spooled.offset = hashlib.sha256(), 0
+                        raise HTTPException(
+                            status_code=400,
+                            detail=f"Upload {filename} does not match its digest.",
+                        )
+                    blob = spooled.blob = self.blobs_dir / digest
+                    if await run_in_threadpool(_store_blob, spooled.path, blob):
+                        self.stats.files_deduplicated += 1
+                        self.stats.bytes_deduplicated += spooled.offset
+                    if spooled.claims is not None:
+                        # The client sent the bytes, it may reuse the blob by digest.
+                        await run_in_threadpool(_claim_blob, spooled.claims / digest)
+                finalized.append((spooled, blob))
+
+        files = [
+            UploadFile(
+                file=await run_in_threadpool(blob.open, "rb"),
+                path=Path(spooled.filename),
+                size=spooled.offset,
+                headers=Headers({
+                    "content-type": spooled.content_type or "application/octet-stream"
+                }),
+                digest=blob.name,
+            )
+            for spooled, blob in finalized
+        ]
+        await self.discard(token, session_id)
+        return files
+
+    async def discard(self, token: str, session_id: str) -> None:
+        """Forget a session and remove its spool files.
+
+        Args:
+            token: The client token.
+            session_id: The client-chosen upload session id.
+        """
+        session_dir = self._session_dir(token, session_id)
+        for path in [path for path in self._files if path.parent == session_dir]:
+            del self._files[path]
+        await run_in_threadpool(shutil.rmtree, session_dir, True)
+
+    def _evict_files(self, max_files: int) -> None:
+        """Forget the least recently tracked idle files beyond a count.
+
+        Their state is recovered from their spool file when they are used again.
+
+        Args:
+            max_files: The most files to keep.
+        """
+        excess = len(self._files) - max_files
+        for path, spooled in list(self._files.items()):
+            if excess <= 0:
+                break
+            if not spooled.lock.locked():
+                del self._files[path]
+                excess -= 1
+
+    async def _maybe_prune(self) -> None:
+        now = time.time()
+        if now - self._last_prune < min(self.ttl, 60):
+            return
+        self._last_prune = now
+        await self.prune(now - self.ttl)
+
+    async def prune(self, before: float) -> None:
+        """Remove sessions and blobs that were not used since a point in time.
+
+        Files of sessions without a spool directory are forgotten, unless they
+        are being written.
+
+        Args:
+            before: The unix timestamp to compare modification times with.
+        """
+        session_dirs = await run_in_threadpool(self._prune_dirs, before)
+        for path, spooled in list(self._files.items()):
+            if path.parent not in session_dirs and not spooled.lock.locked():
+                del self._files[path]
+
+    def _prune_dirs(self, before: float) -> set[Path]:
+        """Remove the sessions, blobs and claims not used since a point in time.
+
+        Args:
+            before: The unix timestamp to compare modification times with.
+
+        Returns:
+            The session directories that remain.
+        """
+        session_dirs = set()
+        if self.sessions_dir.is_dir():
+            for session_dir in self.sessions_dir.iterdir():
+                with contextlib.suppress(FileNotFoundError):
+                    mtimes = [_mtime(p) for p in session_dir.iterdir()] or [
+                        _mtime(session_dir)
+                    ]
+                    if max(mtimes) < before:
+                        shutil.rmtree(session_dir, ignore_errors=True)
+                    else:
+                        session_dirs.add(session_dir)
+        if self.blobs_dir.is_dir():
+            for blob in self.blobs_dir.iterdir():
+                if _mtime(blob) < before:
+                    blob.unlink(missing_ok=True)
+        if self.claims_dir.is_dir():
+            for claims in self.claims_dir.iterdir():
+                with contextlib.suppress(FileNotFoundError):
+                    for claim in claims.iterdir():
+                        if _mtime(claim) < before:
+                            claim.unlink(missing_ok=True)
+                with contextlib.suppress(OSError):
+                    claims.rmdir()
+        return session_dirs
+
+
+def _mtime(path: Path) -> float:
+    """Get the modification time of a file that may be removed concurrently.
+
+    Args:
+        path: The file.
+
+    Returns:
+        The modification time, or -inf if the file no longer exists.
+    """
+    try:
+        return path.stat().st_mtime
+    except FileNotFoundError:
+        return -math.inf
+
+
+def _touch_blob(blob: Path) -> int | None:
+    """Mark a blob as used so it is not pruned.
+
+    Args:
+        blob: The blob path.
+
+    Returns:
+        The blob size, or None if it does not exist.
+    """
+    try:
+        os.utime(blob)
+        return blob.stat().st_size
+    except FileNotFoundError:
+        return None
+
+
+def _touch_claimed_blob(blob: Path, claim: Path) -> int | None:
+    """Mark a blob the client uploaded before as used.
+
+    Args:
+        blob: The blob path.
+        claim: The marker of the blob for the client.
+
+    Returns:
+        The blob size, or None if it does not exist or the client did not upload it.
+    """
+    try:
+        os.utime(claim)
+    except FileNotFoundError:
+        return None
+    return _touch_blob(blob)
+
+
+def _claim_blob(claim: Path) -> None:
+    """Record that a client uploaded the content of a blob.
+
+    Args:
+        claim: The marker of the blob for the client.
+    """
+    claim.parent.mkdir(parents=True, exist_ok=True)
+    claim.touch()
+
+
+def _store_blob(spool: Path, blob: Path) -> bool:
+    """Move a completed spool file to its content-addressed blob.
+
+    Args:
+        spool: The completed spool file.
+        blob: The blob path for the file's digest.
+
+    Returns:
+        Whether an identical blob already existed and the spool file was dropped.
+    """
+    blob.parent.mkdir(parents=True, exist_ok=True)
+    if _touch_blob(blob) is not None:
+        spool.unlink(missing_ok=True)
+        return True
+    if spool.exists():
+        spool.replace(blob)
+    else:
+        # A zero-length upload never wrote its spool file.
+        blob.touch()
+    return False
+
+
+async def _iter_until_disconnect(stream: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Iterate a request body, ending quietly if the client disconnects.
+
+    Args:
+        stream: The request body.
+
+    Yields:
+        The received body chunks.
+    """
+    with contextlib.suppress(ClientDisconnect):
+        async for data in stream:
+            yield data
+
+
+def _parse_offset_header(request: Request, name: str) -> int | None:
+    """Parse a non-negative integer header.
+
+    Args:
+        request: The incoming request.
+        name: The header name.
+
+    Returns:
+        The header value, or None if it is absent.
+
+    Raises:
+        HTTPException: If the header is not a non-negative integer.
+    """
+    value = request.headers.get(name)
+    if value is None:
+        return None
+    if not value.isdigit():
+        raise HTTPException(status_code=400, detail=f"Invalid {name} header.")
+    return int(value)
+
+
+async def _session_file_from_request(
+    request: Request, sessions: UploadSessionStore, token: str, session_id: str
+) -> _SpooledFile:
+    """Get the session file a chunk or offset request refers to.
+
+    Args:
+        request: The incoming request.
+        sessions: The upload session store.
+        token: The client token.
+        session_id: The upload session id.
+
+    Returns:
+        The spooled file.
+
+    Raises:
+        HTTPException: If the filename header is missing.
+    """
+    filename = request.headers.get(UPLOAD_FILENAME_HEADER)
+    if not filename:
+        raise HTTPException(
+            status_code=400, detail=f"Missing {UPLOAD_FILENAME_HEADER} header."
+        )
+    return await sessions.get_file(
+        token,
+        session_id,
+        filename,
+        length=_parse_offset_header(request, UPLOAD_LENGTH_HEADER),
+        digest=request.headers.get(UPLOAD_DIGEST_HEADER),
+        content_type=request.headers.get("content-type", ""),
+    )
+
+
+def _offset_response(spooled: _SpooledFile, status_code: int = 204) -> Response:
+    """Report the stored offset of a session file.
+
+    Args:
+        spooled: The spooled file.
+        status_code: The response status.
+
+    Returns:
+        An empty response carrying the offset (and length, if known) headers.
+    """
+    headers = {UPLOAD_OFFSET_HEADER: str(spooled.offset)}
+    if spooled.length is not None:
+        headers[UPLOAD_LENGTH_HEADER] = str(spooled.length)
+    return Response(status_code=status_code, headers=headers)
+
+
+async def _replay_spooled_files(
+    files: list[UploadFile], chunk_iter: UploadChunkIterator
+) -> None:
+    """Push the content of completed session files into a streaming handler.
+
+    Args:
+        files: The opened session files.
+        chunk_iter: The iterator consumed by the handler.
+    """
+    for file in files:
+        filename = file.filename or ""
+        content_type = file.headers.get("content-type", "")
+        offset = 0
+        while True:
+            data = await run_in_threadpool(file.file.read, UPLOAD_REPLAY_CHUNK_SIZE)
+            if not data and offset:
+                break
+            await chunk_iter.push(
+                UploadChunk(
+                    filename=filename,
+                    offset=offset,
+                    content_type=content_type,
+                    data=data,
+                )
+            )
+            if not data:
+                break
+            offset += len(data)
+
+
+async def _upload_session_commit(
+    request: Request,
+    app: App,
+    sessions: UploadSessionStore,
+    *,
+    token: str,
+    session_id: str,
+    handler_name: str,
+) -> Response:
+    """Dispatch the upload handler with the completed files of a session.
+
+    The request body is a JSON object with the ``files`` to pass, in order, and
+    optionally the bound handler ``args``.
+
+    Returns:
+        The handler's streamed updates, or 202 for streaming background handlers.
+
+    Raises:
+        HTTPException: If the body is malformed or a file is incomplete.
+    """
+    from reflex_base.event import (
+        Event,
+        resolve_upload_chunk_handler_param,
+        resolve_upload_handler_param,
+    )
+
+    try:
+        body = json.loads(await request.body())
+    except ClientDisconnect:
+        return Response()
+    except json.JSONDecodeError as exc:
+        raise HTTPException(
+            status_code=400, detail="Malformed upload session commit."
+        ) from exc
+    filenames = body.get("files") if isinstance(body, dict) else None
+    if not isinstance(filenames, list) or not all(
+        isinstance(name, str) for name in filenames
+    ):
+        raise HTTPException(
+            status_code=400, detail="Upload session commit must list its files."
+        )
+    extra_args = body.get("args") or {}
+    if not isinstance(extra_args, dict):
+        raise HTTPException(
+            status_code=400, detail="Upload event args must be a JSON object."
+        )
+
+    event_handler = RegistrationContext.get().event_handlers[handler_name].handler
+    chunk_param = None
+    if event_handler.is_background:
+        with contextlib.suppress(exceptions.UploadValueError):
+            chunk_param = resolve_upload_chunk_handler_param(event_handler)
+    upload_param = chunk_param or resolve_upload_handler_param(event_handler)
+
+    files = await sessions.open_files(token, session_id, filenames)
+
+    async def _close_files() -> None:
+        for file in files:
+            await run_in_threadpool(file.file.close)
+
+    if chunk_param is None:
+        return _stream_upload_event(
+            app,
+            token=token,
+            event=Event(
+                name=handler_name,
+                payload={**extra_args, upload_param[0]: files},
+            ),
+            on_finish=_close_files,
+        )
+
+    chunk_iter = UploadChunkIterator(maxsize=8, stats=sessions.stats)
+    task_future = await app.event_processor.enqueue(
+        token,
+        Event(name=handler_name, payload={**extra_args, upload_param[0]: chunk_iter}),
+    )
+    chunk_iter.set_consumer_task(task_future)
+    try:
+        await _replay_spooled_files(files, chunk_iter)
+        await chunk_iter.finish()
+    except RuntimeError as err:
+        await chunk_iter.fail(err)
+        return JSONResponse({"detail": str(err)}, status_code=400)
+    finally:
+        await _close_files()
+    return _background_upload_accepted_response()
+
+
+async def _upload_session_request(
+    request: Request,
+    app: App,
+    sessions: UploadSessionStore,
+    *,
+    token: str,
+    handler_name: str,
+    session_id: str,
+) -> Response:
+    """Handle a request of the resumable upload protocol.
+
+    ``HEAD`` reports the stored offset of a file, ``PATCH`` appends the raw body
+    at the ``Reflex-Upload-Offset`` of a file, ``DELETE`` abandons the session
+    and ``POST`` dispatches the handler with the session's completed files.
+
+    Returns:
+        The protocol response.
+    """
+    if request.method == "POST":
+        return await _upload_session_commit(
+            request,
+            app,
+            sessions,
+            token=token,
+            session_id=session_id,
+            handler_name=handler_name,
+        )
+    if request.method == "DELETE":
+        await sessions.discard(token, session_id)
+        return Response(status_code=204)
+    spooled = await _session_file_from_request(request, sessions, token, session_id)
+    if request.method == "PATCH":
+        offset = _parse_offset_header(request, UPLOAD_OFFSET_HEADER)
+        if offset is None:
+            raise HTTPException(
+                status_code=400, detail=f"Missing {UPLOAD_OFFSET_HEADER} header."
+            )
+        await sessions.receive(spooled, offset, request.stream())
+    return _offset_response(spooled)
+
+
 header_content_disposition = b"content-disposition"
 header_content_type = b"content-type"
 header_x_content_type_options = b"x-content-type-options"
@@ -806,11 +1646,15 @@ class UploadedFilesHeadersMiddleware:
         await self.app(scope, receive, send_with_headers)
 
 
-def upload(app: App):
+def upload(app: App, sessions: UploadSessionStore | None = None):
     """Upload files, dispatching to buffered or streaming handling.
 
+    Requests carrying a ``Reflex-Upload-Session`` header use the resumable
+    upload protocol instead (see ``_upload_session_request``).
+
     Args:
         app: The app to upload the file for.
+        sessions: The store for resumable uploads; without one they are rejected.
 
     Returns:
         The upload function.
@@ -836,6 +1680,19 @@ def upload(app: App):
         )
 
         token, handler_name = _require_upload_headers(request)
+        if session_id := request.headers.get(UPLOAD_SESSION_HEADER):
+            if sessions is None:
+                raise HTTPException(
+                    status_code=400, detail="Resumable uploads are not enabled."
+                )
+            return await _upload_session_request(
+                request,
+                app,
+                sessions,
+                token=token,
+                handler_name=handler_name,
+                session_id=session_id,
+            )
         registered_event_handler = RegistrationContext.get().event_handlers[
             handler_name
         ]
@@ -854,6 +1711,7 @@ def upload(app: App):
                     handler_name=handler_name,
                     handler_upload_param=handler_upload_param,
                     acknowledge_on_upload_endpoint=True,
+                    stats=sessions.stats if sessions is not None else None,
                 )
 
         handler_upload_param = resolve_upload_handler_param(event_handler)
@@ -12,9 +12,11 @@ from reflex_base.components.component import Component, field
 from reflex_base.components.tags import IterTag
 from reflex_base.constants import MemoizationMode
 from reflex_base.constants.state import FIELD_MARKER
+from reflex_base.event import EventHandler, passthrough_event_spec
 from reflex_base.utils import types
 from reflex_base.utils.exceptions import UntypedVarError
 from reflex_base.vars.base import LiteralVar, Var
+from reflex_base.vars.function import ArgsFunctionOperation
 
 from reflex_components_core.base.fragment import Fragment
 from reflex_components_core.core.cond import cond
@@ -177,4 +179,83 @@ class Foreach(Component):
         )
 
 
+class VirtualForeach(Component):
+    """A foreach rendering only the items visible in a scroll container.
+
+    The iterable can be the whole list, or a window of it starting at `offset`
+    out of `total` items: `on_range_change` is then fired with the start and end
+    indices of the items to load when the visible items are not in the window,
+    overscan included, for the backend to send only the items on screen.
+    """
+
+    library = "$/components/reflex/virtual_list"
+
+    tag = "VirtualList"
+
+    _memoization_mode = MemoizationMode(recursive=False)
+
+    iterable: Var[Iterable] = field(
+        doc="The items, or the window of the items starting at offset."
+    )
+
+    render_item: Var[Callable] = field(
+        doc="The function rendering an item and its index, from the render function."
+    )
+
+    item_height: Var[int] = field(
+        doc="The height of every item in pixels. The items are measured when not set."
+    )
+
+    estimated_item_height: Var[int] = field(
+        doc="The height in pixels assumed for items not measured yet. Defaults to 32."
+    )
+
+    overscan: Var[int] = field(
+        doc="The number of items rendered above and below the visible ones. Defaults to 10."
+    )
+
+    height: Var[str] = field(
+        doc="The height of the scroll container. Defaults to 100%."
+    )
+
+    total: Var[int] = field(
+        doc="The total number of items, when the iterable is a window of them."
+    )
+
+    offset: Var[int] = field(doc="The index of the first item of the iterable.")
+
+    on_range_change: EventHandler[passthrough_event_spec(int, int)] = field(
+        doc="Fired with the start and end indices of the items to load."
+    )
+
+    @classmethod
+    def create(
+        cls,
+        iterable: Var[Iterable] | Iterable,
+        render_fn: Callable,
+        **props: Any,
+    ) -> VirtualForeach:
+        """Create a virtualized foreach component.
+
+        Args:
+            iterable: The items, or the window of the items starting at offset.
+            render_fn: A function from the render args to the component.
+            **props: The props of the component, such as item_height, total and on_range_change.
+
+        Returns:
+            The virtualized foreach component.
+        """
+        foreach = Foreach.create(iterable, render_fn)
+        tag = foreach._render()
+        return super().create(
+            iterable=foreach.iterable,
+            render_item=ArgsFunctionOperation.create(
+                (tag.arg_var_name, tag.index_var_name),
+                Var.create(foreach.children[0]),
+            ),
+            **props,
+        )
+
+
 foreach = Foreach.create
+virtual_foreach = VirtualForeach.create
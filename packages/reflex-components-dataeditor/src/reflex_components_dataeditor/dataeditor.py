@@ -398,6 +398,16 @@ class DataEditor(NoSSRComponent):
         doc="Fired when the search close button is clicked."
     )
 
+    on_visible_region_changed: EventHandler[passthrough_event_spec(Rectangle)] = field(
+        doc="Fired when the cells scrolled into view change."
+    )
+
+    data_offset: Var[int] | None = field(
+        default=None,
+        doc="The index of the row at data[0], when data only holds a window of the rows.",
+        is_javascript_property=False,
+    )
+
     # Custom cell renderers
     custom_renderers: Var[Any]
 
@@ -486,9 +496,10 @@ class DataEditor(NoSSRComponent):
 
         columns_path = str(self.columns)
         data_path = str(self.data)
+        row_expr = "row" if self.data_offset is None else f"row - {self.data_offset}"
 
         code.extend([
-            f"    return formatDataEditorCells(col, row, {columns_path}, {data_path});",
+            f"    return formatDataEditorCells(col, {row_expr}, {columns_path}, {data_path});",
             "  }",
         ])
 
@@ -105,7 +105,7 @@ _COMPONENTS_CORE_MAPPING: lazy_loader.SubmodAttrsType = {
         "connection_modal",
     ],
     "reflex_components_core.core.cond": ["cond", "color_mode_cond"],
-    "reflex_components_core.core.foreach": ["foreach"],
+    "reflex_components_core.core.foreach": ["foreach", "virtual_foreach"],
     "reflex_components_core.core.debounce": ["debounce_input"],
     "reflex_components_core.core.html": ["html"],
     "reflex_components_core.core.match": ["match"],
@@ -229,6 +229,7 @@ _MAPPING: lazy_loader.SubmodAttrsType = {
         "State",
         "dynamic",
     ],
+    "istate.query": ["QueryState"],
     "istate.shared": ["SharedState"],
     "istate.wrappers": ["get_state"],
     "style": ["Style", "toggle_color_mode"],
@@ -42,10 +42,14 @@ from reflex_base.event import (
     noop,
 )
 from reflex_base.event.context import EventContext
+from reflex_base.event.executor import handler_executor
 from reflex_base.event.processor import BaseStateEventProcessor, EventProcessor
+from reflex_base.event.profiling import profiler
+from reflex_base.event.tracing import add_to_attribute, mark_received, tracer
+from reflex_base.event.tracing import span as trace_span
 from reflex_base.registry import RegistrationContext
 from reflex_base.telemetry_context import CompileTrigger, TelemetryContext
-from reflex_base.utils import memo_paths
+from reflex_base.utils import columnar, memo_paths
 from reflex_base.utils.imports import ImportVar
 from reflex_base.utils.types import ASGIApp, Message, Receive, Scope, Send
 from reflex_components_core.base.error_boundary import ErrorBoundary
@@ -63,25 +67,33 @@ from socketio import AsyncNamespace, AsyncServer
 from starlette.applications import Starlette
 from starlette.middleware import cors
 from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.responses import JSONResponse, PlainTextResponse, Response
 from starlette.staticfiles import StaticFiles
 from typing_extensions import Unpack
 
-from reflex._upload import UploadedFilesHeadersMiddleware, upload
+from reflex._upload import UploadedFilesHeadersMiddleware, UploadSessionStore, upload
 from reflex._upload import UploadFile as UploadFile
 from reflex.admin import AdminDash
 from reflex.app_mixins import AppMixin, LifespanMixin, MiddlewareMixin
 from reflex.compiler import compiler
 from reflex.compiler.compiler import readable_name_from_component
+from reflex.istate.accounting import state_accounting
 from reflex.istate.data import RouterData
 from reflex.istate.manager import StateManager, StateModificationContext
 from reflex.istate.manager.token import BaseStateToken
+from reflex.istate.media import is_digest, media_offload
 from reflex.route import (
     get_route_args,
     replace_brackets_with_keywords,
     verify_route_validity,
 )
-from reflex.state import BaseState, State, StateUpdate, all_base_state_classes
+from reflex.state import (
+    BaseState,
+    State,
+    StateUpdate,
+    all_base_state_classes,
+    serialize_state_update,
+)
 from reflex.utils import (
     codespaces,
     exceptions,
@@ -98,7 +110,12 @@ from reflex.utils.exec import (
     should_prerender_routes,
 )
 from reflex.utils.misc import run_in_thread
-from reflex.utils.token_manager import RedisTokenManager, TokenManager
+from reflex.utils.token_manager import (
+    ForwardedEventsRecord,
+    ForwardedRecord,
+    RedisTokenManager,
+    TokenManager,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -453,6 +470,9 @@ class App(MiddlewareMixin, LifespanMixin):
     # The processor queue for handling events.
     _event_processor: EventProcessor | None = None
 
+    # Spool files of resumable uploads, created with the upload endpoint.
+    _upload_sessions: UploadSessionStore | None = None
+
     # Store the RegistrationContext to apply inside the ASGI callable task.
     _registration_context: RegistrationContext = dataclasses.field(
         default_factory=RegistrationContext.ensure_context
@@ -580,7 +600,7 @@ class App(MiddlewareMixin, LifespanMixin):
                 ping_interval=environment.REFLEX_SOCKET_INTERVAL.get(),
                 ping_timeout=environment.REFLEX_SOCKET_TIMEOUT.get(),
                 json=SimpleNamespace(
-                    dumps=staticmethod(format.json_dumps),
+                    dumps=staticmethod(_traced_json_dumps),
                     loads=staticmethod(json.loads),
                 ),
                 allow_upgrades=False,
@@ -714,15 +734,36 @@ class App(MiddlewareMixin, LifespanMixin):
 
     @contextlib.asynccontextmanager
     async def _setup_event_processor(self) -> AsyncIterator[None]:
+        tracer.configure_from_environment()
+        profiler.configure_from_environment()
+        handler_executor.configure_from_environment()
+        state_accounting.configure_from_environment()
+        media_offload.configure_from_environment()
         # Create the event processor.
         self._event_processor = BaseStateEventProcessor(
             middleware=self, backend_exception_handler=self.backend_exception_handler
         )
-        async with self._event_processor.configure(
-            state_manager=self.state_manager,
-            event_namespace=self.event_namespace,
+        event_router = None
+        if (
+            self.event_namespace is not None
+            and isinstance(
+                token_manager := self.event_namespace._token_manager,
+                RedisTokenManager,
+            )
+            and token_manager.owner_affinity
         ):
-            yield
+            # Process events for a client on the instance holding its socket.
+            event_router = token_manager.forward_events
+        try:
+            async with self._event_processor.configure(
+                state_manager=self.state_manager,
+                event_namespace=self.event_namespace,
+                event_router=event_router,
+            ):
+                yield
+        finally:
+            # Wait for handlers still running on the pool off the event loop.
+            await asyncio.to_thread(handler_executor.close)
 
     def __repr__(self) -> str:
         """Get the string representation of the app.
@@ -741,8 +782,6 @@ class App(MiddlewareMixin, LifespanMixin):
         Raises:
             ValueError: If the app has not been initialized.
         """
-        from reflex_base.vars.base import GLOBAL_CACHE
-
         from reflex.assets import remove_stale_external_asset_symlinks
 
         # Clean up stale symlinks in assets/external/ before compiling, so that
@@ -774,9 +813,6 @@ class App(MiddlewareMixin, LifespanMixin):
         for plugin in config.plugins:
             plugin.post_compile(app=self)
 
-        # We will not be making more vars, so we can clear the global cache to free up memory.
-        GLOBAL_CACHE.clear()
-
         if not self._api:
             msg = "The app has not been initialized."
             raise ValueError(msg)
@@ -843,11 +879,16 @@ class App(MiddlewareMixin, LifespanMixin):
             prerequisites.get_backend_dir() / constants.Dirs.UPLOAD_IS_USED
         )
         if Upload.is_used or upload_is_used_marker.exists():
-            # To upload files.
+            self._upload_sessions = UploadSessionStore(
+                environment.REFLEX_UPLOAD_SESSIONS_DIR.get()
+                or prerequisites.get_backend_dir() / constants.Dirs.UPLOAD_SESSIONS,
+                ttl=environment.REFLEX_UPLOAD_SESSION_TTL.get(),
+            )
+            # To upload files, optionally resuming across requests.
             self._api.add_route(
                 config.prepend_backend_path(str(constants.Endpoint.UPLOAD)),
-                upload(self),
-                methods=["POST"],
+                upload(self, self._upload_sessions),
+                methods=["POST", "PATCH", "HEAD", "DELETE"],
             )
 
             # To access uploaded files.
@@ -867,6 +908,14 @@ class App(MiddlewareMixin, LifespanMixin):
             )
         if environment.REFLEX_ADD_ALL_ROUTES_ENDPOINT.get():
             self.add_all_routes_endpoint()
+        if environment.REFLEX_ADD_EVENT_TRACES_ENDPOINT.get():
+            self.add_event_traces_endpoint()
+        if environment.REFLEX_ADD_EVENT_PROFILES_ENDPOINT.get():
+            self.add_event_profiles_endpoint()
+        if environment.REFLEX_ADD_STATE_ACCOUNTING_ENDPOINT.get():
+            self.add_state_accounting_endpoint()
+        if environment.REFLEX_MEDIA_STORE.get() is not None:
+            self.add_media_endpoint()
 
     @staticmethod
     def _add_cors(api: Starlette):
@@ -1702,6 +1751,122 @@ class App(MiddlewareMixin, LifespanMixin):
             methods=["GET"],
         )
 
+    def add_event_traces_endpoint(self):
+        """Add an endpoint serving the recent event traces and their per-phase latency.
+
+        The traces are kept by the in-memory trace exporter, which is registered
+        if needed. ``?limit=N`` limits the number of traces returned. The
+        counters of the thread pool running synchronous handlers, and of the
+        batched state update emits, are included.
+        """
+        if not self._api:
+            return
+
+        exporter = tracer.memory_exporter()
+
+        def event_traces(request: Request) -> Response:
+            try:
+                limit = int(request.query_params.get("limit", 100))
+            except ValueError:
+                return JSONResponse({"error": "limit must be an integer"}, 400)
+            return JSONResponse({
+                **exporter.to_json(limit=max(limit, 0)),
+                "executor": handler_executor.stats.to_dict(),
+                "emit": (
+                    self._event_namespace.emit_stats()
+                    if self._event_namespace is not None
+                    else {}
+                ),
+            })
+
+        config = get_config()
+        self._api.add_route(
+            config.prepend_backend_path(str(constants.Endpoint.EVENT_TRACES)),
+            event_traces,
+            methods=["GET"],
+        )
+
+    def add_event_profiles_endpoint(self):
+        """Add an endpoint serving the sampled stacks of slow event handlers.
+
+        GET returns a summary per handler, or with ``?format=folded`` the stacks
+        in the folded format of flamegraph tools. ``?handler=name`` limits the
+        stacks to one handler. DELETE drops the collected profiles.
+        """
+        if not self._api:
+            return
+
+        def event_profiles(request: Request) -> Response:
+            if request.method == "DELETE":
+                profiler.reset()
+                return Response(status_code=204)
+            if request.query_params.get("format") == "folded":
+                return PlainTextResponse(
+                    profiler.folded(handler=request.query_params.get("handler"))
+                )
+            return JSONResponse(profiler.summary())
+
+        config = get_config()
+        self._api.add_route(
+            config.prepend_backend_path(str(constants.Endpoint.EVENT_PROFILES)),
+            event_profiles,
+            methods=["GET", "DELETE"],
+        )
+
+    def add_state_accounting_endpoint(self):
+        """Add an endpoint serving the size and write accounting of each substate.
+
+        GET returns the accounting, largest substates first, and DELETE drops it.
+        """
+        if not self._api:
+            return
+
+        def state_accounting_report(request: Request) -> Response:
+            if request.method == "DELETE":
+                state_accounting.reset()
+                return Response(status_code=204)
+            return JSONResponse(state_accounting.report())
+
+        config = get_config()
+        self._api.add_route(
+            config.prepend_backend_path(str(constants.Endpoint.STATE_ACCOUNTING)),
+            state_accounting_report,
+            methods=["GET", "DELETE"],
+        )
+
+    def add_media_endpoint(self):
+        """Add an endpoint serving the images and bytes of state updates by digest.
+
+        The content of a digest never changes, so responses are cacheable forever,
+        but only by the browser: the media belongs to the state of one client.
+        """
+        if not self._api:
+            return
+
+        async def media(request: Request) -> Response:
+            digest = request.path_params["digest"]
+            blob = (
+                await media_offload.store.get(digest)
+                if media_offload.store is not None and is_digest(digest)
+                else None
+            )
+            if blob is None:
+                return Response(status_code=404)
+            headers = {
+                "ETag": f'"{digest}"',
+                "Cache-Control": "private, max-age=31536000, immutable",
+            }
+            if request.headers.get("if-none-match") == headers["ETag"]:
+                return Response(status_code=304, headers=headers)
+            return Response(blob.data, media_type=blob.content_type, headers=headers)
+
+        config = get_config()
+        self._api.add_route(
+            config.prepend_backend_path(str(constants.Endpoint.MEDIA)) + "/{digest}",
+            media,
+            methods=["GET"],
+        )
+
     @overload
     @deprecated("pass token as rx.BaseStateToken instead of str")
     def modify_state(
@@ -1869,6 +2034,22 @@ class App(MiddlewareMixin, LifespanMixin):
                     raise ValueError(msg)
 
 
+def _traced_json_dumps(obj: Any, **kwargs) -> str:
+    """Serialize a socket message, tracing the time and size for the current event.
+
+    Args:
+        obj: The message to serialize.
+        kwargs: Additional keyword arguments to pass to json.dumps.
+
+    Returns:
+        The serialized message.
+    """
+    with trace_span("serialize"):
+        serialized = format.json_dumps(obj, **kwargs)
+    add_to_attribute("update_bytes", len(serialized))
+    return serialized
+
+
 def ping(_request: Request) -> Response:
     """Test API endpoint.
 
@@ -1920,6 +2101,46 @@ async def health(_request: Request) -> JSONResponse:
     return JSONResponse(content=health_status, status_code=status_code)
 
 
+def _merge_updates(first: StateUpdate, second: StateUpdate) -> StateUpdate:
+    """Merge two state updates sent to the same client into one.
+
+    Args:
+        first: The earlier update.
+        second: The later update.
+
+    Returns:
+        The update with the fields of both deltas, the later winning, and the
+        events of both.
+    """
+    delta = {key: dict(fields) for key, fields in first.delta.items()}
+    for key, fields in second.delta.items():
+        delta.setdefault(key, {}).update(fields)
+    return StateUpdate(delta=delta, events=[*first.events, *second.events])
+
+
+@dataclasses.dataclass(slots=True, eq=False)
+class _PendingEmit:
+    """The state updates waiting to be sent to a connection."""
+
+    # The client token of the updates.
+    token: str
+
+    # The updates merged into one.
+    update: StateUpdate
+
+    # The task sending the previous merged update, sent first.
+    previous: asyncio.Task | None = None
+
+    # The number of updates merged.
+    count: int = 1
+
+    # The task sending the merged update at the end of the interval.
+    task: asyncio.Task | None = None
+
+    # Set to send the merged update without waiting for the end of the interval.
+    send_now: asyncio.Event = dataclasses.field(default_factory=asyncio.Event)
+
+
 class EventNamespace(AsyncNamespace):
     """The event namespace."""
 
@@ -1956,6 +2177,21 @@ class EventNamespace(AsyncNamespace):
         self._client_error_window_start = 0.0
         self._client_error_window_count = 0
 
+        # The updates waiting to be sent, by SID, when REFLEX_EMIT_BATCH_INTERVAL is set.
+        self._pending_emits: dict[str, _PendingEmit] = {}
+
+        # The task sending the latest merged update, by SID.
+        self._emit_tasks: dict[str, asyncio.Task] = {}
+
+        # The number of updates waiting to be sent.
+        self.emit_queue_depth = 0
+
+        # Updates merged into an update waiting to be sent.
+        self.emit_merged_total = 0
+
+        # Updates dropped, their connection closed before they were sent.
+        self.emit_dropped_total = 0
+
     @property
     def token_to_sid(self) -> Mapping[str, str]:
         """Get token to SID mapping for backward compatibility.
@@ -1987,7 +2223,9 @@ class EventNamespace(AsyncNamespace):
         """
         if isinstance(self._token_manager, RedisTokenManager):
             # Make sure this instance is watching for updates from other instances.
-            self._token_manager.ensure_lost_and_found_task(self.emit_update)
+            self._token_manager.ensure_lost_and_found_task(
+                self.emit_update, self._handle_forwarded
+            )
         query_params = urllib.parse.parse_qs(environ.get("QUERY_STRING", ""))
         token_list = query_params.get("token", [])
         if token_list:
@@ -2011,6 +2249,11 @@ class EventNamespace(AsyncNamespace):
             An asyncio Task for cleaning up the token, or None.
         """
         self._client_error_counts.pop(sid, None)
+        if (pending := self._pending_emits.pop(sid, None)) is not None:
+            if pending.task is not None:
+                pending.task.cancel()
+            self.emit_queue_depth -= pending.count
+            self.emit_dropped_total += pending.count
         # Get token before cleaning up
         disconnect_token = self.sid_to_token.get(sid)
         if disconnect_token:
@@ -2032,6 +2275,10 @@ class EventNamespace(AsyncNamespace):
     async def emit_update(self, update: StateUpdate, token: str) -> None:
         """Emit an update to the client.
 
+        With REFLEX_EMIT_BATCH_INTERVAL set, the updates sent to a connection
+        within the interval are merged and sent as one message, in order, and
+        this returns once the update is queued.
+
         Args:
             update: The state update to send.
             token: The client token (tab) associated with the event.
@@ -2051,11 +2298,130 @@ class EventNamespace(AsyncNamespace):
                     f"Attempting to send delta to disconnected client {token!r}"
                 )
             return
+        if (interval := environment.REFLEX_EMIT_BATCH_INTERVAL.get()) is not None:
+            self._queue_update(update, token, socket_record.sid, interval)
+            return
+        await self._send_update(update, token, socket_record.sid)
+
+    def _queue_update(
+        self, update: StateUpdate, token: str, sid: str, interval: int
+    ) -> None:
+        """Merge an update into the update waiting to be sent to a connection.
+
+        An update with events is not merged: the updates waiting are sent
+        first, then the update as it is, so the events run on the client
+        against the deltas sent before them and not the later ones.
+
+        Args:
+            update: The state update to send.
+            token: The client token (tab) associated with the event.
+            sid: The Socket.IO session id of the connection.
+            interval: The milliseconds to wait for more updates before sending.
+        """
+        pending = self._pending_emits.get(sid)
+        if pending is not None and update.events:
+            pending.send_now.set()
+            del self._pending_emits[sid]
+            pending = None
+        if pending is None:
+            pending = _PendingEmit(
+                token=token, update=update, previous=self._emit_tasks.get(sid)
+            )
+            if not update.events:
+                self._pending_emits[sid] = pending
+            task = pending.task = self._emit_tasks[sid] = asyncio.create_task(
+                self._flush_updates(
+                    sid, pending, 0 if update.events else interval / 1000
+                ),
+                name=f"reflex_emit_batch|{token}|{sid}|{time.time()}",
+            )
+            task.add_done_callback(
+                lambda task: (
+                    self._emit_tasks.get(sid) is task and self._emit_tasks.pop(sid)
+                )
+            )
+        else:
+            pending.update = _merge_updates(pending.update, update)
+            pending.count += 1
+            self.emit_merged_total += 1
+            add_to_attribute("merged_updates", 1)
+        self.emit_queue_depth += 1
+
+    async def _flush_updates(self, sid: str, pending: _PendingEmit, delay: float):
+        """Send the merged update of a connection at the end of the interval.
+
+        Args:
+            sid: The Socket.IO session id of the connection.
+            pending: The updates waiting to be sent.
+            delay: The seconds to wait for more updates.
+        """
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(pending.send_now.wait(), delay)
+        if pending.previous is not None:
+            # The errors of the previous update were logged by its own task.
+            await asyncio.wait([pending.previous])
+        if self._pending_emits.get(sid) is pending:
+            del self._pending_emits[sid]
+        self.emit_queue_depth -= pending.count
+        try:
+            await self._send_update(pending.update, pending.token, sid)
+        except Exception:
+            logger.exception(f"Failed to send a state update to {pending.token!r}")
+
+    def emit_stats(self) -> dict[str, int]:
+        """Get the counters of the updates sent with REFLEX_EMIT_BATCH_INTERVAL.
+
+        Returns:
+            The updates waiting to be sent, merged, and dropped on disconnect.
+        """
+        return {
+            "queue_depth": self.emit_queue_depth,
+            "merged_total": self.emit_merged_total,
+            "dropped_total": self.emit_dropped_total,
+        }
+
+    async def _send_update(self, update: StateUpdate, token: str, sid: str) -> None:
+        """Send an update to a connection of this instance.
+
+        Args:
+            update: The state update to send.
+            token: The client token (tab) associated with the event.
+            sid: The Socket.IO session id of the connection.
+        """
+        if (delta := await media_offload.offload_delta(update.delta)) is not None:
+            update = dataclasses.replace(update, delta=delta)
+        payload: StateUpdate | dict[str, Any] = update
+        if environment.REFLEX_COLUMNAR_TRANSPORT.get():
+            with trace_span("serialize"):
+                delta = columnar.encode_delta(update.delta)
+            if delta is not None:
+                # Socket.IO only finds the buffers to attach in plain dicts and lists.
+                payload = {**serialize_state_update(update), "delta": delta}
+                add_to_attribute("update_bytes", columnar.attachment_bytes(delta))
         # Creating a task prevents the update from being blocked behind other coroutines.
-        await asyncio.create_task(
-            self.emit(str(constants.SocketEvent.EVENT), update, to=socket_record.sid),
-            name=f"reflex_emit_event|{token}|{socket_record.sid}|{time.time()}",
-        )
+        with trace_span("emit"):
+            await asyncio.create_task(
+                self.emit(str(constants.SocketEvent.EVENT), payload, to=sid),
+                name=f"reflex_emit_event|{token}|{sid}|{time.time()}",
+            )
+
+    async def _handle_forwarded(self, record: ForwardedRecord) -> None:
+        """Run work that another instance forwarded to the owner of a token's socket.
+
+        Args:
+            record: The forwarded events or state modification.
+        """
+        if isinstance(record, ForwardedEventsRecord):
+            for event in record.events:
+                await self.app.event_processor.enqueue(record.token, event)
+            return
+        async with self.app.modify_state(
+            BaseStateToken(
+                ident=record.token, cls=State.get_class_substate(record.state_name)
+            ),
+            previous_dirty_vars=record.previous_dirty_vars,
+        ):
+            pass
 
     async def on_event(self, sid: str, data: Any):
         """Event for receiving front-end websocket events.
@@ -2068,6 +2434,7 @@ class EventNamespace(AsyncNamespace):
             RuntimeError: If the Socket.IO is badly initialized.
             EventDeserializationError: If the event data is not a dictionary.
         """
+        mark_received()
         # Determine the token for this SID
         if (token := self.sid_to_token.get(sid)) is None:
             logger.warning(
@@ -7,7 +7,7 @@ import dataclasses
 import json
 import logging
 import sys
-from collections.abc import Callable, Iterable, Sequence
+from collections.abc import Callable, Iterable, Mapping, Sequence
 from inspect import getmodule
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -44,7 +44,7 @@ from reflex_components_core.base.fragment import Fragment
 from reflex_components_radix.plugin import RadixThemesPlugin
 from rich.progress import Progress
 
-from reflex.compiler import templates, utils
+from reflex.compiler import computed_vars, templates, utils
 from reflex.compiler.plugins import default_page_plugins
 from reflex.compiler.plugins.builtin import collect_var_app_wraps_in_subtree
 from reflex.compiler.plugins.memoize import MemoizeStatefulPlugin
@@ -1139,6 +1139,30 @@ def _register_plugin_routes(app: App, plugins: Sequence[Plugin]) -> None:
     app._register_plugin_pages(plugins)
 
 
+def _report_computed_vars(app: App, outputs: Mapping[Path, str], save: bool):
+    """Cross-reference the computed vars of the app with its compiled output.
+
+    Args:
+        app: The app.
+        outputs: The compiled code by output path.
+        save: Whether to save the report for the backend.
+    """
+    if app._state is None:
+        return
+    web_dir = get_web_dir().absolute()
+    used = computed_vars.find_used_state_vars({
+        str(path.relative_to(web_dir)) if path.is_relative_to(web_dir) else str(path): (
+            code
+        )
+        for path, code in outputs.items()
+    })
+    report = computed_vars.computed_var_report(app._state, used)
+    computed_vars.warn_unused_computed_vars(report)
+    if save:
+        computed_vars.write_computed_var_report(report)
+    computed_vars.skip_unused_computed_vars(app._state, report)
+
+
 def compile_app(
     app: App,
     *,
@@ -1170,6 +1194,10 @@ def compile_app(
             for route in stateful_pages:
                 logger.debug(f"BE Evaluating stateful page: {route}")
                 app._compile_page(route, save_page=False)
+        if app._state is not None:
+            computed_vars.skip_unused_computed_vars(
+                app._state, computed_vars.load_computed_var_report()
+            )
         app._add_optional_endpoints()
         return False
 
@@ -1185,6 +1213,10 @@ def compile_app(
                 app._compile_page(route, save_page=False)
 
         app._write_stateful_pages_marker()
+        if app._state is not None:
+            computed_vars.skip_unused_computed_vars(
+                app._state, computed_vars.load_computed_var_report()
+            )
         app._add_optional_endpoints()
         return False
 
@@ -1393,6 +1425,14 @@ def compile_app(
     progress.stop()
 
     if dry_run:
+        _report_computed_vars(
+            app,
+            {
+                utils.resolve_path_of_web_dir(output_path): code
+                for output_path, code in compile_results
+            },
+            save=False,
+        )
         return True
 
     # Delete memo files this compile no longer emits. Done here (not before the
@@ -1449,6 +1489,8 @@ def compile_app(
                 raise FileNotFoundError(msg)
         output_mapping[path] = modify_fn(file_content)
 
+    _report_computed_vars(app, output_mapping, save=True)
+
     with log.timing(logger, "Write to Disk"):
         for output_path, code in output_mapping.items():
             utils.write_file(output_path, code)
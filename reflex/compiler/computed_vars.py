@@ -0,0 +1,174 @@
+"""Cross-reference the computed vars of the states with the compiled pages.
+
+The compiler records which state vars the compiled output reads, and reports
+for every computed var its dependencies, the computed vars depending on it and
+the files reading it. Frontend computed vars read by no file are unused: they
+are recomputed whenever they are invalidated, on every event when
+``cache=False``, and sent to a client that never reads them. With
+REFLEX_SKIP_UNUSED_COMPUTED_VARS set, they are left out of the deltas.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+from collections import defaultdict
+from collections.abc import Iterator, Mapping
+from typing import TYPE_CHECKING, Any
+
+from reflex_base import constants
+from reflex_base.constants.state import FIELD_MARKER
+from reflex_base.environment import PerformanceMode, environment
+from reflex_base.utils.format import format_state_name
+
+from reflex.utils import prerequisites
+
+if TYPE_CHECKING:
+    from reflex.state import BaseState
+
+logger = logging.getLogger(__name__)
+
+# A state var read in compiled code, e.g. `reflex___state____state.count_rx_state_`.
+_STATE_VAR_PATTERN = re.compile(rf"(\w+)\??\.(\w+){FIELD_MARKER}")
+
+
+def find_used_state_vars(
+    outputs: Mapping[str, str],
+) -> dict[tuple[str, str], set[str]]:
+    """Find the state vars read by compiled code.
+
+    Args:
+        outputs: The compiled code by output file.
+
+    Returns:
+        The files reading each (formatted state name, var name).
+    """
+    used: dict[tuple[str, str], set[str]] = defaultdict(set)
+    for path, code in outputs.items():
+        for match in _STATE_VAR_PATTERN.finditer(code):
+            used[match.group(1), match.group(2)].add(path)
+    return used
+
+
+def _walk_states(state: type[BaseState]) -> Iterator[type[BaseState]]:
+    yield state
+    for substate in sorted(state.get_substates(), key=lambda s: s.get_name()):
+        yield from _walk_states(substate)
+
+
+def computed_var_report(
+    root_state: type[BaseState], used: Mapping[tuple[str, str], set[str]]
+) -> dict[str, Any]:
+    """Report the dependencies and usage of the computed vars of a state tree.
+
+    Args:
+        root_state: The root state.
+        used: The files reading each state var, from find_used_state_vars.
+
+    Returns:
+        The computed vars by state full name, and the unused ones.
+    """
+    states: dict[str, dict[str, Any]] = {}
+    unused: dict[str, list[str]] = {}
+    for state in _walk_states(root_state):
+        full_name = state.get_full_name()
+        formatted_name = format_state_name(full_name)
+        computed_vars = {}
+        for name, cvar in state.computed_vars.items():
+            if name in state.inherited_vars:
+                continue
+            used_in = sorted(used.get((formatted_name, name), ()))
+            computed_vars[name] = {
+                "cache": cvar._cache,
+                "backend": cvar._backend,
+                "depends_on": sorted(
+                    f"{dep_state}.{dep}"
+                    for dep_state, deps in (
+                        cvar._deps(objclass=state).items() if cvar._cache else ()
+                    )
+                    for dep in deps
+                ),
+                "dependents": sorted(
+                    f"{dep_state}.{dep}"
+                    for dep_state, dep in state._var_dependencies.get(name, ())
+                ),
+                "used_in": used_in,
+            }
+            if not cvar._backend and not used_in:
+                unused.setdefault(full_name, []).append(name)
+        if computed_vars:
+            states[full_name] = computed_vars
+    return {"states": states, "unused": unused}
+
+
+def warn_unused_computed_vars(report: Mapping[str, Any]):
+    """Warn about the unused computed vars recomputed on every event, unless skipped.
+
+    Args:
+        report: The report from computed_var_report.
+    """
+    if (
+        environment.REFLEX_PERF_MODE.get() == PerformanceMode.OFF
+        or environment.REFLEX_SKIP_UNUSED_COMPUTED_VARS.get()
+    ):
+        return
+    unused = report["unused"]
+    uncached = [
+        f"{state}.{name}"
+        for state, names in unused.items()
+        for name in names
+        if not report["states"][state][name]["cache"]
+    ]
+    logger.debug(
+        f"{sum(map(len, unused.values()))} frontend computed vars are not read by any page."
+    )
+    if uncached:
+        logger.warning(
+            f"{len(uncached)} computed vars with cache=False are recomputed on every "
+            f"event but not read by any page: {', '.join(uncached)}. Remove them, "
+            "make them backend vars or set REFLEX_SKIP_UNUSED_COMPUTED_VARS to skip "
+            "them. Run `reflex computed-vars` for the full report."
+        )
+
+
+def write_computed_var_report(report: Mapping[str, Any]):
+    """Save the report for the backend and `reflex computed-vars`.
+
+    Args:
+        report: The report from computed_var_report.
+    """
+    path = prerequisites.get_backend_dir() / constants.Dirs.COMPUTED_VARS
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w") as file:
+        json.dump(report, file, indent=2)
+
+
+def load_computed_var_report() -> dict[str, Any] | None:
+    """Load the report saved by the last compile.
+
+    Returns:
+        The report, or None if the app was not compiled.
+    """
+    path = prerequisites.get_backend_dir() / constants.Dirs.COMPUTED_VARS
+    if not path.exists():
+        return None
+    with path.open("r") as file:
+        return json.load(file)
+
+
+def skip_unused_computed_vars(
+    root_state: type[BaseState], report: Mapping[str, Any] | None
+):
+    """Leave the unused computed vars out of the deltas, if enabled.
+
+    Args:
+        root_state: The root state.
+        report: The report from computed_var_report, None to skip nothing.
+    """
+    if report is None or not environment.REFLEX_SKIP_UNUSED_COMPUTED_VARS.get():
+        return
+    for state in _walk_states(root_state):
+        state._skip_unused_computed_vars(
+            set(report["unused"].get(state.get_full_name(), ()))
+        )
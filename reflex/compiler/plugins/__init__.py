@@ -15,6 +15,7 @@ from .builtin import (
     default_page_plugins,
 )
 from .memoize import MemoizeStatefulPlugin
+from .optimize import OptimizeVarsPlugin
 
 __all__ = [
     "ApplyStylePlugin",
@@ -25,6 +26,7 @@ __all__ = [
     "DefaultCollectorPlugin",
     "DefaultPagePlugin",
     "MemoizeStatefulPlugin",
+    "OptimizeVarsPlugin",
     "PageContext",
     "default_page_plugins",
 ]
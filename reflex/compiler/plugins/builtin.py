@@ -10,6 +10,7 @@ from reflex_base.components.component import BaseComponent, Component, Component
 from reflex_base.components.state_context import get_events_hooks_var_data
 from reflex_base.config import get_config
 from reflex_base.constants.compiler import Hooks
+from reflex_base.environment import environment
 from reflex_base.plugins import CompileContext, PageContext, PageDefinition, Plugin
 from reflex_base.plugins.base import HookOrder
 from reflex_base.utils.format import make_default_page_title
@@ -606,6 +607,10 @@ def default_page_plugins(
     from reflex.compiler.plugins.memoize import MemoizeStatefulPlugin
 
     chain: list[Plugin] = [*plugins, DefaultPagePlugin()]
+    if environment.REFLEX_OPTIMIZE_VARS.get():
+        from reflex.compiler.plugins.optimize import OptimizeVarsPlugin
+
+        chain.append(OptimizeVarsPlugin())
     if style is not None:
         chain.append(ApplyStylePlugin(style=style))
     chain.extend((DefaultCollectorPlugin(), MemoizeStatefulPlugin()))
@@ -0,0 +1,628 @@
+"""OptimizeVarsPlugin — fold constant var operations and hoist repeated expressions.
+
+Var operations are rendered as the JS expressions computing them, even when
+every operand is a literal: ``rx.text(LiteralVar.create(2) * 3)`` renders
+``(2 * 3)``, and a state expression used by several components of a page is
+recomputed by each of them on every render.
+
+With ``REFLEX_OPTIMIZE_VARS`` set, the plugin rewrites the props of the page
+components before they are collected:
+
+- Operations on literals only, for which the result in JS is known, are folded
+  into the literal of their result (arithmetic, comparisons, string
+  concatenation and case, ``to_string``). Operations that cannot be folded keep
+  their folded operands when they render them from their fields.
+- A state expression used by two or more props of the page is computed once, by
+  a ``useMemo`` hook depending on the state vars it reads, and the props read
+  the constant holding it.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import math
+import operator
+from collections.abc import Callable
+from typing import Any
+
+from reflex_base.components.component import BaseComponent, Component
+from reflex_base.plugins import CompileContext, PageContext
+from reflex_base.plugins.base import HookOrder, Plugin
+from reflex_base.utils.imports import ImportVar
+from reflex_base.vars import VarData
+from reflex_base.vars.base import (
+    CachedVarOperation,
+    ComputedVar,
+    CustomVarOperation,
+    LiteralNoneVar,
+    LiteralVar,
+    ToOperation,
+    Var,
+)
+from reflex_base.vars.function import (
+    JSON_STRINGIFY,
+    FunctionStringVar,
+    VarOperationCall,
+)
+from reflex_base.vars.number import LiteralBooleanVar, LiteralNumberVar
+from reflex_base.vars.sequence import ConcatVarOperation, LiteralStringVar
+
+# The largest integer represented exactly by a JS number.
+_MAX_SAFE_INTEGER = 2**53 - 1
+
+# The literal vars of JS primitives, which are folded.
+_PRIMITIVE_LITERALS = (
+    LiteralStringVar,
+    LiteralNumberVar,
+    LiteralBooleanVar,
+    LiteralNoneVar,
+)
+
+# The fields of every var, which are not operands.
+_VAR_FIELDS = frozenset({"_js_expr", "_var_type", "_var_data"})
+
+
+class _CannotFoldError(Exception):
+    """The result of an operation in JS is not known for its operands."""
+
+
+def _number(value: Any) -> int | float:
+    """Check that an operand is a number JS represents exactly.
+
+    Args:
+        value: The operand.
+
+    Returns:
+        The operand.
+
+    Raises:
+        _CannotFoldError: If the operand is not an int or float.
+    """
+    if type(value) is float or (type(value) is int and abs(value) <= _MAX_SAFE_INTEGER):
+        return value
+    raise _CannotFoldError
+
+
+def _ascii(value: Any) -> str:
+    """Check that an operand is a string, cased the same by JS and Python.
+
+    Args:
+        value: The operand.
+
+    Returns:
+        The operand.
+
+    Raises:
+        _CannotFoldError: If the operand is not an ASCII string.
+    """
+    if type(value) is str and value.isascii():
+        return value
+    raise _CannotFoldError
+
+
+def _comparable(lhs: Any, rhs: Any) -> tuple[Any, Any]:
+    """Check that two operands are compared the same by JS and Python.
+
+    Args:
+        lhs: The first operand.
+        rhs: The second operand.
+
+    Returns:
+        The operands.
+
+    Raises:
+        _CannotFoldError: If the operands are not two numbers or two ASCII strings.
+    """
+    if type(lhs) is str or type(rhs) is str:
+        return _ascii(lhs), _ascii(rhs)
+    return _number(lhs), _number(rhs)
+
+
+def _js_type(value: Any) -> str:
+    """Get the JS type of a primitive.
+
+    Args:
+        value: The primitive.
+
+    Returns:
+        The JS type of the primitive.
+    """
+    if value is None:
+        return "null"
+    if type(value) is bool:
+        return "boolean"
+    if type(value) is str:
+        return "string"
+    return "number"
+
+
+def _strict_equal(lhs: Any, rhs: Any) -> bool:
+    """Compare two primitives like ``===``.
+
+    Args:
+        lhs: The first operand.
+        rhs: The second operand.
+
+    Returns:
+        Whether the operands are strictly equal.
+    """
+    return _js_type(lhs) == _js_type(rhs) and lhs == rhs
+
+
+def _js_truthy(value: Any) -> bool:
+    """Get the truthiness of a primitive in JS.
+
+    Args:
+        value: The primitive.
+
+    Returns:
+        Whether the primitive is truthy.
+    """
+    if type(value) is float and math.isnan(value):
+        return False
+    return bool(value)
+
+
+def _js_string(value: Any) -> str:
+    """Convert a primitive to a string like ``String()``.
+
+    Args:
+        value: The primitive.
+
+    Returns:
+        The string of the primitive.
+
+    Raises:
+        _CannotFoldError: If Python formats the number differently than JS.
+    """
+    if value is None:
+        return "null"
+    if type(value) is bool:
+        return "true" if value else "false"
+    if type(value) is str:
+        return value
+    value = _number(value)
+    if type(value) is float:
+        if not math.isfinite(value):
+            raise _CannotFoldError
+        if value.is_integer() and abs(value) < 1e21:
+            return str(int(value))
+        if "e" in (string := repr(value)):
+            # Python and JS switch to the exponent notation at other magnitudes.
+            raise _CannotFoldError
+        return string
+    return str(value)
+
+
+def _modulo(lhs: Any, rhs: Any) -> int | float:
+    """Get the remainder of a division like ``%``, with the sign of the dividend.
+
+    Args:
+        lhs: The dividend.
+        rhs: The divisor.
+
+    Returns:
+        The remainder.
+    """
+    remainder = math.fmod(_number(lhs), _number(rhs))
+    return int(remainder) if type(lhs) is int and type(rhs) is int else remainder
+
+
+# The Python equivalents of the var operations, by operation name.
+_FOLDERS: dict[str, Callable[..., Any]] = {
+    "number_add_operation": lambda a, b: _number(a) + _number(b),
+    "number_subtract_operation": lambda a, b: _number(a) - _number(b),
+    "number_multiply_operation": lambda a, b: _number(a) * _number(b),
+    "number_true_division_operation": lambda a, b: _number(a) / _number(b),
+    "number_floor_division_operation": lambda a, b: math.floor(_number(a) / _number(b)),
+    "number_modulo_operation": _modulo,
+    "number_exponent_operation": lambda a, b: _number(a) ** _number(b),
+    "number_abs_operation": lambda a: abs(_number(a)),
+    "number_negate_operation": lambda a: -_number(a),
+    "number_ceil_operation": lambda a: math.ceil(_number(a)),
+    "number_floor_operation": lambda a: math.floor(_number(a)),
+    "number_trunc_operation": lambda a: math.trunc(_number(a)),
+    "greater_than_operation": lambda a, b: operator.gt(*_comparable(a, b)),
+    "greater_than_or_equal_operation": lambda a, b: operator.ge(*_comparable(a, b)),
+    "less_than_operation": lambda a, b: operator.lt(*_comparable(a, b)),
+    "less_than_or_equal_operation": lambda a, b: operator.le(*_comparable(a, b)),
+    "equal_operation": _strict_equal,
+    "not_equal_operation": lambda a, b: not _strict_equal(a, b),
+    "boolean_not_operation": lambda a: not _js_truthy(a),
+    "string_lower_operation": lambda a: _ascii(a).lower(),
+    "string_upper_operation": lambda a: _ascii(a).upper(),
+    "string_contains_operation": lambda a, b: _ascii(b) in _ascii(a),
+    "string_starts_with_operation": lambda a, b: _ascii(a).startswith(_ascii(b)),
+    "string_ends_with_operation": lambda a, b: _ascii(a).endswith(_ascii(b)),
+}
+
+
+def _literal_value(var: Var) -> Any:
+    """Get the value of a literal primitive var without var data.
+
+    Args:
+        var: The var.
+
+    Returns:
+        The value of the var.
+
+    Raises:
+        _CannotFoldError: If the var is not such a literal.
+    """
+    if not isinstance(var, _PRIMITIVE_LITERALS) or var._var_data is not None:
+        raise _CannotFoldError
+    return var._var_value
+
+
+def _to_literal(value: Any) -> Var:
+    """Create the literal var of a folded value.
+
+    Args:
+        value: The result of a folded operation.
+
+    Returns:
+        The literal var.
+
+    Raises:
+        _CannotFoldError: If the value is no primitive JS represents exactly.
+    """
+    if type(value) is float and not math.isfinite(value):
+        raise _CannotFoldError
+    if value is not None and type(value) not in (bool, str, float):
+        _number(value)
+    return LiteralVar.create(value)
+
+
+def _rebuild(var: Var, fold: Callable[[Var], Var]) -> Var:
+    """Rebuild an operation rendered from its fields with its operands folded.
+
+    Args:
+        var: The operation.
+        fold: The function folding an operand.
+
+    Returns:
+        The rebuilt operation, or the operation if no operand was folded.
+    """
+    changes = {}
+    for field in dataclasses.fields(var):  # pyright: ignore[reportArgumentType]
+        if field.name in _VAR_FIELDS or not field.init:
+            continue
+        value = getattr(var, field.name)
+        if isinstance(value, Var):
+            folded = fold(value)
+        elif type(value) is tuple:
+            folded = tuple(
+                fold(item) if isinstance(item, Var) else item for item in value
+            )
+            if all(a is b for a, b in zip(folded, value, strict=True)):
+                continue
+        else:
+            continue
+        if folded is not value:
+            changes[field.name] = folded
+    if not changes:
+        return var
+    try:
+        return dataclasses.replace(var, **changes)  # pyright: ignore[reportArgumentType]
+    except (TypeError, ValueError):
+        return var
+
+
+def fold_constants(var: Var, _cache: dict[int, tuple[Var, Var]] | None = None) -> Var:
+    """Fold the operations on literals of a var into the literals of their results.
+
+    Args:
+        var: The var to fold.
+        _cache: The folded vars by the id of the var, kept alongside it.
+
+    Returns:
+        The folded var, or the var itself if nothing was folded.
+    """
+    if _cache is None:
+        _cache = {}
+    if (cached := _cache.get(id(var))) is not None:
+        return cached[1]
+
+    def fold(operand: Var) -> Var:
+        return fold_constants(operand, _cache)
+
+    folded = var
+    try:
+        if isinstance(var, ToOperation):
+            original = fold(var._original)  # pyright: ignore[reportAttributeAccessIssue]
+            if isinstance(original, _PRIMITIVE_LITERALS) and var._var_data is None:
+                folded = original
+            elif original is not var._original:  # pyright: ignore[reportAttributeAccessIssue]
+                folded = dataclasses.replace(var, _original=original)  # pyright: ignore[reportArgumentType, reportCallIssue]
+        elif isinstance(var, CustomVarOperation):
+            # The expression is rendered when created, only folded as a whole.
+            folder = _FOLDERS.get(var._name)
+            if folder is not None and var._var_data is None:
+                folded = _to_literal(
+                    folder(*(_literal_value(fold(arg)) for _, arg in var._args))
+                )
+        elif isinstance(var, ConcatVarOperation):
+            folded = _rebuild(var, fold)
+            if var._var_data is None and isinstance(folded, ConcatVarOperation):
+                folded = LiteralStringVar.create(
+                    "".join(
+                        _js_string(_literal_value(part)) for part in folded._var_value
+                    )
+                )
+        elif (
+            isinstance(var, VarOperationCall)
+            and var._func is JSON_STRINGIFY
+            and var._var_data is None
+            and len(var._args) == 1
+            and isinstance(var._args[0], Var)
+        ):
+            value = _literal_value(fold(var._args[0]))
+            folded = LiteralStringVar.create(
+                json.dumps(_ascii(value)) if type(value) is str else _js_string(value)
+            )
+        elif isinstance(var, CachedVarOperation):
+            folded = _rebuild(var, fold)
+    except (_CannotFoldError, ArithmeticError, TypeError, ValueError):
+        folded = var
+    _cache[id(var)] = (var, folded)
+    return folded
+
+
+# The prefix of the names of the constants holding hoisted expressions.
+HOISTED_PREFIX = "reflex___expr_"
+
+# The global objects whose functions may be called by hoisted expressions.
+_GLOBAL_OBJECTS = frozenset({"Array", "JSON", "Math", "Number", "Object", "String"})
+
+
+def _has_hooks(var_data: VarData | None) -> bool:
+    """Check whether var data needs hooks or components in scope.
+
+    Args:
+        var_data: The var data.
+
+    Returns:
+        Whether the var data has hooks or components.
+    """
+    return var_data is not None and bool(var_data.hooks or var_data.components)
+
+
+def _collect_state_reads(var: Var, reads: dict[str, None]) -> bool:
+    """Collect the state vars read by an expression of state vars and literals.
+
+    Args:
+        var: The expression.
+        reads: The JS expressions of the state vars read, in order.
+
+    Returns:
+        Whether the expression only reads state vars, literals and global functions.
+    """
+    var_data = var._var_data
+    if type(var) is Var or isinstance(var, ComputedVar):
+        if var_data is None or not var_data.state or var_data.components:
+            return False
+        reads[str(var)] = None
+        return True
+    if _has_hooks(var_data):
+        return False
+    if isinstance(var, _PRIMITIVE_LITERALS):
+        return True
+    if isinstance(var, FunctionStringVar):
+        return str(var).partition(".")[0] in _GLOBAL_OBJECTS
+    if isinstance(var, ToOperation):
+        return _collect_state_reads(var._original, reads)  # pyright: ignore[reportAttributeAccessIssue]
+    if isinstance(var, CustomVarOperation):
+        if not all(_collect_state_reads(arg, reads) for _, arg in var._args):
+            return False
+        # The returned expression merges the var data of the operands.
+        return_data = var._return._get_all_var_data()
+        if return_data is None:
+            return True
+        args_data = VarData.merge(*(arg._get_all_var_data() for _, arg in var._args))
+        return not return_data.components and set(return_data.hooks) <= set(
+            args_data.hooks if args_data is not None else ()
+        )
+    if not isinstance(var, CachedVarOperation):
+        return False
+    for field in dataclasses.fields(var):  # pyright: ignore[reportArgumentType]
+        if field.name in _VAR_FIELDS:
+            continue
+        value = getattr(var, field.name)
+        for item in value if type(value) is tuple else (value,):
+            if isinstance(item, Var):
+                if not _collect_state_reads(item, reads):
+                    return False
+            elif item is not None and type(item) not in (str, int, float, bool):
+                return False
+    return True
+
+
+def _hoisted_var_data(
+    expression: str, reads: dict[str, None], var_data: VarData | None
+) -> tuple[str, VarData]:
+    """Create the constant computing an expression once per state change.
+
+    The expression is evaluated by the hook even where the component using it
+    would not, e.g. in the branch of a cond not taken, so errors thrown by the
+    expression are caught.
+
+    Args:
+        expression: The JS expression.
+        reads: The state vars read by the expression.
+        var_data: The var data of the expression.
+
+    Returns:
+        The name of the constant and the var data of its hook.
+    """
+    name = HOISTED_PREFIX + hashlib.sha256(expression.encode()).hexdigest()[:16]
+    hook = (
+        f"const {name} = useMemo(() => {{ try {{ return {expression}; }} "
+        f"catch {{ return undefined; }} }}, [{', '.join(reads)}]);"
+    )
+    return name, VarData(
+        hooks={hook: var_data},
+        imports={"react": [ImportVar(tag="useMemo")]},
+    )
+
+
+def _prop_vars(comp: Component) -> list[tuple[str, Var]]:
+    """Get the props of a component set to vars.
+
+    Args:
+        comp: The component.
+
+    Returns:
+        The names and vars of the props.
+    """
+    return [
+        (prop, value)
+        for prop in comp.get_props()
+        if isinstance(value := getattr(comp, prop, None), Var)
+    ]
+
+
+def _hoisted_expressions(
+    root: BaseComponent,
+    fold_cache: dict[int, tuple[Var, Var]],
+    min_uses: int,
+) -> dict[str, tuple[str, VarData]]:
+    """Find the state expressions used by enough props of a component tree.
+
+    Args:
+        root: The root of the tree.
+        fold_cache: The cache of fold_constants.
+        min_uses: The fewest uses of a hoisted expression.
+
+    Returns:
+        The name and hook var data of the hoisted expressions, by expression.
+    """
+    uses: dict[str, int] = {}
+    candidates: dict[str, tuple[Var, dict[str, None]]] = {}
+    visited: set[int] = set()
+    stack = [root]
+    while stack:
+        comp = stack.pop()
+        if id(comp) in visited or not isinstance(comp, Component):
+            continue
+        visited.add(id(comp))
+        stack.extend(comp.children)
+        for _, value in _prop_vars(comp):
+            var = fold_constants(value, fold_cache)
+            expression = str(var)
+            if expression in uses:
+                uses[expression] += 1
+                continue
+            uses[expression] = 1
+            operation = var
+            while isinstance(operation, ToOperation):
+                operation = operation._original  # pyright: ignore[reportAttributeAccessIssue]
+            reads = {}
+            if (
+                isinstance(operation, CachedVarOperation)
+                and _collect_state_reads(var, reads)
+                and reads
+            ):
+                candidates[expression] = (var, reads)
+    return {
+        expression: _hoisted_var_data(expression, reads, var._get_all_var_data())
+        for expression, (var, reads) in candidates.items()
+        if uses[expression] >= min_uses
+    }
+
+
+def _optimize_props(
+    comp: BaseComponent,
+    page_context: PageContext,
+    fold_cache: dict[int, tuple[Var, Var]],
+    hoisted: dict[str, tuple[str, VarData]],
+) -> Component | None:
+    """Fold the props of a component and replace the hoisted expressions.
+
+    Args:
+        comp: The component.
+        page_context: The page context, to own the component before changing it.
+        fold_cache: The cache of fold_constants.
+        hoisted: The name and hook var data of the hoisted expressions.
+
+    Returns:
+        The page-local copy of the component with its props optimized, or None.
+    """
+    if not isinstance(comp, Component):
+        return None
+    changes = {}
+    for prop, value in _prop_vars(comp):
+        optimized = fold_constants(value, fold_cache)
+        if hoisted and (constant := hoisted.get(str(optimized))) is not None:
+            name, var_data = constant
+            optimized = optimized._replace(_js_expr=name, merge_var_data=var_data)
+        if optimized is not value:
+            changes[prop] = optimized
+    if not changes:
+        return None
+    owned = page_context.own(comp)
+    for prop, value in changes.items():
+        setattr(owned, prop, value)
+    owned._clear_compile_caches()
+    return owned
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class OptimizeVarsPlugin(Plugin):
+    """Fold constant var operations and hoist the state expressions repeated in a page."""
+
+    # Rewrite the props before the other plugins read them.
+    _compiler_enter_component_order = HookOrder.PRE
+
+    # The fewest props of a page using a state expression for it to be hoisted.
+    min_uses: int = 2
+
+    def enter_component(
+        self,
+        comp: BaseComponent,
+        /,
+        *,
+        page_context: PageContext,
+        compile_context: Any,
+        in_prop_tree: bool = False,
+    ) -> BaseComponent | None:
+        """Fold the constant operations of the props of a component.
+
+        Hoisting needs the uses of the expressions in the whole page, counted by
+        the hook bound to the page.
+
+        Returns:
+            The page-local copy of the component with its props folded, or None.
+        """
+        if in_prop_tree:
+            return None
+        return _optimize_props(comp, page_context, {}, {})
+
+    def _compiler_bind_enter_component(
+        self,
+        page_context: PageContext,
+        compile_context: CompileContext,
+    ) -> Callable[[BaseComponent, bool], BaseComponent | None]:
+        """Bind an enter hook counting the uses of the expressions from the root.
+
+        Returns:
+            A compiled enter hook that only takes hot-loop positional state.
+        """
+        fold_cache: dict[int, tuple[Var, Var]] = {}
+        hoisted: dict[str, tuple[str, VarData]] | None = None
+        min_uses = self.min_uses
+
+        def enter_component(
+            comp: BaseComponent,
+            in_prop_tree: bool,
+        ) -> BaseComponent | None:
+            nonlocal hoisted
+            if hoisted is None:
+                # The first component entered is the root of the walk.
+                hoisted = _hoisted_expressions(comp, fold_cache, min_uses)
+            if in_prop_tree:
+                return None
+            return _optimize_props(comp, page_context, fold_cache, hoisted)
+
+        return enter_component
@@ -0,0 +1,328 @@
+"""Size and write accounting for substates.
+
+When ``state_accounting`` is enabled, every state update records which
+substates and fields were dirty, every assignment records whether the field
+actually changed, and every serialization by a state manager records its size.
+One update in ``sample_rate`` of each substate also measures the in-memory and
+pickled size of the substate. Accounting aggregates across sessions by substate
+class, to find where splitting a state or moving a field to a backend var pays
+off.
+"""
+
+from __future__ import annotations
+
+import collections
+import contextlib
+import dataclasses
+import pickle
+import sys
+from types import FunctionType, ModuleType
+from typing import TYPE_CHECKING, Any
+
+from reflex.istate import HANDLED_PICKLE_ERRORS
+
+if TYPE_CHECKING:
+    from reflex.state import BaseState
+
+# Values whose size does not depend on anything they reference.
+_ATOMIC_TYPES = (str, bytes, bytearray, int, float, complex, bool, type(None))
+
+# Values shared by the whole process rather than owned by a state.
+_SHARED_TYPES = (type, ModuleType, FunctionType)
+
+# The maximum number of objects visited when measuring the size of a substate.
+MAX_SIZED_OBJECTS = 100_000
+
+# A field is flagged as redundant once it has been assigned this many times,
+# is dirty in this fraction of the updates of its substate, and this fraction
+# of its assignments set an equal value.
+REDUNDANT_MIN_ASSIGNMENTS = 20
+REDUNDANT_DIRTY_RATE = 0.9
+REDUNDANT_UNCHANGED_RATE = 0.9
+
+
+def deep_sizeof(obj: Any, limit: int = MAX_SIZED_OBJECTS) -> int:
+    """Estimate the memory used by an object and everything it references.
+
+    Args:
+        obj: The object to measure.
+        limit: Stop after visiting this many objects.
+
+    Returns:
+        The estimated size in bytes.
+    """
+    seen = set()
+    stack = [obj]
+    size = 0
+    while stack and len(seen) < limit:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        if isinstance(obj, _SHARED_TYPES):
+            continue
+        size += sys.getsizeof(obj, 0)
+        if isinstance(obj, _ATOMIC_TYPES):
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset, collections.deque)):
+            stack.extend(obj)
+        elif (attrs := getattr(obj, "__dict__", None)) is not None:
+            stack.append(attrs)
+    return size
+
+
+def _equal(old: Any, new: Any) -> bool:
+    """Check whether an assignment keeps the value of a field.
+
+    Args:
+        old: The previous value.
+        new: The assigned value.
+
+    Returns:
+        Whether the values are equal, False when they cannot be compared.
+    """
+    if old is new:
+        return True
+    try:
+        return bool(old == new)
+    except Exception:
+        # e.g. the elementwise comparison of arrays and dataframes.
+        return False
+
+
+@dataclasses.dataclass
+class SizeStats:
+    """Observed sizes in bytes."""
+
+    samples: int = 0
+    total: int = 0
+    max: int = 0
+    last: int = 0
+
+    def observe(self, size: int):
+        """Record a size.
+
+        Args:
+            size: The size in bytes.
+        """
+        self.samples += 1
+        self.total += size
+        self.max = max(self.max, size)
+        self.last = size
+
+    def to_dict(self) -> dict[str, int]:
+        """Summarize the sizes.
+
+        Returns:
+            The sample count and the mean, max and last size.
+        """
+        return {
+            "samples": self.samples,
+            "mean": self.total // self.samples if self.samples else 0,
+            "max": self.max,
+            "last": self.last,
+        }
+
+
+@dataclasses.dataclass
+class FieldStats:
+    """How often a field is rewritten, and how often that changes it."""
+
+    # The updates of its substate in which the field was dirty.
+    dirty: int = 0
+
+    # The assignments to the field.
+    assignments: int = 0
+
+    # The assignments setting a value equal to the previous one.
+    unchanged: int = 0
+
+
+@dataclasses.dataclass
+class SubstateStats:
+    """The accounting of a substate class across sessions."""
+
+    # The full name of the substate.
+    state: str
+
+    # The state updates in which the substate was dirty.
+    updates: int = 0
+
+    # The times a state manager serialized the substate to store it.
+    writes: int = 0
+
+    serialized_bytes: SizeStats = dataclasses.field(default_factory=SizeStats)
+    memory_bytes: SizeStats = dataclasses.field(default_factory=SizeStats)
+
+    # The stats of the base and backend vars of the substate by name.
+    fields: dict[str, FieldStats] = dataclasses.field(
+        default_factory=lambda: collections.defaultdict(FieldStats)
+    )
+
+    # The updates of the substate in which each computed var was invalidated.
+    computed_vars: collections.Counter[str] = dataclasses.field(
+        default_factory=collections.Counter
+    )
+
+    def redundant_fields(self) -> list[str]:
+        """Get the fields rewritten in most updates without changing.
+
+        Returns:
+            The names of the fields.
+        """
+        return [
+            name
+            for name, field in self.fields.items()
+            if field.assignments >= REDUNDANT_MIN_ASSIGNMENTS
+            and field.dirty >= self.updates * REDUNDANT_DIRTY_RATE
+            and field.unchanged >= field.assignments * REDUNDANT_UNCHANGED_RATE
+        ]
+
+    def to_dict(self, root_updates: int) -> dict[str, Any]:
+        """Summarize the accounting of the substate.
+
+        Args:
+            root_updates: The number of updates of all states.
+
+        Returns:
+            The counts, dirty rate, sizes, field stats, redundant fields and
+            computed var invalidations, the most invalidated first.
+        """
+        return {
+            "updates": self.updates,
+            "dirty_rate": self.updates / root_updates if root_updates else 0.0,
+            "writes": self.writes,
+            "serialized_bytes": self.serialized_bytes.to_dict(),
+            "memory_bytes": self.memory_bytes.to_dict(),
+            "fields": {
+                name: dataclasses.asdict(field)
+                for name, field in sorted(self.fields.items())
+            },
+            "redundant_fields": self.redundant_fields(),
+            "invalidated_computed_vars": dict(self.computed_vars.most_common()),
+        }
+
+
+@dataclasses.dataclass
+class StateAccounting:
+    """Aggregate the size and write accounting of every substate class."""
+
+    # Measure the size of a substate once in this many of its updates. Accounting is off when 0.
+    sample_rate: int = 0
+
+    # The number of updates of all states.
+    root_updates: int = 0
+
+    # The accounting by substate full name.
+    states: dict[str, SubstateStats] = dataclasses.field(default_factory=dict)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether state updates are accounted for.
+
+        Returns:
+            True when a sample rate is set.
+        """
+        return self.sample_rate > 0
+
+    def configure_from_environment(self):
+        """Apply REFLEX_STATE_ACCOUNTING_SAMPLE_RATE if it is set."""
+        from reflex_base.environment import environment
+
+        if environment.REFLEX_STATE_ACCOUNTING_SAMPLE_RATE.is_set():
+            self.sample_rate = environment.REFLEX_STATE_ACCOUNTING_SAMPLE_RATE.get()
+
+    def _stats(self, state: BaseState) -> SubstateStats:
+        name = state.get_full_name()
+        stats = self.states.get(name)
+        if stats is None:
+            stats = self.states[name] = SubstateStats(state=name)
+        return stats
+
+    def record_assignment(self, state: BaseState, name: str, old: Any, new: Any):
+        """Record an assignment to a base or backend var.
+
+        Args:
+            state: The state owning the var.
+            name: The name of the var.
+            old: The previous value.
+            new: The assigned value.
+        """
+        field = self._stats(state).fields[name]
+        field.assignments += 1
+        if _equal(old, new):
+            field.unchanged += 1
+
+    def record_clean(self, state: BaseState):
+        """Record the dirty vars of a state about to be cleaned after an update.
+
+        Args:
+            state: The state.
+        """
+        if state.parent_state is None:
+            self.root_updates += 1
+        if not state.dirty_vars:
+            return
+        stats = self._stats(state)
+        stats.updates += 1
+        for name in state.dirty_vars:
+            if name in state.base_vars or name in state.backend_vars:
+                stats.fields[name].dirty += 1
+            elif name in state.computed_vars:
+                stats.computed_vars[name] += 1
+        if stats.updates % self.sample_rate == 1 or self.sample_rate == 1:
+            self._measure(state, stats)
+
+    def record_write(self, state: BaseState, size: int):
+        """Record the serialization of a state by a state manager.
+
+        Args:
+            state: The state.
+            size: The size of the serialized state.
+        """
+        stats = self._stats(state)
+        stats.writes += 1
+        stats.serialized_bytes.observe(size)
+
+    def _measure(self, state: BaseState, stats: SubstateStats):
+        """Measure the in-memory and pickled size of a state, without its substates.
+
+        Args:
+            state: The state.
+            stats: The accounting of the state.
+        """
+        stats.memory_bytes.observe(deep_sizeof(state.__getstate__()))
+        # Unpicklable states are reported when a state manager serializes them.
+        with contextlib.suppress(*HANDLED_PICKLE_ERRORS):
+            stats.serialized_bytes.observe(len(pickle.dumps(state)))
+
+    def report(self) -> dict[str, Any]:
+        """Summarize the accounting, the largest substates first.
+
+        Returns:
+            The sample rate, the number of updates and a summary per substate.
+        """
+        states = sorted(
+            self.states.values(),
+            key=lambda stats: (stats.serialized_bytes.max, stats.memory_bytes.max),
+            reverse=True,
+        )
+        return {
+            "sample_rate": self.sample_rate,
+            "updates": self.root_updates,
+            "states": {
+                stats.state: stats.to_dict(self.root_updates) for stats in states
+            },
+        }
+
+    def reset(self):
+        """Drop the accumulated accounting."""
+        self.root_updates = 0
+        self.states.clear()
+
+
+# The accounting of the states of this process.
+state_accounting = StateAccounting()
@@ -5,13 +5,16 @@ import contextlib
 import dataclasses
 import functools
 import logging
+import os
 import time
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
 from hashlib import md5
 from pathlib import Path
-from typing import Any, Generic, cast
+from typing import Any, Generic, TypeVar, cast
 
 from reflex_base.environment import environment
+from reflex_base.event.tracing import add_to_attribute, span, traced_lock
 from typing_extensions import Unpack, override
 
 from reflex.istate.manager import (
@@ -22,10 +25,11 @@ from reflex.istate.manager import (
 from reflex.istate.manager.token import TOKEN_TYPE, BaseStateToken, StateToken
 from reflex.state import BaseState
 from reflex.utils import path_ops, prerequisites
-from reflex.utils.misc import run_in_thread
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 
 @dataclasses.dataclass(frozen=True)
 class QueueItem(Generic[TOKEN_TYPE]):
@@ -36,6 +40,29 @@ class QueueItem(Generic[TOKEN_TYPE]):
     timestamp: float
 
 
+@dataclasses.dataclass
+class DiskIOStats:
+    """Counters describing the disk state manager's I/O executor."""
+
+    # The number of executor jobs currently submitted but not yet finished.
+    queue_depth: int = 0
+
+    # The highest queue depth observed since the manager was created.
+    max_queue_depth: int = 0
+
+    # The number of state files read from disk.
+    reads: int = 0
+
+    # The number of state files written to disk.
+    writes: int = 0
+
+    # The number of executor jobs used to write state files.
+    write_batches: int = 0
+
+    # The number of fsync calls issued (files and directories).
+    fsyncs: int = 0
+
+
 @dataclasses.dataclass
 class StateManagerDisk(StateManager):
     """A state manager that stores states on disk."""
@@ -71,6 +98,24 @@ class StateManagerDisk(StateManager):
         default=environment.REFLEX_STATE_MANAGER_DISK_DEBOUNCE_SECONDS.get()
     )
 
+    # The maximum number of threads used for concurrent state file I/O.
+    io_workers: int = dataclasses.field(
+        default_factory=environment.REFLEX_STATE_MANAGER_DISK_IO_WORKERS.get
+    )
+
+    # Whether to fsync state files after each write batch.
+    fsync: bool = dataclasses.field(
+        default_factory=environment.REFLEX_STATE_MANAGER_DISK_FSYNC.get
+    )
+
+    # Counters for the I/O executor.
+    io_stats: DiskIOStats = dataclasses.field(default_factory=DiskIOStats, init=False)
+
+    # The bounded executor for state file reads and writes.
+    _io_executor: ThreadPoolExecutor | None = dataclasses.field(
+        default=None, init=False
+    )
+
     def __post_init__(self):
         """Create a new state manager."""
         path_ops.mkdir(self.states_directory)
@@ -104,6 +149,37 @@ class StateManagerDisk(StateManager):
                 # remove the file
                 path.unlink()
 
+    async def _run_io(self, func: Callable[..., _T], *args: Any) -> _T:
+        """Run a blocking I/O function on the bounded state file executor.
+
+        Args:
+            func: The blocking function to run.
+            *args: The arguments to pass to the function.
+
+        Returns:
+            The return value of the function.
+        """
+        if self._io_executor is None:
+            self._io_executor = ThreadPoolExecutor(
+                max_workers=max(1, self.io_workers),
+                thread_name_prefix="StateManagerDisk",
+            )
+        stats = self.io_stats
+        stats.queue_depth += 1
+        if stats.queue_depth > stats.max_queue_depth:
+            stats.max_queue_depth = stats.queue_depth
+            if stats.max_queue_depth > self.io_workers:
+                logger.debug(
+                    f"StateManagerDisk: I/O queue depth reached {stats.max_queue_depth} "
+                    f"with {self.io_workers} workers"
+                )
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._io_executor, func, *args
+            )
+        finally:
+            stats.queue_depth -= 1
+
     def token_path(self, token: StateToken) -> Path:
         """Get the path for a token.
 
@@ -117,8 +193,8 @@ class StateManagerDisk(StateManager):
             self.states_directory / f"{md5(str(token).encode()).hexdigest()}.pkl"
         ).absolute()
 
-    async def load_state(self, token: StateToken[TOKEN_TYPE]) -> TOKEN_TYPE | None:
-        """Load a state object based on the provided token.
+    def _read_state_file(self, token: StateToken[TOKEN_TYPE]) -> TOKEN_TYPE | None:
+        """Read and deserialize a state file (blocking).
 
         Args:
             token: The token used to identify the state object.
@@ -127,30 +203,52 @@ class StateManagerDisk(StateManager):
             The loaded state object or None.
         """
         token_path = self.token_path(token)
+        try:
+            with token_path.open(mode="rb") as file:
+                return token.deserialize(fp=file)
+        except Exception:
+            return None
 
-        if token_path.exists():
-            try:
-                with token_path.open(mode="rb") as file:
-                    return token.deserialize(fp=file)
-            except Exception:
-                pass
-        return None
+    async def load_state(self, token: StateToken[TOKEN_TYPE]) -> TOKEN_TYPE | None:
+        """Load a state object based on the provided token.
+
+        Args:
+            token: The token used to identify the state object.
+
+        Returns:
+            The loaded state object or None.
+        """
+        state = cast(
+            "TOKEN_TYPE | None", await self._run_io(self._read_state_file, token)
+        )
+        if state is not None:
+            self.io_stats.reads += 1
+        return state
 
     async def populate_substates(
         self, token: BaseStateToken, state: BaseState, root_state: BaseState
     ):
         """Populate the substates of a state object.
 
+        Sibling substates are loaded concurrently on the I/O executor.
+
         Args:
             token: The token used to identify the state object.
             state: The state object to populate.
             root_state: The root state object.
         """
-        for substate in state.get_substates():
-            substate_token = token.with_cls(substate)
-
+        substate_classes = list(state.get_substates())
+        if not substate_classes:
+            return
+        loaded_instances = await asyncio.gather(
+            *(
+                self.load_state(token.with_cls(substate))
+                for substate in substate_classes
+            )
+        )
+        instances = []
+        for substate, instance in zip(substate_classes, loaded_instances, strict=True):
             fresh_instance = await root_state.get_state(substate)
-            instance = await self.load_state(substate_token)
             if instance is not None:
                 # Ensure all substates exist, even if they weren't serialized previously.
                 instance.substates = fresh_instance.substates
@@ -158,8 +256,14 @@ class StateManagerDisk(StateManager):
                 instance = fresh_instance
             state.substates[substate.get_name()] = instance
             instance.parent_state = state
+            instances.append(instance)
 
-            await self.populate_substates(token, instance, root_state)
+        await asyncio.gather(
+            *(
+                self.populate_substates(token, instance, root_state)
+                for instance in instances
+            )
+        )
 
     @override
     async def get_state(
@@ -206,29 +310,99 @@ class StateManagerDisk(StateManager):
         self.states[token.cache_key] = state
         return cast(TOKEN_TYPE, state)
 
-    async def set_state_for_substate(
-        self, token: StateToken[TOKEN_TYPE], substate: TOKEN_TYPE
+    def _collect_substate_writes(
+        self,
+        token: StateToken[TOKEN_TYPE],
+        substate: TOKEN_TYPE,
+        writes: list[tuple[Path, bytes]],
     ):
-        """Set the state for a substate.
+        """Serialize every touched state in a subtree into pending file writes.
 
         Args:
             token: The token used to identify the state object.
-            substate: The substate to set.
+            substate: The substate to serialize.
+            writes: The list of (path, data) pairs to append to.
         """
-        substate_token = token.with_cls(type(substate))
-
         if token.get_and_reset_touched_state(substate):
             pickle_state = token.serialize(substate)
             if pickle_state:
-                if not self.states_directory.exists():
-                    self.states_directory.mkdir(parents=True, exist_ok=True)
-                await run_in_thread(
-                    lambda: self.token_path(substate_token).write_bytes(pickle_state),
-                )
+                writes.append((
+                    self.token_path(token.with_cls(type(substate))),
+                    pickle_state,
+                ))
 
         if isinstance(token, BaseStateToken) and isinstance(substate, BaseState):
             for substate_substate in substate.substates.values():
-                await self.set_state_for_substate(token, substate_substate)
+                self._collect_substate_writes(token, substate_substate, writes)
+
+    def _write_state_files(self, writes: list[tuple[Path, bytes]]) -> int:
+        """Write a batch of state files (blocking).
+
+        When fsync is enabled, each file is synced and the states directory is
+        synced once for the whole batch.
+
+        Args:
+            writes: The list of (path, data) pairs to write.
+
+        Returns:
+            The number of fsync calls issued.
+        """
+        fsyncs = 0
+        if not self.states_directory.exists():
+            self.states_directory.mkdir(parents=True, exist_ok=True)
+        for path, data in writes:
+            with path.open(mode="wb") as file:
+                file.write(data)
+                if self.fsync:
+                    file.flush()
+                    os.fsync(file.fileno())
+                    fsyncs += 1
+        if self.fsync and hasattr(os, "O_DIRECTORY"):
+            dir_fd = os.open(self.states_directory, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+                fsyncs += 1
+            finally:
+                os.close(dir_fd)
+        return fsyncs
+
+    async def _write_batch(self, writes: list[tuple[Path, bytes]]):
+        """Write a batch of serialized states in a single executor job.
+
+        Args:
+            writes: The list of (path, data) pairs to write.
+        """
+        if not writes:
+            return
+        fsyncs = await self._run_io(self._write_state_files, writes)
+        self.io_stats.writes += len(writes)
+        self.io_stats.write_batches += 1
+        self.io_stats.fsyncs += fsyncs
+
+    async def _write_queue_items(self, items: list[QueueItem]):
+        """Write the touched substates of several queued states in one executor job.
+
+        Args:
+            items: The queued states to write.
+        """
+        writes: list[tuple[Path, bytes]] = []
+        for item in items:
+            self._collect_substate_writes(item.token, item.state, writes)
+        await self._write_batch(writes)
+
+    async def set_state_for_substate(
+        self, token: StateToken[TOKEN_TYPE], substate: TOKEN_TYPE
+    ):
+        """Set the state for a substate and all of its touched descendants.
+
+        Args:
+            token: The token used to identify the state object.
+            substate: The substate to set.
+        """
+        writes: list[tuple[Path, bytes]] = []
+        self._collect_substate_writes(token, substate, writes)
+        add_to_attribute("state_bytes", sum(len(data) for _, data in writes))
+        await self._write_batch(writes)
 
     async def _process_write_queue_delay(self):
         """Wait for the debounce period before processing the write queue again."""
@@ -272,17 +446,15 @@ class StateManagerDisk(StateManager):
                     ),
                     key=lambda item: item.timestamp,
                 )
-                for item in items_to_write:
-                    token = item.token
-                    await self.set_state_for_substate(
-                        token, self._write_queue.pop(token).state
-                    )
+                await self._write_queue_items([
+                    self._write_queue.pop(item.token) for item in items_to_write
+                ])
                 # Check for expired states to purge.
                 for cache_key, last_touched in list(self._token_last_touched.items()):
                     if now - last_touched > self.token_expiration:
                         self._token_last_touched.pop(cache_key)
                         self.states.pop(cache_key, None)
-                await run_in_thread(self._purge_expired_states)
+                await self._run_io(self._purge_expired_states)
                 await self._process_write_queue_delay()
             except asyncio.CancelledError:  # noqa: PERF203
                 await self._flush_write_queue()
@@ -303,11 +475,7 @@ class StateManagerDisk(StateManager):
         logger.debug(
             f"StateManagerDisk._flush_write_queue: writing {n_outstanding_items} remaining items to disk"
         )
-        for item in outstanding_items:
-            await self.set_state_for_substate(
-                item.token,
-                item.state,
-            )
+        await self._write_queue_items(outstanding_items)
         logger.debug(
             f"StateManagerDisk._flush_write_queue: Finished writing {n_outstanding_items} items"
         )
@@ -374,10 +542,12 @@ class StateManagerDisk(StateManager):
                 if lock_key not in self._states_locks:
                     self._states_locks[lock_key] = asyncio.Lock()
 
-        async with self._states_locks[lock_key]:
-            state = await self.get_state(token)
+        async with traced_lock(self._states_locks[lock_key]):
+            with span("state_load"):
+                state = await self.get_state(token)
             yield state
-            await self.set_state(token, state, **context)
+            with span("state_save"):
+                await self.set_state(token, state, **context)
 
     async def close(self):
         """Close the state manager, flushing any pending writes to disk."""
@@ -391,3 +561,7 @@ class StateManagerDisk(StateManager):
             for token, lock in tuple(self._states_locks.items()):
                 if not lock.locked():
                     self._states_locks.pop(token)
+            if self._io_executor is not None:
+                executor, self._io_executor = self._io_executor, None
+                # Drain the pending writes without blocking the event loop.
+                await asyncio.to_thread(executor.shutdown, True)
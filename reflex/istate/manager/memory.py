@@ -7,6 +7,7 @@ import time
 from collections.abc import AsyncIterator
 from typing import Any, cast
 
+from reflex_base.event.tracing import traced_lock
 from typing_extensions import Unpack, override
 
 from reflex.istate.manager import (
@@ -193,7 +194,7 @@ class StateManagerMemory(StateManager):
         state_lock = await self._get_state_lock(token)
 
         try:
-            async with state_lock:
+            async with traced_lock(state_lock):
                 state = self._get_or_create_state(token)
                 self._track_token(token)
                 try:
@@ -0,0 +1,213 @@
+"""Lock contention metrics for state managers."""
+
+from __future__ import annotations
+
+import bisect
+import dataclasses
+import logging
+from collections.abc import Callable, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (s) for lock wait and hold time histograms.
+DURATION_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# Upper bounds for the number of commands sent in one redis pipeline.
+PIPELINE_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128)
+
+# Called with the metric name and the observed value (1 for counters).
+MetricsListener = Callable[[str, float], None]
+
+
+@dataclasses.dataclass
+class Histogram:
+    """A cumulative histogram with fixed bucket upper bounds."""
+
+    # The bucket upper bounds, in ascending order.
+    buckets: Sequence[float] = DURATION_BUCKETS
+
+    # The number of observations in each bucket (the last one is +Inf).
+    counts: list[int] = dataclasses.field(init=False)
+
+    # The sum of all observed values.
+    sum: float = dataclasses.field(default=0.0, init=False)
+
+    # The number of observations.
+    count: int = dataclasses.field(default=0, init=False)
+
+    def __post_init__(self):
+        """Allocate a counter per bucket plus the +Inf bucket."""
+        self.counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, value: float):
+        """Record an observation.
+
+        Args:
+            value: The observed value.
+        """
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        """Get the cumulative count for each bucket upper bound.
+
+        Returns:
+            Pairs of (upper bound label, observations less than or equal to it).
+        """
+        result = []
+        total = 0
+        for bound, count in zip([*self.buckets, "+Inf"], self.counts, strict=True):
+            total += count
+            result.append((str(bound), total))
+        return result
+
+
+@dataclasses.dataclass
+class LockMetrics:
+    """Counters and histograms describing state lock contention.
+
+    Listeners registered with ``add_listener`` are called synchronously on
+    every observation, so they can forward values to an external metrics
+    system. ``render_prometheus`` renders the accumulated values in the
+    Prometheus text exposition format.
+    """
+
+    # How long callers waited to obtain the lock (s).
+    lock_wait_seconds: Histogram = dataclasses.field(default_factory=Histogram)
+
+    # How long the lock was held, including any opportunistic lease (s).
+    lock_hold_seconds: Histogram = dataclasses.field(default_factory=Histogram)
+
+    # The number of commands sent in each redis pipeline.
+    pipeline_commands: Histogram = dataclasses.field(
+        default_factory=lambda: Histogram(buckets=PIPELINE_SIZE_BUCKETS)
+    )
+
+    # Opportunistic leases cut short because another instance requested the lock.
+    lease_breaks_total: int = 0
+
+    # Modifications served from an opportunistically held lease.
+    lease_reuses_total: int = 0
+
+    # Extra attempts made by modify_state before the state was obtained.
+    modify_retries_total: int = 0
+
+    # Waits that hit the lock expiration before a release was observed.
+    lock_wait_timeouts_total: int = 0
+
+    # Writes rejected because the lock expired while the event was processing.
+    lock_expired_total: int = 0
+
+    # `async with self` blocks of background tasks served from their local state copy.
+    background_local_updates_total: int = 0
+
+    # Writes of the batched changes of background tasks.
+    background_flushes_total: int = 0
+
+    # Batched changes of background tasks dropped, the state having changed them meanwhile.
+    background_conflicts_total: int = 0
+
+    _listeners: list[MetricsListener] = dataclasses.field(
+        default_factory=list, init=False, repr=False
+    )
+
+    def add_listener(self, listener: MetricsListener):
+        """Register a callback for every observation.
+
+        Args:
+            listener: Called with the metric name and the observed value.
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: MetricsListener):
+        """Unregister a callback added with ``add_listener``.
+
+        Args:
+            listener: The callback to remove.
+        """
+        self._listeners.remove(listener)
+
+    def _notify(self, name: str, value: float):
+        for listener in self._listeners:
+            try:
+                listener(name, value)
+            except Exception:  # noqa: PERF203
+                logger.exception(f"Lock metrics listener failed for {name}")
+
+    def observe(self, name: str, value: float):
+        """Record an observation for a histogram.
+
+        Args:
+            name: The histogram field name.
+            value: The observed value.
+        """
+        histogram: Histogram = getattr(self, name)
+        histogram.observe(value)
+        self._notify(name, value)
+
+    def increment(self, name: str, amount: int = 1):
+        """Increment a counter.
+
+        Args:
+            name: The counter field name.
+            amount: How much to add.
+        """
+        setattr(self, name, getattr(self, name) + amount)
+        self._notify(name, amount)
+
+    def snapshot(self) -> dict[str, int | dict[str, float | int]]:
+        """Get a plain copy of the current values.
+
+        Returns:
+            Counters by name, and ``{"count", "sum"}`` for each histogram.
+        """
+        result: dict[str, int | dict[str, float | int]] = {}
+        for field in dataclasses.fields(self):
+            if field.name.startswith("_"):
+                continue
+            value = getattr(self, field.name)
+            if isinstance(value, Histogram):
+                result[field.name] = {"count": value.count, "sum": value.sum}
+            else:
+                result[field.name] = value
+        return result
+
+    def render_prometheus(self, prefix: str = "reflex_state_lock") -> str:
+        """Render the metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix: Prepended to every metric name.
+
+        Returns:
+            The exposition text.
+        """
+        lines = []
+        for field in dataclasses.fields(self):
+            if field.name.startswith("_"):
+                continue
+            name = f"{prefix}_{field.name}"
+            value = getattr(self, field.name)
+            if isinstance(value, Histogram):
+                lines.append(f"# TYPE {name} histogram")
+                lines.extend(
+                    f'{name}_bucket{{le="{bound}"}} {count}'
+                    for bound, count in value.cumulative()
+                )
+                lines.extend((f"{name}_sum {value.sum}", f"{name}_count {value.count}"))
+            else:
+                lines.extend((f"# TYPE {name} counter", f"{name} {value}"))
+        return "\n".join(lines) + "\n"
@@ -16,6 +16,7 @@ from redis import ResponseError
 from redis.asyncio import Redis
 from reflex_base.config import get_config
 from reflex_base.environment import environment
+from reflex_base.event.tracing import add_to_attribute, span, traced_lock
 from reflex_base.utils.exceptions import (
     InvalidLockWarningThresholdError,
     LockExpiredError,
@@ -28,6 +29,7 @@ from reflex.istate.manager import (
     StateModificationContext,
     _default_token_expiration,
 )
+from reflex.istate.manager.metrics import LockMetrics
 from reflex.istate.manager.token import TOKEN_TYPE, BaseStateToken, StateToken
 from reflex.state import BaseState
 from reflex.utils.tasks import ensure_task
@@ -137,6 +139,9 @@ class StateManagerRedis(StateManager):
         default_factory=_default_oplock_hold_time_ms
     )
 
+    # Counters and histograms describing lock contention.
+    metrics: LockMetrics = dataclasses.field(default_factory=LockMetrics)
+
     # The keyspace subscription string when redis is waiting for lock to be released.
     _redis_notify_keyspace_events: str = dataclasses.field(
         default=NOTIFY_KEYSPACE_EVENTS
@@ -164,6 +169,12 @@ class StateManagerRedis(StateManager):
         default_factory=environment.REFLEX_OPLOCK_ENABLED.get, init=False
     )
 
+    # Whether to grant the redis lock to waiters in arrival order across all instances.
+    _fair_locking: bool = dataclasses.field(
+        default_factory=environment.REFLEX_STATE_MANAGER_REDIS_FAIR_LOCKS.get,
+        init=False,
+    )
+
     # Cached states
     _cached_states: dict[str, Any] = dataclasses.field(default_factory=dict, init=False)
     _cached_states_locks: dict[str, asyncio.Lock] = dataclasses.field(
@@ -206,6 +217,9 @@ class StateManagerRedis(StateManager):
         if self._oplock_enabled and self.oplock_hold_time_ms >= lock_expiration:
             msg = f"The opportunistic lock hold time({self.oplock_hold_time_ms}) must be less than the lock expiration time({lock_expiration})."
             raise InvalidLockWarningThresholdError(msg)
+        if self._fair_locking and "l" not in self._redis_notify_keyspace_events:
+            # Waiters watch the ticket queue (a list) to learn when their turn comes.
+            self._redis_notify_keyspace_events += "l"
         with contextlib.suppress(RuntimeError):
             asyncio.get_running_loop()  # Check if we're in an event loop.
             self._ensure_lock_task()
@@ -332,6 +346,8 @@ class StateManagerRedis(StateManager):
         redis_pipeline = self.redis.pipeline()
         for state_cls in required_state_classes:
             redis_pipeline.get(str(token.with_cls(state_cls)))
+        if required_state_classes:
+            self.metrics.observe("pipeline_commands", len(required_state_classes))
 
         for state_cls, redis_state in zip(
             required_state_classes,
@@ -414,12 +430,14 @@ class StateManagerRedis(StateManager):
                     else ""
                 )
             )
+            self.metrics.increment("lock_expired_total")
             raise LockExpiredError(msg)
 
         if not isinstance(token, BaseStateToken):
             # Non-BaseState token: simple single-key write.
             pickle_state = token.serialize(state)
             if pickle_state:
+                add_to_attribute("state_bytes", len(pickle_state))
                 await self.redis.set(str(token), pickle_state, ex=self.token_expiration)
             return
 
@@ -461,6 +479,7 @@ class StateManagerRedis(StateManager):
         if base_state._get_was_touched():
             pickle_state = base_state._serialize()
             if pickle_state:
+                add_to_attribute("state_bytes", len(pickle_state))
                 await self.redis.set(
                     str(token.with_cls(type(base_state))),
                     pickle_state,
@@ -488,14 +507,17 @@ class StateManagerRedis(StateManager):
         if not self._oplock_enabled:
             # OpLock is disabled, get a fresh lock, write, and release.
             async with self._lock(token, event_name=event_name) as lock_id:
-                state = await self.get_state(token)
+                with span("state_load"):
+                    state = await self.get_state(token)
                 yield state
-                await self.set_state(token, state, lock_id=lock_id, **context)
+                with span("state_save"):
+                    await self.set_state(token, state, lock_id=lock_id, **context)
             return
 
         # Opportunistically reuse existing lock.
         async with self._get_state_cached(token) as cached_state:
             if cached_state is not None:
+                self.metrics.increment("lease_reuses_total")
                 yield cached_state
                 self._notify_next_waiter(self._lock_key(token))
                 return
@@ -521,9 +543,11 @@ class StateManagerRedis(StateManager):
                         f"{SMR} [{time.monotonic() - start:.3f}] {lock_key} has contention, not leasing"
                     )
                 async with lock_held_ctx:
-                    state = await self.get_state(token)
+                    with span("state_load"):
+                        state = await self.get_state(token)
                     yield state
-                    await self.set_state(token, state, lock_id=lock_id, **context)
+                    with span("state_save"):
+                        await self.set_state(token, state, lock_id=lock_id, **context)
                 return
 
             # Create the lease break task since we got the lock.
@@ -547,9 +571,13 @@ class StateManagerRedis(StateManager):
                             f"{SMR} [{time.monotonic() - start:.3f}] {lock_key} holding lock {lock_id.decode()}, {new_lease_task=} already exited, doing single update..."
                         )
                     async with lock_held_ctx:
-                        state = await self.get_state(token)
+                        with span("state_load"):
+                            state = await self.get_state(token)
                         yield state
-                        await self.set_state(token, state, lock_id=lock_id, **context)
+                        with span("state_save"):
+                            await self.set_state(
+                                token, state, lock_id=lock_id, **context
+                            )
                     return
                 elif self._debug_enabled:
                     logger.debug(
@@ -573,7 +601,11 @@ class StateManagerRedis(StateManager):
             The state for the token.
         """
         token = self._coerce_token(token)
+        attempts = 0
         while True:
+            if attempts:
+                self.metrics.increment("modify_retries_total")
+            attempts += 1
             async with self._try_modify_state(token, **context) as state_instance:
                 if state_instance is not None:
                     yield cast(TOKEN_TYPE, state_instance)
@@ -597,7 +629,7 @@ class StateManagerRedis(StateManager):
             lock_key in self._local_leases
             and (state_lock := self._cached_states_locks.get(lock_key)) is not None
         ):
-            async with state_lock:
+            async with traced_lock(state_lock):
                 if await self._get_local_lease(lock_key) is not None:
                     if (cached_state := self._cached_states.get(lock_key)) is not None:
                         if isinstance(token, BaseStateToken):
@@ -634,6 +666,12 @@ class StateManagerRedis(StateManager):
         Args:
             key: The redis lock key.
         """
+        if self._fair_locking:
+            # Only the waiter holding the oldest ticket may take the lock, so wake
+            # every local waiter and let them check whose turn it is.
+            for event in self._lock_waiters.get(key, ()):
+                event.set()
+            return
         # Notify the next un-notified waiter, if any.
         for event in self._lock_waiters.get(key, ()):
             if not event.is_set():
@@ -826,11 +864,24 @@ class StateManagerRedis(StateManager):
             async with state_lock:
                 if (lease_task := await self._get_local_lease(token)) is not None:
                     lease_task.cancel()
+                    self.metrics.increment("lease_breaks_total")
                     if self._debug_enabled:
                         logger.debug(
                             f"{SMR} [{time.monotonic() - start:.3f}] {token} OPLOCK CONTEND - lease break task cancelled {lease_task=}"
                         )
 
+    async def _handle_ticket_update(self, message: RedisPubSubMessage) -> None:
+        """Handle a change to a fair lock ticket queue.
+
+        Args:
+            message: The redis message.
+        """
+        if message["data"] in (b"lrem", b"del", b"expired"):
+            # The head of the queue may have changed, so let local waiters re-check.
+            key = message["channel"].split(b":", 1)[1][: -len(b"_queue")]
+            if key in self._lock_waiters:
+                self._notify_next_waiter(key)
+
     async def _subscribe_lock_updates(self):
         """Subscribe to redis keyspace notifications for lock updates."""
         await self._enable_keyspace_notifications()
@@ -842,6 +893,10 @@ class StateManagerRedis(StateManager):
             lock_key_pattern: self._handle_lock_release,
             lock_waiter_key_pattern: self._handle_lock_contention,
         }
+        if self._fair_locking:
+            handlers[f"__keyspace@{redis_db}__:*_lock_queue"] = (
+                self._handle_ticket_update
+            )
         async with self.redis.pubsub() as pubsub:
             await pubsub.psubscribe(**handlers)  # pyright: ignore[reportArgumentType]
             self._lock_updates_subscribed.set()
@@ -942,6 +997,22 @@ class StateManagerRedis(StateManager):
             return 0
         return len(lock_released_events)
 
+    async def _n_lock_tickets(self, lock_key: bytes) -> int:
+        """Get the number of queued fair lock tickets for a given lock key.
+
+        Args:
+            lock_key: The redis key for the lock.
+
+        Returns:
+            The length of the ticket queue, always 0 when fair locking is disabled.
+        """
+        if not self._fair_locking:
+            return 0
+        res = self.redis.llen(lock_key + b"_queue")
+        if inspect.isawaitable(res):
+            res = await res
+        return res
+
     async def _n_lock_contenders(self, lock_key: bytes) -> int:
         """Get the number of contenders for a given lock key.
 
@@ -976,6 +1047,7 @@ class StateManagerRedis(StateManager):
         pipeline.sadd(lock_waiter_key, self._instance_id)
         pipeline.pexpire(lock_waiter_key, self.lock_expiration)
         await pipeline.execute()
+        self.metrics.observe("pipeline_commands", 2)
         try:
             yield  # Waiting for redis/oplock to be acquired.
         finally:
@@ -983,6 +1055,96 @@ class StateManagerRedis(StateManager):
             if inspect.isawaitable(res):
                 await res
 
+    @staticmethod
+    def _ticket_key(lock_key: bytes, lock_id: bytes) -> bytes:
+        """Get the redis key marking a queued fair lock ticket as alive.
+
+        Args:
+            lock_key: The redis key for the lock.
+            lock_id: The ID of the lock.
+
+        Returns:
+            The redis key for the ticket.
+        """
+        return lock_key + b"_queue:" + lock_id
+
+    @contextlib.asynccontextmanager
+    async def _lock_ticket(
+        self, lock_key: bytes, lock_id: bytes
+    ) -> AsyncIterator[None]:
+        """Take a place in the FIFO queue for a redis lock when fair locking is enabled.
+
+        Args:
+            lock_key: The redis key for the lock.
+            lock_id: The ID of the lock.
+        """
+        if not self._fair_locking:
+            yield
+            return
+
+        queue_key = lock_key + b"_queue"
+        ticket_key = self._ticket_key(lock_key, lock_id)
+        ttl = self.lock_expiration * 2
+        pipeline = self.redis.pipeline()
+        pipeline.rpush(queue_key, lock_id)
+        pipeline.pexpire(queue_key, ttl)
+        pipeline.set(ticket_key, b"1", px=ttl)
+        await pipeline.execute()
+        self.metrics.observe("pipeline_commands", 3)
+        try:
+            yield
+        finally:
+            pipeline = self.redis.pipeline()
+            pipeline.lrem(queue_key, 1, lock_id)  # pyright: ignore[reportArgumentType]
+            pipeline.delete(ticket_key)
+            await pipeline.execute()
+            self.metrics.observe("pipeline_commands", 2)
+
+    async def _is_next_ticket(self, lock_key: bytes, lock_id: bytes) -> bool:
+        """Check whether a queued waiter holds the oldest live ticket for a lock.
+
+        Also keeps the waiter's own ticket alive, and drops tickets at the head
+        of the queue whose owner went away without leaving it.
+
+        Args:
+            lock_key: The redis key for the lock.
+            lock_id: The ID of the lock.
+
+        Returns:
+            True if the waiter may try to take the lock now.
+        """
+        queue_key = lock_key + b"_queue"
+        ttl = self.lock_expiration * 2
+        pipeline = self.redis.pipeline()
+        pipeline.pexpire(queue_key, ttl)
+        pipeline.pexpire(self._ticket_key(lock_key, lock_id), ttl)
+        pipeline.lindex(queue_key, 0)
+        *_, head = await pipeline.execute()
+        self.metrics.observe("pipeline_commands", 3)
+        while head is not None and head != lock_id:
+            if await self.redis.get(self._ticket_key(lock_key, cast(bytes, head))):
+                return False
+            res = self.redis.lrem(queue_key, 1, head)
+            if inspect.isawaitable(res):
+                await res
+            res = self.redis.lindex(queue_key, 0)
+            head = await res if inspect.isawaitable(res) else res
+        return True
+
+    async def _try_get_lock_in_turn(self, lock_key: bytes, lock_id: bytes) -> bool:
+        """Try to get a redis lock, respecting the FIFO queue when fair locking is enabled.
+
+        Args:
+            lock_key: The redis key for the lock.
+            lock_id: The ID of the lock.
+
+        Returns:
+            True if the lock was obtained.
+        """
+        if self._fair_locking and not await self._is_next_ticket(lock_key, lock_id):
+            return False
+        return bool(await self._try_get_lock(lock_key, lock_id))
+
     async def _get_local_lease(
         self, token: str, raise_when_found: bool = False
     ) -> asyncio.Task | None:
@@ -1026,6 +1188,7 @@ class StateManagerRedis(StateManager):
         if (
             # If there's not a line, try to get the lock immediately.
             not self._n_lock_waiters(lock_key)
+            and not await self._n_lock_tickets(lock_key)
             and await self._try_get_lock(lock_key, lock_id)
         ):
             if self._debug_enabled:
@@ -1039,13 +1202,14 @@ class StateManagerRedis(StateManager):
         async with (
             self._lock_waiter(lock_key) as lock_released_event,
             self._request_lock_release(lock_key, lock_id),
+            self._lock_ticket(lock_key, lock_id),
         ):
             while (
                 self._n_lock_waiters(lock_key) > 1 and not lock_released_event.is_set()
             ) or (
                 # We didn't get the lock so wait for the next release event.
                 lock_released_event.clear() is None
-                and not await self._try_get_lock(lock_key, lock_id)
+                and not await self._try_get_lock_in_turn(lock_key, lock_id)
             ):
                 # Check if this process got a lease, then we can abandon waiting on the redis lock.
                 await self._get_local_lease(token, raise_when_found=True)
@@ -1059,6 +1223,7 @@ class StateManagerRedis(StateManager):
                         timeout=max(self.lock_expiration / 1000, 0),
                     )
                 except (TimeoutError, asyncio.TimeoutError):
+                    self.metrics.increment("lock_wait_timeouts_total")
                     if self._debug_enabled:
                         logger.debug(
                             f"{SMR} [{time.monotonic() - start:.3f}] {lock_key.decode()} wait timeout for {lock_id.decode()}"
@@ -1090,7 +1255,13 @@ class StateManagerRedis(StateManager):
             f"{event_name}:{uuid.uuid4().hex}" if event_name else uuid.uuid4().hex
         ).encode()
 
-        await self._wait_lock(lock_key, lock_id)
+        wait_start = time.monotonic()
+        try:
+            with span("lock_wait"):
+                await self._wait_lock(lock_key, lock_id)
+        finally:
+            acquired_at = time.monotonic()
+            self.metrics.observe("lock_wait_seconds", acquired_at - wait_start)
         state_is_locked = True
 
         try:
@@ -1112,6 +1283,9 @@ class StateManagerRedis(StateManager):
                     logger.warning(
                         f"{lock_key.decode()} was released by {lock_id.decode()}, but it belonged to {deleted_lock_id.decode()}. This is a bug."
                     )
+                self.metrics.observe(
+                    "lock_hold_seconds", time.monotonic() - acquired_at
+                )
                 # To avoid race when a waiter is registered after the del message is processed.
                 self._notify_next_waiter(lock_key)
 
@@ -0,0 +1,419 @@
+"""Serve the images and binary values of state updates from a content-addressed store.
+
+Inlined in a delta, a PIL image is sent as a base64 data URI and ``bytes`` as a
+list of numbers, every time the var is sent. With REFLEX_MEDIA_STORE set, the
+values of at least REFLEX_MEDIA_MIN_BYTES are put in a media store under the
+sha256 digest of their bytes, and the delta carries the URL of the blob on the
+``/_media`` endpoint instead. The content of a URL never changes, so browsers
+cache it for good and an unchanged value costs a URL per delta.
+
+The memory store is local to the backend worker, the disk store is shared by the
+workers of a host, and the redis store by all instances of the app.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import dataclasses
+import hashlib
+import os
+import sys
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from reflex_base import constants
+from reflex_base.environment import environment
+from reflex_base.utils import console
+
+from reflex.utils import prerequisites
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+# The content type of bytes values.
+BYTES_CONTENT_TYPE = "application/octet-stream"
+
+# The least time (s) between two scans of the disk store for blobs to evict.
+DISK_PRUNE_INTERVAL = 60.0
+
+
+def is_digest(digest: str) -> bool:
+    """Check that a string is a sha256 hex digest, before using it as a key.
+
+    Args:
+        digest: The string.
+
+    Returns:
+        Whether the string is 64 lowercase hex digits.
+    """
+    return len(digest) == 64 and all(c in "0123456789abcdef" for c in digest)
+
+
+@dataclasses.dataclass(frozen=True)
+class MediaBlob:
+    """The bytes of a media value and their content type."""
+
+    data: bytes
+
+    content_type: str
+
+    def pack(self) -> bytes:
+        """Pack the blob for a disk or redis store.
+
+        Returns:
+            The content type and the data, separated by a newline.
+        """
+        return self.content_type.encode() + b"\n" + self.data
+
+    @classmethod
+    def unpack(cls, packed: bytes) -> MediaBlob:
+        """Unpack a blob packed with pack.
+
+        Args:
+            packed: The packed blob.
+
+        Returns:
+            The blob.
+        """
+        content_type, _, data = packed.partition(b"\n")
+        return cls(data=data, content_type=content_type.decode())
+
+
+class MediaStore(ABC):
+    """A content-addressed store of media blobs, evicting the least recently used."""
+
+    @abstractmethod
+    async def put(self, digest: str, blob: MediaBlob) -> None:
+        """Store a blob, or mark it used if it is already stored.
+
+        Args:
+            digest: The sha256 hex digest of the blob data.
+            blob: The blob.
+        """
+
+    @abstractmethod
+    async def get(self, digest: str) -> MediaBlob | None:
+        """Get a blob, marking it used.
+
+        Args:
+            digest: The sha256 hex digest of the blob data.
+
+        Returns:
+            The blob, or None if it is not stored or expired.
+        """
+
+    @classmethod
+    def create(cls, mode: str) -> MediaStore:
+        """Create a media store from the REFLEX_MEDIA_STORE_* environment variables.
+
+        Args:
+            mode: The kind of store, memory, disk or redis.
+
+        Returns:
+            The media store.
+
+        Raises:
+            ValueError: If the mode is redis and no redis URL is configured.
+        """
+        max_bytes = environment.REFLEX_MEDIA_STORE_MAX_BYTES.get()
+        ttl = environment.REFLEX_MEDIA_STORE_TTL.get()
+        if mode == "redis":
+            redis = prerequisites.get_redis()
+            if redis is None:
+                msg = "REFLEX_MEDIA_STORE=redis requires REFLEX_REDIS_URL to be set."
+                raise ValueError(msg)
+            return RedisMediaStore(redis=redis, ttl=ttl)
+        if mode == "disk":
+            root = (
+                environment.REFLEX_MEDIA_STORE_DIR.get()
+                or prerequisites.get_backend_dir() / constants.Dirs.MEDIA
+            )
+            return DiskMediaStore(root=root, max_bytes=max_bytes, ttl=ttl)
+        if _runs_multiple_workers():
+            console.warn(
+                "REFLEX_MEDIA_STORE=memory keeps media in each backend worker, so "
+                "requests served by another worker will not find it. Set "
+                "REFLEX_MEDIA_STORE to disk or redis when running several workers."
+            )
+        return MemoryMediaStore(max_bytes=max_bytes, ttl=ttl)
+
+
+def _runs_multiple_workers() -> bool:
+    """Check whether the backend may run several worker processes.
+
+    Returns:
+        Whether more than one worker is configured, or the production backend
+        runs one worker per CPU with redis.
+    """
+    if (workers := os.environ.get("GRANIAN_WORKERS")) is not None:
+        return workers.strip() not in ("", "1")
+    return (
+        environment.REFLEX_ENV_MODE.get() == constants.Env.PROD
+        and prerequisites.parse_redis_url() is not None
+    )
+
+
+class MemoryMediaStore(MediaStore):
+    """Keep media blobs in the memory of the backend worker."""
+
+    def __init__(self, *, max_bytes: int, ttl: float):
+        """Initialize the store.
+
+        Args:
+            max_bytes: The most bytes of blob data to keep.
+            ttl: How long (s) an unused blob is kept.
+        """
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.size = 0
+        # The blobs and the time they were last used, least recently used first.
+        self._blobs: OrderedDict[str, tuple[MediaBlob, float]] = OrderedDict()
+
+    def _pop(self, digest: str):
+        blob, _ = self._blobs.pop(digest)
+        self.size -= len(blob.data)
+
+    async def put(self, digest: str, blob: MediaBlob) -> None:
+        """Store a blob, or mark it used if it is already stored.
+
+        Args:
+            digest: The sha256 hex digest of the blob data.
+            blob: The blob.
+        """
+        now = time.monotonic()
+        if digest in self._blobs:
+            self._blobs[digest] = (self._blobs[digest][0], now)
+            self._blobs.move_to_end(digest)
+            return
+        self._blobs[digest] = (blob, now)
+        self.size += len(blob.data)
+        # Evict the least recently used, keeping at least the new blob.
+        while self.size > self.max_bytes and len(self._blobs) > 1:
+            self._pop(next(iter(self._blobs)))
+
+    async def get(self, digest: str) -> MediaBlob | None:
+        """Get a blob, marking it used.
+
+        Args:
+            digest: The sha256 hex digest of the blob data.
+
+        Returns:
+            The blob, or None if it is not stored or expired.
+        """
+        entry = self._blobs.get(digest)
+        if entry is None:
+            return None
+        now = time.monotonic()
+        if now - entry[1] > self.ttl:
+            self._pop(digest)
+            return None
+        self._blobs[digest] = (entry[0], now)
+        self._blobs.move_to_end(digest)
+        return entry[0]
+
+
+class DiskMediaStore(MediaStore):
+    """Keep media blobs in files named by their digest, shared by the workers of a host.
+
+    The modification time of a file is the time its blob was last used.
+    """
+
+    def __init__(self, *, root: Path, max_bytes: int, ttl: float):
+        """Initialize the store.
+
+        Args:
+            root: The directory of the blob files.
+            max_bytes: The most bytes of blob files to keep.
+            ttl: How long (s) an unused blob is kept.
+        """
+        self.root = root
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._last_prune = 0.0
+
+    def _put(self, digest: str, blob: MediaBlob):
+        path = self.root / digest
+        if path.exists():
+            path.touch()
+            return
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{digest}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(blob.pack())
+        tmp_path.replace(path)
+
+    def _get(self, digest: str) -> MediaBlob | None:
+        path = self.root / digest
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                path.unlink(missing_ok=True)
+                return None
+            packed = path.read_bytes()
+            path.touch()
+        except FileNotFoundError:
+            return None
+        return MediaBlob.unpack(packed)
+
+    def prune(self):
+        """Delete the expired blobs, then the least recently used over the size limit."""
+        now = time.time()
+        files = []
+        for path in self.root.iterdir():
+            with contextlib.suppress(FileNotFoundError):
+                stat = path.stat()
+                if is_digest(path.name) and now - stat.st_mtime <= self.ttl:
+                    files.append((stat.st_mtime, stat.st_size, path))
+                elif now - stat.st_mtime > self.ttl:
+                    path.unlink(missing_ok=True)
+        size = sum(file_size for _, file_size, _ in files)
+        for _, file_size, path in sorted(files):
+            if size <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            size -= file_size
+
+    async def put(self, digest: str, blob: MediaBlob) -> None:
+        """Store a blob, or mark it used if it is already stored.
+
+        Args:
+            digest: The sha256 hex digest of the blob data.
+            blob: The blob.
+        """
+        await asyncio.to_thread(self._put, digest, blob)
+        if time.monotonic() - self._last_prune > DISK_PRUNE_INTERVAL:
+            self._last_prune = time.monotonic()
+            await asyncio.to_thread(self.prune)
+
+    async def get(self, digest: str) -> MediaBlob | None:
+        """Get a blob, marking it used.
+
+        Args:
+            digest: The sha256 hex digest of the blob data.
+
+        Returns:
+            The blob, or None if it is not stored or expired.
+        """
+        return await asyncio.to_thread(self._get, digest)
+
+
+class RedisMediaStore(MediaStore):
+    """Keep media blobs in redis, shared by all instances of the app.
+
+    Every use of a blob extends its expiration. Past the memory limit of the
+    redis server, its maxmemory-policy decides which blobs to evict.
+    """
+
+    def __init__(self, *, redis: Redis, ttl: int):
+        """Initialize the store.
+
+        Args:
+            redis: The redis client.
+            ttl: How long (s) an unused blob is kept.
+        """
+        self.redis = redis
+        self.ttl = ttl
+
+    @staticmethod
+    def _key(digest: str) -> str:
+        return f"reflex_media:{digest}"
+
+    async def put(self, digest: str, blob: MediaBlob) -> None:
+        """Store a blob, or mark it used if it is already stored.
+
+        Args:
+            digest: The sha256 hex digest of the blob data.
+            blob: The blob.
+        """
+        key = self._key(digest)
+        if not await self.redis.expire(key, self.ttl):
+            await self.redis.set(key, blob.pack(), ex=self.ttl)
+
+    async def get(self, digest: str) -> MediaBlob | None:
+        """Get a blob, marking it used.
+
+        Args:
+            digest: The sha256 hex digest of the blob data.
+
+        Returns:
+            The blob, or None if it is not stored or expired.
+        """
+        packed = await self.redis.getex(self._key(digest), ex=self.ttl)
+        return MediaBlob.unpack(packed) if packed is not None else None
+
+
+def _to_blob(value: Any) -> MediaBlob | None:
+    """Encode a value stored as media.
+
+    Args:
+        value: A value of a delta.
+
+    Returns:
+        The blob of an image or bytes value, else None.
+    """
+    if isinstance(value, bytes):
+        return MediaBlob(data=value, content_type=BYTES_CONTENT_TYPE)
+    if (pil_image := sys.modules.get("PIL.Image")) is not None and isinstance(
+        value, pil_image.Image
+    ):
+        from reflex_base.utils.serializers import encode_image
+
+        data, content_type = encode_image(value)
+        return MediaBlob(data=data, content_type=content_type)
+    return None
+
+
+@dataclasses.dataclass
+class MediaOffload:
+    """Replace the images and bytes of deltas with the URLs of stored blobs."""
+
+    # The store of the blobs, None to inline the values.
+    store: MediaStore | None = None
+
+    # The smallest blob to store, smaller values are inlined.
+    min_bytes: int = 16 * 1024
+
+    def configure_from_environment(self):
+        """Create the store set by REFLEX_MEDIA_STORE, if any."""
+        if (mode := environment.REFLEX_MEDIA_STORE.get()) is not None:
+            self.store = MediaStore.create(mode)
+        if environment.REFLEX_MEDIA_MIN_BYTES.is_set():
+            self.min_bytes = environment.REFLEX_MEDIA_MIN_BYTES.get()
+
+    async def offload_delta(
+        self, delta: Mapping[str, Mapping[str, Any]]
+    ) -> dict[str, dict[str, Any]] | None:
+        """Store the images and bytes of a delta.
+
+        Only the values of the vars themselves are stored, not values nested in
+        other values.
+
+        Args:
+            delta: The delta, by substate and var name.
+
+        Returns:
+            The delta with the URLs of the stored values, None if it has no value to store.
+        """
+        if self.store is None:
+            return None
+        offloaded = None
+        base_url = None
+        for substate, values in delta.items():
+            for name, value in values.items():
+                blob = _to_blob(value)
+                if blob is None or len(blob.data) < self.min_bytes:
+                    continue
+                digest = hashlib.sha256(blob.data).hexdigest()
+                await self.store.put(digest, blob)
+                if offloaded is None:
+                    offloaded = {key: dict(vars) for key, vars in delta.items()}
+                base_url = base_url or constants.Endpoint.MEDIA.get_url()
+                offloaded[substate][name] = f"{base_url}/{digest}"
+        return offloaded
+
+
+# Where the images and bytes of the state updates of this process are stored.
+media_offload = MediaOffload()
@@ -8,7 +8,11 @@ import dataclasses
 import functools
 import inspect
 import json
+import logging
+import math
+import pickle
 import sys
+import time
 from collections.abc import Callable, Sequence
 from importlib.util import find_spec
 from types import MethodType
@@ -25,8 +29,12 @@ from typing_extensions import Self
 from reflex.istate.manager.token import BaseStateToken
 
 if TYPE_CHECKING:
+    from reflex.istate.manager import StateManager
+    from reflex.istate.manager.metrics import LockMetrics
     from reflex.state import BaseState, StateUpdate
 
+logger = logging.getLogger(__name__)
+
 T_STATE = TypeVar("T_STATE", bound="BaseState")
 T = TypeVar("T")
 _AccessSpec = (
@@ -41,6 +49,221 @@ _UNREFRESHABLE_ACCESS_SPEC: _AccessSpec = ("unrefreshable", None)
 _DATACLASSES_FILE = dataclasses.__file__
 
 
+def _session_metrics(state_manager: StateManager) -> LockMetrics | None:
+    """Get the metrics of a state manager background tasks batch their changes with.
+
+    Only the redis state manager loads and persists the state on every
+    ``async with self``. With opportunistic locking, the state stays cached
+    between uses, and the state of a session would be shared.
+
+    Args:
+        state_manager: The state manager.
+
+    Returns:
+        The metrics of the state manager, or None if sessions are not used.
+    """
+    from reflex.istate.manager.redis import StateManagerRedis
+
+    if (
+        isinstance(state_manager, StateManagerRedis)
+        and not state_manager._oplock_enabled
+    ):
+        return state_manager.metrics
+    return None
+
+
+def _owned_fields(state: BaseState) -> set[str]:
+    """Get the fields a state persists itself.
+
+    Args:
+        state: The state.
+
+    Returns:
+        The names of the base and backend vars of the state, not inherited.
+    """
+    return {name for name in state.base_vars if name not in state.inherited_vars} | set(
+        state._backend_vars
+    )
+
+
+def _changed(base: bytes, value: Any) -> bool:
+    """Check whether a field changed since a snapshot of its value.
+
+    Args:
+        base: The pickled value of the field in the snapshot.
+        value: The current value of the field.
+
+    Returns:
+        Whether the value changed, True when unknown.
+    """
+    try:
+        return pickle.dumps(value) != base and bool(pickle.loads(base) != value)
+    except Exception:
+        return True
+
+
+_NO_MERGE = object()
+
+
+def _merge(base: Any, local: Any, fresh: Any) -> Any:
+    """Merge the in-place changes of a container into its concurrently changed value.
+
+    Items appended to a list, and keys or members changed in a dict or set
+    since the base value, are applied to the fresh value.
+
+    Args:
+        base: The value at the last flush.
+        local: The value changed by the background task.
+        fresh: The value changed by another handler.
+
+    Returns:
+        The merged value, or _NO_MERGE if the changes cannot be combined.
+    """
+    if isinstance(base, list) and isinstance(local, list) and isinstance(fresh, list):
+        if local[: len(base)] == base:
+            return [*fresh, *local[len(base) :]]
+    elif isinstance(base, dict) and isinstance(local, dict) and isinstance(fresh, dict):
+        merged = dict(fresh)
+        for key in base.keys() | local.keys():
+            if key in local and (key not in base or base[key] != local[key]):
+                if key in fresh and key in base and fresh[key] != base[key]:
+                    return _NO_MERGE
+                merged[key] = local[key]
+            elif key not in local:
+                merged.pop(key, None)
+        return merged
+    elif isinstance(base, set) and isinstance(local, set) and isinstance(fresh, set):
+        return (fresh | (local - base)) - (base - local)
+    return _NO_MERGE
+
+
+@dataclasses.dataclass(slots=True)
+class _BackgroundSession:
+    """The local copy of the state of a background task, between two flushes."""
+
+    # The metrics of the state manager, counting the local updates and flushes.
+    metrics: LockMetrics
+
+    # The seconds the changes are batched for.
+    interval: float
+
+    # The root of the local copy, None before the first flush.
+    root: BaseState | None = None
+
+    # The monotonic time of the last flush.
+    flushed_at: float = -math.inf
+
+    # The pickled values of the fields at the last flush, by substate path.
+    base: dict[tuple[str, ...], dict[str, bytes]] = dataclasses.field(
+        default_factory=dict
+    )
+
+    # The names of the fields changed since the last flush, by substate path.
+    pending: dict[tuple[str, ...], set[str]] = dataclasses.field(default_factory=dict)
+
+    # The task flushing the changes at the end of the interval, while it waits.
+    flush_task: asyncio.Task | None = None
+
+    def current_root(self) -> BaseState | None:
+        """Get the local copy, if flushed within the interval.
+
+        Returns:
+            The root of the local copy, or None to flush.
+        """
+        if self.root is None or time.monotonic() - self.flushed_at >= self.interval:
+            return None
+        self.metrics.increment("background_local_updates_total")
+        return self.root
+
+    def record(self, state: BaseState):
+        """Record the fields changed in a state tree, before it is cleaned.
+
+        Args:
+            state: The root of the dirty states.
+        """
+        if changed := state.dirty_vars & _owned_fields(state):
+            path = tuple(state.get_full_name().split("."))
+            self.pending.setdefault(path, set()).update(changed)
+        for name in state.dirty_substates:
+            if (substate := state.substates.get(name)) is not None:
+                self.record(substate)
+
+    async def apply(self, root: BaseState):
+        """Write the changes of the local copy to the state read under the lock.
+
+        If the state changed a field since the last flush, the in-place changes
+        of a list, dict or set are merged into its value, other changes are
+        dropped with a warning. The client already got the local values, so
+        only the merged values and the values kept instead of a dropped change
+        are part of the next delta.
+
+        Args:
+            root: The root of the state read under the lock.
+        """
+        if self.root is None or not self.pending:
+            return
+        conflicts = 0
+        for path, names in self.pending.items():
+            local = self.root.get_substate(path)
+            fresh = await root.get_state(type(local))
+            base = self.base.get(path, {})
+            for name in names:
+                value = local.get_value(name)
+                changed = name in base and _changed(base[name], fresh.get_value(name))
+                if changed:
+                    try:
+                        value = _merge(
+                            pickle.loads(base[name]), value, fresh.get_value(name)
+                        )
+                    except Exception:
+                        value = _NO_MERGE
+                    if value is _NO_MERGE:
+                        conflicts += 1
+                        logger.warning(
+                            f"Dropped the change of {fresh.get_full_name()}.{name} by "
+                            "a background task, another event changed it meanwhile."
+                        )
+                        # Correct the local value the client got.
+                        fresh.dirty_vars.add(name)
+                        fresh._mark_dirty()
+                        continue
+                setattr(fresh, name, value)
+                if name in base and not changed:
+                    # Unchanged since the snapshot: saved, but already sent.
+                    fresh.dirty_vars.discard(name)
+                    fresh._was_touched = True
+        self.metrics.increment("background_flushes_total")
+        if conflicts:
+            self.metrics.increment("background_conflicts_total", conflicts)
+
+    def reset(self, root: BaseState, path: tuple[str, ...]):
+        """Start batching the changes of a state written under the lock.
+
+        Only the fields of the task's own state and of the states it changed
+        last are kept to detect conflicts, the others are written as they are.
+
+        Args:
+            root: The root of the state written under the lock.
+            path: The path of the substate of the task.
+        """
+        base = {}
+        for state_path in {path, *self.pending}:
+            try:
+                state = root.get_substate(state_path)
+            except ValueError:
+                continue
+            fields = base[state_path] = {}
+            for name in _owned_fields(state):
+                try:
+                    fields[name] = pickle.dumps(state.get_value(name))
+                except Exception:  # noqa: PERF203
+                    continue
+        self.root = root
+        self.flushed_at = time.monotonic()
+        self.base = base
+        self.pending.clear()
+
+
 class StateProxy(wrapt.ObjectProxy):
     """Proxy of a state instance to control mutability of vars for a background task.
 
@@ -57,6 +280,12 @@ class StateProxy(wrapt.ObjectProxy):
     A background task will be passed the `StateProxy` as `self`, so mutability
     can be safely performed inside an `async with self` block.
 
+    With a flush interval and the redis state manager without opportunistic
+    locking, the blocks within the interval of the last write change a local
+    copy of the state instead, whose changes are written by the next block
+    after the interval, when the task finishes, or when the interval ends.
+    Other state managers ignore the flush interval with a warning.
+
         class State(rx.State):
             counter: int = 0
 
@@ -72,6 +301,7 @@ class StateProxy(wrapt.ObjectProxy):
         state_instance: BaseState,
         event: Event | None = None,
         parent_state_proxy: StateProxy | None = None,
+        flush_interval: int | None = None,
     ):
         """Create a proxy for a state instance.
 
@@ -83,14 +313,30 @@ class StateProxy(wrapt.ObjectProxy):
             state_instance: The state instance to proxy.
             event: The event associated with the state modification context.
             parent_state_proxy: The parent state proxy, for linked mutability and context tracking.
+            flush_interval: The milliseconds to batch the changes of the task for.
         """
         super().__init__(state_instance)
+        ctx = EventContext.get()
         self._self_event = event
         self._self_substate_path = tuple(state_instance.get_full_name().split("."))
         self._self_substate_token = BaseStateToken(
-            ident=EventContext.get().token,
+            ident=ctx.token,
             cls=state_instance.__class__,
         )
+        metrics = _session_metrics(ctx.state_manager) if flush_interval else None
+        if flush_interval and metrics is None:
+            handler_name = event.name if event else type(state_instance).__name__
+            logger.warning(
+                f"The flush_interval of {handler_name} is ignored with "
+                f"{type(ctx.state_manager).__name__}, only the redis state manager "
+                "without opportunistic locking batches background task changes.",
+                extra={"dedupe": True},
+            )
+        self._self_session = (
+            _BackgroundSession(metrics=metrics, interval=flush_interval / 1000)
+            if metrics is not None and flush_interval
+            else None
+        )
         self._self_actx = None
         self._self_mutable = False
         self._self_actx_lock = asyncio.Lock()
@@ -148,10 +394,16 @@ class StateProxy(wrapt.ObjectProxy):
         await self._self_actx_lock.acquire()
         try:
             self._self_actx_lock_holder = current_task
-            self._self_actx = ctx.state_manager.modify_state_with_links(
-                token=self._self_substate_token, event=self._self_event
-            )
-            mutable_state = await self._self_actx.__aenter__()
+            session = self._self_session
+            if session is not None and (local := session.current_root()) is not None:
+                mutable_state = local
+            else:
+                self._self_actx = ctx.state_manager.modify_state_with_links(
+                    token=self._self_substate_token, event=self._self_event
+                )
+                mutable_state = await self._self_actx.__aenter__()
+                if session is not None:
+                    await session.apply(mutable_state)
             self._self_mutable = True
             super().__setattr__(
                 "__wrapped__", mutable_state.get_substate(self._self_substate_path)
@@ -173,10 +425,15 @@ class StateProxy(wrapt.ObjectProxy):
         if self._self_parent_state_proxy is not None:
             await self._self_parent_state_proxy.__aexit__(*exc_info)
             return
+        session = self._self_session
+        root_state = None
         try:
-            if self._self_mutable and self._self_actx is not None:
+            if self._self_mutable:
                 root_state = self.__wrapped__._get_root_state()
                 delta = await root_state._get_resolved_delta()
+                if session is not None and self._self_actx is None:
+                    # Changed in the local copy, written by the next flush.
+                    session.record(root_state)
                 root_state._clean()
                 # When the frontend vars are modified emit the delta to the frontend.
                 if delta:
@@ -186,11 +443,46 @@ class StateProxy(wrapt.ObjectProxy):
             try:
                 if self._self_mutable and self._self_actx is not None:
                     await self._self_actx.__aexit__(*exc_info)
+                    # Unless the block raised, and the state was not written.
+                    if (
+                        session is not None
+                        and root_state is not None
+                        and exc_info[0] is None
+                    ):
+                        session.reset(root_state, self._self_substate_path)
             finally:
                 self._self_actx = None
                 self._self_mutable = False
                 self._self_actx_lock_holder = None
                 self._self_actx_lock.release()
+        if session is not None and session.pending and session.flush_task is None:
+            session.flush_task = asyncio.create_task(self._flush_later(session))
+
+    async def _flush_later(self, session: _BackgroundSession):
+        """Flush the batched changes of the task at the end of the interval.
+
+        Args:
+            session: The session of the task.
+        """
+        await asyncio.sleep(session.flushed_at + session.interval - time.monotonic())
+        session.flush_task = None
+        try:
+            await self._flush()
+        except Exception:
+            # Kept for the next flush.
+            logger.exception("Failed to flush the state changes of a background task")
+
+    async def _flush(self):
+        """Write the batched changes of the task, if any, under the lock."""
+        session = self._self_session
+        if session is None or not session.pending:
+            return
+        if session.flush_task is not None:
+            session.flush_task.cancel()
+            session.flush_task = None
+        session.flushed_at = -math.inf
+        async with self:
+            pass
 
     def __enter__(self):
         """Enter the regular context manager protocol.
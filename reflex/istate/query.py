@@ -0,0 +1,467 @@
+"""State mixin for windows over SQL queries whose rows are not stored in state."""
+
+from __future__ import annotations
+
+import dataclasses
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Sequence
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from reflex_base.environment import environment
+
+from reflex.state import State, var
+from reflex.utils.misc import run_in_thread
+
+if TYPE_CHECKING:
+    import sqlalchemy
+
+
+# The column types reported to the data editor, by python type.
+_DATA_EDITOR_COLUMN_TYPES = {int: "int", float: "float", bool: "bool"}
+
+
+@dataclasses.dataclass
+class QueryPageCache:
+    """A process-wide LRU cache of query result pages.
+
+    Pages are keyed by the compiled query (including sort and filters) and the
+    page index, so every state showing the same query shares them.
+    """
+
+    # The maximum number of pages kept.
+    max_pages: int = 256
+
+    # The cached pages by key, least recently used first, with their fetch time.
+    _pages: OrderedDict[tuple[Hashable, ...], tuple[float, Any]] = dataclasses.field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+
+    _lock: threading.Lock = dataclasses.field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+
+    # The number of lookups served from the cache.
+    hits: int = dataclasses.field(default=0, init=False)
+
+    # The number of lookups that had to run the query.
+    misses: int = dataclasses.field(default=0, init=False)
+
+    # The number of pages dropped to stay within max_pages.
+    evictions: int = dataclasses.field(default=0, init=False)
+
+    def get(self, key: tuple[Hashable, ...], ttl: float) -> Any | None:
+        """Get a cached page.
+
+        Args:
+            key: The page key.
+            ttl: How old (s) a page may be to still be used.
+
+        Returns:
+            The page, or None if it is missing or too old.
+        """
+        with self._lock:
+            entry = self._pages.get(key)
+            if entry is None or time.monotonic() - entry[0] > ttl:
+                self.misses += 1
+                return None
+            self._pages.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: tuple[Hashable, ...], page: Any):
+        """Store a page, evicting the least recently used pages if needed.
+
+        Args:
+            key: The page key.
+            page: The page to store.
+        """
+        with self._lock:
+            self._pages[key] = (time.monotonic(), page)
+            self._pages.move_to_end(key)
+            while len(self._pages) > self.max_pages:
+                self._pages.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, query_key: Hashable | None = None):
+        """Drop cached pages.
+
+        Args:
+            query_key: Only drop the pages of this query, or all pages if None.
+        """
+        with self._lock:
+            if query_key is None:
+                self._pages.clear()
+                return
+            for key in [key for key in self._pages if key[0] == query_key]:
+                del self._pages[key]
+
+
+query_page_cache = QueryPageCache(
+    max_pages=environment.REFLEX_QUERY_PAGE_CACHE_SIZE.get()
+)
+
+
+def _query_key(statement: sqlalchemy.Select) -> Hashable:
+    """Identify a statement by its SQL and bound parameters.
+
+    Args:
+        statement: The statement.
+
+    Returns:
+        A hashable key.
+    """
+    compiled = statement.compile()
+    return (str(compiled), repr(sorted(compiled.params.items())))
+
+
+class QueryState(State, mixin=True):
+    """Mixin for showing a window of a SQL query's rows.
+
+    Only the query window (offset, limit, sort and filters) is kept in state.
+    The rows of the window are fetched when the window changes, from a read
+    replica when one is configured, in pages shared by every client through a
+    process-wide LRU cache. Rows never enter the state store. Call ``refresh``
+    to fetch them again, for example when ``get_query`` reads other vars.
+
+    Subclass this class together with ``rx.State`` and implement ``get_query``
+    to return the select statement. ``rows``, ``columns``, ``total_rows`` and
+    ``data_editor_columns`` can then be bound to ``rx.data_table`` or
+    ``rx.data_editor``.
+
+    ```python
+    class Users(rx.QueryState, rx.State):
+        def get_query(self):
+            return sqlmodel.select(User)
+
+
+    rx.data_editor(
+        columns=Users.data_editor_columns,
+        data=Users.rows,
+        rows=Users.total_rows,
+        data_offset=Users.offset,
+        on_visible_region_changed=Users.set_visible_region,
+    )
+
+    rx.virtual_foreach(
+        Users.rows,
+        lambda row: rx.text(row[1]),
+        item_height=32,
+        total=Users.total_rows,
+        offset=Users.offset,
+        on_range_change=Users.set_range,
+    )
+    ```
+    """
+
+    # Rows are fetched from the database in pages of this many rows.
+    page_size: ClassVar[int] = 100
+
+    # How long (s) a fetched page is reused before the query runs again.
+    cache_ttl: ClassVar[float] = 30.0
+
+    # Extra rows kept around the visible region of a data editor.
+    overscan: ClassVar[int] = 50
+
+    # The most rows a client can ask for at once.
+    max_limit: ClassVar[int] = 1_000
+
+    # The largest first row index a client can ask for.
+    max_offset: ClassVar[int] = 2**31 - 1
+
+    # The index of the first row in the window.
+    offset: int = 0
+
+    # The number of rows in the window.
+    limit: int = 100
+
+    # The column to sort by, or empty to keep the query's own order.
+    sort_column: str = ""
+
+    # Whether to sort in descending order.
+    sort_descending: bool = False
+
+    # Case-insensitive substring filters, by column.
+    filters: dict[str, str] = {}
+
+    # Bumped by refresh to fetch the rows and columns again.
+    _query_revision: int = 0
+
+    # The computed vars kept out of the state store.
+    _query_vars: ClassVar[tuple[str, ...]] = (
+        "rows",
+        "total_rows",
+        "columns",
+        "data_editor_columns",
+    )
+
+    def get_query(self) -> sqlalchemy.Select:
+        """Get the statement whose rows are shown.
+
+        Returns:
+            The select statement, without offset or limit.
+
+        Raises:
+            NotImplementedError: Always, subclasses must implement it.
+        """
+        msg = f"{type(self).__name__} must implement get_query."
+        raise NotImplementedError(msg)
+
+    def _get_windowed_query(self) -> sqlalchemy.Select:
+        """Apply the sort and filters of the window to the query.
+
+        Returns:
+            The sorted and filtered statement.
+        """
+        import sqlalchemy
+
+        statement = self.get_query()
+        selected = statement.selected_columns
+        for name, value in self.filters.items():
+            if value and name in selected:
+                statement = statement.where(
+                    sqlalchemy.cast(selected[name], sqlalchemy.String).icontains(
+                        value, autoescape=True
+                    )
+                )
+        if self.sort_column in selected:
+            column = selected[self.sort_column]
+            statement = statement.order_by(None).order_by(
+                column.desc() if self.sort_descending else column.asc()
+            )
+        return statement
+
+    def _fetch_page(
+        self, statement: sqlalchemy.Select, query_key: Hashable, page: int
+    ) -> list[list[Any]]:
+        """Get one page of rows, from the cache or the database.
+
+        Args:
+            statement: The sorted and filtered statement.
+            query_key: The cache key of the statement.
+            page: The page index.
+
+        Returns:
+            The rows of the page.
+        """
+        from reflex.model import session
+
+        key = (query_key, "page", page)
+        cached = query_page_cache.get(key, self.cache_ttl)
+        if cached is not None:
+            return cached
+        paged = statement.offset(page * self.page_size).limit(self.page_size)
+        with session(read_only=True) as db:
+            # Executing on the connection returns plain column values even for
+            # statements selecting ORM entities.
+            result = db.connection().execute(paged)
+            fetched = [list(row) for row in result]
+        query_page_cache.put(key, fetched)
+        return fetched
+
+    def _fetch_window(self) -> list[list[Any]]:
+        """Get the rows of the current window.
+
+        Returns:
+            The rows of the window.
+        """
+        statement = self._get_windowed_query()
+        query_key = _query_key(statement)
+        offset, limit = max(self.offset, 0), max(self.limit, 0)
+        rows: list[list[Any]] = []
+        first_page = offset // self.page_size
+        last_page = (offset + limit - 1) // self.page_size
+        for page in range(first_page, last_page + 1):
+            page_rows = self._fetch_page(statement, query_key, page)
+            rows.extend(page_rows)
+            if len(page_rows) < self.page_size:
+                break
+        start = offset - first_page * self.page_size
+        return rows[start : start + limit]
+
+    def _count(self) -> int:
+        """Get the number of rows matching the filters.
+
+        Returns:
+            The row count.
+        """
+        import sqlalchemy
+
+        from reflex.model import session
+
+        statement = self._get_windowed_query().order_by(None)
+        key = (_query_key(statement), "count")
+        cached = query_page_cache.get(key, self.cache_ttl)
+        if cached is not None:
+            return cached
+        with session(read_only=True) as db:
+            count = (
+                db
+                .connection()
+                .execute(
+                    sqlalchemy.select(sqlalchemy.func.count()).select_from(
+                        statement.subquery()
+                    )
+                )
+                .scalar_one()
+            )
+        query_page_cache.put(key, count)
+        return count
+
+    @var(
+        deps=[
+            "offset",
+            "limit",
+            "sort_column",
+            "sort_descending",
+            "filters",
+            "_query_revision",
+        ],
+        auto_deps=False,
+    )
+    async def rows(self) -> list[list[Any]]:
+        """The rows of the current window.
+
+        Returns:
+            The rows, as lists of column values.
+        """
+        return await run_in_thread(self._fetch_window)
+
+    @var(deps=["filters", "_query_revision"], auto_deps=False)
+    async def total_rows(self) -> int:
+        """The number of rows matching the filters.
+
+        Returns:
+            The row count.
+        """
+        return await run_in_thread(self._count)
+
+    @var(deps=["_query_revision"], auto_deps=False)
+    def columns(self) -> list[str]:
+        """The names of the selected columns.
+
+        Returns:
+            The column names.
+        """
+        return [str(column.key) for column in self.get_query().selected_columns]
+
+    @var(deps=["_query_revision"], auto_deps=False)
+    def data_editor_columns(self) -> list[dict[str, str]]:
+        """Column definitions for ``rx.data_editor``.
+
+        Returns:
+            The column title, id and cell type of each selected column.
+        """
+        columns = []
+        for column in self.get_query().selected_columns:
+            try:
+                python_type = column.type.python_type
+            except NotImplementedError:
+                python_type = str
+            columns.append({
+                "title": str(column.key),
+                "id": str(column.key),
+                "type": _DATA_EDITOR_COLUMN_TYPES.get(python_type, "str"),
+            })
+        return columns
+
+    def set_window(self, offset: int, limit: int):
+        """Show a different window of rows.
+
+        Args:
+            offset: The index of the first row.
+            limit: The number of rows.
+        """
+        self.offset = min(max(int(offset), 0), self.max_offset)
+        self.limit = min(max(int(limit), 0), self.max_limit)
+
+    def set_visible_region(self, region: dict[str, int]):
+        """Follow the rows scrolled into view in a data editor.
+
+        Args:
+            region: The visible region, with ``y`` and ``height`` in rows.
+        """
+        first = int(region.get("y", 0))
+        last = first + int(region.get("height", 0))
+        start = max(first - self.overscan, 0)
+        end = last + self.overscan
+        # Only refetch when the visible rows leave the current window, or the
+        # window is much larger than needed.
+        if (
+            first < self.offset
+            or last > self.offset + self.limit
+            or self.limit > 2 * (end - start)
+        ):
+            self.set_window(start, end - start)
+
+    def set_range(self, start: int, end: int):
+        """Follow the items a virtual foreach asks for.
+
+        Args:
+            start: The index of the first item, overscan included.
+            end: The index after the last item, overscan included.
+        """
+        self.set_window(start, max(int(end) - int(start), 0))
+
+    def next_page(self):
+        """Move the window forward by its own size."""
+        self.set_window(self.offset + self.limit, self.limit)
+
+    def previous_page(self):
+        """Move the window back by its own size."""
+        self.offset = max(self.offset - self.limit, 0)
+
+    def sort_by(self, column: str):
+        """Sort by a column, toggling the direction if it is already sorted by.
+
+        Args:
+            column: The column name.
+        """
+        if column == self.sort_column:
+            self.sort_descending = not self.sort_descending
+        else:
+            self.sort_column = column
+            self.sort_descending = False
+
+    def set_filter(self, column: str, value: str):
+        """Filter a column to values containing a substring.
+
+        Args:
+            column: The column name.
+            value: The substring, or empty to clear the filter.
+        """
+        self.filters = {**self.filters, column: value}
+        self.offset = 0
+
+    def refresh(self):
+        """Drop the cached pages of this query and fetch the window again."""
+        query_page_cache.invalidate(_query_key(self._get_windowed_query()))
+        query_page_cache.invalidate(
+            _query_key(self._get_windowed_query().order_by(None))
+        )
+        self._query_revision += 1
+
+    def __getstate__(self):
+        """Get the state for serialization, without the fetched rows.
+
+        Returns:
+            The state dict for serialization.
+        """
+        state = super().__getstate__()
+        for name in self._query_vars:
+            state.pop(self.computed_vars[name]._cache_attr, None)
+        return state
+
+
+def clear_query_page_cache(statements: Sequence[sqlalchemy.Select] | None = None):
+    """Drop cached query pages, for example after writing to the queried tables.
+
+    Args:
+        statements: Only drop the pages of these (sorted and filtered) statements.
+    """
+    if statements is None:
+        query_page_cache.invalidate()
+        return
+    for statement in statements:
+        query_page_cache.invalidate(_query_key(statement))
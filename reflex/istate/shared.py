@@ -14,6 +14,7 @@ from typing_extensions import Self
 
 from reflex.istate.manager.token import BaseStateToken
 from reflex.state import BaseState, State, _override_base_method
+from reflex.utils.token_manager import RedisTokenManager
 
 logger = logging.getLogger(__name__)
 
@@ -53,20 +54,28 @@ def _do_update_other_tokens(
         The list of asyncio tasks created to perform the updates.
     """
     app = RegistrationContext.get().app
+    tasks = []
+    if (event_namespace := app.event_namespace) is None:
+        return tasks
+    token_manager = event_namespace._token_manager
 
     async def _update_client(token: str):
+        if isinstance(
+            token_manager, RedisTokenManager
+        ) and await token_manager.forward_modify(
+            token, state_type.get_full_name(), previous_dirty_vars
+        ):
+            # The instance holding the client's socket applies the update itself.
+            return
         async with app.modify_state(
             BaseStateToken(ident=token, cls=state_type),
             previous_dirty_vars=previous_dirty_vars,
         ):
             pass
 
-    tasks = []
-    if (event_namespace := app.event_namespace) is None:
-        return tasks
     for affected_token in affected_tokens:
         # Don't send updates for disconnected clients.
-        if affected_token not in event_namespace._token_manager.token_to_socket:
+        if affected_token not in token_manager.token_to_socket:
             continue
         # TODO: remove disconnected clients after some time.
         t = asyncio.create_task(_update_client(affected_token))
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
+import dataclasses
+import itertools
 import logging
 import re
+import time
 from collections import defaultdict
 from contextlib import suppress
 from importlib.util import find_spec
-from typing import TYPE_CHECKING, Any, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 from reflex_base.config import get_config
 from reflex_base.environment import environment
@@ -63,6 +67,120 @@ if find_spec("sqlalchemy"):
     _ENGINE: dict[str, sqlalchemy.engine.Engine] = {}
     _ASYNC_ENGINE: dict[str, sqlalchemy.ext.asyncio.AsyncEngine] = {}
 
+    # Round-robin position over the configured read replicas.
+    _REPLICA_COUNTER = itertools.count()
+
+    @dataclasses.dataclass
+    class PoolStats:
+        """Connection pool counters for one database engine."""
+
+        # Connections handed out by the pool.
+        checkouts: int = 0
+
+        # Checkouts that found the pool exhausted and had to wait for a connection.
+        waits: int = 0
+
+        # Time spent obtaining connections, including waits and new connects (s).
+        checkout_seconds: float = 0.0
+
+        # Checkouts that gave up after the pool timeout.
+        timeouts: int = 0
+
+        # Connections opened beyond the pool size.
+        overflow_connections: int = 0
+
+    class _PoolStatsMixin:
+        """Count checkouts, waits and overflow of a QueuePool."""
+
+        stats: ClassVar[PoolStats]
+
+        def _do_get(self):
+            pool = cast(sqlalchemy.pool.QueuePool, self)
+            max_overflow = pool._max_overflow
+            overflow = pool.overflow()
+            exhausted = (
+                pool.checkedin() == 0 and max_overflow > -1 and overflow >= max_overflow
+            )
+            started = time.perf_counter()
+            try:
+                connection = super()._do_get()  # pyright: ignore[reportAttributeAccessIssue]
+            except sqlalchemy.exc.TimeoutError:
+                self.stats.timeouts += 1
+                raise
+            finally:
+                self.stats.checkout_seconds += time.perf_counter() - started
+            self.stats.checkouts += 1
+            if exhausted:
+                self.stats.waits += 1
+            if pool.overflow() > max(overflow, 0):
+                self.stats.overflow_connections += 1
+            return connection
+
+    def _instrumented_pool_class(url: str) -> type[sqlalchemy.pool.Pool] | None:
+        """Get a statistics-recording variant of the default pool class for a url.
+
+        Args:
+            url: The database url.
+
+        Returns:
+            The pool class, or None to keep the dialect default (non-queue pools).
+        """
+        sa_url = sqlalchemy.engine.make_url(url)
+        try:
+            pool_class = sa_url.get_dialect().get_pool_class(sa_url)  # pyright: ignore[reportAttributeAccessIssue]
+        except Exception:
+            return None
+        if not issubclass(pool_class, sqlalchemy.pool.QueuePool):
+            return None
+        return type(
+            f"Instrumented{pool_class.__name__}",
+            (_PoolStatsMixin, pool_class),
+            {"stats": PoolStats()},
+        )
+
+    def get_pool_stats() -> dict[str, dict[str, int | float]]:
+        """Get connection pool statistics for every engine created so far.
+
+        Returns:
+            The counters and current pool size, checked out and overflow
+            connections, by database url (with credentials removed).
+        """
+        result: dict[str, dict[str, int | float]] = {}
+        engines: list[tuple[str, sqlalchemy.engine.Engine]] = [
+            *_ENGINE.items(),
+            *((url, engine.sync_engine) for url, engine in _ASYNC_ENGINE.items()),
+        ]
+        for url, engine in engines:
+            pool = engine.pool
+            entry: dict[str, int | float] = {}
+            if isinstance(pool, _PoolStatsMixin):
+                entry.update(dataclasses.asdict(pool.stats))
+            if isinstance(pool, sqlalchemy.pool.QueuePool):
+                entry.update(
+                    size=pool.size(),
+                    checked_out=pool.checkedout(),
+                    overflow=max(pool.overflow(), 0),
+                )
+            result[_safe_db_url_for_logging(url)] = entry
+        return result
+
+    def get_read_replica_url(is_async: bool = False) -> str | None:
+        """Pick the database url for a read-only session.
+
+        Args:
+            is_async: Whether to pick from the async replica urls.
+
+        Returns:
+            The next configured read replica url, or None to use the primary.
+        """
+        conf = get_config()
+        replicas = (
+            conf.async_db_read_replica_urls if is_async else conf.db_read_replica_urls
+        )
+        if not replicas:
+            return None
+        return replicas[next(_REPLICA_COUNTER) % len(replicas)]
+
     def get_engine_args(url: str | None = None) -> dict[str, Any]:
         """Get the database engine arguments.
 
@@ -116,10 +234,10 @@ if find_spec("sqlalchemy"):
                 "Database is not initialized, run [bold]reflex db init[/bold] first.",
                 extra={"dedupe": True, "rich": True},
             )
-        _ENGINE[url] = sqlalchemy.engine.create_engine(
-            url,
-            **get_engine_args(url),
-        )
+        kwargs = get_engine_args(url)
+        if pool_class := _instrumented_pool_class(url):
+            kwargs["poolclass"] = pool_class
+        _ENGINE[url] = sqlalchemy.engine.create_engine(url, **kwargs)
         return _ENGINE[url]
 
     def create_all():
@@ -164,10 +282,10 @@ if find_spec("sqlalchemy"):
                 "Database is not initialized, run [bold]reflex db init[/bold] first.",
                 extra={"dedupe": True, "rich": True},
             )
-        _ASYNC_ENGINE[url] = sqlalchemy.ext.asyncio.create_async_engine(
-            url,
-            **get_engine_args(url),
-        )
+        kwargs = get_engine_args(url)
+        if pool_class := _instrumented_pool_class(url):
+            kwargs["poolclass"] = pool_class
+        _ASYNC_ENGINE[url] = sqlalchemy.ext.asyncio.create_async_engine(url, **kwargs)
         return _ASYNC_ENGINE[url]
 
     def sqla_session(url: str | None = None) -> sqlalchemy.orm.Session:
@@ -513,7 +631,10 @@ if find_spec("sqlmodel") and find_spec("sqlalchemy") and find_spec("pydantic"):
     import sqlmodel
     from sqlmodel.ext.asyncio.session import AsyncSession
 
-    _AsyncSessionLocal: dict[str | None, sqlalchemy.ext.asyncio.async_sessionmaker] = {}
+    _AsyncSessionLocal: dict[
+        tuple[str | None, type[AsyncSession]],
+        sqlalchemy.ext.asyncio.async_sessionmaker,
+    ] = {}
 
     def get_db_status() -> dict[str, bool]:
         """Checks the status of the database connection.
@@ -680,41 +801,165 @@ if find_spec("sqlmodel") and find_spec("sqlalchemy") and find_spec("pydantic"):
 
     ModelRegistry.register(Model)
 
-    def session(url: str | None = None) -> sqlmodel.Session:
+    class _EventScopedSession(sqlmodel.Session):
+        """A session shared by the rx.session() calls of one event handler.
+
+        Leaving the outermost ``with`` block rolls back uncommitted changes, as
+        closing a regular session would, which also ends the transaction: the
+        connection goes back to the pool and the next block sees the rows
+        committed since. Nested blocks leave the transaction of the outer one
+        alone. The session is closed when the handler finishes.
+        """
+
+        _depth: int = 0
+
+        def __enter__(self):
+            self._depth += 1
+            return self
+
+        def __exit__(self, type_: Any, value: Any, traceback: Any):
+            self._depth -= 1
+            if not self._depth:
+                self.rollback()
+                self.expire_all()
+
+    class _EventScopedAsyncSession(AsyncSession):
+        """An async session shared by the rx.asession() calls of one event handler."""
+
+        _depth: int = 0
+
+        async def __aenter__(self):
+            self._depth += 1
+            return self
+
+        async def __aexit__(self, type_: Any, value: Any, traceback: Any):
+            self._depth -= 1
+            if not self._depth:
+                await self.rollback()
+                self.expire_all()
+
+    # Sessions shared within the task running an event handler, by (url, read_only, is_async).
+    _EVENT_SESSIONS: dict[
+        asyncio.Task,
+        dict[tuple[str | None, bool, bool], sqlmodel.Session | AsyncSession],
+    ] = {}
+
+    # Keep references to pending async session closes.
+    _CLOSING_SESSIONS: set[asyncio.Task] = set()
+
+    def _close_event_sessions(task: asyncio.Task):
+        """Close the sessions shared by an event handler once it finishes.
+
+        Args:
+            task: The finished event handler task.
+        """
+        for scoped in _EVENT_SESSIONS.pop(task, {}).values():
+            if isinstance(scoped, AsyncSession):
+                close_task = task.get_loop().create_task(scoped.close())
+                _CLOSING_SESSIONS.add(close_task)
+                close_task.add_done_callback(_CLOSING_SESSIONS.discard)
+            else:
+                scoped.close()
+
+    def _get_event_sessions() -> (
+        dict[tuple[str | None, bool, bool], sqlmodel.Session | AsyncSession] | None
+    ):
+        """Get the sessions shared by the currently running event handler.
+
+        Returns:
+            The shared sessions, or None outside of an event handler or when
+            event-scoped sessions are disabled.
+        """
+        if not environment.REFLEX_DB_EVENT_SCOPED_SESSIONS.get():
+            return None
+        from reflex_base.event.context import EventContext
+
+        try:
+            EventContext.get()
+            task = asyncio.current_task()
+        except (LookupError, RuntimeError):
+            return None
+        if task is None:
+            return None
+        if (sessions := _EVENT_SESSIONS.get(task)) is None:
+            sessions = _EVENT_SESSIONS[task] = {}
+            task.add_done_callback(_close_event_sessions)
+        return sessions
+
+    def session(url: str | None = None, *, read_only: bool = False) -> sqlmodel.Session:
         """Get a sqlmodel session to interact with the database.
 
+        With ``REFLEX_DB_EVENT_SCOPED_SESSIONS`` enabled, every call for the same
+        database within one event handler returns the same session.
+
         Args:
             url: The database url.
+            read_only: Use one of the configured read replicas (when no url is given).
 
         Returns:
             A database session.
         """
-        return sqlmodel.Session(get_engine(url))
+        key = (url, read_only, False)
+        if url is None and read_only:
+            url = get_read_replica_url()
+        if (sessions := _get_event_sessions()) is None:
+            return sqlmodel.Session(get_engine(url))
+        scoped = sessions.get(key)
+        if scoped is None:
+            scoped = sessions[key] = _EventScopedSession(get_engine(url))
+        return cast(sqlmodel.Session, scoped)
+
+    def _async_sessionmaker(
+        url: str | None, class_: type[AsyncSession] = AsyncSession
+    ) -> sqlalchemy.ext.asyncio.async_sessionmaker:
+        """Get the cached async session factory for a database.
+
+        Args:
+            url: The database url.
+            class_: The session class to create.
+
+        Returns:
+            The session factory.
+        """
+        key = (url, class_)
+        if key not in _AsyncSessionLocal:
+            _AsyncSessionLocal[key] = sqlalchemy.ext.asyncio.async_sessionmaker(
+                bind=get_async_engine(url),
+                class_=class_,
+                expire_on_commit=False,
+                autocommit=False,
+                autoflush=False,
+            )
+        return _AsyncSessionLocal[key]
 
-    def asession(url: str | None = None) -> AsyncSession:
+    def asession(url: str | None = None, *, read_only: bool = False) -> AsyncSession:
         """Get an async sqlmodel session to interact with the database.
 
         async with rx.asession() as asession:
             ...
 
-        Most operations against the `asession` must be awaited.
+        Most operations against the `asession` must be awaited. With
+        ``REFLEX_DB_EVENT_SCOPED_SESSIONS`` enabled, every call for the same
+        database within one event handler returns the same session.
 
         Args:
             url: The database url.
+            read_only: Use one of the configured async read replicas (when no url is given).
 
         Returns:
             An async database session.
         """
-        global _AsyncSessionLocal
-        if url not in _AsyncSessionLocal:
-            _AsyncSessionLocal[url] = sqlalchemy.ext.asyncio.async_sessionmaker(
-                bind=get_async_engine(url),
-                class_=AsyncSession,
-                expire_on_commit=False,
-                autocommit=False,
-                autoflush=False,
-            )
-        return _AsyncSessionLocal[url]()
+        key = (url, read_only, True)
+        if url is None and read_only:
+            url = get_read_replica_url(is_async=True)
+        if (sessions := _get_event_sessions()) is None:
+            return _async_sessionmaker(url)()
+        scoped = sessions.get(key)
+        if scoped is None:
+            scoped = sessions[key] = _async_sessionmaker(
+                url, _EventScopedAsyncSession
+            )()
+        return cast(AsyncSession, scoped)
 
 else:
     get_db_status = _print_db_not_available
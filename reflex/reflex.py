@@ -1040,6 +1040,178 @@ def rename(new_name: str):
     rename_app(new_name, get_config().loglevel)
 
 
+def _backend_endpoint_url(endpoint: constants.Endpoint, url: str | None) -> str:
+    """Get the URL of an endpoint of a running backend.
+
+    Args:
+        endpoint: The endpoint.
+        url: The URL of the backend, defaults to the api_url of the config.
+
+    Returns:
+        The URL of the endpoint.
+    """
+    if not url:
+        return endpoint.get_url()
+    return url.rstrip("/") + get_config().prepend_backend_path(str(endpoint))
+
+
+@cli.command()
+@log_options
+@click.option(
+    "--url",
+    help="The URL of the backend. Defaults to the api_url of the config.",
+)
+@click.option(
+    "--handler",
+    help="Only dump the stacks of the event handler with this full event name.",
+)
+@click.option(
+    "-o",
+    "--output",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Write the folded stacks to this file instead of stdout.",
+)
+@click.option(
+    "--reset",
+    is_flag=True,
+    default=False,
+    help="Drop the collected profiles after dumping them.",
+)
+def profile(url: str | None, handler: str | None, output: Path | None, reset: bool):
+    """Dump the profiles of slow event handlers from a running backend.
+
+    The stacks are printed in the folded format read by flamegraph.pl,
+    speedscope and inferno. The backend must run with
+    REFLEX_ADD_EVENT_PROFILES_ENDPOINT=1, and REFLEX_EVENT_PROFILE_THRESHOLD or
+    REFLEX_EVENT_PROFILE_SAMPLE_RATE set.
+    """
+    import httpx
+
+    endpoint = _backend_endpoint_url(constants.Endpoint.EVENT_PROFILES, url)
+    params = {"format": "folded"}
+    if handler:
+        params["handler"] = handler
+    try:
+        response = httpx.get(endpoint, params=params, timeout=30)
+        response.raise_for_status()
+        if reset:
+            httpx.delete(endpoint, timeout=30).raise_for_status()
+    except httpx.HTTPError as err:
+        logger.error(f"Could not fetch the event profiles from {endpoint}: {err}")
+        raise SystemExit(1) from None
+
+    if output is None:
+        click.echo(response.text, nl=False)
+        return
+    output.write_text(response.text)
+    logger.info(f"Wrote the event profiles to {output}.")
+
+
+@cli.command(name="state-report")
+@log_options
+@click.option(
+    "--url",
+    help="The URL of the backend. Defaults to the api_url of the config.",
+)
+@click.option(
+    "--reset",
+    is_flag=True,
+    default=False,
+    help="Drop the accounting after printing it.",
+)
+def state_report(url: str | None, reset: bool):
+    """Print the size and write accounting of each substate of a running backend.
+
+    The backend must run with REFLEX_ADD_STATE_ACCOUNTING_ENDPOINT=1 and
+    REFLEX_STATE_ACCOUNTING_SAMPLE_RATE set. Redundant fields are rewritten in
+    most updates of their substate without changing, they are candidates for
+    backend vars or a separate substate.
+    """
+    import httpx
+
+    endpoint = _backend_endpoint_url(constants.Endpoint.STATE_ACCOUNTING, url)
+    try:
+        response = httpx.get(endpoint, timeout=30)
+        response.raise_for_status()
+        if reset:
+            httpx.delete(endpoint, timeout=30).raise_for_status()
+    except httpx.HTTPError as err:
+        logger.error(f"Could not fetch the state accounting from {endpoint}: {err}")
+        raise SystemExit(1) from None
+
+    report = response.json()
+    console.print_table(
+        [
+            [
+                name,
+                f"{stats['dirty_rate']:.0%}",
+                str(stats["writes"]),
+                f"{stats['serialized_bytes']['mean']} / {stats['serialized_bytes']['max']}",
+                f"{stats['memory_bytes']['mean']} / {stats['memory_bytes']['max']}",
+                ", ".join(stats["redundant_fields"]),
+                ", ".join(
+                    f"{name} ({count})"
+                    for name, count in list(stats["invalidated_computed_vars"].items())[
+                        :3
+                    ]
+                ),
+            ]
+            for name, stats in report["states"].items()
+        ],
+        headers=[
+            "State",
+            "Dirty rate",
+            "Writes",
+            "Serialized bytes (mean / max)",
+            "Memory bytes (mean / max)",
+            "Redundant fields",
+            "Most invalidated computed vars",
+        ],
+        overflow="fold",
+    )
+
+
+@cli.command(name="computed-vars")
+@log_options
+@click.option(
+    "--unused",
+    is_flag=True,
+    default=False,
+    help="Only list the frontend computed vars read by no page.",
+)
+def computed_vars(unused: bool):
+    """Print the dependencies and usage of the computed vars of the last compile.
+
+    Unused computed vars are frontend computed vars read by no compiled page.
+    They are left out of the deltas when the backend runs with
+    REFLEX_SKIP_UNUSED_COMPUTED_VARS=1.
+    """
+    from reflex.compiler.computed_vars import load_computed_var_report
+
+    report = load_computed_var_report()
+    if report is None:
+        logger.error("No computed var report found, run `reflex compile` first.")
+        raise SystemExit(1)
+
+    rows = [
+        [
+            f"{state}.{name}",
+            "yes" if info["cache"] else "no",
+            "backend" if info["backend"] else ", ".join(info["used_in"]) or "unused",
+            ", ".join(info["depends_on"]),
+            ", ".join(info["dependents"]),
+        ]
+        for state, cvars in report["states"].items()
+        for name, info in cvars.items()
+        if not unused or name in report["unused"].get(state, ())
+    ]
+    console.print_table(
+        rows,
+        headers=["Computed var", "Cached", "Read by", "Depends on", "Dependents"],
+        overflow="fold",
+    )
+
+
 if find_spec("typer") and find_spec("typer.main"):
     import typer  # pyright: ignore[reportMissingImports]
 
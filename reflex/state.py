@@ -54,7 +54,7 @@ from reflex_base.utils.exceptions import (
     UnretrievableVarValueError,
 )
 from reflex_base.utils.exceptions import ImmutableStateError as ImmutableStateError
-from reflex_base.utils.serializers import serializer
+from reflex_base.utils.serializers import forget_json_fragments, serializer
 from reflex_base.utils.types import _isinstance
 from reflex_base.vars import Field, VarData, field
 from reflex_base.vars.base import (
@@ -73,6 +73,7 @@ from typing_extensions import Self
 import reflex.istate.dynamic
 from reflex import event
 from reflex.istate import HANDLED_PICKLE_ERRORS, debug_failed_pickles
+from reflex.istate.accounting import state_accounting
 from reflex.istate.data import RouterData
 from reflex.istate.proxy import ImmutableMutableProxy as ImmutableMutableProxy
 from reflex.istate.proxy import MutableProxy, is_mutable_type
@@ -372,6 +373,7 @@ CLASS_VAR_NAMES = frozenset({
     "_always_dirty_computed_vars",
     "_always_dirty_substates",
     "_potentially_dirty_states",
+    "_unused_computed_vars",
 })
 
 
@@ -411,6 +413,9 @@ class BaseState(EvenMoreBasicBaseState):
     # Set of states which might need to be recomputed if vars in this state change.
     _potentially_dirty_states: ClassVar[set[str]] = set()
 
+    # Set of frontend computed vars read by no compiled page, left out of deltas.
+    _unused_computed_vars: ClassVar[set[str]] = set()
+
     # The parent state.
     parent_state: BaseState | None = field(default=None, is_var=False)
 
@@ -566,6 +571,7 @@ class BaseState(EvenMoreBasicBaseState):
         # Reset dirty substate tracking for this class.
         cls._always_dirty_substates = set()
         cls._potentially_dirty_states = set()
+        cls._unused_computed_vars = set()
 
         # Get the parent vars.
         parent_state = cls.get_parent_state()
@@ -939,6 +945,28 @@ class BaseState(EvenMoreBasicBaseState):
         # Reset cached schema value
         cls._to_schema.cache_clear()
 
+    @classmethod
+    def _skip_unused_computed_vars(cls, names: set[str]):
+        """Leave frontend computed vars that no page reads out of the deltas.
+
+        Unused vars with cache=False are no longer recomputed on every event,
+        unless another computed var depends on them.
+
+        Args:
+            names: The names of the unused computed vars.
+        """
+        cls._unused_computed_vars = {
+            name
+            for name in names
+            if name in cls.computed_vars and not cls.computed_vars[name]._backend
+        }
+        cls._always_dirty_computed_vars = {
+            name
+            for name, cvar in cls.computed_vars.items()
+            if not cvar._cache
+            and (name not in cls._unused_computed_vars or name in cls._var_dependencies)
+        }
+
     @classmethod
     def _check_overridden_methods(cls):
         """Check for shadow methods and raise error if any.
@@ -1518,6 +1546,10 @@ class BaseState(EvenMoreBasicBaseState):
             return
 
         if name in self.backend_vars:
+            if state_accounting.enabled:
+                state_accounting.record_assignment(
+                    self, name, self._backend_vars.get(name), value
+                )
             self._backend_vars.__setitem__(name, value)
             self.dirty_vars.add(name)
             self._mark_dirty()
@@ -1547,6 +1579,11 @@ class BaseState(EvenMoreBasicBaseState):
                     f" but got '{value}' of type '{type(value)}'."
                 )
 
+        if state_accounting.enabled and name in self.base_vars:
+            state_accounting.record_assignment(
+                self, name, self.__dict__.get(name), value
+            )
+
         # Set the attribute.
         object.__setattr__(self, name, value)
 
@@ -1870,7 +1907,9 @@ class BaseState(EvenMoreBasicBaseState):
 
         self._mark_dirty_computed_vars()
         frontend_computed_vars: set[str] = {
-            name for name, cv in self.computed_vars.items() if not cv._backend
+            name
+            for name, cv in self.computed_vars.items()
+            if not cv._backend and name not in self._unused_computed_vars
         }
 
         # Return the dirty vars for this instance, any cached/dependent computed vars,
@@ -1886,6 +1925,8 @@ class BaseState(EvenMoreBasicBaseState):
         }
 
         if len(subdelta) > 0:
+            # The values changed since the JSON text kept for them was encoded.
+            forget_json_fragments(subdelta.values())
             delta[self.get_full_name()] = subdelta
 
         # Recursively find the substate deltas.
@@ -1955,6 +1996,9 @@ class BaseState(EvenMoreBasicBaseState):
                 continue
             self.substates[substate]._clean()
 
+        if state_accounting.enabled:
+            state_accounting.record_clean(self)
+
         # Clean this state.
         self.dirty_vars = set()
         self.dirty_substates = set()
@@ -2016,7 +2060,7 @@ class BaseState(EvenMoreBasicBaseState):
                 # Include the computed vars.
                 prop_name: self.get_value(prop_name)
                 for prop_name, cv in self.computed_vars.items()
-                if not cv._backend
+                if not cv._backend and prop_name not in self._unused_computed_vars
             }
         else:
             computed_vars = {}
@@ -2185,6 +2229,9 @@ class BaseState(EvenMoreBasicBaseState):
         if environment.REFLEX_PERF_MODE.get() != PerformanceMode.OFF:
             self._check_state_size(len(payload))
 
+        if state_accounting.enabled and payload:
+            state_accounting.record_write(self, len(payload))
+
         if not payload:
             e = StateSerializationError(error)
             if sys.version_info >= (3, 11):
@@ -0,0 +1,275 @@
+"""Parallel, incremental zip packaging for exported apps."""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import hashlib
+import logging
+import os
+import struct
+import zipfile
+import zlib
+from collections import deque
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import BinaryIO
+
+logger = logging.getLogger(__name__)
+
+# Raw deflate streams (no zlib header) as stored in zip entries.
+_DEFLATE_WBITS = -15
+
+# Local file header: signature, versions, flags, method, time, date, crc, sizes, name/extra lengths.
+_LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+_LOCAL_HEADER_SIGNATURE = b"PK\x03\x04"
+
+# How many pending files each worker may have queued before writing catches up.
+_PENDING_PER_WORKER = 4
+
+
+def get_file_id(path: Path) -> tuple[int, int] | None:
+    """Get the (device, inode) pair identifying a file, following symlinks.
+
+    Args:
+        path: The path to identify.
+
+    Returns:
+        The file id, or None if the path does not exist.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_dev, st.st_ino)
+
+
+def get_file_ids(paths: Iterable[Path]) -> set[tuple[int, int]]:
+    """Precompute the file ids of existing paths for O(1) exclusion checks.
+
+    Args:
+        paths: The paths to identify.
+
+    Returns:
+        The file ids of the paths that exist.
+    """
+    return {file_id for path in paths if (file_id := get_file_id(path)) is not None}
+
+
+@dataclasses.dataclass(frozen=True)
+class ArchiveStats:
+    """Summary of a written archive."""
+
+    # The number of files written to the archive.
+    files: int
+
+    # The number of entries copied verbatim from the previous archive.
+    reused: int
+
+    # The number of entries compressed in this run.
+    compressed: int
+
+
+@dataclasses.dataclass(frozen=True)
+class _PreparedEntry:
+    """A file that is ready to be written into the archive."""
+
+    zinfo: zipfile.ZipInfo
+    data: bytes | None = None
+
+
+class _ArchiveWriter(zipfile.ZipFile):
+    """A ZipFile that accepts entries whose data is already compressed."""
+
+    def write_compressed(self, zinfo: zipfile.ZipInfo, data: bytes):
+        """Append an entry whose CRC, sizes and compressed payload are precomputed.
+
+        Args:
+            zinfo: The entry metadata, including CRC, compress_type and sizes.
+            data: The compressed entry payload.
+        """
+        with self._lock:  # pyright: ignore[reportAttributeAccessIssue]
+            if self._seekable:  # pyright: ignore[reportAttributeAccessIssue]
+                self.fp.seek(self.start_dir)  # pyright: ignore[reportOptionalMemberAccess]
+            zinfo.header_offset = self.fp.tell()  # pyright: ignore[reportOptionalMemberAccess]
+            self._writecheck(zinfo)  # pyright: ignore[reportAttributeAccessIssue]
+            self._didModify = True
+            zip64 = (
+                zinfo.file_size > zipfile.ZIP64_LIMIT
+                or zinfo.compress_size > zipfile.ZIP64_LIMIT
+            )
+            self.fp.write(zinfo.FileHeader(zip64))  # pyright: ignore[reportOptionalMemberAccess]
+            self.fp.write(data)  # pyright: ignore[reportOptionalMemberAccess]
+            self.filelist.append(zinfo)
+            self.NameToInfo[zinfo.filename] = zinfo
+            self.start_dir = self.fp.tell()  # pyright: ignore[reportOptionalMemberAccess]
+
+
+def _read_raw_entry(fp: BinaryIO, zinfo: zipfile.ZipInfo) -> bytes:
+    """Read the still-compressed payload of an entry from an open archive.
+
+    Args:
+        fp: The binary file object of the archive.
+        zinfo: The entry to read.
+
+    Returns:
+        The compressed payload.
+
+    Raises:
+        zipfile.BadZipFile: If the local header is corrupt.
+    """
+    fp.seek(zinfo.header_offset)
+    header = _LOCAL_HEADER.unpack(fp.read(_LOCAL_HEADER.size))
+    if header[0] != _LOCAL_HEADER_SIGNATURE:
+        msg = f"Bad local header for {zinfo.filename}"
+        raise zipfile.BadZipFile(msg)
+    fp.seek(header[10] + header[11], os.SEEK_CUR)
+    return fp.read(zinfo.compress_size)
+
+
+def _load_previous_entries(target: Path) -> dict[str, zipfile.ZipInfo]:
+    """Read the content-hash manifest of a previously written archive.
+
+    Each entry written by this module records the digest of its source file
+    in the per-entry comment of the central directory.
+
+    Args:
+        target: The previous archive.
+
+    Returns:
+        A mapping of archive names to entries that carry a content hash.
+    """
+    if not target.is_file():
+        return {}
+    try:
+        with zipfile.ZipFile(target) as previous:
+            return {
+                zinfo.filename: zinfo
+                for zinfo in previous.infolist()
+                if zinfo.comment and not zinfo.flag_bits & 0x08
+            }
+    except (OSError, zipfile.BadZipFile):
+        logger.debug(f"Not reusing entries from unreadable archive {target}")
+        return {}
+
+
+def _prepare_entry(
+    path: Path,
+    arcname: str,
+    previous: dict[str, zipfile.ZipInfo],
+    compresslevel: int,
+) -> _PreparedEntry:
+    """Hash and (unless unchanged) compress a file in a worker thread.
+
+    Args:
+        path: The file to add.
+        arcname: The name of the file inside the archive.
+        previous: The entries of the previous archive, keyed by name.
+        compresslevel: The zlib compression level.
+
+    Returns:
+        The prepared entry. ``data`` is None when the previous entry can be reused.
+    """
+    zinfo = zipfile.ZipInfo.from_file(path, arcname)
+    if zinfo.is_dir():
+        zinfo.CRC = zinfo.compress_size = 0
+        return _PreparedEntry(zinfo=zinfo, data=b"")
+    raw = path.read_bytes()
+    digest = hashlib.blake2b(raw, digest_size=16).hexdigest().encode()
+    zinfo.comment = digest
+    zinfo.file_size = len(raw)
+    prior = previous.get(arcname)
+    if prior is not None and prior.comment == digest:
+        zinfo.compress_type = prior.compress_type
+        zinfo.CRC = prior.CRC
+        zinfo.compress_size = prior.compress_size
+        return _PreparedEntry(zinfo=zinfo)
+
+    compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, _DEFLATE_WBITS)
+    data = compressor.compress(raw) + compressor.flush()
+    if len(data) < len(raw):
+        zinfo.compress_type = zipfile.ZIP_DEFLATED
+    else:
+        # Already-compressed assets (images, fonts) are cheaper to store as-is.
+        zinfo.compress_type = zipfile.ZIP_STORED
+        data = raw
+    zinfo.CRC = zlib.crc32(raw)
+    zinfo.compress_size = len(data)
+    return _PreparedEntry(zinfo=zinfo, data=data)
+
+
+def write_zip(
+    target: Path,
+    files: Iterable[tuple[Path, str]],
+    *,
+    reuse_previous: bool = True,
+    max_workers: int | None = None,
+    compresslevel: int = zlib.Z_DEFAULT_COMPRESSION,
+    on_file: Callable[[Path], None] | None = None,
+) -> ArchiveStats:
+    """Write a zip archive, compressing files in parallel worker threads.
+
+    Entries are written in the order given. When ``reuse_previous`` is set and
+    ``target`` already exists, files whose content hash matches the previous
+    archive's manifest are copied over without being recompressed. The archive
+    is written to a temporary file and atomically replaces ``target``.
+
+    Args:
+        target: The archive to write.
+        files: Pairs of (source path, archive name).
+        reuse_previous: Whether to reuse unchanged entries from an existing target.
+        max_workers: The number of compression threads (defaults to the CPU count).
+        compresslevel: The zlib compression level.
+        on_file: Called with each source path after it is written.
+
+    Returns:
+        Statistics about the written archive.
+    """
+    target = Path(target)
+    previous = _load_previous_entries(target) if reuse_previous else {}
+    max_workers = max_workers or os.cpu_count() or 1
+    tmp_target = target.with_name(f".{target.name}.tmp")
+    written = reused = 0
+
+    try:
+        with contextlib.ExitStack() as stack:
+            executor = stack.enter_context(
+                ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix="reflex-zip"
+                )
+            )
+            archive = stack.enter_context(_ArchiveWriter(tmp_target, "w"))
+            previous_fp = stack.enter_context(target.open("rb")) if previous else None
+            pending: deque[tuple[Path, Future[_PreparedEntry]]] = deque()
+
+            def _write_next():
+                nonlocal written, reused
+                path, future = pending.popleft()
+                entry = future.result()
+                data = entry.data
+                if data is None and previous_fp is not None:
+                    data = _read_raw_entry(previous_fp, previous[entry.zinfo.filename])
+                    reused += 1
+                archive.write_compressed(entry.zinfo, data or b"")
+                written += 1
+                if on_file is not None:
+                    on_file(path)
+
+            for path, arcname in files:
+                pending.append((
+                    path,
+                    executor.submit(
+                        _prepare_entry, path, arcname, previous, compresslevel
+                    ),
+                ))
+                if len(pending) >= max_workers * _PENDING_PER_WORKER:
+                    _write_next()
+            while pending:
+                _write_next()
+    except BaseException:
+        tmp_target.unlink(missing_ok=True)
+        raise
+
+    tmp_target.replace(target)
+    return ArchiveStats(files=written, reused=reused, compressed=written - reused)
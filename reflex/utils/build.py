@@ -4,13 +4,20 @@ from __future__ import annotations
 
 import logging
 import os
-import zipfile
 from pathlib import Path, PosixPath
 
 from reflex_base import constants
 from reflex_base.config import get_config
 
-from reflex.utils import console, js_runtimes, path_ops, prerequisites, processes
+from reflex.utils import (
+    archive,
+    console,
+    js_runtimes,
+    path_ops,
+    precompress,
+    prerequisites,
+    processes,
+)
 from reflex.utils.exec import is_in_app_harness
 
 logger = logging.getLogger(__name__)
@@ -44,9 +51,13 @@ def _zip(
     directory_names_to_exclude: set[str] | None = None,
     files_to_exclude: set[Path] | None = None,
     globs_to_include: list[str] | None = None,
+    reuse_previous: bool = True,
 ) -> None:
     """Zip utility function.
 
+    Files are compressed in parallel worker threads, and entries whose content
+    is unchanged since the previous archive at ``target`` are reused as-is.
+
     Args:
         component_name: The name of the component: backend or frontend.
         target: The target zip file.
@@ -56,12 +67,14 @@ def _zip(
         directory_names_to_exclude: The directory names to exclude.
         files_to_exclude: The files to exclude.
         globs_to_include: Apply these globs from the root_directory and always include them in the zip.
+        reuse_previous: Whether to reuse unchanged entries from an existing target archive.
 
     """
     target = Path(target)
     root_directory = Path(root_directory).resolve()
     directory_names_to_exclude = directory_names_to_exclude or set()
-    files_to_exclude = files_to_exclude or set()
+    # Identify excluded paths once so each walked entry costs a single stat.
+    excluded_ids = archive.get_file_ids(files_to_exclude or ())
     files_to_zip: list[Path] = []
     # Traverse the root directory in a top-down manner. In this traversal order,
     # we can modify the dirs list in-place to remove directories we don't want to include.
@@ -74,12 +87,9 @@ def _zip(
             subdirectory_name
             for subdirectory_name in subdirectories_names
             if subdirectory_name not in directory_names_to_exclude
-            and not any(
-                (directory_path / subdirectory_name).samefile(exclude)
-                for exclude in files_to_exclude
-                if exclude.exists()
-            )
             and not subdirectory_name.startswith(".")
+            and archive.get_file_id(directory_path / subdirectory_name)
+            not in excluded_ids
             and (
                 not exclude_venv_directories
                 or not _looks_like_venv_directory(directory_path / subdirectory_name)
@@ -95,18 +105,14 @@ def _zip(
         files_to_zip += [
             directory_path / subfile_name
             for subfile_name in subfiles_names
-            if not any(
-                (directory_path / subfile_name).samefile(excluded_file)
-                for excluded_file in files_to_exclude
-                if excluded_file.exists()
-            )
+            if archive.get_file_id(directory_path / subfile_name) not in excluded_ids
         ]
     if globs_to_include:
         for glob in globs_to_include:
             files_to_zip += [
                 file
                 for file in root_directory.glob(glob)
-                if file.name not in files_to_exclude
+                if archive.get_file_id(file) not in excluded_ids
             ]
     # Create a progress bar for zipping the component.
     progress = console.progress()
@@ -114,11 +120,24 @@ def _zip(
         f"Zipping {component_name.value}:", total=len(files_to_zip)
     )
 
-    with progress, zipfile.ZipFile(target, "w", zipfile.ZIP_DEFLATED) as zipf:
-        for file in files_to_zip:
-            logger.debug(f"{target}: {file}", extra={"progress": progress})
-            progress.advance(task)
-            zipf.write(file, Path(file).relative_to(root_directory))
+    def _on_file(file: Path):
+        logger.debug(f"{target}: {file}", extra={"progress": progress})
+        progress.advance(task)
+
+    with progress:
+        stats = archive.write_zip(
+            target,
+            (
+                (file, file.relative_to(root_directory).as_posix())
+                for file in files_to_zip
+            ),
+            reuse_previous=reuse_previous,
+            on_file=_on_file,
+        )
+    logger.debug(
+        f"{target}: wrote {stats.files} files "
+        f"({stats.reused} reused, {stats.compressed} compressed)"
+    )
 
 
 def zip_app(
@@ -192,7 +211,11 @@ def _duplicate_index_html_to_parent_directory(directory: Path):
 
 
 def _compress_static_output(directory: Path, formats: tuple[str, ...]) -> None:
-    """Run the shared frontend compressor against the final static output tree.
+    """Write precompressed sidecars for the final static output tree.
+
+    Compression runs in-process when every configured format is available to
+    Python (brotli needs ``brotli``; zstd needs Python 3.14 or ``zstandard``).
+    Otherwise the shared JavaScript compressor is used.
 
     Args:
         directory: The static output directory.
@@ -205,6 +228,20 @@ def _compress_static_output(directory: Path, formats: tuple[str, ...]) -> None:
         return
 
     web_dir = prerequisites.get_web_dir().resolve()
+    if all(precompress.is_format_available(format_) for format_ in formats):
+        stats = precompress.compress_directory(
+            directory, formats, web_dir / constants.Dirs.PRECOMPRESS_CACHE
+        )
+        logger.debug(
+            f"Precompressed {stats.files} files: {stats.compressed} variants compressed, "
+            f"{stats.cached} reused from cache, {stats.skipped} skipped"
+        )
+        return
+
+    unavailable = [f for f in formats if not precompress.is_format_available(f)]
+    logger.debug(
+        f"Falling back to the JavaScript compressor for formats: {', '.join(unavailable)}"
+    )
     runtime = path_ops.get_node_path() or path_ops.get_bun_path()
     if runtime is None:
         logger.error("Node.js or Bun is required to compress the exported frontend.")
@@ -12,7 +12,7 @@ import platform
 import re
 import subprocess
 import sys
-from collections.abc import Mapping, Sequence
+from collections.abc import Callable, Mapping, Sequence
 from pathlib import Path
 from typing import Any, NamedTuple, TypedDict
 
@@ -21,8 +21,9 @@ from reflex_base.config import get_config
 from reflex_base.constants.base import LogLevel
 from reflex_base.environment import environment
 from reflex_base.telemetry_context import CompileTrigger
-from reflex_base.utils import console
+from reflex_base.utils import console, log
 from reflex_base.utils.decorator import once
+from reflex_base.utils.types import ASGIApp
 
 from reflex.utils import path_ops
 from reflex.utils.misc import get_module_path
@@ -365,6 +366,8 @@ def get_frontend_mount():
             directory=static_dir,
             html=True,
             encodings=config.frontend_compression_formats,
+            immutable=environment.REFLEX_FRONTEND_STATIC_INDEX.get(),
+            memory_cache_size=environment.REFLEX_FRONTEND_STATIC_MEMORY_CACHE_SIZE.get(),
         ),
         name="frontend",
     )
@@ -812,7 +815,40 @@ def run_granian_backend_prod(
         workers=int(os.getenv("GRANIAN_WORKERS", str(_get_backend_workers()))),
     )
 
-    granian_app.serve()
+    target_loader = None
+    if app_target is None and environment.REFLEX_PRELOAD_BACKEND.get():
+        target_loader = _preload_backend_app()
+
+    granian_app.serve(target_loader=target_loader)
+
+
+def _preload_backend_app() -> Callable[[str], ASGIApp] | None:
+    """Evaluate the app in this process, for the forked workers to inherit it.
+
+    Otherwise every worker imports the app and evaluates its stateful pages
+    again when it starts.
+
+    Returns:
+        The loader of the evaluated app, or None if the workers are not forked.
+    """
+    import multiprocessing
+
+    from reflex.utils import prerequisites
+
+    if multiprocessing.get_start_method() != "fork":
+        logger.warning(
+            f"{environment.REFLEX_PRELOAD_BACKEND.name} needs the backend workers "
+            "to be forked, the app is loaded by every worker."
+        )
+        return None
+
+    with log.timing(logger, "Preload backend"):
+        asgi_app = prerequisites.get_and_validate_app().app()
+
+    def load_preloaded_app(_target: str) -> ASGIApp:
+        return asgi_app
+
+    return load_preloaded_app
 
 
 def output_system_info():
@@ -0,0 +1,287 @@
+"""Generate precompressed sidecars for the exported static frontend in-process."""
+
+from __future__ import annotations
+
+import concurrent.futures
+import dataclasses
+import gzip
+import hashlib
+import json
+import logging
+import os
+import shutil
+from collections.abc import Callable, Sequence
+from importlib.util import find_spec
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Only text-like assets benefit from compression.
+COMPRESSIBLE_EXTENSIONS = frozenset({
+    ".js",
+    ".css",
+    ".html",
+    ".json",
+    ".svg",
+    ".xml",
+    ".txt",
+    ".map",
+    ".mjs",
+})
+
+# Files smaller than this are not worth a sidecar. HTML entrypoints are always
+# compressed (ignoring both thresholds) so their negotiated sidecars exist.
+MIN_SIZE = 256
+
+# A variant is only written when it is at least this many times smaller than the original.
+MIN_RATIO = 1.05
+
+# The sidecar suffix for each supported format.
+SUFFIXES = {"gzip": ".gz", "brotli": ".br", "zstd": ".zst"}
+
+# The manifest of content digests to compressed variants, stored in the cache directory.
+MANIFEST = "manifest.json"
+
+# Bump when compression settings change so cached variants are regenerated.
+MANIFEST_VERSION = 1
+
+
+def _compress_gzip(raw: bytes) -> bytes:
+    # mtime=0 keeps the output deterministic so unchanged inputs give identical sidecars.
+    return gzip.compress(raw, compresslevel=9, mtime=0)
+
+
+def _compress_brotli(raw: bytes) -> bytes:
+    import brotli  # pyright: ignore[reportMissingImports]
+
+    return brotli.compress(raw, quality=11)
+
+
+def _compress_zstd(raw: bytes) -> bytes:
+    try:
+        from compression import zstd  # pyright: ignore[reportMissingImports]
+    except ImportError:
+        import zstandard  # pyright: ignore[reportMissingImports]
+
+        return zstandard.ZstdCompressor(level=19).compress(raw)
+    return zstd.compress(raw, level=19)
+
+
+_COMPRESSORS: dict[str, Callable[[bytes], bytes]] = {
+    "gzip": _compress_gzip,
+    "brotli": _compress_brotli,
+    "zstd": _compress_zstd,
+}
+
+
+def is_format_available(format_name: str) -> bool:
+    """Check whether a compression format can be produced in-process.
+
+    Args:
+        format_name: The format name (gzip, brotli or zstd).
+
+    Returns:
+        Whether the compressor's module is installed.
+    """
+    if format_name == "gzip":
+        return True
+    if format_name == "brotli":
+        return find_spec("brotli") is not None
+    if format_name == "zstd":
+        return (
+            find_spec("compression") is not None
+            and find_spec("compression.zstd") is not None
+        ) or find_spec("zstandard") is not None
+    return False
+
+
+@dataclasses.dataclass
+class PrecompressStats:
+    """Summary of a precompression pass."""
+
+    # The number of candidate files considered.
+    files: int = 0
+
+    # The number of variants compressed in this pass.
+    compressed: int = 0
+
+    # The number of variants restored from the cache without recompressing.
+    cached: int = 0
+
+    # The number of variants skipped because they did not meet the size ratio.
+    skipped: int = 0
+
+
+def _compress_variants(
+    path: str, formats: Sequence[str], cache_dir: str, digest: str, min_ratio: float
+) -> dict[str, int | None]:
+    """Compress one file into each requested format (runs in a worker process).
+
+    Variants that meet the ratio threshold are written next to the file and into
+    the cache; variants that do not are omitted and any stale sidecar is removed.
+
+    Args:
+        path: The file to compress.
+        formats: The formats to produce.
+        cache_dir: The content-addressed cache directory.
+        digest: The content digest of the file.
+        min_ratio: The minimum original/compressed size ratio worth keeping.
+
+    Returns:
+        The compressed size of each format, or None when it was not worth writing.
+    """
+    raw = Path(path).read_bytes()
+    results: dict[str, int | None] = {}
+    for format_name in formats:
+        suffix = SUFFIXES[format_name]
+        sidecar = Path(path + suffix)
+        compressed = _COMPRESSORS[format_name](raw)
+        if len(compressed) * min_ratio > len(raw):
+            sidecar.unlink(missing_ok=True)
+            results[format_name] = None
+            continue
+        sidecar.write_bytes(compressed)
+        (Path(cache_dir) / f"{digest}{suffix}").write_bytes(compressed)
+        results[format_name] = len(compressed)
+    return results
+
+
+def _load_manifest(cache_dir: Path) -> dict[str, dict[str, int | None]]:
+    """Load the precompression manifest.
+
+    Args:
+        cache_dir: The cache directory.
+
+    Returns:
+        A mapping of content digests to the size of each format variant (None if skipped).
+    """
+    try:
+        data = json.loads((cache_dir / MANIFEST).read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+        return {}
+    entries = data.get("entries")
+    return entries if isinstance(entries, dict) else {}
+
+
+def _iter_candidates(directory: Path):
+    """Yield the files under a directory that should get compressed sidecars.
+
+    Args:
+        directory: The static output directory.
+
+    Yields:
+        The candidate file paths.
+    """
+    sidecar_suffixes = tuple(SUFFIXES.values())
+    for dirpath, _, filenames in os.walk(directory):
+        for filename in filenames:
+            path = Path(dirpath) / filename
+            if path.suffix in COMPRESSIBLE_EXTENSIONS and not filename.endswith(
+                sidecar_suffixes
+            ):
+                yield path
+
+
+def compress_directory(
+    directory: Path,
+    formats: Sequence[str],
+    cache_dir: Path,
+    *,
+    min_size: int = MIN_SIZE,
+    min_ratio: float = MIN_RATIO,
+    max_workers: int | None = None,
+) -> PrecompressStats:
+    """Write precompressed sidecars for every compressible file in a directory.
+
+    Work is incremental: each file is identified by a content digest, and
+    variants produced for the same content in an earlier pass are copied from
+    ``cache_dir`` instead of being recompressed. Only new content is sent to the
+    worker process pool. Cache entries for content that no longer exists are
+    pruned at the end of the pass.
+
+    Args:
+        directory: The static output directory.
+        formats: The formats to produce (gzip, brotli, zstd).
+        cache_dir: The directory holding the manifest and cached variants.
+        min_size: Files smaller than this are skipped, except HTML entrypoints.
+        min_ratio: The minimum original/compressed size ratio worth writing.
+        max_workers: The number of worker processes (defaults to the CPU count).
+
+    Returns:
+        Statistics about the pass.
+
+    Raises:
+        ValueError: If a format is unknown or its compressor is not installed.
+    """
+    if unavailable := [f for f in formats if not is_format_available(f)]:
+        msg = f"Compression formats not available in this environment: {', '.join(unavailable)}"
+        raise ValueError(msg)
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    manifest = _load_manifest(cache_dir)
+    used: dict[str, dict[str, int | None]] = {}
+    stats = PrecompressStats()
+    jobs: list[tuple[Path, str, list[str], float]] = []
+
+    for path in _iter_candidates(directory):
+        raw = path.read_bytes()
+        is_html = path.suffix == ".html"
+        if len(raw) < min_size and not is_html:
+            continue
+        stats.files += 1
+        digest = hashlib.sha256(raw).hexdigest()
+        known = manifest.get(digest, {})
+        entry = used.setdefault(digest, {})
+        missing: list[str] = []
+        for format_name in formats:
+            suffix = SUFFIXES[format_name]
+            sidecar = Path(f"{path}{suffix}")
+            if format_name not in known:
+                missing.append(format_name)
+            elif known[format_name] is None:
+                sidecar.unlink(missing_ok=True)
+                entry[format_name] = None
+                stats.skipped += 1
+            elif (cached := cache_dir / f"{digest}{suffix}").is_file():
+                shutil.copyfile(cached, sidecar)
+                entry[format_name] = known[format_name]
+                stats.cached += 1
+            else:
+                missing.append(format_name)
+        if missing:
+            jobs.append((path, digest, missing, 0.0 if is_html else min_ratio))
+
+    if jobs:
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=min(max_workers or os.cpu_count() or 1, len(jobs))
+        ) as executor:
+            futures = {
+                executor.submit(
+                    _compress_variants,
+                    str(path),
+                    missing,
+                    str(cache_dir),
+                    digest,
+                    ratio,
+                ): digest
+                for path, digest, missing, ratio in jobs
+            }
+            for future in concurrent.futures.as_completed(futures):
+                results = future.result()
+                used[futures[future]].update(results)
+                for size in results.values():
+                    if size is None:
+                        stats.skipped += 1
+                    else:
+                        stats.compressed += 1
+
+    # Forget variants for content that is no longer part of the output.
+    for cached in cache_dir.iterdir():
+        if cached.name != MANIFEST and cached.name.split(".", 1)[0] not in used:
+            cached.unlink(missing_ok=True)
+    (cache_dir / MANIFEST).write_text(
+        json.dumps({"version": MANIFEST_VERSION, "entries": used})
+    )
+    return stats
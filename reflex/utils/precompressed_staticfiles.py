@@ -2,19 +2,34 @@
 
 from __future__ import annotations
 
+import hashlib
+import logging
 import os
 import stat
 from collections.abc import Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from email.utils import formatdate
 from functools import lru_cache
 from mimetypes import guess_type
 from os import PathLike
 from pathlib import Path
 
+import anyio.to_thread
 from starlette.datastructures import Headers
 from starlette.responses import FileResponse, Response
 from starlette.staticfiles import NotModifiedResponse, StaticFiles
-from starlette.types import Scope
+from starlette.types import Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+# Files at least this large are streamed in bigger chunks to cut thread hops.
+LARGE_FILE_SIZE = 1024 * 1024
+
+# The chunk size used to stream large files when the server cannot send them zero-copy.
+LARGE_FILE_CHUNK_SIZE = 1024 * 1024
+
+# Files larger than this are never held in the in-memory cache.
+MEMORY_CACHE_MAX_FILE_SIZE = 256 * 1024
 
 
 @dataclass(frozen=True, slots=True)
@@ -30,6 +45,124 @@ _SUPPORTED_ENCODINGS: dict[str, _EncodingFormat] = {
 }
 
 
+@dataclass(frozen=True, slots=True)
+class _FileVariant:
+    """A servable file (original or sidecar) with its precomputed metadata."""
+
+    path: str
+    stat_result: os.stat_result
+    headers: dict[str, str]
+    body: bytes | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class _IndexedFile:
+    """An original file, its media type and its available sidecars."""
+
+    original: _FileVariant
+    media_type: str | None
+    # Keyed by Content-Encoding token, in configured preference order.
+    sidecars: dict[str, _FileVariant] = field(default_factory=dict)
+
+
+def _stat_headers(stat_result: os.stat_result) -> dict[str, str]:
+    """Compute the validator headers FileResponse derives from a stat result.
+
+    Args:
+        stat_result: The stat result of the file.
+
+    Returns:
+        The content-length, last-modified and etag headers.
+    """
+    etag_base = f"{stat_result.st_mtime}-{stat_result.st_size}"
+    return {
+        "content-length": str(stat_result.st_size),
+        "last-modified": formatdate(stat_result.st_mtime, usegmt=True),
+        "etag": f'"{hashlib.md5(etag_base.encode(), usedforsecurity=False).hexdigest()}"',
+    }
+
+
+def _guess_media_type(path: str | PathLike[str]) -> str | None:
+    """Guess the media type of a static file.
+
+    Args:
+        path: The file path.
+
+    Returns:
+        The media type, if known.
+    """
+    if Path(path).suffix.lower() in {".js", ".mjs"}:
+        return "text/javascript"
+    return guess_type(os.fspath(path))[0]
+
+
+class _StaticFileResponse(FileResponse):
+    """A FileResponse that reuses precomputed headers and avoids chunked copies where possible.
+
+    Servers advertising ``http.response.pathsend`` are handled by Starlette. For
+    servers advertising ``http.response.zerocopysend`` the open file is handed to
+    the server to ``sendfile``. Otherwise large files stream in bigger chunks.
+    """
+
+    def set_stat_headers(self, stat_result: os.stat_result) -> None:
+        """Set validator headers unless they were precomputed by the index.
+
+        Args:
+            stat_result: The stat result of the file.
+        """
+        if "etag" in self.headers:
+            return
+        super().set_stat_headers(stat_result)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Send the file, preferring zero-copy transfer.
+
+        Args:
+            scope: The ASGI scope.
+            receive: The ASGI receive channel.
+            send: The ASGI send channel.
+        """
+        extensions = scope.get("extensions") or {}
+        headers = Headers(scope=scope)
+        if (
+            scope["type"] == "http"
+            and scope["method"].upper() != "HEAD"
+            and "http.response.pathsend" not in extensions
+            and "http.response.zerocopysend" in extensions
+            and "range" not in headers
+            and self.stat_result is not None
+        ):
+            await self._send_zerocopy(send, self.stat_result.st_size)
+            if self.background is not None:
+                await self.background()
+            return
+        if self.stat_result is not None and self.stat_result.st_size >= LARGE_FILE_SIZE:
+            self.chunk_size = LARGE_FILE_CHUNK_SIZE
+        await super().__call__(scope, receive, send)
+
+    async def _send_zerocopy(self, send: Send, size: int) -> None:
+        """Hand the open file to the server's zero-copy send extension.
+
+        Args:
+            send: The ASGI send channel.
+            size: The number of bytes to send.
+        """
+        file = await anyio.to_thread.run_sync(Path(self.path).open, "rb")
+        try:
+            await send({
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": self.raw_headers,
+            })
+            await send({
+                "type": "http.response.zerocopysend",
+                "file": file,
+                "count": size,
+            })
+        finally:
+            file.close()
+
+
 @lru_cache(maxsize=64)
 def _parse_accept_encoding(header_value: str | None) -> dict[str, float]:
     """Parse an ``Accept-Encoding`` header into a token-to-quality mapping.
@@ -66,12 +199,20 @@ def _parse_accept_encoding(header_value: str | None) -> dict[str, float]:
 
 
 class PrecompressedStaticFiles(StaticFiles):
-    """StaticFiles that prefers matching precompressed sidecar files."""
+    """StaticFiles that prefers matching precompressed sidecar files.
+
+    With ``immutable=True`` the directory is treated as a finished build: its
+    files, sidecars, validators and media types are indexed once, so requests
+    are answered without ``stat`` calls, and small files can be served from
+    memory.
+    """
 
     def __init__(
         self,
         *args,
         encodings: Sequence[str] = (),
+        immutable: bool = False,
+        memory_cache_size: int = 0,
         **kwargs,
     ):
         """Initialize the static file server.
@@ -79,10 +220,103 @@ class PrecompressedStaticFiles(StaticFiles):
         Args:
             *args: Passed through to ``StaticFiles``.
             encodings: Ordered list of supported precompressed formats.
+            immutable: Whether to index the directory once instead of checking the filesystem per request.
+            memory_cache_size: Total bytes of small indexed files to keep in memory (0 disables).
             **kwargs: Passed through to ``StaticFiles``.
         """
         super().__init__(*args, **kwargs)
         self._encodings = tuple(_SUPPORTED_ENCODINGS[name] for name in encodings)
+        self._immutable = immutable
+        self._memory_cache_size = memory_cache_size
+        # Relative request path -> (full path, stat) for indexed files and directories.
+        self._paths: dict[str, tuple[str, os.stat_result]] | None = None
+        # Full path -> indexed file metadata.
+        self._files: dict[str, _IndexedFile] = {}
+        if immutable and self.directory is not None and Path(self.directory).is_dir():
+            self._build_index()
+
+    def _build_index(self):
+        """Walk the directory once and record every file, sidecar and directory."""
+        paths: dict[str, tuple[str, os.stat_result]] = {}
+        files: dict[str, _IndexedFile] = {}
+        memory_budget = self._memory_cache_size
+        sidecar_suffixes = tuple(fmt.suffix for fmt in self._encodings)
+        for directory in self.all_directories:
+            root = os.path.realpath(directory)
+            for dirpath, _, filenames in os.walk(root, followlinks=self.follow_symlink):
+                relative_dir = os.path.normpath(os.path.relpath(dirpath, root))
+                paths.setdefault(relative_dir, (dirpath, Path(dirpath).stat()))
+                for filename in filenames:
+                    full_path = str(Path(dirpath) / filename)
+                    relative_path = os.path.normpath(Path(relative_dir) / filename)
+                    if relative_path in paths:
+                        # Earlier directories take precedence, as in lookup_path.
+                        continue
+                    if not self.follow_symlink and (
+                        os.path.commonpath([os.path.realpath(full_path), root]) != root
+                    ):
+                        # Links leaving the directory are not served, as in lookup_path.
+                        continue
+                    try:
+                        stat_result = Path(full_path).stat()
+                    except OSError:
+                        continue
+                    if not stat.S_ISREG(stat_result.st_mode):
+                        continue
+                    paths[relative_path] = (full_path, stat_result)
+
+        def _variant(full_path: str, stat_result: os.stat_result) -> _FileVariant:
+            nonlocal memory_budget
+            body = None
+            if stat_result.st_size <= min(MEMORY_CACHE_MAX_FILE_SIZE, memory_budget):
+                body = Path(full_path).read_bytes()
+                memory_budget -= len(body)
+            return _FileVariant(
+                path=full_path,
+                stat_result=stat_result,
+                headers=_stat_headers(stat_result),
+                body=body,
+            )
+
+        for relative_path, (full_path, stat_result) in paths.items():
+            if not stat.S_ISREG(stat_result.st_mode):
+                continue
+            sidecars: dict[str, _FileVariant] = {}
+            if not full_path.endswith(sidecar_suffixes):
+                for encoding in self._encodings:
+                    sidecar = paths.get(relative_path + encoding.suffix)
+                    if sidecar is not None:
+                        sidecars[encoding.content_encoding] = _variant(*sidecar)
+            files[full_path] = _IndexedFile(
+                original=_variant(full_path, stat_result),
+                media_type=_guess_media_type(full_path),
+                sidecars=sidecars,
+            )
+        self._paths = paths
+        self._files = files
+        logger.debug(
+            f"Indexed {len(files)} static files in {self.directory} "
+            f"({self._memory_cache_size - memory_budget} bytes cached in memory)"
+        )
+
+    def lookup_path(self, path: str) -> tuple[str, os.stat_result | None]:
+        """Resolve a request path, using the immutable index when enabled.
+
+        Args:
+            path: The requested relative file path.
+
+        Returns:
+            The full path and its stat result, or ``("", None)`` if missing.
+        """
+        if not self._immutable:
+            return super().lookup_path(path)
+        if self._paths is None:
+            if self.directory is None or not Path(self.directory).is_dir():
+                return super().lookup_path(path)
+            self._build_index()
+        if path.startswith(("/", "\\")):
+            return "", None
+        return (self._paths or {}).get(os.path.normpath(path), ("", None))
 
     def _select_sidecar(
         self, full_path: str | PathLike[str], scope: Scope
@@ -122,6 +356,78 @@ class PrecompressedStaticFiles(StaticFiles):
                 break
         return best
 
+    def _select_indexed_sidecar(
+        self, indexed: _IndexedFile, scope: Scope
+    ) -> tuple[str, _FileVariant] | None:
+        """Pick the best Accept-Encoding sidecar recorded in the index.
+
+        Args:
+            indexed: The indexed original file.
+            scope: The ASGI request scope.
+
+        Returns:
+            ``(content_encoding, variant)`` or ``None``.
+        """
+        if not indexed.sidecars:
+            return None
+        accepted = _parse_accept_encoding(Headers(scope=scope).get("accept-encoding"))
+        if not accepted:
+            return None
+        best: tuple[str, _FileVariant] | None = None
+        best_quality = 0.0
+        for content_encoding, variant in indexed.sidecars.items():
+            quality = accepted.get(content_encoding, accepted.get("*", 0.0))
+            if quality > best_quality:
+                best = (content_encoding, variant)
+                best_quality = quality
+                if best_quality >= 1.0:
+                    break
+        return best
+
+    def _indexed_file_response(
+        self, indexed: _IndexedFile, scope: Scope, status_code: int
+    ) -> Response:
+        """Build a response for an indexed file without touching the filesystem.
+
+        Args:
+            indexed: The indexed original file.
+            scope: The ASGI request scope.
+            status_code: The response status code to use.
+
+        Returns:
+            A response serving the best matching asset variant.
+        """
+        variant = indexed.original
+        response_headers: dict[str, str] = {}
+        if self._encodings:
+            response_headers["Vary"] = "Accept-Encoding"
+            sidecar = self._select_indexed_sidecar(indexed, scope)
+            if sidecar is not None:
+                response_headers["Content-Encoding"], variant = sidecar
+        response_headers.update(variant.headers)
+
+        request_headers = Headers(scope=scope)
+        response: Response
+        if variant.body is not None and "range" not in request_headers:
+            response_headers["accept-ranges"] = "bytes"
+            response = Response(
+                variant.body,
+                status_code=status_code,
+                headers=response_headers,
+                media_type=indexed.media_type,
+            )
+        else:
+            response = _StaticFileResponse(
+                variant.path,
+                status_code=status_code,
+                headers=response_headers,
+                media_type=indexed.media_type,
+                stat_result=variant.stat_result,
+            )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
     def file_response(
         self,
         full_path: str | PathLike[str],
@@ -140,14 +446,13 @@ class PrecompressedStaticFiles(StaticFiles):
         Returns:
             A file response that serves the best matching asset variant.
         """
+        if (indexed := self._files.get(os.fspath(full_path))) is not None:
+            return self._indexed_file_response(indexed, scope, status_code)
+
         response_path: str | PathLike[str] = full_path
         response_stat = stat_result
         response_headers: dict[str, str] = {}
-        media_type = (
-            "text/javascript"
-            if Path(full_path).suffix.lower() in {".js", ".mjs"}
-            else guess_type(os.fspath(full_path))[0]
-        )
+        media_type = _guess_media_type(full_path)
 
         if self._encodings:
             response_headers["Vary"] = "Accept-Encoding"
@@ -156,7 +461,7 @@ class PrecompressedStaticFiles(StaticFiles):
                 content_encoding, response_path, response_stat = sidecar
                 response_headers["Content-Encoding"] = content_encoding
 
-        response = FileResponse(
+        response = _StaticFileResponse(
             response_path,
             status_code=status_code,
             headers=response_headers or None,
@@ -177,11 +482,16 @@ class PrecompressedStaticFiles(StaticFiles):
         Returns:
             The resolved static response for the request.
         """
+        if self._paths is not None and scope["method"] in ("GET", "HEAD"):
+            # Indexed hits need no filesystem access, so skip the worker thread hop.
+            full_path, stat_result = self.lookup_path(path)
+            if stat_result is not None and stat.S_ISREG(stat_result.st_mode):
+                return self.file_response(full_path, stat_result, scope)
         response = await super().get_response(path, scope)
         # Starlette's get_response builds the 404.html fallback with bare FileResponse,
         # bypassing file_response. Re-route it so the sidecar/Vary handling applies.
         if (
-            self._encodings
+            (self._encodings or self._immutable)
             and self.html
             and isinstance(response, FileResponse)
             and response.status_code == 404
@@ -13,6 +13,8 @@ from collections.abc import AsyncIterator, Callable, Coroutine
 from types import MappingProxyType
 from typing import TYPE_CHECKING, ClassVar
 
+from reflex_base.environment import environment
+
 from reflex.istate.manager.redis import enable_keyspace_notifications
 from reflex.state import StateUpdate
 from reflex.utils import prerequisites
@@ -22,6 +24,7 @@ logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
     from redis.asyncio import Redis
+    from reflex_base.event import Event
 
 
 def _get_new_token() -> str:
@@ -49,6 +52,51 @@ class LostAndFoundRecord:
     update: StateUpdate
 
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ForwardedEventsRecord:
+    """Record for events to process on the instance that owns the token's socket."""
+
+    token: str
+    events: list[Event]
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ForwardedModifyRecord:
+    """Record for a state modification to run on the instance that owns the token's socket."""
+
+    token: str
+    # The full name of the state class to modify.
+    state_name: str
+    previous_dirty_vars: dict[str, set[str]] | None = None
+
+
+# Records handled by the instance that owns a socket.
+ForwardedRecord = ForwardedEventsRecord | ForwardedModifyRecord
+
+
+@dataclasses.dataclass
+class CrossInstanceStats:
+    """Counters for work and updates that crossed between app instances."""
+
+    # Deltas published to another instance's lost and found channel.
+    deltas_sent: int = 0
+
+    # Deltas received from other instances.
+    deltas_received: int = 0
+
+    # Events or state modifications forwarded to the owning instance.
+    work_forwarded: int = 0
+
+    # Events or state modifications received from other instances.
+    work_received: int = 0
+
+    # Owner lookups answered from the local socket record cache.
+    owner_cache_hits: int = 0
+
+    # Owner lookups that had to read the socket record from redis.
+    owner_cache_misses: int = 0
+
+
 class TokenManager(ABC):
     """Abstract base class for managing client token to session ID mappings."""
 
@@ -209,9 +257,15 @@ class RedisTokenManager(LocalTokenManager):
         config = get_config()
         self.token_expiration = config.redis_token_expiration
 
+        # Whether to run work for a token on the instance that owns its socket.
+        self.owner_affinity = environment.REFLEX_TOKEN_MANAGER_OWNER_AFFINITY.get()
+        self.stats = CrossInstanceStats()
+
         # Pub/sub tasks for handling sockets owned by other instances.
         self._socket_record_task: asyncio.Task | None = None
         self._lost_and_found_task: asyncio.Task | None = None
+        # Work forwarded by other instances that is still running.
+        self._forwarded_tasks: set[asyncio.Task] = set()
 
     def _get_redis_key(self, token: str) -> str:
         """Get Redis key for token mapping.
@@ -383,11 +437,14 @@ class RedisTokenManager(LocalTokenManager):
     async def _subscribe_lost_and_found_updates(
         self,
         emit_update: Callable[[StateUpdate, str], Coroutine[None, None, None]],
+        handle_forwarded: Callable[[ForwardedRecord], Coroutine[None, None, None]]
+        | None = None,
     ) -> None:
         """Subscribe to Redis channel notifications for lost and found deltas.
 
         Args:
             emit_update: The function to emit state updates.
+            handle_forwarded: The function to run work forwarded by other instances.
         """
         async with self.redis.pubsub() as pubsub:
             await pubsub.psubscribe(
@@ -396,16 +453,40 @@ class RedisTokenManager(LocalTokenManager):
             async for message in pubsub.listen():
                 if message["type"] == "pmessage":
                     record = pickle.loads(message["data"])
-                    await emit_update(record.update, record.token)
+                    if isinstance(record, LostAndFoundRecord):
+                        self.stats.deltas_received += 1
+                        await emit_update(record.update, record.token)
+                    elif handle_forwarded is not None:
+                        self.stats.work_received += 1
+                        # Run forwarded work concurrently, like events from a socket.
+                        task = asyncio.create_task(
+                            handle_forwarded(record),
+                            name=f"reflex_forwarded_work|{record.token}",
+                        )
+                        self._forwarded_tasks.add(task)
+                        task.add_done_callback(self._forwarded_task_done)
+
+    def _forwarded_task_done(self, task: asyncio.Task) -> None:
+        """Log errors from forwarded work and stop tracking the task.
+
+        Args:
+            task: The finished task.
+        """
+        self._forwarded_tasks.discard(task)
+        if not task.cancelled() and (exc := task.exception()) is not None:
+            logger.error(f"Error running work forwarded from another instance: {exc}")
 
     def ensure_lost_and_found_task(
         self,
         emit_update: Callable[[StateUpdate, str], Coroutine[None, None, None]],
+        handle_forwarded: Callable[[ForwardedRecord], Coroutine[None, None, None]]
+        | None = None,
     ) -> None:
         """Ensure the lost and found subscriber task is running.
 
         Args:
             emit_update: The function to emit state updates.
+            handle_forwarded: The function to run work forwarded by other instances.
         """
         ensure_task(
             owner=self,
@@ -413,6 +494,7 @@ class RedisTokenManager(LocalTokenManager):
             coro_function=self._subscribe_lost_and_found_updates,
             suppress_exceptions=[Exception],
             emit_update=emit_update,
+            handle_forwarded=handle_forwarded,
         )
 
     async def _get_token_owner(self, token: str, refresh: bool = False) -> str | None:
@@ -429,8 +511,10 @@ class RedisTokenManager(LocalTokenManager):
             not refresh
             and (socket_record := self.token_to_socket.get(token)) is not None
         ):
+            self.stats.owner_cache_hits += 1
             return socket_record.instance_id
 
+        self.stats.owner_cache_misses += 1
         redis_key = self._get_redis_key(token)
         try:
             record_pkl = await self.redis.get(redis_key)
@@ -438,6 +522,8 @@ class RedisTokenManager(LocalTokenManager):
                 socket_record = pickle.loads(record_pkl)
                 self.token_to_socket[token] = socket_record
                 self.sid_to_token[socket_record.sid] = token
+                # The cached record is invalidated by socket record notifications.
+                self._ensure_socket_record_task()
                 return socket_record.instance_id
         except Exception as e:
             logger.error(f"Redis error getting token owner: {e}")
@@ -470,9 +556,90 @@ class RedisTokenManager(LocalTokenManager):
         except Exception as e:
             logger.error(f"Redis error publishing lost and found delta: {e}")
         else:
+            self.stats.deltas_sent += 1
             return True
         return False
 
+    async def _forward_to_owner(self, record: ForwardedRecord) -> bool:
+        """Publish work to the instance that owns the record's token, if that is not this one.
+
+        Args:
+            record: The work to forward.
+
+        Returns:
+            True if the work was forwarded, False if it should run locally.
+        """
+        if not self.owner_affinity:
+            return False
+        owner_instance_id = await self._get_token_owner(record.token)
+        if owner_instance_id is None or owner_instance_id == self.instance_id:
+            return False
+        try:
+            data = pickle.dumps(record)
+        except Exception as e:
+            logger.error(f"Failed to pickle work forwarded to owner instance: {e}")
+            return False
+        try:
+            receivers = await self.redis.publish(
+                f"channel:{self._get_lost_and_found_key(owner_instance_id)}", data
+            )
+        except Exception as e:
+            logger.error(f"Redis error forwarding work to owner instance: {e}")
+            return False
+        if not receivers:
+            # The owner is gone, drop its cached record and run the work here.
+            socket_record = self.token_to_socket.get(record.token)
+            if (
+                socket_record is not None
+                and socket_record.instance_id == owner_instance_id
+            ):
+                del self.token_to_socket[record.token]
+                self.sid_to_token.pop(socket_record.sid, None)
+            return False
+        self.stats.work_forwarded += 1
+        return True
+
+    async def forward_events(self, token: str, *events: Event) -> bool:
+        """Send events to the instance that owns the token's socket.
+
+        Processing events on the owning instance lets their deltas go straight
+        to the socket instead of taking a lost and found hop per update.
+
+        Args:
+            token: The client token.
+            events: The events to process.
+
+        Returns:
+            True if the events were forwarded, False if they should be processed locally.
+        """
+        return await self._forward_to_owner(
+            ForwardedEventsRecord(token=token, events=list(events))
+        )
+
+    async def forward_modify(
+        self,
+        token: str,
+        state_name: str,
+        previous_dirty_vars: dict[str, set[str]] | None = None,
+    ) -> bool:
+        """Ask the instance that owns the token's socket to refresh a state.
+
+        Args:
+            token: The client token.
+            state_name: The full name of the state class to modify.
+            previous_dirty_vars: Vars to consider dirty when computing the delta.
+
+        Returns:
+            True if the modification was forwarded, False if it should run locally.
+        """
+        return await self._forward_to_owner(
+            ForwardedModifyRecord(
+                token=token,
+                state_name=state_name,
+                previous_dirty_vars=previous_dirty_vars,
+            )
+        )
+
     async def close(self) -> None:
         """Cancel background pub/sub tasks and close the Redis client."""
         for task in (self._socket_record_task, self._lost_and_found_task):
@@ -482,4 +649,6 @@ class RedisTokenManager(LocalTokenManager):
                     await task
         self._socket_record_task = None
         self._lost_and_found_task = None
+        for task in list(self._forwarded_tasks):
+            task.cancel()
         await self.redis.aclose()
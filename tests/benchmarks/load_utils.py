@@ -0,0 +1,565 @@
+"""Multi-client load testing against the real backend stack.
+
+A backend-only ``AppHarness`` serves a small app with the chosen state
+manager, and worker processes drive simulated Socket.IO clients against it:
+each client hydrates, sends a burst of events, starts background tasks and
+uploads files, timing every operation until its state update arrives.
+
+The clients run in separate processes so they neither compete with the
+backend for the GIL nor count towards its memory. Run it from pytest with
+``REFLEX_RUN_LOAD_TEST=1`` (see ``test_load.py``) or directly::
+
+    python -m tests.benchmarks.load_utils --state-manager redis --clients 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import concurrent.futures
+import dataclasses
+import gc
+import json
+import math
+import multiprocessing
+import os
+import tempfile
+import time
+import uuid
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from reflex_base.constants.state import FIELD_MARKER
+from reflex_base.environment import environment
+from reflex_base.event import get_hydrate_event
+from typing_extensions import Self
+
+from reflex.istate.manager import StateManager
+from reflex.state import State
+from reflex.testing import AppHarness
+
+LOAD_TEST_RUN_ENV_VAR = "REFLEX_RUN_LOAD_TEST"
+TRUTHY_ENV_VALUES = {"1", "true", "yes", "on"}
+
+STATE_MANAGER_MODES = ("memory", "disk", "redis")
+
+# The Socket.IO path and namespace of the event endpoint.
+EVENT_PATH = "/_event"
+
+# The operations timed for each client.
+OPERATIONS = ("hydrate", "event", "background", "upload")
+
+
+def LoadApp():
+    """App driven by the simulated clients."""
+    import reflex as rx
+
+    class LoadState(rx.State):
+        count: int = 0
+        background_count: int = 0
+        uploaded_bytes: int = 0
+
+        @rx.event
+        def increment(self):
+            self.count += 1
+
+        @rx.event(background=True)
+        async def background_increment(self):
+            async with self:
+                self.background_count += 1
+
+        @rx.event
+        async def handle_upload(self, files: list[rx.UploadFile]):
+            for file in files:
+                self.uploaded_bytes += len(await file.read())
+
+    # Created at import, as pages are not compiled, so the upload endpoint is mounted.
+    upload_area = rx.upload(rx.text("Drop files"), id="load_upload")
+
+    def index():
+        return rx.vstack(rx.text(LoadState.count), upload_area)
+
+    app = rx.App()
+    app.add_page(index)
+
+
+@dataclasses.dataclass
+class BackendAppHarness(AppHarness):
+    """An AppHarness that only runs the backend, with a chosen state manager."""
+
+    # Creates the state manager used instead of the configured one.
+    state_manager_factory: Callable[[], StateManager] | None = None
+
+    # The URL of the running backend.
+    backend_url: str | None = None
+
+    def start(self) -> Self:
+        """Start the backend in a new thread, without building a frontend.
+
+        Returns:
+            self
+        """
+        skip_compile = environment.REFLEX_SKIP_COMPILE.getenv()
+        # The simulated clients never load pages, so skip compiling them.
+        environment.REFLEX_SKIP_COMPILE.set(True)
+        try:
+            self._initialize_app()
+        finally:
+            environment.REFLEX_SKIP_COMPILE.set(skip_compile)
+        if self.state_manager_factory is not None and self.app_instance is not None:
+            # The state manager is first used when the backend lifespan starts.
+            self.app_instance._state_manager = self.state_manager_factory()
+        self._start_backend()
+        self.backend_url = "http://{}:{}".format(
+            *self._poll_for_servers(timeout=30).getsockname()
+        )
+        return self
+
+
+def create_state_manager(mode: str) -> StateManager:
+    """Create a state manager for a load test.
+
+    Args:
+        mode: memory, disk or redis. Redis uses ``REFLEX_REDIS_URL`` when set,
+            otherwise the in-process redis mock from the unit tests.
+
+    Returns:
+        The state manager.
+
+    Raises:
+        ValueError: If the mode is unknown.
+    """
+    from reflex.istate.manager.disk import StateManagerDisk
+    from reflex.istate.manager.memory import StateManagerMemory
+    from reflex.istate.manager.redis import StateManagerRedis
+    from reflex.utils import prerequisites
+
+    if mode == "memory":
+        return StateManagerMemory()
+    if mode == "disk":
+        return StateManagerDisk()
+    if mode == "redis":
+        redis = prerequisites.get_redis()
+        if redis is None:
+            from tests.units.mock_redis import mock_redis
+
+            redis = mock_redis()
+        return StateManagerRedis(redis=redis)
+    msg = f"Unknown state manager mode {mode!r}, expected one of {STATE_MANAGER_MODES}."
+    raise ValueError(msg)
+
+
+@dataclasses.dataclass(frozen=True)
+class LoadProfile:
+    """What each simulated client does."""
+
+    # The number of simulated clients.
+    clients: int = 100
+
+    # The number of increment events each client sends in one burst.
+    events_per_client: int = 10
+
+    # The number of background tasks each client starts.
+    background_tasks_per_client: int = 2
+
+    # The number of uploads each client makes.
+    uploads_per_client: int = 1
+
+    # The size of each uploaded file (bytes).
+    upload_size: int = 16 * 1024
+
+    # The number of processes running clients.
+    client_processes: int = 2
+
+    # The maximum number of clients connecting at the same time, per process.
+    connect_concurrency: int = 50
+
+    # How long (s) a client waits for a state update before failing.
+    timeout: float = 60.0
+
+
+@dataclasses.dataclass(frozen=True)
+class LoadTarget:
+    """Where and how the simulated clients reach the app."""
+
+    # The URL of the backend.
+    backend_url: str
+
+    # The name of the hydrate event.
+    hydrate_event: str
+
+    # The full name of the state holding the load test vars.
+    state_name: str
+
+
+@dataclasses.dataclass
+class SwarmResult:
+    """Timings collected by one client process."""
+
+    # The latencies (s) of each operation, by operation name.
+    latencies: dict[str, list[float]] = dataclasses.field(
+        default_factory=lambda: {operation: [] for operation in OPERATIONS}
+    )
+
+    # The error messages of failed clients.
+    errors: list[str] = dataclasses.field(default_factory=list)
+
+    def merge(self, other: SwarmResult):
+        """Add the timings of another process.
+
+        Args:
+            other: The other result.
+        """
+        for operation, values in other.latencies.items():
+            self.latencies[operation].extend(values)
+        self.errors.extend(other.errors)
+
+
+class _SimulatedClient:
+    """One browser tab, speaking the Socket.IO protocol like the frontend."""
+
+    def __init__(self, target: LoadTarget, profile: LoadProfile, result: SwarmResult):
+        import socketio
+
+        self.target = target
+        self.profile = profile
+        self.result = result
+        self.token = str(uuid.uuid4())
+        self.sio = socketio.AsyncClient(reconnection=False)
+        self.sio.on("event", self._on_update, namespace=EVENT_PATH)
+        # The latest value received for each var of the load state.
+        self.values: dict[str, Any] = {}
+        self.changed = asyncio.Condition()
+
+    async def _on_update(self, update: dict[str, Any]):
+        delta = update.get("delta") or {}
+        if (state := delta.get(self.target.state_name)) is None:
+            return
+        async with self.changed:
+            self.values.update(state)
+            self.changed.notify_all()
+
+    async def _wait_for(self, name: str, value: int):
+        key = name + FIELD_MARKER
+        async with self.changed:
+            await asyncio.wait_for(
+                self.changed.wait_for(lambda: self.values.get(key, -1) >= value),
+                self.profile.timeout,
+            )
+
+    async def _emit(self, handler: str, payload: dict[str, Any] | None = None):
+        await self.sio.emit(
+            "event",
+            {
+                "name": handler,
+                "payload": payload or {},
+                "router_data": {"pathname": "/", "asPath": "/", "query": {}},
+            },
+            namespace=EVENT_PATH,
+        )
+
+    async def _timed_burst(self, handler: str, var: str, count: int) -> list[float]:
+        """Send events without waiting, then time each until its update arrives.
+
+        Args:
+            handler: The event handler name.
+            var: The var counting the handled events.
+            count: The number of events to send.
+
+        Returns:
+            The latency of each event.
+        """
+        sent = []
+        for _ in range(count):
+            sent.append(time.perf_counter())
+            await self._emit(handler)
+        latencies = []
+        for index, start in enumerate(sent):
+            await self._wait_for(var, index + 1)
+            latencies.append(time.perf_counter() - start)
+        return latencies
+
+    async def _upload(self, http) -> float:
+        start = time.perf_counter()
+        response = await http.post(
+            f"{self.target.backend_url}/_upload",
+            headers={
+                "reflex-client-token": self.token,
+                "reflex-event-handler": f"{self.target.state_name}.handle_upload",
+            },
+            files=[("files", ("load.bin", os.urandom(self.profile.upload_size)))],
+        )
+        response.raise_for_status()
+        return time.perf_counter() - start
+
+    async def connect(self):
+        """Open the socket, like a newly loaded page."""
+        await self.sio.connect(
+            f"{self.target.backend_url}?token={self.token}",
+            socketio_path=EVENT_PATH,
+            transports=["websocket"],
+            namespaces=[EVENT_PATH],
+            wait_timeout=math.ceil(self.profile.timeout),
+        )
+
+    async def run(self, http):
+        """Hydrate, then send events, start background tasks and upload.
+
+        Args:
+            http: The HTTP client used for uploads.
+        """
+        latencies = self.result.latencies
+        start = time.perf_counter()
+        await self._emit(self.target.hydrate_event)
+        await self._wait_for("count", 0)
+        latencies["hydrate"].append(time.perf_counter() - start)
+
+        name = self.target.state_name
+        latencies["event"].extend(
+            await self._timed_burst(
+                f"{name}.increment", "count", self.profile.events_per_client
+            )
+        )
+        latencies["background"].extend(
+            await self._timed_burst(
+                f"{name}.background_increment",
+                "background_count",
+                self.profile.background_tasks_per_client,
+            )
+        )
+        for _ in range(self.profile.uploads_per_client):
+            latencies["upload"].append(await self._upload(http))
+
+    async def close(self):
+        """Disconnect the socket."""
+        await self.sio.disconnect()
+
+
+async def _swarm(target: LoadTarget, profile: LoadProfile, clients: int) -> SwarmResult:
+    import httpx
+
+    result = SwarmResult()
+    connecting = asyncio.Semaphore(profile.connect_concurrency)
+
+    async def simulate(http: httpx.AsyncClient):
+        client = _SimulatedClient(target, profile, result)
+        try:
+            async with connecting:
+                await client.connect()
+            await client.run(http)
+        except Exception as ex:
+            result.errors.append(f"{type(ex).__name__}: {ex}")
+        finally:
+            await client.close()
+
+    async with httpx.AsyncClient(timeout=profile.timeout) as http:
+        await asyncio.gather(*(simulate(http) for _ in range(clients)))
+    return result
+
+
+def _run_swarm(target: LoadTarget, profile: LoadProfile, clients: int) -> SwarmResult:
+    """Run simulated clients to completion (in a worker process).
+
+    Args:
+        target: The app to load.
+        profile: What each client does.
+        clients: The number of clients run by this process.
+
+    Returns:
+        The collected timings.
+    """
+    return asyncio.run(_swarm(target, profile, clients))
+
+
+def _percentile(values: list[float], percent: float) -> float:
+    """Get a percentile using the nearest-rank method.
+
+    Args:
+        values: The observed values.
+        percent: The percentile (0-100).
+
+    Returns:
+        The percentile, or NaN when there are no values.
+    """
+    if not values:
+        return math.nan
+    ordered = sorted(values)
+    return ordered[max(math.ceil(percent / 100 * len(ordered)) - 1, 0)]
+
+
+@dataclasses.dataclass(frozen=True)
+class LoadReport:
+    """The outcome of a load test."""
+
+    # The state manager mode under test.
+    state_manager: str
+
+    # The number of simulated clients.
+    clients: int
+
+    # The number of timed operations that completed.
+    operations: int
+
+    # The wall-clock time of the load phase (s).
+    duration: float
+
+    # The 50th and 99th percentile latency (s) of each operation.
+    latency: dict[str, tuple[float, float]]
+
+    # Backend resident memory growth divided by the number of clients (bytes).
+    memory_per_session: float
+
+    # The error messages of failed clients.
+    errors: list[str]
+
+    @property
+    def throughput(self) -> float:
+        """Completed operations per second.
+
+        Returns:
+            The throughput.
+        """
+        return self.operations / self.duration if self.duration else 0.0
+
+    @property
+    def summary(self) -> str:
+        """A human readable summary.
+
+        Returns:
+            The summary text.
+        """
+        lines = [
+            (
+                f"state manager: {self.state_manager}, clients: {self.clients}, "
+                f"errors: {len(self.errors)}"
+            ),
+            f"throughput: {self.throughput:.1f} ops/s over {self.duration:.2f}s",
+            f"memory per session: {self.memory_per_session / 1024:.1f} KiB",
+        ]
+        lines.extend(
+            f"{operation:>10}: p50 {p50 * 1000:8.1f} ms  p99 {p99 * 1000:8.1f} ms"
+            for operation, (p50, p99) in self.latency.items()
+        )
+        lines.extend(self.errors[:5])
+        return "\n".join(lines)
+
+    def to_json(self) -> str:
+        """Serialize the report, for comparing runs.
+
+        Returns:
+            The report as JSON.
+        """
+        return json.dumps({
+            **dataclasses.asdict(self),
+            "throughput": self.throughput,
+        })
+
+
+def run_load_test(
+    app_root: Path, state_manager: str, profile: LoadProfile | None = None
+) -> LoadReport:
+    """Start the load test app and drive simulated clients against it.
+
+    Args:
+        app_root: The directory for the generated app.
+        state_manager: memory, disk or redis.
+        profile: What the simulated clients do, defaults to ``LoadProfile()``.
+
+    Returns:
+        The report.
+    """
+    import psutil
+
+    profile = profile or LoadProfile()
+
+    harness = BackendAppHarness.create(root=app_root, app_source=LoadApp)
+    harness.state_manager_factory = lambda: create_state_manager(state_manager)
+    with harness:
+        assert harness.backend_url is not None
+        target = LoadTarget(
+            backend_url=harness.backend_url,
+            hydrate_event=get_hydrate_event(State),  # pyright: ignore[reportArgumentType]
+            state_name=harness.get_full_state_name(["_load_state"]),
+        )
+        process = psutil.Process()
+        gc.collect()
+        rss_before = process.memory_info().rss
+
+        workers = max(min(profile.client_processes, profile.clients), 1)
+        shares = [
+            profile.clients // workers + (index < profile.clients % workers)
+            for index in range(workers)
+        ]
+        result = SwarmResult()
+        start = time.perf_counter()
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            for share_result in executor.map(
+                _run_swarm, [target] * workers, [profile] * workers, shares
+            ):
+                result.merge(share_result)
+        duration = time.perf_counter() - start
+
+        gc.collect()
+        # Sessions stay in the state manager after disconnecting, so the growth
+        # is what the backend retains for them.
+        rss_after = process.memory_info().rss
+
+    return LoadReport(
+        state_manager=state_manager,
+        clients=profile.clients,
+        operations=sum(len(values) for values in result.latencies.values()),
+        duration=duration,
+        latency={
+            operation: (_percentile(values, 50), _percentile(values, 99))
+            for operation, values in result.latencies.items()
+        },
+        memory_per_session=max(rss_after - rss_before, 0) / max(profile.clients, 1),
+        errors=result.errors,
+    )
+
+
+def should_run_load_test() -> bool:
+    """Check whether load tests are enabled.
+
+    Returns:
+        Whether load tests are enabled.
+    """
+    return os.environ.get(LOAD_TEST_RUN_ENV_VAR, "").lower() in TRUTHY_ENV_VALUES
+
+
+def main():
+    """Run a load test from the command line and print the report."""
+    defaults = LoadProfile()
+    parser = argparse.ArgumentParser(description="Run a backend load test.")
+    parser.add_argument(
+        "--state-manager", choices=STATE_MANAGER_MODES, default="memory"
+    )
+    parser.add_argument("--clients", type=int, default=defaults.clients)
+    parser.add_argument("--events", type=int, default=defaults.events_per_client)
+    parser.add_argument(
+        "--background-tasks", type=int, default=defaults.background_tasks_per_client
+    )
+    parser.add_argument("--uploads", type=int, default=defaults.uploads_per_client)
+    parser.add_argument("--processes", type=int, default=defaults.client_processes)
+    parser.add_argument("--json", type=Path, help="Also write the report to a file.")
+    args = parser.parse_args()
+
+    profile = LoadProfile(
+        clients=args.clients,
+        events_per_client=args.events,
+        background_tasks_per_client=args.background_tasks,
+        uploads_per_client=args.uploads,
+        client_processes=args.processes,
+    )
+    with tempfile.TemporaryDirectory() as app_root:
+        report = run_load_test(Path(app_root), args.state_manager, profile)
+    print(report.summary)
+    if args.json is not None:
+        args.json.write_text(report.to_json())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Load tests driving simulated clients against each state manager."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from .load_utils import (
+    STATE_MANAGER_MODES,
+    LoadProfile,
+    _percentile,
+    run_load_test,
+    should_run_load_test,
+)
+
+# Scale of the load test, override to look for scaling regressions.
+LOAD_TEST_CLIENTS_ENV_VAR = "REFLEX_LOAD_TEST_CLIENTS"
+
+# Fail when the p99 latency of handled events exceeds this (ms).
+LOAD_TEST_MAX_P99_ENV_VAR = "REFLEX_LOAD_TEST_MAX_EVENT_P99_MS"
+
+
+def test_percentile():
+    """Test the nearest-rank percentile used in load reports."""
+    values = [float(v) for v in range(1, 101)]
+    assert _percentile(values, 50) == 50
+    assert _percentile(values, 99) == 99
+    assert _percentile([3.0], 99) == 3
+    assert _percentile([], 50) != _percentile([], 50)  # NaN
+
+
+@pytest.mark.skipif(
+    not should_run_load_test(),
+    reason="Set REFLEX_RUN_LOAD_TEST=1 to run load tests.",
+)
+@pytest.mark.parametrize("state_manager", STATE_MANAGER_MODES)
+def test_load(state_manager: str, tmp_path_factory: pytest.TempPathFactory):
+    """Drive simulated clients against the app and report throughput and latency.
+
+    Args:
+        state_manager: The state manager mode under test.
+        tmp_path_factory: Pytest helper for allocating temporary directories.
+    """
+    pytest.importorskip("aiohttp", reason="The Socket.IO client requires aiohttp.")
+    profile = LoadProfile(clients=int(os.environ.get(LOAD_TEST_CLIENTS_ENV_VAR, 200)))
+    report = run_load_test(
+        Path(tmp_path_factory.mktemp(f"load_{state_manager}")), state_manager, profile
+    )
+    print(report.summary)
+
+    assert not report.errors
+    assert report.operations == profile.clients * (
+        1
+        + profile.events_per_client
+        + profile.background_tasks_per_client
+        + profile.uploads_per_client
+    )
+    if max_p99 := os.environ.get(LOAD_TEST_MAX_P99_ENV_VAR):
+        assert report.latency["event"][1] * 1000 <= float(max_p99)
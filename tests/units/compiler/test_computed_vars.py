@@ -0,0 +1,182 @@
+"""Tests for the computed var usage report."""
+
+from collections.abc import Iterator
+
+import pytest
+
+import reflex as rx
+from reflex.compiler.computed_vars import (
+    computed_var_report,
+    find_used_state_vars,
+    skip_unused_computed_vars,
+)
+from reflex.state import BaseState
+
+
+class ReportState(BaseState):
+    """A state with used, unused and dependent computed vars."""
+
+    count: int = 0
+
+    @rx.var
+    def double(self) -> int:
+        """Read by the page.
+
+        Returns:
+            Twice the count.
+        """
+        return self.count * 2
+
+    @rx.var
+    def quadruple(self) -> int:
+        """Read by no page, depends on another computed var.
+
+        Returns:
+            Four times the count.
+        """
+        return self.double * 2
+
+    @rx.var(cache=False)
+    def label(self) -> str:
+        """Read by no page, recomputed on every event.
+
+        Returns:
+            The count as a label.
+        """
+        return f"count {self.count}"
+
+    @rx.var(cache=False)
+    def raw(self) -> int:
+        """Read by no page, but by another computed var.
+
+        Returns:
+            The count.
+        """
+        return self.count
+
+    @rx.var
+    def from_raw(self) -> int:
+        """Read by the page.
+
+        Returns:
+            The count plus one.
+        """
+        return self.raw + 1
+
+    @rx.var(backend=True)
+    def _secret(self) -> int:
+        """Never sent to the client.
+
+        Returns:
+            The negated count.
+        """
+        return -self.count
+
+
+def _page_code() -> str:
+    return (
+        f"jsx(Text, {{}}, {ReportState.double!s}, {ReportState.from_raw!s}?.toString())"
+    )
+
+
+@pytest.fixture
+def report() -> dict:
+    """Report the computed vars of ReportState as read by one page.
+
+    Returns:
+        The report.
+    """
+    used = find_used_state_vars({"app/routes/_index.jsx": _page_code()})
+    return computed_var_report(ReportState, used)
+
+
+@pytest.fixture
+def skipping(
+    report: dict, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[type[ReportState]]:
+    """Skip the unused computed vars of ReportState.
+
+    Args:
+        report: The computed var report.
+        monkeypatch: pytest fixture to set environment variables.
+
+    Yields:
+        The state class.
+    """
+    monkeypatch.setenv("REFLEX_SKIP_UNUSED_COMPUTED_VARS", "1")
+    skip_unused_computed_vars(ReportState, report)
+    yield ReportState
+    ReportState._skip_unused_computed_vars(set())
+
+
+def test_find_used_state_vars():
+    """Test that state var reads are found, with optional chaining and not for locals."""
+    used = find_used_state_vars({
+        "a.jsx": "reflex___state____state.count_rx_state_ + x.items_rx_state_?.length",
+        "b.jsx": "(k_rx_state_) => reflex___state____state?.count_rx_state_",
+    })
+    assert used == {
+        ("reflex___state____state", "count"): {"a.jsx", "b.jsx"},
+        ("x", "items"): {"a.jsx"},
+    }
+
+
+def test_computed_var_report(report: dict):
+    """Test that the report lists dependencies, dependents and readers.
+
+    Args:
+        report: The computed var report.
+    """
+    name = ReportState.get_full_name()
+    cvars = report["states"][name]
+    assert cvars["double"] == {
+        "cache": True,
+        "backend": False,
+        "depends_on": [f"{name}.count"],
+        "dependents": [f"{name}.quadruple"],
+        "used_in": ["app/routes/_index.jsx"],
+    }
+    assert cvars["label"]["cache"] is False
+    assert cvars["label"]["depends_on"] == []
+    assert cvars["raw"]["dependents"] == [f"{name}.from_raw"]
+    assert cvars["_secret"]["backend"] is True
+    assert sorted(report["unused"][name]) == ["label", "quadruple", "raw"]
+
+
+def test_report_is_not_applied_by_default(report: dict):
+    """Test that unused computed vars are still sent without the opt-in.
+
+    Args:
+        report: The computed var report.
+    """
+    skip_unused_computed_vars(ReportState, report)
+    assert ReportState._unused_computed_vars == set()
+    assert ReportState._always_dirty_computed_vars == {"label", "raw"}
+
+
+def test_unused_computed_vars_are_skipped(skipping: type[ReportState]):
+    """Test that unused computed vars are left out of deltas and not recomputed.
+
+    Args:
+        skipping: The state class skipping its unused computed vars.
+    """
+    # raw is still recomputed on every event for from_raw.
+    assert skipping._always_dirty_computed_vars == {"raw"}
+
+    state = skipping()
+    state.count = 1
+    delta = state.get_delta()[skipping.get_full_name()]
+    assert set(delta) == {"count_rx_state_", "double_rx_state_", "from_raw_rx_state_"}
+    state._clean()
+    assert state.get_delta() == {
+        skipping.get_full_name(): {"from_raw_rx_state_": 2},
+    }
+    assert set(state.dict()[skipping.get_full_name()]) == {
+        "router_rx_state_",
+        "count_rx_state_",
+        "double_rx_state_",
+        "from_raw_rx_state_",
+    }
+    # Unused vars can still be read on the backend.
+    assert state.quadruple == 4
+    assert state.label == "count 1"
@@ -0,0 +1,161 @@
+# ruff: noqa: D101
+
+import dataclasses
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from reflex_base.components.component import Component
+from reflex_base.plugins import CompileContext, CompilerHooks, PageContext
+from reflex_base.vars.base import Field, LiteralVar, Var, field
+
+import reflex as rx
+from reflex.compiler.plugins import (
+    DefaultCollectorPlugin,
+    DefaultPagePlugin,
+    OptimizeVarsPlugin,
+    default_page_plugins,
+)
+from reflex.compiler.plugins.optimize import HOISTED_PREFIX, fold_constants
+from reflex.state import BaseState
+
+
+class OptimizeState(BaseState):
+    count: Field[int] = field(default=1)
+    name: Field[str] = field(default="a")
+
+
+@dataclasses.dataclass(slots=True)
+class FakePage:
+    route: str
+    component: Callable[[], Component]
+    title: Any = None
+    description: Any = None
+    image: str = ""
+    meta: tuple[dict[str, Any], ...] = ()
+    _source_module: str | None = None
+
+
+def _compile_single_page(
+    component_factory: Callable[[], Component],
+) -> PageContext:
+    ctx = CompileContext(
+        pages=[FakePage(route="/p", component=component_factory)],
+        hooks=CompilerHooks(
+            plugins=(
+                OptimizeVarsPlugin(),
+                DefaultPagePlugin(),
+                DefaultCollectorPlugin(),
+            )
+        ),
+    )
+    with ctx:
+        ctx.compile()
+    return ctx.compiled_pages["/p"]
+
+
+def _props(page_ctx: PageContext, tag: str) -> list[list[str]]:
+    found = []
+    stack = [page_ctx.root_component.render()]
+    while stack:
+        rendered = stack.pop()
+        if rendered.get("name") == tag:
+            found.append(rendered["props"])
+        stack.extend(rendered.get("children", ()))
+    return found
+
+
+@pytest.mark.parametrize(
+    ("var", "expected"),
+    [
+        (LiteralVar.create(2) * 3, "6"),
+        (LiteralVar.create(7) // 2, "3"),
+        (LiteralVar.create(-7) % 3, "-1"),
+        (LiteralVar.create(1) / 4, "0.25"),
+        (LiteralVar.create(2) > 1, "true"),
+        (LiteralVar.create(1) == "1", "false"),
+        (LiteralVar.create("a") + "b", '"ab"'),
+        (LiteralVar.create("Ab").lower(), '"ab"'),
+        ((LiteralVar.create(2) * 3).to_string(), '"6"'),
+        (LiteralVar.create(2.0).to_string(), '"2"'),
+    ],
+)
+def test_fold_constants(var: Var, expected: str):
+    """Operations on literals fold into the literal of their JS result.
+
+    Args:
+        var: The operation.
+        expected: The folded JS expression.
+    """
+    assert str(fold_constants(var)) == expected
+
+
+@pytest.mark.parametrize(
+    "var",
+    [
+        OptimizeState.count * 2,
+        LiteralVar.create(1) / 0,
+        LiteralVar.create(2**60) + 1,
+        LiteralVar.create("é").upper(),
+        LiteralVar.create(1e300).to_string(),
+    ],
+)
+def test_fold_constants_keeps_unknown_results(var: Var):
+    """Operations whose JS result is not known are not folded.
+
+    Args:
+        var: The operation.
+    """
+    assert fold_constants(var) is var
+
+
+def test_fold_constants_keeps_folded_operands():
+    """An operation rendered from its fields keeps its folded operands."""
+    var = OptimizeState.name + (LiteralVar.create("a") + "b")
+    assert str(fold_constants(var)) == f'({OptimizeState.name!s}+"ab")'
+
+
+def test_plugin_folds_and_hoists_repeated_state_expression():
+    """A state expression used by two props is computed once by a page hook."""
+    expression = (OptimizeState.count * 2).to_string()
+
+    page_ctx = _compile_single_page(
+        lambda: rx.el.div(
+            rx.el.span(title=expression),
+            rx.el.span(title=expression),
+            rx.el.p(title=(LiteralVar.create(2) * 3).to_string()),
+        )
+    )
+
+    hoisted = [hook for hook in page_ctx.hooks if HOISTED_PREFIX in hook]
+    assert len(hoisted) == 1
+    name = hoisted[0].split()[1]
+    assert "useMemo" in hoisted[0]
+    assert f"[{OptimizeState.count!s}]" in hoisted[0]
+    # The hook reads the state context, declared before it.
+    hooks = list(page_ctx.hooks)
+    state_hook = next(hook for hook in hooks if "useContext" in hook)
+    assert hooks.index(state_hook) < hooks.index(hoisted[0])
+    assert _props(page_ctx, '"span"') == [[f"title:{name}"], [f"title:{name}"]]
+    assert _props(page_ctx, '"p"') == [['title:"6"']]
+
+
+def test_plugin_does_not_hoist_single_use():
+    """A state expression used by one prop is left in place."""
+    expression = (OptimizeState.count * 2).to_string()
+
+    page_ctx = _compile_single_page(lambda: rx.el.span(title=expression))
+
+    assert not [hook for hook in page_ctx.hooks if HOISTED_PREFIX in hook]
+    assert _props(page_ctx, '"span"') == [[f"title:{expression!s}"]]
+
+
+def test_default_page_plugins_opt_in(monkeypatch: pytest.MonkeyPatch):
+    """The plugin only runs with REFLEX_OPTIMIZE_VARS set.
+
+    Args:
+        monkeypatch: The pytest monkeypatch fixture.
+    """
+    assert not any(isinstance(p, OptimizeVarsPlugin) for p in default_page_plugins())
+    monkeypatch.setenv("REFLEX_OPTIMIZE_VARS", "true")
+    assert any(isinstance(p, OptimizeVarsPlugin) for p in default_page_plugins())
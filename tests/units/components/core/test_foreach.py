@@ -10,6 +10,7 @@ from reflex_components_core.core.foreach import (
     ForeachRenderError,
     ForeachVarError,
     foreach,
+    virtual_foreach,
 )
 from reflex_components_radix.themes.layout.box import box
 from reflex_components_radix.themes.typography.text import text
@@ -325,3 +326,30 @@ def test_optional_list():
         ForEachState.optional_dict_value,
         lambda color: text(color[0], color[1]),
     )
+
+
+def test_virtual_foreach():
+    """Test that a virtual foreach passes the render function as a JS function."""
+    component = virtual_foreach(
+        ForEachState.colors_list,
+        lambda color, index: text(color, index),
+        item_height=24,
+    )
+    props = component.render()["props"]
+    iterable = str(ForEachState.colors_list)
+    assert f"iterable:{iterable}" in props
+    assert "itemHeight:24" in props
+    render_item = next(prop for prop in props if prop.startswith("renderItem:"))
+    assert render_item.startswith(
+        f"renderItem:((color{FIELD_MARKER}, index{FIELD_MARKER}) => (jsx(RadixThemesText,"
+    )
+    imports = component._get_all_imports()
+    assert "$/components/reflex/virtual_list" in imports
+    # The imports of the rendered items are collected.
+    assert any("radix-ui/themes" in lib for lib in imports)
+
+
+def test_virtual_foreach_validates_render_fn():
+    """Test that the render function is checked like in a foreach."""
+    with pytest.raises(ForeachRenderError):
+        virtual_foreach(ForEachState.colors_list, lambda: text("x"))
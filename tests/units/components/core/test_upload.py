@@ -1,15 +1,21 @@
 import asyncio
+import hashlib
 import io
 import json
+from pathlib import Path
 from typing import Any, cast
 
 import pytest
+import reflex_components_core.core._upload as upload_module
 from reflex_base.event import EventChain, EventHandler, EventSpec, parse_args_spec
 from reflex_base.vars import VarData
 from reflex_base.vars.base import LiteralVar, Var
 from reflex_components_core.core._upload import (
     UPLOAD_EVENT_ARGS_FIELD,
+    UPLOAD_OFFSET_HEADER,
+    UploadChunk,
     UploadChunkIterator,
+    UploadSessionStore,
     _buffered_upload_args,
     _decode_event_args,
     _sanitize_upload_filename,
@@ -29,6 +35,7 @@ from starlette.datastructures import FormData, Headers
 from starlette.datastructures import UploadFile as StarletteUploadFile
 from starlette.exceptions import HTTPException
 from starlette.formparsers import MultiPartException
+from starlette.requests import ClientDisconnect
 
 import reflex as rx
 from reflex import event
@@ -517,6 +524,203 @@ async def test_chunk_parser_oversized_args_rejected(monkeypatch):
         await _run_chunk_parser(body, "BOUNDARY")
 
 
+async def _body(*pieces: bytes, disconnect: bool = False):
+    for piece in pieces:
+        await asyncio.sleep(0)
+        yield piece
+    if disconnect:
+        raise ClientDisconnect
+
+
+async def test_upload_session_resumes_after_disconnect(tmp_path):
+    """Bytes received before a disconnect are kept and the upload resumes there."""
+    store = UploadSessionStore(tmp_path)
+    spooled = await store.get_file("token", "session", "data/file.bin", length=10)
+
+    await store.receive(spooled, 0, _body(b"abc", b"def", disconnect=True))
+    assert spooled.offset == 6
+
+    # A fresh store (e.g. after a restart) recovers the offset from the spool file.
+    store = UploadSessionStore(tmp_path)
+    spooled = await store.get_file("token", "session", "data/file.bin", length=10)
+    assert spooled.offset == 6
+    with pytest.raises(HTTPException) as err:
+        await store.receive(spooled, 0, _body(b"abcdef"))
+    assert err.value.status_code == 409
+    assert err.value.headers == {UPLOAD_OFFSET_HEADER: "6"}
+
+    await store.receive(spooled, 6, _body(b"ghij"))
+    assert spooled.complete
+
+    (file,) = await store.open_files("token", "session", ["data/file.bin"])
+    try:
+        assert file.filename == "file.bin"
+        assert str(file.path) == "data/file.bin"
+        assert file.file.read() == b"abcdefghij"
+        assert file.digest == hashlib.sha256(b"abcdefghij").hexdigest()
+    finally:
+        file.file.close()
+    assert not store.sessions_dir.exists() or not any(store.sessions_dir.iterdir())
+    # Only the bytes received after the restart are counted by the fresh store.
+    assert store.stats.bytes_received == 4
+    assert store.stats.requests_resumed == 1
+    assert store.stats.offset_conflicts == 1
+
+
+async def test_upload_session_is_scoped_to_token(tmp_path):
+    """Another client cannot continue or commit a session it did not start."""
+    store = UploadSessionStore(tmp_path)
+    spooled = await store.get_file("token", "session", "file.bin")
+    await store.receive(spooled, 0, _body(b"secret"))
+
+    other = await store.get_file("other-token", "session", "file.bin")
+    assert other.offset == 0
+
+
+async def test_upload_session_rejects_overlong_and_incomplete_files(tmp_path):
+    """Files must match their announced length before the handler gets them."""
+    store = UploadSessionStore(tmp_path)
+    spooled = await store.get_file("token", "session", "file.bin", length=4)
+    with pytest.raises(HTTPException) as err:
+        await store.receive(spooled, 0, _body(b"too long"))
+    assert err.value.status_code == 400
+
+    await store.receive(spooled, spooled.offset, _body(b"ab"))
+    with pytest.raises(HTTPException) as err:
+        await store.open_files("token", "session", ["file.bin"])
+    assert err.value.status_code == 400
+
+
+async def test_upload_session_deduplicates_content(tmp_path):
+    """Identical content is stored once, and announced known content is skipped."""
+    data = b"dataset" * 100
+    digest = hashlib.sha256(data).hexdigest()
+    store = UploadSessionStore(tmp_path)
+
+    first = await store.get_file("token", "one", "a.bin")
+    await store.receive(first, 0, _body(data))
+    second = await store.get_file("token", "two", "b.bin")
+    await store.receive(second, 0, _body(data))
+    for session_id, filename in (("one", "a.bin"), ("two", "b.bin")):
+        (file,) = await store.open_files("token", session_id, [filename])
+        file.file.close()
+    assert [blob.name for blob in store.blobs_dir.iterdir()] == [digest]
+    assert store.stats.files_deduplicated == 1
+
+    third = await store.get_file(
+        "token", "three", "c.bin", length=len(data), digest=digest
+    )
+    assert third.complete
+    assert third.offset == len(data)
+    (file,) = await store.open_files("token", "three", ["c.bin"])
+    with file.file:
+        assert file.file.read() == data
+    assert store.stats.files_deduplicated == 2
+    assert store.stats.bytes_deduplicated == 2 * len(data)
+    assert store.stats.bytes_received == 2 * len(data)
+
+
+async def test_upload_session_does_not_deduplicate_other_clients_content(tmp_path):
+    """A digest announced for content another client uploaded is not trusted."""
+    data = b"secret" * 100
+    digest = hashlib.sha256(data).hexdigest()
+    store = UploadSessionStore(tmp_path)
+    spooled = await store.get_file("token", "session", "file.bin")
+    await store.receive(spooled, 0, _body(data))
+    (file,) = await store.open_files("token", "session", ["file.bin"])
+    file.file.close()
+
+    other = await store.get_file("other-token", "session", "file.bin", digest=digest)
+    assert not other.complete
+    assert other.offset == 0
+    with pytest.raises(HTTPException):
+        await store.open_files("other-token", "session", ["file.bin"])
+
+    # Sending the bytes proves the content, and claims the blob for the client.
+    other = await store.get_file("other-token", "session", "file.bin", digest=digest)
+    await store.receive(other, 0, _body(data))
+    (file,) = await store.open_files("other-token", "session", ["file.bin"])
+    file.file.close()
+    again = await store.get_file("other-token", "again", "file.bin", digest=digest)
+    assert again.complete
+
+
+async def test_upload_session_rejects_digest_mismatch(tmp_path):
+    """A file that does not hash to its announced digest is discarded."""
+    store = UploadSessionStore(tmp_path)
+    spooled = await store.get_file(
+        "token", "session", "file.bin", digest=hashlib.sha256(b"other").hexdigest()
+    )
+    await store.receive(spooled, 0, _body(b"data"))
+    with pytest.raises(HTTPException):
+        await store.open_files("token", "session", ["file.bin"])
+    assert spooled.offset == 0
+
+
+async def test_upload_session_prunes_unused_content(tmp_path):
+    """Sessions and blobs that were not used within the ttl are removed."""
+    store = UploadSessionStore(tmp_path)
+    for session_id in ("pending", "done"):
+        spooled = await store.get_file("token", session_id, "file.bin")
+        await store.receive(spooled, 0, _body(session_id.encode()))
+    (file,) = await store.open_files("token", "done", ["file.bin"])
+    file.file.close()
+
+    await store.prune(before=0)
+    assert len(list(store.sessions_dir.iterdir())) == 1
+    assert len(list(store.blobs_dir.iterdir())) == 1
+
+    await store.prune(before=float("inf"))
+    assert not any(store.sessions_dir.iterdir())
+    assert not any(store.blobs_dir.iterdir())
+    assert not any(store.claims_dir.iterdir())
+    spooled = await store.get_file("token", "pending", "file.bin")
+    spooled = await store.get_file("token", "session", "file.bin")
+    assert spooled.offset == 0
+
+
+async def test_upload_session_forgets_files_without_spool(tmp_path, monkeypatch):
+    """Files that were only looked up are forgotten, and tracked files are bounded."""
+    store = UploadSessionStore(tmp_path)
+    spooled = await store.get_file("token", "session", "file.bin")
+    await store.receive(spooled, 0, _body(b"data"))
+    for i in range(3):
+        await store.get_file("token", f"probe-{i}", "file.bin")
+    assert len(store._files) == 4
+
+    await store.prune(before=0)
+    assert list(store._files.values()) == [spooled]
+
+    monkeypatch.setattr(upload_module, "UPLOAD_MAX_TRACKED_FILES", 2)
+    for i in range(3):
+        await store.get_file("token", f"probe-{i}", "file.bin")
+    assert len(store._files) == 2
+    # A forgotten file is recovered from its spool file.
+    spooled = await store.get_file("token", "session", "file.bin")
+    assert spooled.offset == 4
+
+
+async def test_chunk_iterator_records_backpressure_stalls():
+    """Producers waiting on a slow handler are counted as backpressure stalls."""
+    store = UploadSessionStore(Path())
+    chunk_iter = UploadChunkIterator(maxsize=1, stats=store.stats)
+
+    def _chunk(offset: int) -> UploadChunk:
+        return UploadChunk(
+            filename="file.bin", offset=offset, content_type="", data=b"x"
+        )
+
+    await chunk_iter.push(_chunk(0))
+    producer = asyncio.create_task(chunk_iter.push(_chunk(1)))
+    await asyncio.sleep(0)
+    assert not producer.done()
+    assert (await anext(chunk_iter)).offset == 0
+    await producer
+
+    assert store.stats.backpressure_stalls == 1
+    assert store.stats.backpressure_stall_seconds >= 0
+
+
 def test_styled_upload_create():
     styled_up_comp_1 = StyledUpload.create()
     assert isinstance(styled_up_comp_1, StyledUpload)
@@ -9,3 +9,11 @@ def test_dataeditor():
         'css:({ ["width"] : "100%", ["height"] : "100%" })'
     ]
     assert editor["name"] == "DataEditor"
+
+
+def test_dataeditor_data_offset():
+    editor = DataEditor.create(data=[], rows=100, data_offset=40).children[0]
+    assert isinstance(editor, DataEditor)
+    (hook,) = editor.add_hooks()
+    assert "formatDataEditorCells(col, row - 40," in hook
+    assert not any("dataOffset" in prop for prop in editor.render()["props"])
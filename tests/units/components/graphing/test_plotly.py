@@ -32,7 +32,7 @@ def test_serialize_plotly(plotly_fig: go.Figure):
     """
     value = serialize(plotly_fig)
     assert isinstance(value, dict)
-    assert value == serialize_figure(plotly_fig)
+    assert value == serialize_figure(plotly_fig).loads()
 
 
 def test_plotly_config_option(plotly_fig: go.Figure):
@@ -1,9 +1,15 @@
 """Tests for the disk state manager."""
 
 import os
+import threading
 from pathlib import Path
 
+import pytest
+
 from reflex.istate.manager.disk import StateManagerDisk
+from reflex.istate.manager.token import BaseStateToken
+from reflex.state import BaseState
+from reflex.utils import prerequisites
 
 
 def test_states_directory_survives_chdir(tmp_path: Path, monkeypatch):
@@ -25,3 +31,92 @@ def test_states_directory_survives_chdir(tmp_path: Path, monkeypatch):
     assert manager.states_directory == states_dir
     # Purge resolves against the original directory, not the new cwd.
     manager._purge_expired_states()
+
+
+@pytest.mark.asyncio
+async def test_touched_substates_written_in_one_batch(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, token: str
+):
+    """All touched substates of a token are written by a single executor job.
+
+    Args:
+        tmp_path: A temporary directory.
+        monkeypatch: The pytest monkeypatch fixture.
+        token: A token.
+    """
+    monkeypatch.setattr(prerequisites, "get_states_dir", lambda: tmp_path)
+
+    class Root(BaseState):
+        pass
+
+    class Left(Root):
+        left: int = 0
+
+    class Right(Root):
+        right: int = 0
+
+    class LeftChild(Left):
+        child: int = 0
+
+    fields = {Left: "left", Right: "right", LeftChild: "child"}
+    bs_token = BaseStateToken(ident=token, cls=Root)
+    manager = StateManagerDisk(_write_debounce_seconds=0, fsync=True)
+    async with manager.modify_state(bs_token) as root:
+        for state_cls, field in fields.items():
+            setattr(await root.get_state(state_cls), field, 1)
+    await manager.close()
+
+    assert manager.io_stats.write_batches == 1
+    assert manager.io_stats.writes == 3
+    # One fsync per file plus one for the states directory.
+    assert manager.io_stats.fsyncs == (4 if hasattr(os, "O_DIRECTORY") else 3)
+    assert manager.io_stats.queue_depth == 0
+
+    reloaded = StateManagerDisk(_write_debounce_seconds=0)
+    root = await reloaded.get_state(bs_token)
+    for state_cls, field in fields.items():
+        assert getattr(await root.get_state(state_cls), field) == 1
+    assert reloaded.io_stats.reads == 3
+    await reloaded.close()
+
+
+@pytest.mark.asyncio
+async def test_sibling_substates_load_concurrently(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, token: str
+):
+    """Sibling substates are loaded on the I/O executor at the same time.
+
+    Args:
+        tmp_path: A temporary directory.
+        monkeypatch: The pytest monkeypatch fixture.
+        token: A token.
+    """
+    monkeypatch.setattr(prerequisites, "get_states_dir", lambda: tmp_path)
+
+    class Root(BaseState):
+        pass
+
+    class A(Root):
+        pass
+
+    class B(Root):
+        pass
+
+    class C(Root):
+        pass
+
+    manager = StateManagerDisk(_write_debounce_seconds=0, io_workers=4)
+    barrier = threading.Barrier(3, timeout=5)
+    read_state_file = manager._read_state_file
+
+    def _read_state_file(state_token):
+        if state_token.cls is not Root:
+            # Deadlocks (and times out) unless all three siblings are read together.
+            barrier.wait()
+        return read_state_file(state_token)
+
+    monkeypatch.setattr(manager, "_read_state_file", _read_state_file)
+    root = await manager.get_state(BaseStateToken(ident=token, cls=Root))
+    assert set(root.substates) == {A.get_name(), B.get_name(), C.get_name()}
+    assert manager.io_stats.max_queue_depth == 3
+    await manager.close()
@@ -4,11 +4,12 @@ import asyncio
 import os
 import time
 import uuid
-from collections.abc import AsyncGenerator
-from typing import Any
+from collections.abc import AsyncGenerator, Awaitable
+from typing import Any, cast
 
 import pytest
 import pytest_asyncio
+from redis.asyncio import Redis
 
 from reflex.istate.manager.redis import StateManagerRedis
 from reflex.istate.manager.token import BaseStateToken
@@ -736,3 +737,155 @@ async def test_oplock_hold_oplock_after_cancel(
     )
     assert isinstance(final_state, root_state)
     assert final_state.count == 2
+
+
+async def test_lock_metrics(
+    state_manager_redis: StateManagerRedis,
+    root_state: type[RedisTestState],
+):
+    """Test that lock waits, holds and pipelines are recorded and exported.
+
+    Args:
+        state_manager_redis: The StateManagerRedis to test.
+        root_state: The root state class.
+    """
+    state_manager_redis._oplock_enabled = False
+    metrics = state_manager_redis.metrics
+    observed: list[tuple[str, float]] = []
+    metrics.add_listener(lambda name, value: observed.append((name, value)))
+
+    token = BaseStateToken(ident=str(uuid.uuid4()), cls=root_state)
+    holding = asyncio.Event()
+    release = asyncio.Event()
+
+    async def hold():
+        async with state_manager_redis.modify_state(token) as state:
+            assert isinstance(state, root_state)
+            state.count += 1
+            holding.set()
+            await release.wait()
+
+    async def wait():
+        await holding.wait()
+        async with state_manager_redis.modify_state(token) as state:
+            assert isinstance(state, root_state)
+            state.count += 1
+
+    tasks = [asyncio.create_task(hold()), asyncio.create_task(wait())]
+    await holding.wait()
+    await asyncio.sleep(0.05)
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert metrics.lock_wait_seconds.count == 2
+    assert metrics.lock_hold_seconds.count == 2
+    assert metrics.lock_hold_seconds.sum >= 0.05
+    assert metrics.pipeline_commands.count >= 2
+    assert metrics.lock_expired_total == 0
+    assert {name for name, _ in observed} >= {
+        "lock_wait_seconds",
+        "lock_hold_seconds",
+        "pipeline_commands",
+    }
+
+    exported = metrics.render_prometheus()
+    assert "# TYPE reflex_state_lock_lock_wait_seconds histogram" in exported
+    assert 'reflex_state_lock_lock_hold_seconds_bucket{le="+Inf"} 2' in exported
+    assert "reflex_state_lock_lease_breaks_total 0" in exported
+    assert metrics.snapshot()["lock_wait_seconds"] == {
+        "count": 2,
+        "sum": metrics.lock_wait_seconds.sum,
+    }
+
+
+async def _queue_length(redis: Redis, lock_key: bytes) -> int:
+    """Get the length of the fair lock ticket queue.
+
+    Args:
+        redis: The redis client.
+        lock_key: The redis key for the lock.
+
+    Returns:
+        The number of queued tickets.
+    """
+    return await cast(Awaitable[int], redis.llen(lock_key + b"_queue"))
+
+
+async def test_fair_locking_grants_lock_in_arrival_order(
+    root_state: type[RedisTestState],
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that fair locking hands the lock to waiters in FIFO order across instances.
+
+    Args:
+        root_state: The root state class.
+        monkeypatch: Pytest monkeypatch fixture.
+    """
+    monkeypatch.setenv("REFLEX_STATE_MANAGER_REDIS_FAIR_LOCKS", "true")
+    monkeypatch.setenv("REFLEX_OPLOCK_ENABLED", "false")
+    redis = mock_redis()
+    manager_1 = StateManagerRedis(redis=redis)
+    manager_2 = StateManagerRedis(redis=redis)
+    assert manager_1._fair_locking
+    assert "l" in manager_1._redis_notify_keyspace_events
+
+    token = BaseStateToken(ident=str(uuid.uuid4()), cls=root_state)
+    lock_key = StateManagerRedis._lock_key(token)
+    order: list[str] = []
+
+    async def acquire(manager: StateManagerRedis, name: str):
+        async with manager._lock(token):
+            order.append(name)
+            await asyncio.sleep(0.01)
+
+    async def wait_for_tickets(n: int):
+        on_update = redis._internals["event_log_on_update"]  # pyright: ignore[reportAttributeAccessIssue]
+        while True:
+            on_update.clear()
+            if await _queue_length(redis, lock_key) >= n:
+                return
+            await on_update.wait()
+
+    try:
+        async with manager_1._lock(token):
+            waiters = []
+            # Alternate instances so local wakeups cannot jump the queue.
+            for i, manager in enumerate([manager_2, manager_1, manager_2, manager_1]):
+                waiters.append(asyncio.create_task(acquire(manager, f"waiter_{i}")))
+                await wait_for_tickets(i + 1)
+        await asyncio.wait_for(asyncio.gather(*waiters), timeout=5)
+    finally:
+        await manager_2.close()
+        await manager_1.close()
+
+    assert order == ["waiter_0", "waiter_1", "waiter_2", "waiter_3"]
+    assert await _queue_length(redis, lock_key) == 0
+    assert manager_1.metrics.lock_wait_seconds.count == 3
+    assert manager_2.metrics.lock_wait_seconds.count == 2
+
+
+async def test_fair_locking_skips_abandoned_tickets(
+    root_state: type[RedisTestState],
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that a ticket whose owner went away does not block the queue.
+
+    Args:
+        root_state: The root state class.
+        monkeypatch: Pytest monkeypatch fixture.
+    """
+    monkeypatch.setenv("REFLEX_STATE_MANAGER_REDIS_FAIR_LOCKS", "true")
+    monkeypatch.setenv("REFLEX_OPLOCK_ENABLED", "false")
+    redis = mock_redis()
+    manager = StateManagerRedis(redis=redis)
+    token = BaseStateToken(ident=str(uuid.uuid4()), cls=root_state)
+    lock_key = StateManagerRedis._lock_key(token)
+
+    # A crashed instance left its ticket in the queue, but its liveness key expired.
+    await cast(Awaitable[int], redis.rpush(lock_key + b"_queue", b"gone"))
+    try:
+        async with manager._lock(token) as lock_id:
+            assert await redis.get(lock_key) == lock_id
+    finally:
+        await manager.close()
+    assert await _queue_length(redis, lock_key) == 0
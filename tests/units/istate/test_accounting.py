@@ -0,0 +1,149 @@
+"""Tests for the size and write accounting of substates."""
+
+import sys
+from collections.abc import Iterator
+
+import pytest
+
+import reflex as rx
+from reflex.istate.accounting import StateAccounting, deep_sizeof, state_accounting
+from reflex.state import BaseState
+
+
+class AccountingState(BaseState):
+    """A state with a field that changes on every update and one that does not."""
+
+    count: int = 0
+    status: str = "idle"
+    _cache: dict[str, int] = {}
+
+    @rx.var
+    def doubled(self) -> int:
+        """Invalidated whenever the count changes.
+
+        Returns:
+            Twice the count.
+        """
+        return self.count * 2
+
+
+class AccountingChildState(AccountingState):
+    """A substate updated on some of the updates of its parent."""
+
+    items: list[int] = []
+
+
+@pytest.fixture
+def accounting() -> Iterator[StateAccounting]:
+    """Enable the state accounting, measuring sizes every 10 updates.
+
+    Yields:
+        The process-wide state accounting.
+    """
+    state_accounting.sample_rate = 10
+    yield state_accounting
+    state_accounting.sample_rate = 0
+    state_accounting.reset()
+
+
+def test_accounting_is_disabled_by_default():
+    """Test that nothing is recorded without a sample rate."""
+    state = AccountingState()
+    state.count += 1
+    state._clean()
+    assert not state_accounting.enabled
+    assert state_accounting.states == {}
+
+
+def test_updates_fields_and_sizes(accounting: StateAccounting):
+    """Test that updates, field rewrites and sampled sizes are recorded per substate.
+
+    Args:
+        accounting: The enabled state accounting.
+    """
+    state = AccountingState()
+    child = state.substates[AccountingChildState.get_name()]
+    assert isinstance(child, AccountingChildState)
+    for i in range(25):
+        state.count += 1
+        state.status = "idle"
+        state._cache = {"hits": i}
+        if i % 5 == 0:
+            child.items = [*child.items, i]
+        state._clean()
+
+    report = accounting.report()
+    assert report["updates"] == 25
+
+    stats = report["states"][AccountingState.get_full_name()]
+    assert stats["updates"] == 25
+    assert stats["dirty_rate"] == 1
+    assert stats["fields"]["count"] == {"dirty": 25, "assignments": 25, "unchanged": 0}
+    assert stats["fields"]["status"] == {
+        "dirty": 25,
+        "assignments": 25,
+        "unchanged": 25,
+    }
+    assert stats["fields"]["_cache"]["unchanged"] == 0
+    assert stats["redundant_fields"] == ["status"]
+    # Updates 1, 11 and 21 are measured.
+    assert stats["memory_bytes"]["samples"] == 3
+    assert stats["memory_bytes"]["max"] > 0
+    assert stats["serialized_bytes"]["samples"] == 3
+    assert stats["writes"] == 0
+    assert stats["invalidated_computed_vars"] == {"doubled": 25}
+
+    child_stats = report["states"][AccountingChildState.get_full_name()]
+    assert child_stats["updates"] == 5
+    assert child_stats["dirty_rate"] == pytest.approx(0.2)
+    assert child_stats["redundant_fields"] == []
+
+
+def test_writes_record_serialized_size(accounting: StateAccounting):
+    """Test that serializing a state for a state manager is recorded as a write.
+
+    Args:
+        accounting: The enabled state accounting.
+    """
+    state = AccountingState()
+    payload = state._serialize()
+    stats = accounting.states[AccountingState.get_full_name()]
+    assert stats.writes == 1
+    assert stats.serialized_bytes.last == len(payload)
+
+    accounting.reset()
+    assert accounting.report() == {"sample_rate": 10, "updates": 0, "states": {}}
+
+
+def test_uncomparable_values_count_as_changed(accounting: StateAccounting):
+    """Test that values failing to compare are counted as changed.
+
+    Args:
+        accounting: The enabled state accounting.
+    """
+
+    class Uncomparable:
+        def __eq__(self, other):
+            raise ValueError
+
+        __hash__ = object.__hash__
+
+    state = AccountingState()
+    accounting.record_assignment(state, "count", Uncomparable(), Uncomparable())
+    field = accounting.states[AccountingState.get_full_name()].fields["count"]
+    assert (field.assignments, field.unchanged) == (1, 0)
+
+
+def test_deep_sizeof():
+    """Test that nested containers are measured once per object."""
+    inner = [1.5] * 100
+    value = {"a": inner, "b": inner}
+    assert deep_sizeof(value) == (
+        sys.getsizeof(value)
+        + sys.getsizeof("a")
+        + sys.getsizeof("b")
+        + sys.getsizeof(inner)
+        + sys.getsizeof(1.5)
+    )
+    # Classes are shared by the whole process and not counted.
+    assert deep_sizeof([AccountingState]) == sys.getsizeof([AccountingState])
@@ -0,0 +1,141 @@
+"""Tests for storing the images and bytes of state updates as media."""
+
+import hashlib
+import os
+import time
+from pathlib import Path
+
+import pytest
+from PIL import Image
+from reflex_base.utils import console
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.routing import Route
+
+from reflex.app import App
+from reflex.istate.media import (
+    DiskMediaStore,
+    MediaBlob,
+    MediaOffload,
+    MediaStore,
+    MemoryMediaStore,
+    media_offload,
+)
+
+
+def _blob(data: bytes) -> tuple[str, MediaBlob]:
+    return hashlib.sha256(data).hexdigest(), MediaBlob(data, "text/plain")
+
+
+async def test_memory_store_evicts_least_recently_used():
+    """Test that the memory store keeps the most recently used blobs within its size."""
+    store = MemoryMediaStore(max_bytes=8, ttl=60)
+    (a, blob_a), (b, blob_b), (c, blob_c) = map(_blob, (b"aaaa", b"bbbb", b"cccc"))
+    await store.put(a, blob_a)
+    await store.put(b, blob_b)
+    assert await store.get(a) == blob_a
+    await store.put(c, blob_c)
+    assert await store.get(b) is None
+    assert await store.get(a) == blob_a
+    assert await store.get(c) == blob_c
+    assert store.size == 8
+
+
+async def test_memory_store_expires_unused_blobs():
+    """Test that blobs unused for longer than the ttl are dropped."""
+    store = MemoryMediaStore(max_bytes=1024, ttl=-1)
+    digest, blob = _blob(b"data")
+    await store.put(digest, blob)
+    assert await store.get(digest) is None
+    assert store.size == 0
+
+
+async def test_disk_store(tmp_path: Path):
+    """Test that the disk store keeps blobs with their content type, and prunes them.
+
+    Args:
+        tmp_path: The directory of the store.
+    """
+    store = DiskMediaStore(root=tmp_path, max_bytes=30, ttl=60)
+    (a, blob_a), (b, blob_b), (c, blob_c) = map(_blob, (b"a\naa", b"bbbb", b"cccc"))
+    await store.put(a, blob_a)
+    await store.put(b, blob_b)
+    await store.put(c, blob_c)
+    assert await store.get(a) == blob_a
+
+    # Two blobs of 15 bytes with their content type fit, b is the least recently used.
+    os.utime(tmp_path / b, (0, time.time() - 30))
+    store.prune()
+    assert await store.get(b) is None
+    assert await store.get(c) == blob_c
+
+    os.utime(tmp_path / c, (0, time.time() - 120))
+    assert await store.get(c) is None
+    assert not (tmp_path / c).exists()
+
+
+async def test_offload_delta():
+    """Test that large images and bytes are replaced by their URL, and small ones inlined."""
+    offload = MediaOffload(
+        store=MemoryMediaStore(max_bytes=1 << 20, ttl=60), min_bytes=64
+    )
+    image = Image.new("RGB", (32, 32), color="red")
+    data = os.urandom(128)
+    delta = {
+        "state": {"count_rx_state_": 1, "small_rx_state_": b"abc"},
+        "state.sub": {"image_rx_state_": image, "data_rx_state_": data},
+    }
+    offloaded = await offload.offload_delta(delta)
+    assert offloaded is not None
+    assert offloaded["state"] == delta["state"]
+    assert delta["state.sub"]["data_rx_state_"] is data
+
+    digest = hashlib.sha256(data).hexdigest()
+    assert offloaded["state.sub"]["data_rx_state_"].endswith(f"/_media/{digest}")
+    blob = await offload.store.get(digest)  # pyright: ignore[reportOptionalMemberAccess]
+    assert blob == MediaBlob(data, "application/octet-stream")
+
+    image_digest = offloaded["state.sub"]["image_rx_state_"].rpartition("/")[2]
+    image_blob = await offload.store.get(image_digest)  # pyright: ignore[reportOptionalMemberAccess]
+    assert image_blob is not None
+    assert image_blob.content_type == "image/png"
+
+    assert await offload.offload_delta({"state": {"small_rx_state_": b"abc"}}) is None
+
+    assert await MediaOffload(min_bytes=0).offload_delta(delta) is None
+
+
+def test_memory_store_warns_with_several_workers(monkeypatch: pytest.MonkeyPatch):
+    """Test that a memory store is only created quietly for a single worker."""
+    warnings = []
+    monkeypatch.setattr(console, "warn", warnings.append)
+    monkeypatch.setenv("GRANIAN_WORKERS", "1")
+    assert isinstance(MediaStore.create("memory"), MemoryMediaStore)
+    assert not warnings
+
+    monkeypatch.setenv("GRANIAN_WORKERS", "4")
+    assert isinstance(MediaStore.create("memory"), MemoryMediaStore)
+    assert "disk or redis" in warnings[0]
+
+
+async def test_media_endpoint_is_privately_cached(monkeypatch: pytest.MonkeyPatch):
+    """Test that shared caches do not keep the media of a client's state."""
+    digest, blob = _blob(b"data")
+    store = MemoryMediaStore(max_bytes=1024, ttl=60)
+    await store.put(digest, blob)
+    monkeypatch.setattr(media_offload, "store", store)
+    app = App()
+    app._api = Starlette()
+    app.add_media_endpoint()
+
+    (route,) = app._api.routes
+    assert isinstance(route, Route)
+    request = Request({
+        "type": "http",
+        "method": "GET",
+        "headers": [],
+        "path_params": {"digest": digest},
+    })
+    response = await route.endpoint(request)
+    assert response.body == b"data"
+    assert response.headers["cache-control"].startswith("private,")
@@ -4,23 +4,29 @@ import asyncio
 import dataclasses
 import pickle
 from asyncio import CancelledError
+from collections.abc import Mapping
 from contextlib import asynccontextmanager
 from typing import Any
 
 import pytest
+from reflex_base.constants.state import FIELD_MARKER
 from reflex_base.event.context import EventContext
 from reflex_base.utils.exceptions import ImmutableStateError
 
 import reflex as rx
 from reflex.istate.data import RouterData
+from reflex.istate.manager.redis import StateManagerRedis
 from reflex.istate.manager.token import BaseStateToken
 from reflex.istate.proxy import (
+    _NO_MERGE,
     ImmutableMutableProxy,
     MutableProxy,
     ReadOnlyStateProxy,
     StateProxy,
+    _merge,
 )
 from reflex.state import BaseState
+from tests.units.mock_redis import mock_redis
 
 
 @dataclasses.dataclass
@@ -713,3 +719,208 @@ async def test_mutable_proxy_custom_get_method_path_tracking(
     ) as state:
         assert isinstance(state, CustomGetState)
         assert state.registry.entries == {"a": [1, 2]}
+
+
+class BackgroundFlushState(rx.State):
+    """Test state for batching the changes of a background task."""
+
+    count: int = 0
+    other: int = 0
+    items: list[int] = []
+
+
+@pytest.fixture
+async def redis_state_manager(attached_mock_event_context: EventContext):
+    """Use a redis state manager without opportunistic locking in the context.
+
+    Args:
+        attached_mock_event_context: The attached mock event context.
+
+    Yields:
+        The redis state manager.
+    """
+    state_manager = StateManagerRedis(redis=mock_redis())
+    state_manager._oplock_enabled = False
+    orig_state_manager = attached_mock_event_context.state_manager
+    object.__setattr__(attached_mock_event_context, "state_manager", state_manager)
+    yield state_manager
+    await state_manager.close()
+    object.__setattr__(attached_mock_event_context, "state_manager", orig_state_manager)
+
+
+async def _flush_state_proxy(
+    state_manager: StateManagerRedis, token: str
+) -> StateProxy:
+    async with state_manager.modify_state(
+        BaseStateToken(ident=token, cls=BackgroundFlushState)
+    ) as state:
+        return StateProxy(
+            await state.get_state(BackgroundFlushState), flush_interval=60_000
+        )
+
+
+async def _stored(state_manager: StateManagerRedis, token: str) -> BackgroundFlushState:
+    state = await state_manager.get_state(
+        BaseStateToken(ident=token, cls=BackgroundFlushState)
+    )
+    return await state.get_state(BackgroundFlushState)
+
+
+@pytest.mark.asyncio
+async def test_state_proxy_flush_interval_batches_changes(
+    token: str, redis_state_manager: StateManagerRedis
+):
+    """The blocks within the flush interval change a local copy of the state."""
+    state_proxy = await _flush_state_proxy(redis_state_manager, token)
+
+    for _ in range(3):
+        async with state_proxy:
+            state_proxy.count += 1
+    assert state_proxy.count == 3
+    assert (await _stored(redis_state_manager, token)).count == 1
+    assert redis_state_manager.metrics.background_local_updates_total == 2
+
+    await state_proxy._flush()
+    assert (await _stored(redis_state_manager, token)).count == 3
+    assert redis_state_manager.metrics.background_flushes_total == 1
+    assert redis_state_manager.metrics.background_conflicts_total == 0
+    assert state_proxy._self_session is not None
+    assert state_proxy._self_session.flush_task is None
+
+
+@pytest.mark.asyncio
+async def test_state_proxy_flush_interval_conflict(
+    token: str, redis_state_manager: StateManagerRedis, caplog: pytest.LogCaptureFixture
+):
+    """A field changed by another handler since the last flush keeps its value."""
+    state_proxy = await _flush_state_proxy(redis_state_manager, token)
+    async with state_proxy:
+        state_proxy.count += 1
+    async with state_proxy:
+        state_proxy.count += 1
+        state_proxy.other = 5
+
+    async with redis_state_manager.modify_state(
+        BaseStateToken(ident=token, cls=BackgroundFlushState)
+    ) as state:
+        (await state.get_state(BackgroundFlushState)).count = 10
+
+    await state_proxy._flush()
+    stored = await _stored(redis_state_manager, token)
+    assert stored.count == 10
+    assert stored.other == 5
+    assert state_proxy.count == 10
+    assert redis_state_manager.metrics.background_conflicts_total == 1
+    assert f"{BackgroundFlushState.get_full_name()}.count" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_state_proxy_flush_interval_deltas(
+    token: str,
+    redis_state_manager: StateManagerRedis,
+    emitted_deltas: list[tuple[str, Mapping[str, Mapping[str, Any]]]],
+):
+    """The flush only sends the values the client did not get from the local copy."""
+    state_proxy = await _flush_state_proxy(redis_state_manager, token)
+    async with state_proxy:
+        state_proxy.count += 1
+    async with state_proxy:
+        state_proxy.count += 1
+        state_proxy.other = 5
+
+    async with redis_state_manager.modify_state(
+        BaseStateToken(ident=token, cls=BackgroundFlushState)
+    ) as state:
+        (await state.get_state(BackgroundFlushState)).count = 10
+
+    emitted_deltas.clear()
+    await state_proxy._flush()
+    # The dropped change is corrected, the unchanged field is not sent again.
+    assert emitted_deltas == [
+        (token, {BackgroundFlushState.get_full_name(): {"count" + FIELD_MARKER: 10}})
+    ]
+    assert (await _stored(redis_state_manager, token)).other == 5
+
+
+@pytest.mark.asyncio
+async def test_state_proxy_flush_interval_merges_containers(
+    token: str, redis_state_manager: StateManagerRedis
+):
+    """Items appended by the task and by another handler are both kept."""
+    state_proxy = await _flush_state_proxy(redis_state_manager, token)
+    async with state_proxy:
+        state_proxy.items.append(1)
+    async with state_proxy:
+        state_proxy.items.append(2)
+
+    async with redis_state_manager.modify_state(
+        BaseStateToken(ident=token, cls=BackgroundFlushState)
+    ) as state:
+        (await state.get_state(BackgroundFlushState)).items.append(10)
+
+    await state_proxy._flush()
+    assert (await _stored(redis_state_manager, token)).items == [1, 10, 2]
+    assert redis_state_manager.metrics.background_conflicts_total == 0
+
+
+@pytest.mark.parametrize(
+    ("base", "local", "fresh", "merged"),
+    [
+        ([1], [1, 2], [1, 3], [1, 3, 2]),
+        ({"a": 1}, {"a": 1, "b": 2}, {"a": 3}, {"a": 3, "b": 2}),
+        ({"a": 1, "b": 1}, {"b": 1}, {"a": 1, "b": 1, "c": 1}, {"b": 1, "c": 1}),
+        ({1, 2}, {2, 3}, {1, 2, 4}, {2, 3, 4}),
+    ],
+)
+def test_merge_background_changes(base: Any, local: Any, fresh: Any, merged: Any):
+    """In-place changes of containers are applied to the concurrent value."""
+    assert _merge(base, local, fresh) == merged
+
+
+@pytest.mark.parametrize(
+    ("base", "local", "fresh"),
+    [
+        (1, 2, 3),
+        ([1, 2], [2], [1, 2, 3]),
+        ({"a": 1}, {"a": 2}, {"a": 3}),
+    ],
+)
+def test_merge_background_changes_conflict(base: Any, local: Any, fresh: Any):
+    """Changes that overwrite a concurrent change are not merged."""
+    assert _merge(base, local, fresh) is _NO_MERGE
+
+
+@pytest.mark.asyncio
+async def test_state_proxy_flush_interval_timer(
+    token: str, redis_state_manager: StateManagerRedis
+):
+    """The changes are flushed when the interval ends."""
+    state_proxy = await _flush_state_proxy(redis_state_manager, token)
+    session = state_proxy._self_session
+    assert session is not None
+    session.interval = 0.05
+    async with state_proxy:
+        state_proxy.count += 1
+    async with state_proxy:
+        state_proxy.count += 1
+    assert session.flush_task is not None
+
+    await asyncio.sleep(0.2)
+    assert session.flush_task is None
+    assert (await _stored(redis_state_manager, token)).count == 2
+
+
+@pytest.mark.asyncio
+async def test_state_proxy_flush_interval_memory(
+    token: str,
+    attached_mock_event_context: EventContext,
+    caplog: pytest.LogCaptureFixture,
+):
+    """Without the redis state manager, every block writes the state, with a warning."""
+    async with attached_mock_event_context.state_manager.modify_state(
+        BaseStateToken(ident=token, cls=BackgroundFlushState)
+    ) as state:
+        state_proxy = StateProxy(state, flush_interval=60_000)
+    assert state_proxy._self_session is None
+    assert "flush_interval" in caplog.text
+    assert "StateManagerMemory" in caplog.text
@@ -0,0 +1,241 @@
+"""Tests for rx.QueryState."""
+
+import pickle
+from collections.abc import Iterator
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from reflex_base.registry import RegistrationContext
+
+import reflex.model
+from reflex.istate import query
+from reflex.istate.query import QueryPageCache, QueryState
+from reflex.state import State
+
+sqlmodel = pytest.importorskip("sqlmodel")
+sqlalchemy = pytest.importorskip("sqlalchemy")
+
+_metadata = sqlalchemy.MetaData()
+
+_items = sqlalchemy.Table(
+    "items",
+    _metadata,
+    sqlalchemy.Column("id", sqlalchemy.Integer, primary_key=True),
+    sqlalchemy.Column("name", sqlalchemy.String),
+)
+
+
+@pytest.fixture
+def items_state(
+    forked_registration_context: RegistrationContext,
+) -> Iterator[type[QueryState]]:
+    """Define a query state over the items table.
+
+    Args:
+        forked_registration_context: keeps the state out of the global state tree
+
+    Yields:
+        The state class.
+    """
+
+    class ItemsState(QueryState, State):
+        page_size = 10
+
+        overscan = 5
+
+        def get_query(self):
+            return sqlalchemy.select(_items.c.id, _items.c.name).order_by(_items.c.id)
+
+    yield ItemsState
+    State._always_dirty_substates.discard(ItemsState.get_name())
+
+
+@pytest.fixture
+def items_db(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> mock.Mock:
+    """Create a database with 35 items and a fresh page cache.
+
+    Args:
+        tmp_path: directory where the database is stored
+        monkeypatch: pytest fixture to overwrite attributes
+
+    Returns:
+        A mock wrapping the session function, to count database round trips.
+    """
+    config_mock = mock.Mock()
+    config_mock.db_url = f"sqlite:///{tmp_path}/items.db"
+    config_mock.db_read_replica_urls = []
+    monkeypatch.setattr(reflex.model, "get_config", mock.Mock(return_value=config_mock))
+    monkeypatch.setattr(reflex.model, "_ENGINE", {})
+    monkeypatch.setattr(query, "query_page_cache", QueryPageCache(max_pages=3))
+    engine = reflex.model.get_engine()
+    _metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            _items.insert(), [{"id": i, "name": f"item {i}"} for i in range(35)]
+        )
+    session = mock.Mock(wraps=reflex.model.session)
+    monkeypatch.setattr(reflex.model, "session", session)
+    return session
+
+
+@pytest.mark.asyncio
+async def test_query_state_window(items_state: type[QueryState], items_db: mock.Mock):
+    """Test that only the window is fetched, in shared cached pages.
+
+    Args:
+        items_state: the query state class
+        items_db: the session mock of the items database
+    """
+    state = items_state(_reflex_internal_init=True)  # pyright: ignore[reportCallIssue]
+    state.set_window(8, 5)
+    assert await state.rows == [[i, f"item {i}"] for i in range(8, 13)]
+    assert await state.total_rows == 35
+    assert state.columns == ["id", "name"]
+    assert [c["type"] for c in state.data_editor_columns] == ["int", "str"]
+    # Pages 0 and 1, plus the count.
+    assert items_db.call_count == 3
+
+    other = items_state(_reflex_internal_init=True)  # pyright: ignore[reportCallIssue]
+    other.set_window(12, 3)
+    assert await other.rows == [[i, f"item {i}"] for i in range(12, 15)]
+    assert items_db.call_count == 3
+    assert query.query_page_cache.hits == 1
+
+    # The last page is short.
+    other.next_page()
+    other.next_page()
+    other.next_page()
+    other.next_page()
+    other.next_page()
+    other.next_page()
+    other.next_page()
+    assert other.offset == 33
+    assert await other.rows == [[33, "item 33"], [34, "item 34"]]
+
+    # Three pages fit in the cache, so the oldest one was evicted.
+    assert query.query_page_cache.evictions == 1
+
+    other.refresh()
+    assert len(query.query_page_cache._pages) == 0
+
+
+@pytest.mark.asyncio
+async def test_query_state_sort_and_filter(
+    items_state: type[QueryState], items_db: mock.Mock
+):
+    """Test that sorting and filtering are applied in the query.
+
+    Args:
+        items_state: the query state class
+        items_db: the session mock of the items database
+    """
+    state = items_state(_reflex_internal_init=True)  # pyright: ignore[reportCallIssue]
+    state.set_window(0, 3)
+    state.sort_by("id")
+    state.sort_by("id")
+    assert state.sort_descending
+    assert await state.rows == [[34, "item 34"], [33, "item 33"], [32, "item 32"]]
+
+    state.set_filter("name", "item 1")
+    assert await state.total_rows == 11
+    assert await state.rows == [[19, "item 19"], [18, "item 18"], [17, "item 17"]]
+
+    # Wildcards in the filter are matched literally.
+    state.set_filter("name", "%")
+    assert await state.total_rows == 0
+
+    # Unknown columns are ignored rather than interpolated into the query.
+    state.set_filter("name", "")
+    state.set_filter("missing", "x")
+    state.sort_by("missing")
+    assert await state.total_rows == 35
+
+
+def test_query_state_visible_region(items_state: type[QueryState]):
+    """Test that the window follows the visible region of a data editor.
+
+    Args:
+        items_state: the query state class
+    """
+    state = items_state(_reflex_internal_init=True)  # pyright: ignore[reportCallIssue]
+    state.set_visible_region({"x": 0, "y": 20, "width": 2, "height": 10})
+    assert (state.offset, state.limit) == (15, 20)
+
+    # Scrolling within the window keeps it.
+    state.set_visible_region({"x": 0, "y": 18, "width": 2, "height": 10})
+    assert (state.offset, state.limit) == (15, 20)
+
+    state.set_visible_region({"x": 0, "y": 0, "width": 2, "height": 10})
+    assert (state.offset, state.limit) == (0, 15)
+
+
+def test_query_state_range(items_state: type[QueryState]):
+    """Test that the window follows the range asked for by a virtual foreach.
+
+    Args:
+        items_state: the query state class
+    """
+    state = items_state(_reflex_internal_init=True)  # pyright: ignore[reportCallIssue]
+    state.set_range(40, 70)
+    assert (state.offset, state.limit) == (40, 30)
+
+
+def test_query_state_window_clamped(items_state: type[QueryState]):
+    """Test that client supplied windows are clamped.
+
+    Args:
+        items_state: the query state class
+    """
+    state = items_state(_reflex_internal_init=True)  # pyright: ignore[reportCallIssue]
+    state.set_window(-5, 10**9)
+    assert (state.offset, state.limit) == (0, state.max_limit)
+    state.set_window(10**30, -1)
+    assert (state.offset, state.limit) == (state.max_offset, 0)
+    state.set_range(10, 10**9)
+    assert (state.offset, state.limit) == (10, state.max_limit)
+    state.set_visible_region({"y": 0, "height": 10**9})
+    assert (state.offset, state.limit) == (0, state.max_limit)
+
+
+def test_query_state_not_pickled(items_state: type[QueryState]):
+    """Test that the fetched rows are not part of the stored state.
+
+    Args:
+        items_state: the query state class
+    """
+    state = items_state(_reflex_internal_init=True)  # pyright: ignore[reportCallIssue]
+    assert "rows" not in state.base_vars
+    assert "rows" in state.computed_vars
+    state.set_window(0, 3)
+    object.__setattr__(state, state.computed_vars["rows"]._cache_attr, [[0, "item 0"]])
+    assert pickle.loads(pickle.dumps(state)).offset == 0
+    assert "item 0" not in str(state.__getstate__())
+
+
+@pytest.mark.asyncio
+async def test_query_state_fetches_on_window_change(
+    items_state: type[QueryState], items_db: mock.Mock
+):
+    """Test that the rows are only fetched again when the window changes.
+
+    Args:
+        items_state: the query state class
+        items_db: the session mock of the items database
+    """
+    assert items_state.get_name() not in State._always_dirty_substates
+    state = items_state(_reflex_internal_init=True)  # pyright: ignore[reportCallIssue]
+    state.set_window(0, 3)
+    assert await state.rows == [[i, f"item {i}"] for i in range(3)]
+    lookups = query.query_page_cache.hits + query.query_page_cache.misses
+    assert await state.rows == [[i, f"item {i}"] for i in range(3)]
+    assert query.query_page_cache.hits + query.query_page_cache.misses == lookups
+
+    state.set_window(3, 3)
+    assert await state.rows == [[i, f"item {i}"] for i in range(3, 6)]
+
+    with reflex.model.get_engine().begin() as connection:
+        connection.execute(_items.update().values(name="renamed"))
+    assert (await state.rows)[0] == [3, "item 3"]
+    state.refresh()
+    assert (await state.rows)[0] == [3, "renamed"]
@@ -22,7 +22,7 @@ def mock_redis() -> Redis:
     Returns:
         The mocked redis client.
     """
-    keys: dict[bytes, EncodableT | set[EncodableT]] = {}
+    keys: dict[bytes, EncodableT | set[EncodableT] | list[EncodableT]] = {}
     expire_times: dict[bytes, float] = {}
     event_log: list[dict[str, bytes]] = []
     event_log_new_events = asyncio.Event()
@@ -142,6 +142,54 @@ def mock_redis() -> Redis:
             return True
         return False
 
+    async def mock_rpush(key: KeyT, *values: EncodableT) -> int:  # noqa: RUF029
+        _expire_keys()
+        key = _key_bytes(key)
+        keylist = keys.setdefault(key, [])
+        if not isinstance(keylist, list):
+            raise TypeError(WRONGTYPE_MESSAGE)
+        keylist.extend(values)
+        _keyspace_event(key, "rpush")
+        return len(keylist)
+
+    async def mock_lrem(key: KeyT, count: int, value: EncodableT) -> int:
+        _expire_keys()
+        keylist = keys.get(_key_bytes(key))
+        if keylist is None:
+            return 0
+        if not isinstance(keylist, list):
+            raise TypeError(WRONGTYPE_MESSAGE)
+        removed = 0
+        while value in keylist and (count == 0 or removed < abs(count)):
+            keylist.remove(value)
+            removed += 1
+        if removed:
+            _keyspace_event(key, "lrem")
+            if not keylist:
+                await redis_mock.delete(key)
+        return removed
+
+    async def mock_lindex(key: KeyT, index: int) -> Any:  # noqa: RUF029
+        _expire_keys()
+        keylist = keys.get(_key_bytes(key))
+        if keylist is None:
+            return None
+        if not isinstance(keylist, list):
+            raise TypeError(WRONGTYPE_MESSAGE)
+        try:
+            return keylist[index]
+        except IndexError:
+            return None
+
+    async def mock_llen(key: KeyT) -> int:  # noqa: RUF029
+        _expire_keys()
+        keylist = keys.get(_key_bytes(key))
+        if keylist is None:
+            return 0
+        if not isinstance(keylist, list):
+            raise TypeError(WRONGTYPE_MESSAGE)
+        return len(keylist)
+
     def pipeline():
         pipeline_mock = Mock()
         results = []
@@ -164,6 +212,18 @@ def mock_redis() -> Redis:
         def pexpire_pipeline(key: KeyT, px: int, xx: bool = False):
             results.append(redis_mock.pexpire(key=key, px=px, xx=xx))
 
+        def rpush_pipeline(key: KeyT, *values: EncodableT):
+            results.append(redis_mock.rpush(key, *values))
+
+        def lrem_pipeline(key: KeyT, count: int, value: EncodableT):
+            results.append(redis_mock.lrem(key, count, value))
+
+        def lindex_pipeline(key: KeyT, index: int):
+            results.append(redis_mock.lindex(key, index))
+
+        def delete_pipeline(key: KeyT):
+            results.append(redis_mock.delete(key))
+
         async def execute():
             _expire_keys()
             return await asyncio.gather(*results)
@@ -172,6 +232,10 @@ def mock_redis() -> Redis:
         pipeline_mock.set = set_pipeline
         pipeline_mock.sadd = sadd_pipeline
         pipeline_mock.pexpire = pexpire_pipeline
+        pipeline_mock.rpush = rpush_pipeline
+        pipeline_mock.lrem = lrem_pipeline
+        pipeline_mock.lindex = lindex_pipeline
+        pipeline_mock.delete = delete_pipeline
         pipeline_mock.execute = execute
 
         return pipeline_mock
@@ -243,6 +307,10 @@ def mock_redis() -> Redis:
     redis_mock.srem = mock_srem
     redis_mock.scard = mock_scard
     redis_mock.pexpire = mock_pexpire
+    redis_mock.rpush = mock_rpush
+    redis_mock.lrem = mock_lrem
+    redis_mock.lindex = mock_lindex
+    redis_mock.llen = mock_llen
     redis_mock.pipeline = pipeline
     redis_mock.pttl = pttl
     redis_mock.pubsub = pubsub
@@ -2,6 +2,8 @@
 
 import asyncio
 import dataclasses
+import logging
+import threading
 import traceback
 from collections.abc import Mapping
 from typing import Any
@@ -11,7 +13,12 @@ import pytest_asyncio
 from reflex_base.constants import CompileVars
 from reflex_base.constants.state import FIELD_MARKER
 from reflex_base.event.context import EventContext
-from reflex_base.event.processor import BaseStateEventProcessor
+from reflex_base.event.processor import (
+    BaseStateEventProcessor,
+    base_state_processor,
+    event_processor,
+)
+from reflex_base.event.tracing import EventTracer, InMemoryTraceExporter, hash_token
 from reflex_base.registry import RegistrationContext
 
 import reflex as rx
@@ -288,3 +295,224 @@ async def test_chained_event_keeps_originating_router_data(
         BaseStateToken(ident=token, cls=State)
     )
     assert (await state.get_state(RouterState)).seen == ["/item/abc|abc"]
+
+
+async def test_event_trace_records_pipeline_phases(
+    wired_app: App,
+    real_base_state_processor: BaseStateEventProcessor,
+    token: str,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Each processed event exports a trace with a span per pipeline phase.
+
+    Args:
+        wired_app: The App wired to the processor's state manager.
+        real_base_state_processor: The unmocked BaseStateEventProcessor.
+        token: The client token.
+        monkeypatch: pytest fixture to swap the tracer of the event processor.
+    """
+    exporter = InMemoryTraceExporter()
+    monkeypatch.setattr(event_processor, "tracer", EventTracer(exporters=[exporter]))
+
+    class TracedState(State):
+        count: int = 0
+
+        @event
+        def increment(self):
+            self.count += 1
+
+    async with real_base_state_processor as processor:
+        await processor.enqueue(
+            token, Event.from_event_type(TracedState.increment())[0]
+        )
+        await processor.join(1)
+
+    (trace,) = exporter.traces()
+    assert trace.event_name.endswith(".increment")
+    assert trace.token_hash == hash_token(token)
+    assert trace.error is None
+    phases = trace.phase_durations()
+    assert {"queue", "lock_wait", "handler", "delta"} <= phases.keys()
+    assert sum(phases.values()) == pytest.approx(trace.duration)
+
+
+async def test_thread_executor_keeps_loop_responsive(
+    wired_app: App,
+    real_base_state_processor: BaseStateEventProcessor,
+    emitted_deltas: list[tuple[str, Mapping[str, Mapping[str, Any]]]],
+    token: str,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """A blocking handler on the thread pool does not hold up other clients.
+
+    Args:
+        wired_app: The App wired to the processor's state manager.
+        real_base_state_processor: The unmocked BaseStateEventProcessor.
+        emitted_deltas: List capturing emitted deltas.
+        token: The client token.
+        monkeypatch: pytest fixture to swap the tracer of the event processor.
+    """
+    exporter = InMemoryTraceExporter()
+    monkeypatch.setattr(event_processor, "tracer", EventTracer(exporters=[exporter]))
+    released = threading.Event()
+
+    class BlockingState(State):
+        count: int = 0
+
+        @event(executor="thread")
+        def slow(self):
+            self.count += 1
+            yield
+            # Only set by the other client's event, which needs the event loop.
+            assert released.wait(timeout=5)
+            self.count += 1
+
+        @event
+        def release(self):
+            released.set()
+
+    other_token = f"{token}-other"
+    async with real_base_state_processor as processor:
+        await processor.enqueue(token, Event.from_event_type(BlockingState.slow())[0])
+        await processor.enqueue(
+            other_token, Event.from_event_type(BlockingState.release())[0]
+        )
+        await processor.join(10)
+
+    counts = [
+        delta[BlockingState.get_full_name()]["count" + FIELD_MARKER]
+        for delta_token, delta in emitted_deltas
+        if delta_token == token and BlockingState.get_full_name() in delta
+    ]
+    # After the rehydration of the fresh token.
+    assert counts[-2:] == [1, 2]
+    slow_trace = next(t for t in exporter.traces() if t.event_name.endswith(".slow"))
+    assert "executor_queue" in slow_trace.phase_durations()
+
+
+async def test_emit_interval_coalesces_generator_deltas(
+    wired_app: App,
+    real_base_state_processor: BaseStateEventProcessor,
+    emitted_deltas: list[tuple[str, Mapping[str, Mapping[str, Any]]]],
+    token: str,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """The yields within the emit interval merge their deltas into the next one.
+
+    Args:
+        wired_app: The App wired to the processor's state manager.
+        real_base_state_processor: The unmocked BaseStateEventProcessor.
+        emitted_deltas: List capturing emitted deltas.
+        token: The client token.
+        monkeypatch: pytest fixture to swap the tracer of the event processor.
+    """
+    exporter = InMemoryTraceExporter()
+    monkeypatch.setattr(event_processor, "tracer", EventTracer(exporters=[exporter]))
+
+    class StreamingState(State):
+        text: str = ""
+
+        @event(emit_interval=60_000)
+        async def stream(self):
+            for token in ("a", "b", "c"):
+                self.text += token
+                yield
+
+    async with real_base_state_processor as processor:
+        await processor.enqueue(
+            token, Event.from_event_type(StreamingState.stream())[0]
+        )
+        await processor.join(5)
+
+    texts = [
+        delta[StreamingState.get_full_name()]["text" + FIELD_MARKER]
+        for delta_token, delta in emitted_deltas
+        if delta_token == token and StreamingState.get_full_name() in delta
+    ]
+    # The first yield emits, the rest is flushed when the handler returns.
+    assert texts[-2:] == ["a", "abc"]
+    stream_trace = next(
+        t for t in exporter.traces() if t.event_name.endswith(".stream")
+    )
+    assert stream_trace.attributes["coalesced_emits"] == 2
+
+
+async def test_emit_interval_flushes_trailing_delta(
+    wired_app: App,
+    real_base_state_processor: BaseStateEventProcessor,
+    emitted_deltas: list[tuple[str, Mapping[str, Mapping[str, Any]]]],
+    token: str,
+    caplog: pytest.LogCaptureFixture,
+):
+    """A merged yield is flushed at the end of the interval, without waiting for the next one.
+
+    Args:
+        wired_app: The App wired to the processor's state manager.
+        real_base_state_processor: The unmocked BaseStateEventProcessor.
+        emitted_deltas: List capturing emitted deltas.
+        token: The client token.
+        caplog: pytest fixture to capture the debug log.
+    """
+    flushed = asyncio.Event()
+
+    class SlowStreamingState(State):
+        text: str = ""
+
+        @event(emit_interval=50)
+        async def stream(self):
+            for token in ("a", "b"):
+                self.text += token
+                yield
+            # The merged "b" is sent while the handler waits.
+            await asyncio.wait_for(flushed.wait(), timeout=5)
+            self.text += "c"
+
+    def _texts() -> list[str]:
+        return [
+            delta[SlowStreamingState.get_full_name()]["text" + FIELD_MARKER]
+            for delta_token, delta in emitted_deltas
+            if delta_token == token and SlowStreamingState.get_full_name() in delta
+        ]
+
+    caplog.set_level(logging.DEBUG, logger=base_state_processor.__name__)
+    async with real_base_state_processor as processor:
+        await processor.enqueue(
+            token, Event.from_event_type(SlowStreamingState.stream())[0]
+        )
+        for _ in range(100):
+            if _texts()[-1:] == ["ab"]:
+                break
+            await asyncio.sleep(0.01)
+        flushed.set()
+        await processor.join(5)
+
+    assert _texts()[-3:] == ["a", "ab", "abc"]
+    assert "Yields merged into one delta: 1" in caplog.text
+
+
+def test_emit_interval_only_for_generators():
+    """Only generator handlers with a positive interval can set an emit interval."""
+
+    def not_a_generator(self):
+        pass
+
+    def generator(self):
+        yield
+
+    with pytest.raises(TypeError):
+        event(emit_interval=100)(not_a_generator)
+    with pytest.raises(ValueError, match="emit interval"):
+        event(emit_interval=0)(generator)
+
+
+def test_flush_interval_only_for_background():
+    """Only background handlers with a positive interval can set a flush interval."""
+
+    async def not_background(self):
+        pass
+
+    with pytest.raises(TypeError):
+        event(flush_interval=100)(not_background)
+    with pytest.raises(ValueError, match="flush interval"):
+        event(background=True, flush_interval=0)(not_background)
+    assert event(background=True, flush_interval=100)(not_background)
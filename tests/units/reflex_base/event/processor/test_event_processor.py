@@ -12,6 +12,7 @@ from reflex_base.event.processor.event_processor import (
     QueueShutDown,
     _stream_queue_until_done,
 )
+from reflex_base.event.processor.future import EventFuture
 from reflex_base.registry import RegistrationContext
 
 from reflex.event import Event, EventHandler
@@ -515,6 +516,30 @@ async def test_chained_event_processed(token: str):
     assert _CALL_LOG == [{"value": "chained"}]
 
 
+async def test_event_router_forwards_chained_events(token: str):
+    """Events enqueued via ctx.enqueue go to the router, and run locally when it declines.
+
+    Args:
+        token: The client token.
+    """
+    routed: list[tuple[str, tuple[Event, ...]]] = []
+
+    async def router(route_token: str, *events: Event) -> bool:  # noqa: RUF029
+        routed.append((route_token, events))
+        return len(routed) == 1
+
+    ep = EventProcessor(graceful_shutdown_timeout=2)
+    ep.configure(event_router=router)
+    async with ep:
+        # Events enqueued directly on the processor are never routed.
+        await ep.enqueue(token, Event.from_event_type(chaining_event())[0])
+        await ep.join()
+        # The second chained event is declined by the router and runs locally.
+        await ep.enqueue(token, Event.from_event_type(chaining_event())[0])
+    assert [route_token for route_token, _ in routed] == [token, token]
+    assert _CALL_LOG == [{"value": "chained"}]
+
+
 async def test_join_when_not_started(processor: EventProcessor):
     """join() when not started is a no-op (queue is None).
 
@@ -597,6 +622,68 @@ async def test_stream_delta_yields_rapid_back_to_back_deltas(token: str):
     ]
 
 
+async def test_stream_delta_concurrent_streams(token: str):
+    """Concurrent streams each track their own event and all complete.
+
+    Args:
+        token: The client token.
+    """
+    ep = EventProcessor(graceful_shutdown_timeout=2)
+    ep.configure()
+
+    async def _stream(stream_token: str) -> list:
+        event = Event.from_event_type(multi_delta_event())[0]
+        return [d async for d in ep.enqueue_stream_delta(stream_token, event)]
+
+    async with ep:
+        results = await asyncio.wait_for(
+            asyncio.gather(*(_stream(f"{token}_{i}") for i in range(3))), timeout=5
+        )
+    for collected in results:
+        assert collected == [
+            {"state": {"i": 0}},
+            {"state": {"i": 1}},
+            {"state": {"i": 2}},
+        ]
+
+
+async def test_stream_delta_forks_root_context(
+    token: str, monkeypatch: pytest.MonkeyPatch
+):
+    """Each stream is enqueued with its own txid, forked from the root context.
+
+    Args:
+        token: The client token.
+        monkeypatch: Pytest monkeypatch fixture.
+    """
+    ep = EventProcessor(graceful_shutdown_timeout=2)
+    ep.configure()
+    contexts: list[EventContext] = []
+    enqueue = EventProcessor.enqueue
+
+    async def _enqueue(
+        self: EventProcessor,
+        token: str,
+        event: Event,
+        ev_ctx: EventContext | None = None,
+    ) -> EventFuture:
+        assert ev_ctx is not None
+        contexts.append(ev_ctx)
+        return await enqueue(self, token, event, ev_ctx=ev_ctx)
+
+    monkeypatch.setattr(EventProcessor, "enqueue", _enqueue)
+    async with ep:
+        for i in range(2):
+            event = Event.from_event_type(multi_delta_event())[0]
+            _ = [d async for d in ep.enqueue_stream_delta(f"{token}_{i}", event)]
+
+    root = ep._root_context
+    assert root is not None
+    assert [ctx.token for ctx in contexts] == [f"{token}_0", f"{token}_1"]
+    assert len({root.txid, *(ctx.txid for ctx in contexts)}) == 3
+    assert all(ctx.parent_txid == root.txid for ctx in contexts)
+
+
 async def test_stream_delta_noop_handler_yields_nothing(token: str):
     """enqueue_stream_delta with a handler that emits no deltas yields nothing.
 
@@ -0,0 +1,138 @@
+"""Tests for running synchronous event handlers on a thread pool."""
+
+import asyncio
+import contextvars
+import threading
+import time
+from collections.abc import Iterator
+
+import pytest
+from reflex_base.event import EventHandler, event
+from reflex_base.event.executor import HandlerExecutor
+from reflex_base.event.tracing import EventTracer, InMemoryTraceExporter
+
+_request_id: contextvars.ContextVar[str] = contextvars.ContextVar("request_id")
+
+
+@pytest.fixture
+def executor() -> Iterator[HandlerExecutor]:
+    """Create an executor with two threads.
+
+    Yields:
+        The executor, shut down after the test.
+    """
+    executor = HandlerExecutor(max_workers=2)
+    yield executor
+    executor.close()
+
+
+def _handler(fn) -> EventHandler:
+    return EventHandler(fn=fn)
+
+
+def test_offloads():
+    """Test that only synchronous handlers run on threads, per handler or by default."""
+
+    def plain(self):
+        pass
+
+    @event(executor="thread")
+    def threaded(self):
+        pass
+
+    @event(executor="loop")
+    def on_loop(self):
+        pass
+
+    async def coroutine(self):
+        pass
+
+    executor = HandlerExecutor()
+    assert not executor.offloads(_handler(plain))
+    assert executor.offloads(_handler(threaded))
+    assert not executor.offloads(_handler(on_loop))
+
+    executor.default = "thread"
+    assert executor.offloads(_handler(plain))
+    assert not executor.offloads(_handler(on_loop))
+    assert not executor.offloads(_handler(coroutine))
+
+
+def test_invalid_executor():
+    """Test that the executor must be known, and set on a synchronous handler."""
+    with pytest.raises(ValueError, match="Invalid event executor"):
+
+        @event(executor="process")  # pyright: ignore[reportCallIssue, reportArgumentType]
+        def handler(self):
+            pass
+
+    with pytest.raises(TypeError, match="Only synchronous"):
+
+        @event(executor="thread")
+        async def coroutine(self):
+            pass
+
+
+async def test_run_in_thread_with_context(executor: HandlerExecutor):
+    """Test that calls run off the event loop thread with the context of the caller.
+
+    Args:
+        executor: The executor.
+    """
+
+    def work(suffix: str) -> tuple[str, int | None]:
+        return _request_id.get() + suffix, threading.get_ident()
+
+    _request_id.set("abc")
+    value, ident = await executor.run(work, suffix="!")
+    assert value == "abc!"
+    assert ident != threading.get_ident()
+
+
+async def test_queue_stats(executor: HandlerExecutor):
+    """Test that calls waiting for a free thread are counted.
+
+    Args:
+        executor: The executor with two threads.
+    """
+    await asyncio.gather(*(executor.run(time.sleep, 0.05) for _ in range(4)))
+    stats = executor.stats.to_dict()
+    assert stats["submitted"] == 4
+    assert stats["queue_depth"] == 0
+    assert stats["max_queue_depth"] >= 1
+    # Two of the calls waited for the first two to finish.
+    assert stats["max_queue_ms"] >= 40
+
+
+async def test_cancelled_call_completes(executor: HandlerExecutor):
+    """Test that cancelling the caller waits for the call to return.
+
+    Args:
+        executor: The executor.
+    """
+    finished = threading.Event()
+
+    def work():
+        time.sleep(0.05)
+        finished.set()
+
+    task = asyncio.create_task(executor.run(work))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert finished.is_set()
+
+
+async def test_run_records_queue_span(executor: HandlerExecutor):
+    """Test that a call records its wait for a thread, but no handler span of its own.
+
+    Args:
+        executor: The executor.
+    """
+    tracer = EventTracer(exporters=[InMemoryTraceExporter(max_traces=1)])
+    trace = tracer.start_trace("state.work", "token", "txid")
+    assert trace is not None
+    with tracer.activate(trace):
+        await executor.run(time.sleep, 0)
+    assert [span.name for span in trace.spans] == ["queue", "executor_queue"]
@@ -0,0 +1,135 @@
+"""Tests for the sampling profiler of event handlers."""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Iterator
+
+import pytest
+from reflex_base.event.profiling import AWAIT_FRAME, EventProfiler
+
+
+@pytest.fixture
+def profiler() -> Iterator[EventProfiler]:
+    """Create a profiler sampling every millisecond.
+
+    Yields:
+        The profiler, closed after the test.
+    """
+    profiler = EventProfiler(interval=0.001)
+    yield profiler
+    profiler.close()
+
+
+async def _run_event(
+    profiler: EventProfiler, handler: str, work: Callable[[], Awaitable[None]]
+):
+    with profiler.profile(handler):
+        await work()
+
+
+def _busy(duration: float):
+    end = time.perf_counter() + duration
+    while time.perf_counter() < end:
+        pass
+
+
+async def _busy_handler():
+    await asyncio.sleep(0)
+    _busy(0.05)
+
+
+async def _fast_handler():
+    pass
+
+
+async def _awaiting_handler():
+    await asyncio.sleep(0.05)
+
+
+def test_disabled_profiler_keeps_nothing():
+    """Test that no event is profiled without a threshold or a sample rate."""
+    profiler = EventProfiler()
+    assert not profiler.enabled
+    with profiler.profile("state.increment"):
+        _busy(0.01)
+    assert profiler.profiles == {}
+    assert profiler._sampler is None
+
+
+async def test_threshold_keeps_slow_events(profiler: EventProfiler):
+    """Test that only events slower than the threshold are kept, with their stacks.
+
+    Args:
+        profiler: The profiler.
+    """
+    profiler.threshold = 0.02
+    await _run_event(profiler, "state.slow", _busy_handler)
+    await _run_event(profiler, "state.fast", _fast_handler)
+    assert list(profiler.profiles) == ["state.slow"]
+
+    profile = profiler.profiles["state.slow"]
+    assert profile.events == 1
+    assert profile.max_duration >= 0.05
+    assert profile.stacks
+    stack = profile.stacks.most_common(1)[0][0]
+    assert stack[0].startswith("_run_event (")
+    assert stack[-1].startswith("_busy (")
+
+    lines = profiler.folded().splitlines()
+    assert lines
+    assert all(line.startswith("state.slow;_run_event (") for line in lines)
+    assert profiler.folded(handler="state.fast") == ""
+
+    summary = profiler.summary()
+    assert summary["threshold_ms"] == 20
+    assert summary["handlers"]["state.slow"]["hottest"][0]["frame"].startswith(
+        "_busy ("
+    )
+
+    profiler.reset()
+    assert profiler.profiles == {}
+
+
+async def test_awaiting_events_are_sampled(profiler: EventProfiler):
+    """Test that samples of an awaiting event follow its awaited coroutines.
+
+    Args:
+        profiler: The profiler.
+    """
+    profiler.threshold = 0.02
+    await _run_event(profiler, "state.wait", _awaiting_handler)
+    stacks = profiler.profiles["state.wait"].stacks
+    assert stacks
+    stack = stacks.most_common(1)[0][0]
+    assert stack[-1] == AWAIT_FRAME
+    assert stack[0].startswith("_run_event (")
+    assert any(frame.startswith("_awaiting_handler (") for frame in stack)
+    hottest = profiler.summary()["handlers"]["state.wait"]["hottest"][0]["frame"]
+    assert hottest.endswith(f") {AWAIT_FRAME}")
+
+
+async def test_sample_rate_keeps_one_in_n_events(profiler: EventProfiler):
+    """Test that a sample rate keeps events regardless of their duration.
+
+    Args:
+        profiler: The profiler.
+    """
+    profiler.sample_rate = 2
+    for _ in range(4):
+        await _run_event(profiler, "state.fast", _fast_handler)
+    assert profiler.profiles["state.fast"].events == 2
+
+
+def test_configure_from_environment(monkeypatch: pytest.MonkeyPatch):
+    """Test that the profiler settings are read from the environment.
+
+    Args:
+        monkeypatch: pytest fixture to set environment variables.
+    """
+    monkeypatch.setenv("REFLEX_EVENT_PROFILE_THRESHOLD", "250")
+    monkeypatch.setenv("REFLEX_EVENT_PROFILE_INTERVAL", "2")
+    profiler = EventProfiler(sample_rate=10)
+    profiler.configure_from_environment()
+    assert profiler.threshold == pytest.approx(0.25)
+    assert profiler.interval == pytest.approx(0.002)
+    assert profiler.sample_rate == 10
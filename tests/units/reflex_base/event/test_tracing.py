@@ -0,0 +1,167 @@
+"""Tests for per-event tracing spans."""
+
+import asyncio
+import logging
+import time
+
+import pytest
+import reflex_base.event.tracing as tracing
+from reflex_base.event.tracing import (
+    EventTracer,
+    InMemoryTraceExporter,
+    LoggingTraceExporter,
+)
+
+
+def test_spans_are_noops_outside_of_a_trace():
+    """Test that spans and counters do nothing when no event is traced."""
+    with tracing.span("handler") as span:
+        assert span is None
+    tracing.add_to_attribute("state_bytes", 10)
+    assert tracing.current_trace() is None
+
+
+def test_nested_spans_exclusive_phase_durations():
+    """Test that nested spans are excluded from the phase of the enclosing span."""
+    exporter = InMemoryTraceExporter(max_traces=2)
+    tracer = EventTracer(exporters=[exporter])
+    trace = tracer.start_trace("state.increment", "token", "txid")
+    assert trace is not None
+    with tracer.activate(trace):
+        assert tracing.current_trace() is trace
+        with tracing.span("handler"):
+            time.sleep(0.01)
+            with tracing.span("delta"):
+                time.sleep(0.02)
+            tracing.add_to_attribute("state_bytes", 10)
+            tracing.add_to_attribute("state_bytes", 5)
+    assert tracing.current_trace() is None
+    assert exporter.traces() == [trace]
+
+    assert [span.name for span in trace.spans] == ["queue", "handler", "delta"]
+    handler, delta = trace.spans[1:]
+    assert delta.parent == 1
+    assert handler.child_duration == delta.duration
+    phases = trace.phase_durations()
+    assert phases["delta"] >= 0.02
+    assert 0.01 <= phases["handler"] < handler.duration
+    assert sum(phases.values()) == pytest.approx(trace.duration)
+    assert trace.attributes == {"state_bytes": 15}
+    assert trace.token_hash == tracing.hash_token("token") != "token"
+
+    # Spans recorded by tasks outliving the event are dropped.
+    scope_token = tracing._current_scope.set(tracing._Scope(trace))
+    try:
+        with tracing.span("state_save") as span:
+            assert span is None
+    finally:
+        tracing._current_scope.reset(scope_token)
+
+
+def test_receive_span_starts_the_trace():
+    """Test that a marked receive time becomes the start of the next trace only."""
+    tracer = EventTracer(exporters=[InMemoryTraceExporter()])
+    tracing._received_at.set(time.perf_counter() - 0.05)
+    trace = tracer.start_trace("state.increment", "token", "txid")
+    assert trace is not None
+    assert [span.name for span in trace.spans] == ["receive"]
+    assert trace.spans[0].start == 0
+    assert trace.spans[0].duration >= 0.05
+
+    next_trace = tracer.start_trace("state.increment", "token", "txid2")
+    assert next_trace is not None
+    assert next_trace.spans == []
+
+
+def test_error_is_recorded():
+    """Test that the exception raised by the handler is recorded on the trace."""
+    exporter = InMemoryTraceExporter()
+    tracer = EventTracer(exporters=[exporter])
+    trace = tracer.start_trace("state.fail", "token", "txid")
+    with pytest.raises(ValueError), tracer.activate(trace):
+        raise ValueError
+    assert exporter.traces()[0].error == "ValueError"
+
+
+def test_disabled_tracer_starts_no_trace():
+    """Test that tracing is off without exporters."""
+    assert EventTracer().start_trace("state.increment", "token", "txid") is None
+
+
+def test_memory_exporter_ring_buffer_and_summary():
+    """Test that the in-memory exporter keeps the latest traces and summarizes them."""
+    exporter = InMemoryTraceExporter(max_traces=3)
+    for i in range(5):
+        trace = tracing.EventTrace(event_name="e", token_hash="t", txid=str(i))
+        trace.spans.append(tracing.Span(name="handler", start=0, duration=i / 1000))
+        trace.duration = (i + 1) / 1000
+        exporter.export(trace)
+    assert [trace.txid for trace in exporter.traces()] == ["2", "3", "4"]
+
+    data = exporter.to_json(limit=2)
+    assert [trace["txid"] for trace in data["traces"]] == ["4", "3"]
+    assert data["summary"]["count"] == 3
+    assert data["summary"]["phases_ms"]["handler"] == {
+        "p50": pytest.approx(3),
+        "p99": pytest.approx(4),
+        "max": pytest.approx(4),
+    }
+    assert data["summary"]["phases_ms"]["total"]["max"] == pytest.approx(5)
+
+    exporter.clear()
+    assert exporter.traces() == []
+
+
+def test_logging_exporter_threshold(caplog: pytest.LogCaptureFixture):
+    """Test that only traces over the threshold are logged.
+
+    Args:
+        caplog: pytest fixture capturing log records.
+    """
+    exporter = LoggingTraceExporter(min_duration=0.01)
+    fast = tracing.EventTrace(event_name="fast", token_hash="t", txid="1")
+    slow = tracing.EventTrace(event_name="slow", token_hash="t", txid="2")
+    slow.duration = 0.02
+    slow.spans.append(tracing.Span(name="lock_wait", start=0, duration=0.015))
+    with caplog.at_level(logging.INFO, logger=tracing.__name__):
+        exporter.export(fast)
+        exporter.export(slow)
+    assert len(caplog.records) == 1
+    assert "slow" in caplog.records[0].message
+    assert "lock_wait=15.0ms" in caplog.records[0].message
+
+
+def test_configure_from_environment(monkeypatch: pytest.MonkeyPatch):
+    """Test that the exporters named in the environment are registered once.
+
+    Args:
+        monkeypatch: pytest fixture to set environment variables.
+    """
+    monkeypatch.setenv("REFLEX_EVENT_TRACE_EXPORTERS", "logging:memory")
+    monkeypatch.setenv("REFLEX_EVENT_TRACE_BUFFER_SIZE", "7")
+    tracer = EventTracer()
+    tracer.configure_from_environment()
+    tracer.configure_from_environment()
+    assert [type(exporter) for exporter in tracer.exporters] == [
+        LoggingTraceExporter,
+        InMemoryTraceExporter,
+    ]
+    assert tracer.memory_exporter().max_traces == 7
+    assert len(tracer.exporters) == 2
+
+
+async def test_traced_lock_records_wait():
+    """Test that waiting for a contended lock is recorded as lock_wait."""
+    tracer = EventTracer(exporters=[InMemoryTraceExporter()])
+    lock = asyncio.Lock()
+    assert tracing.traced_lock(lock) is lock
+
+    await lock.acquire()
+    asyncio.get_running_loop().call_later(0.02, lock.release)
+    trace = tracer.start_trace("state.increment", "token", "txid")
+    assert trace is not None
+    with tracer.activate(trace):
+        async with tracing.traced_lock(lock):
+            assert lock.locked()
+    assert not lock.locked()
+    assert trace.phase_durations()["lock_wait"] >= 0.015
@@ -24,6 +24,7 @@ from reflex_base.components.component import Component
 from reflex_base.constants.state import FIELD_MARKER
 from reflex_base.event import Event
 from reflex_base.event.context import EventContext
+from reflex_base.event.executor import handler_executor
 from reflex_base.event.processor import BaseStateEventProcessor
 from reflex_base.plugins import CompileContext, CompilerHooks, PageContext, Plugin
 from reflex_base.registry import RegistrationContext
@@ -43,7 +44,7 @@ from starlette_admin.auth import AuthProvider
 
 import reflex as rx
 from reflex import AdminDash, constants
-from reflex._upload import upload
+from reflex._upload import UploadSessionStore, upload
 from reflex.app import App, ComponentCallable, EventNamespace, default_overlay_component
 from reflex.compiler.compiler import (
     _compile_app,
@@ -59,8 +60,15 @@ from reflex.istate.manager.redis import StateManagerRedis
 from reflex.istate.manager.token import BaseStateToken
 from reflex.istate.storage import Cookie, LocalStorage, SessionStorage
 from reflex.model import Model
-from reflex.state import BaseState, OnLoadInternalState, State, reload_state_module
+from reflex.state import (
+    BaseState,
+    OnLoadInternalState,
+    State,
+    StateUpdate,
+    reload_state_module,
+)
 from reflex.utils import exec as exec_utils
+from reflex.utils.token_manager import SocketRecord
 
 from .conftest import chdir
 from .states import GenState
@@ -1215,6 +1223,84 @@ async def test_upload_empty_buffered_request_dispatches_alias_handler(
     assert substate.img_list == ["count:0"]
 
 
+@pytest.mark.asyncio
+async def test_upload_session_resumes_and_dispatches_handler(
+    tmp_path: Path,
+    token: str,
+    attached_mock_base_state_event_processor: BaseStateEventProcessor,
+    mock_root_event_context: EventContext,
+):
+    """Test a resumable upload interrupted mid-file and committed to a handler.
+
+    Args:
+        tmp_path: Temporary path.
+        token: A token.
+        attached_mock_base_state_event_processor: BaseStateEventProcessor Fixture attached to the app instance to capture emitted events.
+        mock_root_event_context: The mocked root event context, for accessing state_manager.
+    """
+    app = Mock(event_processor=attached_mock_base_state_event_processor)
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+    async with mock_root_event_context.state_manager.modify_state(
+        BaseStateToken(ident=token, cls=FileUploadState)
+    ) as root_state:
+        substate = await root_state.get_state(FileUploadState)
+        substate._tmp_path = out_dir
+        substate.img_list = []
+
+    upload_fn = upload(app, UploadSessionStore(tmp_path / "sessions"))
+    data = b"large dataset contents"
+
+    def _request(method: str, body: bytes = b"", /, **headers: str):
+        request_mock = unittest.mock.Mock()
+        request_mock.method = method
+        request_mock.headers = Headers({
+            "reflex-client-token": token,
+            "reflex-event-handler": f"{FileUploadState.get_full_name()}.multi_handle_upload",
+            "reflex-upload-session": "session-1",
+            **headers,
+        })
+
+        async def stream():
+            await asyncio.sleep(0)
+            yield body
+            raise ClientDisconnect
+
+        async def read_body():  # noqa: RUF029
+            return body
+
+        request_mock.stream = stream
+        request_mock.body = read_body
+        return request_mock
+
+    file_headers = {"reflex-upload-filename": "data.bin", "reflex-upload-length": "22"}
+    response = await upload_fn(
+        _request("PATCH", data[:5], **file_headers, **{"reflex-upload-offset": "0"})
+    )
+    assert response.status_code == 204
+    assert response.headers["reflex-upload-offset"] == "5"
+
+    response = await upload_fn(_request("HEAD", **file_headers))
+    assert response.headers["reflex-upload-offset"] == "5"
+
+    response = await upload_fn(
+        _request("PATCH", data[5:], **file_headers, **{"reflex-upload-offset": "5"})
+    )
+    assert response.headers["reflex-upload-offset"] == str(len(data))
+
+    streaming_response = await upload_fn(
+        _request("POST", json.dumps({"files": ["data.bin"]}).encode())
+    )
+    assert isinstance(streaming_response, StreamingResponse)
+    updates = [
+        json.loads(str(update)) async for update in streaming_response.body_iterator
+    ]
+    assert updates[-1]["delta"] == {
+        FileUploadState.get_full_name(): {"img_list" + FIELD_MARKER: ["data.bin"]}
+    }
+    assert (out_dir / "data.bin").read_bytes() == data
+
+
 @pytest.mark.asyncio
 async def test_upload_file_closes_form_on_form_error(
     token: str,
@@ -4283,3 +4369,173 @@ def test_client_error_constants_match_frontend():
         f'const ERROR_TYPE_STATE_UPDATE = "{constants.ClientErrorType.STATE_UPDATE}"'
         in state_js
     )
+
+
+@pytest.fixture
+def batching_event_namespace(
+    event_namespace: EventNamespace, monkeypatch: pytest.MonkeyPatch
+) -> EventNamespace:
+    """An event namespace merging the updates sent within 50ms, with a mocked emit.
+
+    Args:
+        event_namespace: The event namespace.
+        monkeypatch: The pytest monkeypatch fixture.
+
+    Returns:
+        The event namespace.
+    """
+    monkeypatch.setenv("REFLEX_EMIT_BATCH_INTERVAL", "50")
+    token_manager = event_namespace._token_manager
+    token_manager.token_to_socket["some_token"] = SocketRecord(
+        instance_id=token_manager.instance_id, sid="known_sid"
+    )
+    event_namespace.emit = AsyncMock()
+    return event_namespace
+
+
+@pytest.mark.asyncio
+async def test_emit_update_batches_updates(batching_event_namespace: EventNamespace):
+    """The updates one handler emits within the interval are merged into one message.
+
+    Args:
+        batching_event_namespace: The batching event namespace.
+    """
+    namespace = batching_event_namespace
+    assert isinstance(namespace.emit, AsyncMock)
+    updates = [
+        StateUpdate(delta={"state": {"a": 1, "b": 1}}),
+        StateUpdate(delta={"state": {"a": 2}, "other": {"c": 3}}),
+        StateUpdate(delta={"state": {"b": 2}}),
+    ]
+
+    # Each emit returns once its update is queued.
+    for update in updates:
+        await namespace.emit_update(update, "some_token")
+    namespace.emit.assert_not_awaited()
+    assert namespace.emit_stats() == {
+        "queue_depth": 3,
+        "merged_total": 2,
+        "dropped_total": 0,
+    }
+
+    await asyncio.sleep(0.2)
+    namespace.emit.assert_awaited_once()
+    (_, payload), kwargs = namespace.emit.call_args
+    assert kwargs == {"to": "known_sid"}
+    assert payload.delta == {"state": {"a": 2, "b": 2}, "other": {"c": 3}}
+    assert payload.events == []
+    assert namespace.emit_queue_depth == 0
+    assert not namespace._pending_emits
+    assert not namespace._emit_tasks
+
+
+@pytest.mark.asyncio
+async def test_emit_update_events_are_not_merged(
+    batching_event_namespace: EventNamespace,
+):
+    """An update with events flushes the waiting updates, and is sent before the later ones.
+
+    Args:
+        batching_event_namespace: The batching event namespace.
+    """
+    namespace = batching_event_namespace
+    assert isinstance(namespace.emit, AsyncMock)
+    event = Event(name="state.handler", payload={})
+    updates = [
+        StateUpdate(delta={"state": {"a": 1}}),
+        StateUpdate(delta={"state": {"a": 2}}, events=[event]),
+        StateUpdate(delta={"state": {"a": 3}}),
+    ]
+    for update in updates:
+        await namespace.emit_update(update, "some_token")
+
+    # The events do not wait for the interval.
+    await asyncio.sleep(0.01)
+    assert [call.args[1] for call in namespace.emit.await_args_list] == updates[:2]
+
+    await asyncio.sleep(0.2)
+    assert [call.args[1] for call in namespace.emit.await_args_list] == updates
+    assert namespace.emit_merged_total == 0
+    assert namespace.emit_queue_depth == 0
+    assert not namespace._pending_emits
+    assert not namespace._emit_tasks
+
+
+@pytest.mark.asyncio
+async def test_emit_update_batches_are_sent_in_order(
+    batching_event_namespace: EventNamespace,
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+):
+    """A batch queued while the previous one is sent waits for it, errors are logged.
+
+    Args:
+        batching_event_namespace: The batching event namespace.
+        monkeypatch: The pytest monkeypatch fixture.
+        caplog: The pytest log capture fixture.
+    """
+    namespace = batching_event_namespace
+    monkeypatch.setenv("REFLEX_EMIT_BATCH_INTERVAL", "0")
+    sent = []
+    release = asyncio.Event()
+
+    async def emit(event: str, payload: StateUpdate, to: str):
+        if not sent:
+            sent.append(payload.delta)
+            await release.wait()
+            msg = "send failed"
+            raise RuntimeError(msg)
+        sent.append(payload.delta)
+
+    monkeypatch.setattr(namespace, "emit", emit)
+    await namespace.emit_update(StateUpdate(delta={"state": {"a": 1}}), "some_token")
+    await asyncio.sleep(0.05)
+    await namespace.emit_update(StateUpdate(delta={"state": {"a": 2}}), "some_token")
+    await asyncio.sleep(0.05)
+    assert sent == [{"state": {"a": 1}}]
+
+    release.set()
+    await asyncio.sleep(0.05)
+    assert sent == [{"state": {"a": 1}}, {"state": {"a": 2}}]
+    assert "send failed" in caplog.text
+    assert not namespace._emit_tasks
+
+
+@pytest.mark.asyncio
+async def test_emit_update_batch_dropped_on_disconnect(
+    batching_event_namespace: EventNamespace,
+):
+    """The updates waiting for a closed connection are dropped.
+
+    Args:
+        batching_event_namespace: The batching event namespace.
+    """
+    namespace = batching_event_namespace
+    await namespace.emit_update(StateUpdate(delta={"state": {"a": 1}}), "some_token")
+
+    task = namespace.on_disconnect("known_sid")
+    if task is not None:
+        await task
+    await asyncio.sleep(0.1)
+
+    assert isinstance(namespace.emit, AsyncMock)
+    namespace.emit.assert_not_awaited()
+    assert namespace.emit_queue_depth == 0
+    assert namespace.emit_dropped_total == 1
+
+
+@pytest.mark.asyncio
+async def test_event_processor_teardown_closes_handler_executor(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """The handler thread pool is shut down with the event processor.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture.
+    """
+    close = Mock()
+    monkeypatch.setattr(handler_executor, "close", close)
+    app = App(_state=EmptyState)
+    async with app._setup_event_processor():
+        close.assert_not_called()
+    close.assert_called_once_with()
@@ -298,3 +298,175 @@ def test_no_rebind_mutable_proxy_for_instrumented_functions():
     assert "sa_obj" not in sa_state.dirty_vars
     sa_state.sa_obj.keywords.append(SAKeyword(value="test"))
     assert "sa_obj" in sa_state.dirty_vars
+
+
+@pytest.fixture
+def db_config(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> mock.Mock:
+    """Configure a primary database and two read replicas with fresh engines.
+
+    Args:
+        tmp_path: directory where the databases are stored
+        monkeypatch: pytest fixture to overwrite attributes
+
+    Returns:
+        The mocked config.
+    """
+    config_mock = mock.Mock()
+    config_mock.db_url = f"sqlite:///{tmp_path}/primary.db"
+    config_mock.db_read_replica_urls = [
+        f"sqlite:///{tmp_path}/replica1.db",
+        f"sqlite:///{tmp_path}/replica2.db",
+    ]
+    monkeypatch.setattr(reflex.model, "get_config", mock.Mock(return_value=config_mock))
+    monkeypatch.setattr(reflex.model, "_ENGINE", {})
+    return config_mock
+
+
+def _bind_url(session) -> str:
+    import sqlalchemy
+
+    bind = session.get_bind()
+    assert isinstance(bind, sqlalchemy.engine.Engine)
+    return str(bind.url)
+
+
+def test_read_only_sessions_use_replicas(db_config: mock.Mock):
+    """Test that read-only sessions are spread across the read replicas.
+
+    Args:
+        db_config: the mocked config with read replicas
+    """
+    read_urls = {_bind_url(reflex.model.session(read_only=True)) for _ in range(4)}
+    assert read_urls == set(db_config.db_read_replica_urls)
+    assert _bind_url(reflex.model.session()) == db_config.db_url
+
+    db_config.db_read_replica_urls = []
+    assert _bind_url(reflex.model.session(read_only=True)) == db_config.db_url
+
+
+def test_pool_stats(db_config: mock.Mock):
+    """Test that connection pool checkouts are counted per engine.
+
+    Args:
+        db_config: the mocked config with read replicas
+    """
+    import sqlalchemy
+
+    with reflex.model.session() as session:
+        session.exec(sqlalchemy.text("SELECT 1"))  # pyright: ignore[reportCallIssue, reportArgumentType]
+    with get_engine().connect() as connection:
+        connection.execute(sqlalchemy.text("SELECT 1"))
+
+    stats = reflex.model.get_pool_stats()[db_config.db_url]
+    assert stats["checkouts"] == 2
+    assert stats["waits"] == 0
+    assert stats["timeouts"] == 0
+    assert stats["checked_out"] == 0
+    assert stats["size"] == 5
+
+
+@pytest.mark.asyncio
+async def test_event_scoped_sessions(
+    db_config: mock.Mock, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that sessions are shared within an event handler and closed after it.
+
+    Args:
+        db_config: the mocked config with read replicas
+        monkeypatch: pytest fixture to overwrite attributes
+    """
+    import asyncio
+
+    from reflex_base.event.context import EventContext
+
+    monkeypatch.setenv("REFLEX_DB_EVENT_SCOPED_SESSIONS", "true")
+
+    async def handler():  # noqa: RUF029
+        EventContext.set(mock.Mock())
+        with reflex.model.session() as first:
+            pass
+        with reflex.model.session() as second:
+            pass
+        read = reflex.model.session(read_only=True)
+        assert read is reflex.model.session(read_only=True)
+        assert read is not first
+        return first, second
+
+    first, second = await asyncio.create_task(handler())
+    assert first is second
+    # Let the task's done callbacks run.
+    await asyncio.sleep(0)
+    assert not reflex.model._EVENT_SESSIONS
+
+    # Outside of an event handler every call gets its own session.
+    assert reflex.model.session() is not reflex.model.session()
+
+
+@pytest.mark.asyncio
+async def test_event_scoped_session_ends_transaction_per_block(
+    db_config: mock.Mock, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that leaving a block ends the transaction of an event-scoped session.
+
+    Args:
+        db_config: the mocked config with read replicas
+        monkeypatch: pytest fixture to overwrite attributes
+    """
+    import asyncio
+
+    import sqlalchemy
+    from reflex_base.event.context import EventContext
+
+    monkeypatch.setenv("REFLEX_DB_EVENT_SCOPED_SESSIONS", "true")
+
+    async def handler():  # noqa: RUF029
+        EventContext.set(mock.Mock())
+        with reflex.model.session() as session:
+            session.exec(sqlalchemy.text("CREATE TABLE item (id INTEGER)"))  # pyright: ignore[reportCallIssue, reportArgumentType]
+            session.commit()
+        with reflex.model.session() as session:
+            session.exec(sqlalchemy.text("SELECT 1"))  # pyright: ignore[reportCallIssue, reportArgumentType]
+        assert not session.in_transaction()
+        with reflex.model.session() as session:
+            session.exec(sqlalchemy.text("INSERT INTO item VALUES (1)"))  # pyright: ignore[reportCallIssue, reportArgumentType]
+            session.flush()
+        assert not session.in_transaction()
+        with reflex.model.session() as session:
+            return session.exec(sqlalchemy.text("SELECT COUNT(*) FROM item")).one()  # pyright: ignore[reportCallIssue, reportArgumentType]
+
+    # Writes that were not committed are rolled back.
+    assert tuple(await asyncio.create_task(handler())) == (0,)
+
+
+@pytest.mark.asyncio
+async def test_event_scoped_session_nested_blocks(
+    db_config: mock.Mock, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that leaving a nested block keeps the transaction of the outer one.
+
+    Args:
+        db_config: the mocked config with read replicas
+        monkeypatch: pytest fixture to overwrite attributes
+    """
+    import asyncio
+
+    import sqlalchemy
+    from reflex_base.event.context import EventContext
+
+    monkeypatch.setenv("REFLEX_DB_EVENT_SCOPED_SESSIONS", "true")
+
+    async def handler():  # noqa: RUF029
+        EventContext.set(mock.Mock())
+        with reflex.model.session() as outer:
+            outer.exec(sqlalchemy.text("CREATE TABLE item (id INTEGER)"))  # pyright: ignore[reportCallIssue, reportArgumentType]
+            outer.exec(sqlalchemy.text("INSERT INTO item VALUES (1)"))  # pyright: ignore[reportCallIssue, reportArgumentType]
+            with reflex.model.session() as inner:
+                assert inner is outer
+                inner.exec(sqlalchemy.text("INSERT INTO item VALUES (2)"))  # pyright: ignore[reportCallIssue, reportArgumentType]
+            assert outer.in_transaction()
+            outer.commit()
+        with reflex.model.session() as session:
+            return session.exec(sqlalchemy.text("SELECT COUNT(*) FROM item")).one()  # pyright: ignore[reportCallIssue, reportArgumentType]
+
+    # The inner block did not roll back the pending writes of the outer one.
+    assert tuple(await asyncio.create_task(handler())) == (2,)
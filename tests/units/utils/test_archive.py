@@ -0,0 +1,71 @@
+"""Tests for reflex.utils.archive."""
+
+from __future__ import annotations
+
+import os
+import zipfile
+from pathlib import Path
+
+from reflex.utils import archive
+
+
+def _make_tree(root: Path) -> list[tuple[Path, str]]:
+    root.mkdir()
+    (root / "assets").mkdir()
+    files = {
+        "index.html": "<html>" + "hello " * 200 + "</html>",
+        "assets/app.js": "console.log('x');\n" * 100,
+        "assets/empty.txt": "",
+        "assets/random.bin": "",
+    }
+    for name, content in files.items():
+        (root / name).write_text(content)
+    # Incompressible content is stored rather than deflated.
+    (root / "assets/random.bin").write_bytes(os.urandom(1024))
+    return [(root / name, name) for name in files]
+
+
+def test_write_zip_roundtrip(tmp_path: Path):
+    """Every file is readable from the archive with its original content."""
+    files = _make_tree(tmp_path / "src")
+    target = tmp_path / "out.zip"
+
+    stats = archive.write_zip(target, files, max_workers=2)
+
+    assert stats == archive.ArchiveStats(files=4, reused=0, compressed=4)
+    with zipfile.ZipFile(target) as zipf:
+        assert zipf.testzip() is None
+        assert zipf.namelist() == [name for _, name in files]
+        for path, name in files:
+            assert zipf.read(name) == path.read_bytes()
+        assert zipf.getinfo("index.html").compress_type == zipfile.ZIP_DEFLATED
+        assert zipf.getinfo("assets/random.bin").compress_type == zipfile.ZIP_STORED
+    assert not (tmp_path / ".out.zip.tmp").exists()
+
+
+def test_write_zip_reuses_unchanged_entries(tmp_path: Path):
+    """A second run only recompresses files whose content changed."""
+    files = _make_tree(tmp_path / "src")
+    target = tmp_path / "out.zip"
+    archive.write_zip(target, files)
+
+    changed = tmp_path / "src" / "assets" / "app.js"
+    changed.write_text("console.log('changed');\n" * 100)
+    stats = archive.write_zip(target, files)
+
+    assert stats == archive.ArchiveStats(files=4, reused=3, compressed=1)
+    with zipfile.ZipFile(target) as zipf:
+        assert zipf.testzip() is None
+        for path, name in files:
+            assert zipf.read(name) == path.read_bytes()
+
+    stats = archive.write_zip(target, files, reuse_previous=False)
+    assert stats.reused == 0
+
+
+def test_get_file_ids_skips_missing(tmp_path: Path):
+    """Exclusion ids follow the file, not the spelling of its path."""
+    existing = tmp_path / "a.txt"
+    existing.write_text("a")
+    ids = archive.get_file_ids([existing, tmp_path / "missing.txt"])
+    assert ids == {archive.get_file_id(tmp_path / "." / "a.txt")}
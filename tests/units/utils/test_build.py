@@ -4,29 +4,22 @@ from __future__ import annotations
 
 import gzip
 import json
+import zipfile
 from pathlib import Path
 
-import pytest
-import reflex_base
 from pytest_mock import MockerFixture
+from reflex_base import constants
 
 from reflex.plugins import EmbedPlugin, Plugin
-from reflex.utils import build, path_ops
+from reflex.utils import build
 
 
 def test_compress_static_output_overwrites_stale_sidecars(
     tmp_path: Path, mocker: MockerFixture
 ):
     """Compression must rewrite sidecars whose source file has changed since the prior pass."""
-    if path_ops.get_node_path() is None and path_ops.get_bun_path() is None:
-        pytest.skip("Node.js or Bun is required for compression test")
-
     web_dir = tmp_path / ".web"
     web_dir.mkdir()
-    compress_script = (
-        Path(reflex_base.__file__).parent / ".templates/web/compress-static.js"
-    )
-    (web_dir / "compress-static.js").write_text(compress_script.read_text())
 
     static_dir = tmp_path / "static"
     static_dir.mkdir()
@@ -146,3 +139,55 @@ def test_set_env_json_later_plugin_wins(tmp_path: Path, mocker: MockerFixture):
     assert env["SHARED"] == "second"
     assert env["ONLY_FIRST"] == 1
     assert env["ONLY_SECOND"] == 2
+
+
+def test_zip_excludes_files_and_directories(tmp_path: Path):
+    """Excluded paths are skipped no matter how they are spelled."""
+    root = tmp_path / "app"
+    (root / "keep").mkdir(parents=True)
+    (root / "skip").mkdir()
+    (root / "__pycache__").mkdir()
+    (root / "keep" / "main.py").write_text("print('hi')")
+    (root / "skip" / "secret.py").write_text("secret")
+    (root / "__pycache__" / "main.pyc").write_text("")
+    (root / "app.db").write_text("")
+    (root / "backend.zip").write_text("")
+    target = tmp_path / "backend.zip"
+
+    build._zip(
+        component_name=constants.ComponentName.BACKEND,
+        target=target,
+        root_directory=root,
+        exclude_venv_directories=True,
+        directory_names_to_exclude={"__pycache__"},
+        files_to_exclude={root / "keep" / ".." / "skip", root / "backend.zip"},
+    )
+
+    with zipfile.ZipFile(target) as zipf:
+        assert zipf.namelist() == ["keep/main.py"]
+
+
+def test_compress_static_output_falls_back_to_js(tmp_path: Path, mocker: MockerFixture):
+    """Formats without an in-process compressor use the JavaScript compressor."""
+    web_dir = tmp_path / ".web"
+    web_dir.mkdir()
+    mocker.patch("reflex.utils.build.prerequisites.get_web_dir", return_value=web_dir)
+    mocker.patch(
+        "reflex.utils.build.precompress.is_format_available",
+        side_effect=lambda format_: format_ == "gzip",
+    )
+    mocker.patch("reflex.utils.build.path_ops.get_node_path", return_value="node")
+    compress_directory = mocker.patch(
+        "reflex.utils.build.precompress.compress_directory"
+    )
+    new_process = mocker.patch(
+        "reflex.utils.build.processes.new_process",
+        return_value=mocker.Mock(returncode=0),
+    )
+
+    build._compress_static_output(tmp_path, ("gzip", "brotli"))
+
+    compress_directory.assert_not_called()
+    command = new_process.call_args.args[0]
+    assert command[0] == "node"
+    assert command[-2:] == ["gzip", "brotli"]
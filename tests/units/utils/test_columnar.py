@@ -0,0 +1,81 @@
+"""Tests for the columnar encoding of DataFrames and NumPy arrays."""
+
+import numpy as np
+import pandas as pd
+from reflex_base.utils.columnar import (
+    COLUMNAR_MARKER,
+    attachment_bytes,
+    encode_delta,
+    encode_value,
+)
+from reflex_base.utils.serializers import format_dataframe_values, serialize
+from socketio import packet
+
+
+def _read(column: dict) -> list:
+    if "buffer" not in column:
+        return column["values"]
+    return np.frombuffer(column["buffer"], dtype=column["dtype"]).tolist()
+
+
+def test_encode_dataframe():
+    """Test that numeric columns are sent as buffers, and other columns as values."""
+    df = pd.DataFrame({
+        "int": [1, 2, 3],
+        "float": [0.5, 1.5, 2.5],
+        "flag": [True, False, True],
+        "small": np.array([1, 2, 3], dtype="int16"),
+        "name": ["a", "b", ("c", "d")],
+    })
+    encoded = encode_value(df)
+    assert encoded[COLUMNAR_MARKER] == "dataframe"
+    assert encoded["columns"] == ["int", "float", "flag", "small", "name"]
+    assert encoded["length"] == 3
+    assert [column.get("dtype") for column in encoded["data"]] == [
+        "float64",
+        "float64",
+        "bool",
+        "int16",
+        None,
+    ]
+    rows = [list(row) for row in zip(*map(_read, encoded["data"]), strict=True)]
+    # The same values as the JSON encoding.
+    assert rows == format_dataframe_values(df)
+
+
+def test_unsafe_integers_are_sent_as_values():
+    """Test that integers a JS number cannot represent are not sent as a buffer."""
+    df = pd.DataFrame({"big": [2**60, 1]})
+    assert encode_value(df)["data"] == [{"values": [2**60, 1]}]
+
+
+def test_encode_ndarray():
+    """Test that numeric arrays are sent as a buffer with their shape."""
+    array = np.arange(6, dtype="float32").reshape(2, 3)
+    encoded = encode_value(array)
+    assert encoded[COLUMNAR_MARKER] == "ndarray"
+    assert encoded["shape"] == [2, 3]
+    assert _read(encoded) == [0, 1, 2, 3, 4, 5]
+
+    strings = np.array(["a", "b"])
+    assert encode_value(strings) is strings
+    assert serialize(strings) == ["a", "b"]
+
+
+def test_encode_delta_attachments():
+    """Test that only deltas with values to encode are copied, and sent as attachments."""
+    delta = {"state": {"count_rx_state_": 1}, "state.sub": {"text_rx_state_": "a"}}
+    assert encode_delta(delta) is None
+
+    delta["state.sub"]["values_rx_state_"] = np.array([1.0, 2.0])
+    encoded = encode_delta(delta)
+    assert encoded is not None
+    assert isinstance(delta["state.sub"]["values_rx_state_"], np.ndarray)
+    assert encoded["state"] == {"count_rx_state_": 1}
+    assert attachment_bytes(encoded) == 16
+
+    encoded_packet = packet.Packet(
+        packet.EVENT, data=["event", {"delta": encoded}]
+    ).encode()
+    assert isinstance(encoded_packet, list)
+    assert encoded_packet[1:] == [np.array([1.0, 2.0]).astype("<f8").tobytes()]
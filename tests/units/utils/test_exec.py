@@ -101,3 +101,57 @@ def test_with_development_condition_preserves_existing_options():
     assert env["BUN_OPTIONS"] == "--conditions=development"
     # The dev condition must not leak into the parent environment.
     assert environ["NODE_OPTIONS"] == "--max-old-space-size=4096"
+
+
+@pytest.mark.parametrize("preload", [False, True])
+def test_run_granian_backend_prod_preloads_app(
+    mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch, preload: bool
+):
+    """With REFLEX_PRELOAD_BACKEND, the forked workers share the app evaluated once."""
+    monkeypatch.setenv(environment.REFLEX_PRELOAD_BACKEND.name, str(preload))
+    mocker.patch.object(
+        exec_utils, "get_app_instance_from_file", return_value="app:app"
+    )
+    mocker.patch("multiprocessing.get_start_method", return_value="fork")
+    asgi_app = object()
+    app = mocker.Mock(return_value=asgi_app)
+    get_app = mocker.patch(
+        "reflex.utils.prerequisites.get_and_validate_app",
+        return_value=mocker.Mock(app=app),
+    )
+
+    seen: dict[str, object] = {}
+    granian_server = pytest.importorskip("granian.server")
+
+    class FakeGranian:
+        def __init__(self, *_args, **_kwargs):
+            pass
+
+        def serve(self, target_loader=None):
+            seen["loader"] = target_loader
+
+    mocker.patch.object(granian_server, "Server", FakeGranian)
+
+    exec_utils.run_granian_backend_prod(
+        host="0.0.0.0", port=8000, loglevel=exec_utils.LogLevel.INFO
+    )
+
+    loader = seen["loader"]
+    if not preload:
+        assert loader is None
+        get_app.assert_not_called()
+        return
+    assert callable(loader)
+    app.assert_called_once_with()
+    assert loader("app:app") is asgi_app
+    assert loader("app:app") is asgi_app
+    app.assert_called_once_with()
+
+
+def test_preload_backend_app_needs_forked_workers(mocker: MockerFixture):
+    """The app is loaded by every worker when they are not forked."""
+    mocker.patch("multiprocessing.get_start_method", return_value="spawn")
+    get_app = mocker.patch("reflex.utils.prerequisites.get_and_validate_app")
+
+    assert exec_utils._preload_backend_app() is None
+    get_app.assert_not_called()
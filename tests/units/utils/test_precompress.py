@@ -0,0 +1,86 @@
+"""Tests for reflex.utils.precompress."""
+
+from __future__ import annotations
+
+import gzip
+import os
+from pathlib import Path
+
+import pytest
+
+from reflex.utils import precompress
+
+
+@pytest.fixture
+def static_dir(tmp_path: Path) -> Path:
+    """A static output tree with compressible, tiny and incompressible files.
+
+    Returns:
+        The static output directory.
+    """
+    static = tmp_path / "static"
+    (static / "assets").mkdir(parents=True)
+    (static / "index.html").write_text("<html></html>")
+    (static / "assets" / "app.js").write_text("console.log('app');\n" * 100)
+    (static / "assets" / "tiny.css").write_text("a{}")
+    (static / "assets" / "noise.json").write_bytes(os.urandom(2048))
+    (static / "assets" / "logo.png").write_bytes(b"\x89PNG" * 100)
+    return static
+
+
+def test_compress_directory_thresholds(static_dir: Path, tmp_path: Path):
+    """Only variants that clear the size and ratio thresholds are written."""
+    stats = precompress.compress_directory(
+        static_dir, ["gzip"], tmp_path / "cache", max_workers=2
+    )
+
+    app_js = static_dir / "assets" / "app.js"
+    assert gzip.decompress((static_dir / "assets" / "app.js.gz").read_bytes()) == (
+        app_js.read_bytes()
+    )
+    # Small HTML entrypoints are always compressed.
+    assert (static_dir / "index.html.gz").exists()
+    # Below the minimum size.
+    assert not (static_dir / "assets" / "tiny.css.gz").exists()
+    # Incompressible content does not meet the ratio.
+    assert not (static_dir / "assets" / "noise.json.gz").exists()
+    # Not a compressible extension.
+    assert not (static_dir / "assets" / "logo.png.gz").exists()
+    assert stats == precompress.PrecompressStats(
+        files=3, compressed=2, cached=0, skipped=1
+    )
+
+
+def test_compress_directory_is_incremental(static_dir: Path, tmp_path: Path):
+    """Unchanged content is restored from the cache and stale sidecars are replaced."""
+    cache_dir = tmp_path / "cache"
+    precompress.compress_directory(static_dir, ["gzip"], cache_dir)
+
+    # Simulate a fresh build output with one changed file.
+    for sidecar in static_dir.rglob("*.gz"):
+        sidecar.unlink()
+    (static_dir / "assets" / "noise.json.gz").write_bytes(b"stale")
+    app_js = static_dir / "assets" / "app.js"
+    app_js.write_text("console.log('changed');\n" * 100)
+
+    stats = precompress.compress_directory(static_dir, ["gzip"], cache_dir)
+
+    assert stats == precompress.PrecompressStats(
+        files=3, compressed=1, cached=1, skipped=1
+    )
+    assert gzip.decompress((static_dir / "assets" / "app.js.gz").read_bytes()) == (
+        app_js.read_bytes()
+    )
+    assert (static_dir / "index.html.gz").exists()
+    assert not (static_dir / "assets" / "noise.json.gz").exists()
+    # Only the variants of the current content remain cached.
+    assert len(list(cache_dir.glob("*.gz"))) == 2
+
+
+def test_compress_directory_rejects_unavailable_format(
+    static_dir: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """A format without an installed compressor is an error."""
+    monkeypatch.setattr(precompress, "is_format_available", lambda _: False)
+    with pytest.raises(ValueError, match="brotli"):
+        precompress.compress_directory(static_dir, ["brotli"], tmp_path / "cache")
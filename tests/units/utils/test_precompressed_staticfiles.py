@@ -6,6 +6,7 @@ import asyncio
 from pathlib import Path
 
 import pytest
+from starlette.exceptions import HTTPException
 from starlette.responses import FileResponse, Response
 from starlette.types import Message
 
@@ -169,3 +170,141 @@ async def test_precompressed_static_files_fall_back_to_identity(tmp_path: Path):
     assert "content-encoding" not in response.headers
     assert response.headers["vary"] == "Accept-Encoding"
     assert await _collect_body(response, scope) == b"console.log('hello');"
+
+
+@pytest.mark.asyncio
+async def test_immutable_static_files_serve_from_index_without_stat(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Answer indexed requests without touching the filesystem."""
+    (tmp_path / "index.html").write_text("<html>hello</html>")
+    (tmp_path / "index.html.br").write_bytes(b"compressed-brotli")
+    (tmp_path / "app.js").write_text("console.log('hello');")
+
+    static_files = PrecompressedStaticFiles(
+        directory=tmp_path,
+        html=True,
+        encodings=["gzip", "brotli"],
+        immutable=True,
+    )
+
+    def _no_stat(*args, **kwargs):
+        msg = "stat should not be called for indexed files"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(Path, "stat", _no_stat)
+    monkeypatch.setattr("os.stat", _no_stat)
+
+    scope = _scope("/", "gzip, br")
+    response = await static_files.get_response("", scope)
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "br"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.media_type == "text/html"
+
+    response = await static_files.get_response("app.js", _scope("/app.js", "gzip"))
+    assert "content-encoding" not in response.headers
+    assert response.media_type == "text/javascript"
+    assert response.headers["content-length"] == str(len("console.log('hello');"))
+
+
+@pytest.mark.asyncio
+async def test_immutable_static_files_serve_small_files_from_memory(tmp_path: Path):
+    """Serve cached bodies from memory and honor conditional requests."""
+    (tmp_path / "app.js").write_text("console.log('hello');")
+    (tmp_path / "big.js").write_bytes(b"x" * 64)
+
+    static_files = PrecompressedStaticFiles(
+        directory=tmp_path, immutable=True, memory_cache_size=32
+    )
+
+    scope = _scope("/app.js")
+    response = await static_files.get_response("app.js", scope)
+    assert not isinstance(response, FileResponse)
+    assert await _collect_body(response, scope) == b"console.log('hello');"
+
+    # The second file does not fit in the remaining budget.
+    big = await static_files.get_response("big.js", _scope("/big.js"))
+    assert isinstance(big, FileResponse)
+
+    conditional = _scope("/app.js")
+    conditional["headers"].append((b"if-none-match", response.headers["etag"].encode()))
+    not_modified = await static_files.get_response("app.js", conditional)
+    assert not_modified.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_immutable_static_files_404_fallback(tmp_path: Path):
+    """Fall back to the indexed 404.html for unknown paths."""
+    (tmp_path / "404.html").write_text("<html>missing</html>")
+    (tmp_path / "404.html.gz").write_bytes(b"compressed-404")
+
+    static_files = PrecompressedStaticFiles(
+        directory=tmp_path, html=True, encodings=["gzip"], immutable=True
+    )
+
+    # Files added after startup are not served from an immutable index.
+    (tmp_path / "late.js").write_text("late")
+    scope = _scope("/late.js", "gzip")
+    response = await static_files.get_response("late.js", scope)
+
+    assert response.status_code == 404
+    assert response.headers["content-encoding"] == "gzip"
+    assert await _collect_body(response, scope) == b"compressed-404"
+
+
+@pytest.mark.asyncio
+async def test_immutable_static_files_skip_links_outside_directory(tmp_path: Path):
+    """Do not index links to files outside the directory unless following links."""
+    outside = tmp_path / "secret.txt"
+    outside.write_text("secret")
+    static_dir = tmp_path / "static"
+    static_dir.mkdir()
+    (static_dir / "app.js").write_text("app")
+    (static_dir / "inside.js").symlink_to(static_dir / "app.js")
+    (static_dir / "leak.txt").symlink_to(outside)
+
+    static_files = PrecompressedStaticFiles(directory=static_dir, immutable=True)
+    assert (
+        await static_files.get_response("inside.js", _scope("/inside.js"))
+    ).status_code == 200
+    with pytest.raises(HTTPException) as exc_info:
+        await static_files.get_response("leak.txt", _scope("/leak.txt"))
+    assert exc_info.value.status_code == 404
+
+    following = PrecompressedStaticFiles(
+        directory=static_dir, immutable=True, follow_symlink=True
+    )
+    assert (
+        await following.get_response("leak.txt", _scope("/leak.txt"))
+    ).status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_static_files_use_zerocopysend_when_supported(tmp_path: Path):
+    """Hand the open file to servers that advertise zero-copy send."""
+    (tmp_path / "app.js").write_text("console.log('hello');")
+    static_files = PrecompressedStaticFiles(directory=tmp_path, immutable=True)
+
+    scope = _scope("/app.js")
+    scope["extensions"] = {"http.response.zerocopysend": {}}
+    response = await static_files.get_response("app.js", scope)
+    messages: list[Message] = []
+
+    async def receive() -> dict:
+        await asyncio.sleep(0)
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:
+        await asyncio.sleep(0)
+        if message["type"] == "http.response.zerocopysend":
+            message = {**message, "body": message["file"].read(message["count"])}
+        messages.append(message)
+
+    await response(scope, receive, send)
+
+    assert [message["type"] for message in messages] == [
+        "http.response.start",
+        "http.response.zerocopysend",
+    ]
+    assert messages[1]["body"] == b"console.log('hello');"
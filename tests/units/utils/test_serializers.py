@@ -247,3 +247,49 @@ def test_serialize_var_to_str(value: Any, expected: str, exp_var_is_string: bool
     """
     v = LiteralVar.create(value)
     assert str(v) == expected
+
+
+def test_raw_json_is_spliced():
+    """Test that RawJSON text is written verbatim by json_dumps, and decoded by serialize."""
+
+    class Encoded:
+        pass
+
+    @serializers.serializer(to=dict)
+    def serialize_encoded(value: Encoded) -> serializers.RawJSON:
+        return serializers.RawJSON('{"pre":"encoded"}')
+
+    try:
+        value = Encoded()
+        # A string looking like the placeholder of a fragment is left alone.
+        text = json_dumps({"a": [value, "\0abc:0"], "b": value})
+        assert json.loads(text) == {
+            "a": [{"pre": "encoded"}, "\0abc:0"],
+            "b": {"pre": "encoded"},
+        }
+        assert serializers.serialize(value) == {"pre": "encoded"}
+    finally:
+        serializers.SERIALIZERS.pop(Encoded)
+        serializers.get_serializer.cache_clear()
+
+
+def test_json_fragment_cache():
+    """Test that JSON text is reused for the same object until it is forgotten."""
+
+    class Figure:
+        pass
+
+    encoded = []
+
+    def encode(value: Figure) -> str:
+        encoded.append(value)
+        return str(len(encoded))
+
+    figure = Figure()
+    assert serializers.json_fragment(figure, encode).text == "1"
+    assert serializers.json_fragment(figure, encode).text == "1"
+    assert serializers.json_fragment(Figure(), encode).text == "2"
+
+    serializers.forget_json_fragments([figure])
+    assert serializers.json_fragment(figure, encode).text == "3"
+    assert len(encoded) == 3
@@ -11,10 +11,14 @@ import pytest
 
 from reflex import config
 from reflex.app import EventNamespace
+from reflex.event import Event
 from reflex.istate.data import RouterData
 from reflex.state import StateUpdate
 from reflex.utils.token_manager import (
+    ForwardedEventsRecord,
+    ForwardedModifyRecord,
     LocalTokenManager,
+    LostAndFoundRecord,
     RedisTokenManager,
     SocketRecord,
     TokenManager,
@@ -235,6 +239,7 @@ class TestRedisTokenManager:
         redis.exists = AsyncMock()
         redis.set = AsyncMock()
         redis.delete = AsyncMock()
+        redis.publish = AsyncMock(return_value=1)
 
         # Non-async call
         redis.get_connection_kwargs = Mock(return_value={"db": 0})
@@ -516,6 +521,147 @@ class TestRedisTokenManager:
 
         mock_redis.aclose.assert_awaited_once()
 
+    async def test_forward_events_disabled_without_owner_affinity(
+        self, manager, mock_redis
+    ):
+        """Test events are processed locally unless owner affinity is enabled.
+
+        Args:
+            manager: RedisTokenManager fixture instance.
+            mock_redis: Mock Redis client fixture.
+        """
+        manager.token_to_socket["token1"] = SocketRecord(
+            instance_id="other-instance", sid="sid1"
+        )
+
+        assert not await manager.forward_events("token1", Mock())
+        mock_redis.publish.assert_not_called()
+
+    async def test_forward_events_to_owner(self, manager, mock_redis):
+        """Test events for a socket on another instance are published to its channel.
+
+        Args:
+            manager: RedisTokenManager fixture instance.
+            mock_redis: Mock Redis client fixture.
+        """
+        manager.owner_affinity = True
+        manager.token_to_socket["remote"] = SocketRecord(
+            instance_id="other-instance", sid="sid1"
+        )
+        manager.token_to_socket["local"] = SocketRecord(
+            instance_id=manager.instance_id, sid="sid2"
+        )
+        event = Event(name="state.handler", payload={"x": 1})
+
+        assert await manager.forward_events("remote", event)
+        assert not await manager.forward_events("local", event)
+
+        mock_redis.publish.assert_awaited_once()
+        channel, data = mock_redis.publish.call_args[0]
+        assert channel == "channel:token_manager_lost_and_found_other-instance"
+        record = pickle.loads(data)
+        assert isinstance(record, ForwardedEventsRecord)
+        assert record.token == "remote"
+        assert record.events == [event]
+        assert manager.stats.work_forwarded == 1
+        assert manager.stats.owner_cache_hits == 2
+
+    async def test_forward_events_without_subscriber_runs_locally(
+        self, manager, mock_redis
+    ):
+        """Test events are processed locally when the owner no longer listens.
+
+        Args:
+            manager: RedisTokenManager fixture instance.
+            mock_redis: Mock Redis client fixture.
+        """
+        manager.owner_affinity = True
+        manager.token_to_socket["remote"] = SocketRecord(
+            instance_id="other-instance", sid="sid1"
+        )
+        manager.sid_to_token["sid1"] = "remote"
+        mock_redis.publish = AsyncMock(return_value=0)
+
+        assert not await manager.forward_events(
+            "remote", Event(name="state.handler", payload={})
+        )
+        mock_redis.publish.assert_awaited_once()
+        assert manager.stats.work_forwarded == 0
+        assert "remote" not in manager.token_to_socket
+        assert "sid1" not in manager.sid_to_token
+
+    async def test_forward_unpicklable_events_runs_locally(self, manager, mock_redis):
+        """Test events that cannot be pickled are processed locally.
+
+        Args:
+            manager: RedisTokenManager fixture instance.
+            mock_redis: Mock Redis client fixture.
+        """
+        manager.owner_affinity = True
+        manager.token_to_socket["remote"] = SocketRecord(
+            instance_id="other-instance", sid="sid1"
+        )
+        event = Event(name="state.handler", payload={"x": lambda: None})
+
+        assert not await manager.forward_events("remote", event)
+        mock_redis.publish.assert_not_called()
+
+    async def test_forward_modify_unknown_owner_runs_locally(self, manager, mock_redis):
+        """Test a modification is not forwarded when no instance owns the token.
+
+        Args:
+            manager: RedisTokenManager fixture instance.
+            mock_redis: Mock Redis client fixture.
+        """
+        manager.owner_affinity = True
+        mock_redis.get = AsyncMock(return_value=None)
+
+        assert not await manager.forward_modify("token1", "state.shared", {})
+        mock_redis.publish.assert_not_called()
+        assert manager.stats.owner_cache_misses == 1
+
+    async def test_lost_and_found_dispatches_forwarded_work(self, manager, mock_redis):
+        """Test the instance channel routes deltas and forwarded work to their handlers.
+
+        Args:
+            manager: RedisTokenManager fixture instance.
+            mock_redis: Mock Redis client fixture.
+        """
+        update = StateUpdate(delta={"state": {"x": 1}})
+        modify = ForwardedModifyRecord(
+            token="token2", state_name="state.shared", previous_dirty_vars={}
+        )
+        messages = [
+            {
+                "type": "pmessage",
+                "data": pickle.dumps(LostAndFoundRecord(token="token1", update=update)),
+            },
+            {"type": "pmessage", "data": pickle.dumps(modify)},
+        ]
+
+        async def listen():
+            for message in messages:
+                yield message
+                await asyncio.sleep(0)
+
+        @asynccontextmanager
+        async def pubsub():
+            pubsub_mock = AsyncMock()
+            pubsub_mock.listen = listen
+            yield pubsub_mock
+
+        mock_redis.pubsub = pubsub
+        emit_update = AsyncMock()
+        handle_forwarded = AsyncMock()
+
+        await manager._subscribe_lost_and_found_updates(emit_update, handle_forwarded)
+        await asyncio.gather(*manager._forwarded_tasks)
+
+        emit_update.assert_awaited_once_with(update, "token1")
+        handle_forwarded.assert_awaited_once_with(modify)
+        assert manager.stats.deltas_received == 1
+        assert manager.stats.work_received == 1
+
 
 @pytest.fixture
 def redis_url():
@@ -77,3 +77,36 @@ def test_computed_var_replace() -> None:
 
     replaced = cv._replace(_var_type=float)
     assert replaced._var_type is float
+
+
+def test_var_operations_are_interned() -> None:
+    """Structurally identical operations share one instance, held weakly."""
+    import gc
+
+    from reflex_base.vars.base import _INTERNED_VARS, LiteralVar, Var
+
+    x = Var(_js_expr="x").to(int)
+    first = (x + 1) * LiteralVar.create(2)
+    second = (x + 1) * LiteralVar.create(2)
+    assert first is second
+    assert (x + 1.0) is not (x + 1)
+    assert LiteralVar.create(True) is not LiteralVar.create(1)
+    assert str(LiteralVar.create(-0.0)) != str(LiteralVar.create(0.0))
+
+    # Vars of mutable values are not interned.
+    assert LiteralVar.create({"a": 1}) is not LiteralVar.create({"a": 1})
+
+    interned = len(_INTERNED_VARS)
+    del first, second
+    gc.collect()
+    assert len(_INTERNED_VARS) < interned
+
+
+def test_replace_js_expr_keeps_interned_var() -> None:
+    """Replacing the JS expression of an interned var does not change the var."""
+    from reflex_base.vars.base import LiteralVar
+
+    var = LiteralVar.create(1) + 2
+    replaced = var._replace(_js_expr="three")
+    assert str(replaced) == "three"
+    assert str(LiteralVar.create(1) + 2) == "(1 + 2)"